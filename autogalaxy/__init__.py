@@ -59,6 +59,7 @@ from .analysis.adapt_images.adapt_images import galaxy_name_image_dict_via_resul
 from . import aggregator as agg
 from . import exc
 from . import plot
+from . import profiling
 from . import util
 from .ellipse.dataset_interp import DatasetInterp
 from .ellipse.ellipse.ellipse import Ellipse
@@ -66,10 +67,13 @@ from .ellipse.ellipse.ellipse_multipole import EllipseMultipole
 from .ellipse.ellipse.ellipse_multipole import EllipseMultipoleScaled
 from .ellipse.fit_ellipse import FitEllipse
 from .ellipse.model.analysis import AnalysisEllipse
+from .ellipse.model import cutout_batch
 from .operate.image import OperateImage
 from .operate.image import OperateImageList
 from .operate.image import OperateImageGalaxies
 from .operate.lens_calc import LensCalc
+from .operate.lens_calc import LensingMaps
+from .operate import lens_calc_batch
 from .gui.scribbler import Scribbler
 from .imaging.fit_imaging import FitImaging
 from .imaging.model.analysis import AnalysisImaging
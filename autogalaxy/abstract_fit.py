@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, Optional
+from collections import Counter
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 import numpy as np
 
+from autoconf import cached_property
 from autofit import ModelInstance
 
 if TYPE_CHECKING:
@@ -10,10 +13,31 @@ if TYPE_CHECKING:
 
 import autoarray as aa
 
+from autogalaxy import profiling
 from autogalaxy.profiles.light.linear import LightProfileLinear
 from autogalaxy.profiles.basis import Basis
 
 
+def cached_fit_property(func: Callable):
+    """
+    A `cached_property` for the intermediate quantities of a fit (e.g. the `blurred_image` of a `FitImaging`), which
+    are computed once per fit object and then reused by every other quantity that depends on them.
+
+    Every evaluation is counted in the fit's `evaluation_counter`, which tests use to assert that each intermediate
+    is only computed once. The count is incremented in Python, so it also counts evaluations while a fit is traced
+    by JAX, where the cached value is a tracer that is only used inside the traced function which created the fit.
+
+    If profiling is enabled (see `autogalaxy.profiling`), every evaluation is also recorded as a stage of the fit.
+    """
+
+    @wraps(func)
+    def wrapper(fit):
+        fit.evaluation_counter[func.__name__] += 1
+        return func(fit)
+
+    return cached_property(profiling.profile_method(wrapper))
+
+
 class AbstractFitInversion:
     def __init__(self, model_obj, settings: aa.Settings, xp=np):
         """
@@ -35,6 +59,14 @@ class AbstractFitInversion:
         self.settings = settings or aa.Settings()
         self.use_jax = xp is not np
 
+    @cached_property
+    def evaluation_counter(self) -> Counter:
+        """
+        Counts how many times each intermediate quantity of the fit decorated with `cached_fit_property` has been
+        evaluated, keyed by its name.
+        """
+        return Counter()
+
     @property
     def _xp(self):
         if self.use_jax:
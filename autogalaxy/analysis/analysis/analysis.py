@@ -23,6 +23,7 @@ import autoarray as aa
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.cosmology.model import LensingCosmology
+from autogalaxy.cosmology.redshift_cache import RedshiftCache
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,49 @@ class Analysis(af.Analysis):
 
         super().__init__(use_jax=use_jax, **kwargs)
 
+    def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        This function is called immediately before the non-linear search begins and performs final tasks and checks
+        before it begins.
+
+        It prewarms the cache of the quantities the cosmology computes at fixed redshifts (see
+        `autogalaxy.cosmology.redshift_cache`) with the fixed redshifts of the galaxies in the model.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        model
+            The model object, which includes model components representing the galaxies that are fitted to
+            the data.
+        """
+        self.prewarm_cosmology_cache(model=model)
+
+        return super().modify_before_fit(paths=paths, model=model)
+
+    def prewarm_cosmology_cache(self, model: af.Collection):
+        """
+        Computes and caches the quantities the cosmology computes at the redshifts of the galaxies in the model
+        (e.g. their kpc per arcsecond and the critical surface densities between them), so that they are not
+        recomputed every time the likelihood function is called.
+
+        Galaxies whose redshift is a free parameter of the model are omitted.
+
+        Parameters
+        ----------
+        model
+            The model object, which includes model components representing the galaxies that are fitted to
+            the data.
+        """
+        redshift_list = [
+            galaxy.redshift
+            for galaxy in model.models_with_type(Galaxy, include_zero_dimension=True)
+            if galaxy.redshift is not None and not isinstance(galaxy.redshift, af.Prior)
+        ]
+
+        RedshiftCache.prewarm(cosmology=self.cosmology, redshift_list=redshift_list)
+
     def galaxies_via_instance_from(
         self,
         instance: af.ModelInstance,
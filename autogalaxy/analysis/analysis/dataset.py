@@ -6,8 +6,11 @@ from autoconf.dictable import to_dict, output_to_json
 
 import autofit as af
 import autoarray as aa
+from autofit.non_linear.paths.null import NullPaths
 
+from autogalaxy import profiling
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
+from autogalaxy.analysis.inversion_cache import InversionCache
 from autogalaxy.cosmology.model import LensingCosmology
 from autogalaxy.analysis.analysis.analysis import Analysis
 from autogalaxy.analysis.result import ResultDataset
@@ -35,6 +38,10 @@ class AnalysisDataset(Analysis):
         pixelization or inversion), the Cosmology used for the analysis and adapt images used for certain model
         classes.
 
+        When JAX is not used, the matrices of a pixelization which do not change between samples of the model (e.g.
+        the `Mapper` and `curvature_matrix` when only the regularization varies) are reused across calls of the
+        likelihood function via an `InversionCache` (see `autogalaxy.analysis.inversion_cache`).
+
         Parameters
         ----------
         dataset
@@ -64,6 +71,8 @@ class AnalysisDataset(Analysis):
 
         self.title_prefix = title_prefix
 
+        self.inversion_cache = InversionCache()
+
     def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
         """
         This function is called immediately before the non-linear search begins and performs final tasks and checks
@@ -153,6 +162,10 @@ class AnalysisDataset(Analysis):
 
         - The maximum log likelihood galaxies of the fit.
 
+        If profiling is enabled (see `autogalaxy.profiling`), the report of the wall time and number of calls of
+        every stage of the fit is also output to the file `profiling.results` in the output folder, alongside
+        `model.results`.
+
         Parameters
         ----------
         paths
@@ -169,6 +182,11 @@ class AnalysisDataset(Analysis):
         except AttributeError:
             pass
 
+        profiler = profiling.current()
+
+        if profiler is not None and not isinstance(paths, NullPaths):
+            profiler.output_to(file_path=paths.output_path / "profiling.results")
+
     def adapt_images_via_instance_from(self, instance: af.ModelInstance) -> AdaptImages:
         try:
             return self.adapt_images.updated_via_instance_from(instance=instance)
@@ -0,0 +1,275 @@
+"""
+A cache of the matrices of a pixelization's inversion which do not change between calls of the likelihood function.
+
+In **PyAutoGalaxy** there is no lensing, therefore the `source_plane_data_grid` of every pixelization's `Mapper` is
+the dataset's `pixelization` grid and its mesh-grid and adapt image come from fixed `adapt_images`. When a model-fit
+only varies the regularization or light profile parameters, the `Mapper`, its `mapping_matrix`, the blurred (imaging)
+or transformed (interferometer) mapping matrix and the `curvature_matrix` are therefore identical for every sample,
+yet were recomputed every time the likelihood function was called.
+
+The `InversionCache` stores these matrices in a bounded least-recently-used (LRU) cache, which `AnalysisImaging`
+and `AnalysisInterferometer` pass to every fit via `GalaxiesToInversion`:
+
+- A `Mapper` is keyed on a fingerprint of its mesh (its class and parameters), the values of the data grid,
+  mesh-grid and adapt image it is computed from, the border relocator and the settings of the inversion. When the
+  key is in the cache, the cached `Mapper` (including its `mapping_matrix`) is copied with the sample's
+  regularization.
+- The operated mapping matrix of a cached `Mapper` is keyed on the `Mapper`'s key and the PSF or transformer.
+- If every linear object of the inversion is a cached `Mapper`, the `curvature_matrix` is keyed on their keys,
+  the PSF or transformer and the values of the noise-map.
+
+Only the quantities which depend on the data or regularization (e.g. the `data_vector` and the
+`regularization_matrix`) are therefore computed for every sample.
+
+The cache is only used with NumPy, because when using JAX the likelihood function is compiled and its matrices
+are not computed again for every sample. Only the mapping matrix formalism of the inversion (e.g. a dataset without
+a `sparse_operator`) uses the cached operated mapping matrices and `curvature_matrix`.
+"""
+import copy
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from typing import Callable, Optional
+
+from autoconf import conf
+
+import autoarray as aa
+
+from autogalaxy.cosmology.redshift_cache import CacheInfo
+
+
+def fingerprint_from(value):
+    """
+    Returns a hashable fingerprint of the values of an object, which is used to key the `InversionCache`.
+
+    NumPy arrays (including those of **PyAutoArray** structures, like a `Grid2D` and its `over_sample_size`) are
+    fingerprinted by their shape, data type and a hash of their values, and other objects (e.g. a mesh) by their
+    class and the fingerprints of their attributes.
+
+    A `TypeError` is raised for values which cannot be fingerprinted (e.g. JAX tracers).
+
+    Parameters
+    ----------
+    value
+        The object whose values are fingerprinted.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (tuple, list)):
+        return tuple(fingerprint_from(entry) for entry in value)
+
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+
+        return (
+            array.shape,
+            array.dtype.str,
+            hashlib.blake2b(array.view(np.uint8), digest_size=16).digest(),
+        )
+
+    array = getattr(value, "array", None)
+
+    if isinstance(array, np.ndarray):
+        return (
+            type(value).__name__,
+            fingerprint_from(array),
+            fingerprint_from(getattr(value, "over_sample_size", None)),
+        )
+
+    if hasattr(value, "__dict__"):
+        return (
+            type(value).__name__,
+            tuple(
+                (name, fingerprint_from(attribute))
+                for name, attribute in sorted(vars(value).items())
+            ),
+        )
+
+    raise TypeError(f"Cannot fingerprint an object of type {type(value)}.")
+
+
+class InversionCache:
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        A bounded least-recently-used (LRU) cache of the matrices of a pixelization's inversion which do not change
+        between calls of the likelihood function (see the module docstring).
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of values stored, where the least recently used value is removed when it is exceeded.
+            If not input, it is loaded from the `inversion` section of the `general.yaml` config.
+        """
+        self._maxsize = maxsize
+
+        self.value_dict = OrderedDict()
+        self.object_dict = OrderedDict()
+        self.total_identities = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        """
+        The cached matrices are not pickled (e.g. when an `Analysis` is sent to the processes of a parallel
+        non-linear search), because they may use a lot of memory and are recomputed on the first call.
+        """
+        state = self.__dict__.copy()
+
+        state["value_dict"] = OrderedDict()
+        state["object_dict"] = OrderedDict()
+
+        return state
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return conf.instance["general"]["inversion"]["invariant_cache_size"]
+
+        return self._maxsize
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache in the same format as `functools.lru_cache`.
+        """
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self.value_dict),
+        )
+
+    def cache_clear(self):
+        """
+        Removes every value from the cache and resets its statistics.
+        """
+        self.value_dict.clear()
+        self.object_dict.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    def value_from(self, key, func: Callable):
+        """
+        Returns the value of a key, computing it via `func` and caching it if it is not in the cache.
+        """
+        if key in self.value_dict:
+            self.hits += 1
+            self.value_dict.move_to_end(key)
+            return self.value_dict[key]
+
+        self.misses += 1
+
+        value = func()
+
+        self.value_dict[key] = value
+
+        while len(self.value_dict) > self.maxsize:
+            self.value_dict.popitem(last=False)
+
+        return value
+
+    def identity_from(self, obj) -> int:
+        """
+        Returns an integer identifying an object which is fixed during a model-fit (e.g. the PSF of the dataset), which
+        is used to key the cache instead of fingerprinting its values.
+
+        The object is stored by the cache with its identity, so that its `id` cannot be reused by a different object.
+        At most `maxsize` objects are stored, with the least recently used removed first. An object which is input
+        again after it is removed is given a new identity, such that values cached with the identity of a removed
+        object (whose `id` may since have been reused) are never loaded.
+        """
+        if id(obj) in self.object_dict:
+            self.object_dict.move_to_end(id(obj))
+
+            return self.object_dict[id(obj)][1]
+
+        identity = self.total_identities
+        self.total_identities += 1
+
+        self.object_dict[id(obj)] = (obj, identity)
+        self.object_dict.move_to_end(id(obj))
+
+        while len(self.object_dict) > self.maxsize:
+            self.object_dict.popitem(last=False)
+
+        return identity
+
+    def mapper_key_from(
+        self,
+        mesh: aa.AbstractMesh,
+        source_plane_data_grid: aa.Grid2D,
+        source_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        adapt_data: Optional[aa.Array2D],
+        border_relocator: Optional[aa.BorderRelocator],
+        settings: aa.Settings,
+    ) -> Optional[tuple]:
+        """
+        Returns the key of a `Mapper` in the cache, which fingerprints every input the `Mapper` is computed from.
+
+        Returns `None` if an input cannot be fingerprinted, in which case the `Mapper` is not cached.
+
+        Parameters
+        ----------
+        mesh
+            The mesh of the pixelization (e.g. `Delaunay`), which is fingerprinted by its class and parameters.
+        source_plane_data_grid
+            The data-grid of the `Mapper`, which in **PyAutoGalaxy** is the dataset's `pixelization` grid.
+        source_plane_mesh_grid
+            The mesh-grid of the `Mapper`, which comes from the `adapt_images`.
+        adapt_data
+            The adapt image of the galaxy the pixelization belongs to.
+        border_relocator
+            The border relocator of the dataset, which is fixed during a model-fit.
+        settings
+            The settings of the inversion (e.g. whether mixed precision is used).
+        """
+        try:
+            return (
+                fingerprint_from(mesh),
+                fingerprint_from(source_plane_data_grid),
+                fingerprint_from(source_plane_mesh_grid),
+                fingerprint_from(adapt_data),
+                self.identity_from(border_relocator),
+                fingerprint_from(settings),
+            )
+        except TypeError:
+            return None
+
+    def mapper_from(
+        self,
+        key: tuple,
+        func: Callable,
+        regularization: Optional[aa.AbstractRegularization],
+    ) -> aa.Mapper:
+        """
+        Returns the `Mapper` of a key, computing it via `func` if it is not in the cache.
+
+        A cached `Mapper` is shallow copied with the input `regularization`, so that the matrices it has already
+        computed (e.g. its `mapping_matrix`) are reused, whereas those which depend on the regularization (e.g. the
+        `regularization_matrix`) are computed for the input regularization.
+
+        Parameters
+        ----------
+        key
+            The key of the `Mapper`, computed via `mapper_key_from`.
+        func
+            Computes the `Mapper` if it is not in the cache.
+        regularization
+            The regularization scheme of the `Mapper`, which may change between calls of the likelihood function.
+        """
+        hits = self.hits
+
+        mapper = self.value_from(key=("mapper", key), func=func)
+
+        if self.hits == hits:
+            return mapper
+
+        mapper = copy.copy(mapper)
+        mapper.regularization = regularization
+
+        return mapper
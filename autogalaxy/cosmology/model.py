@@ -11,7 +11,22 @@ subclass initialized with Planck 2015 parameter values.
 All methods accept an `xp` keyword argument (defaulting to `numpy`) so they can be traced by JAX when
 automatic differentiation or GPU acceleration is required.
 """
+from collections import OrderedDict
 import numpy as np
+from typing import Optional, Tuple
+
+from autogalaxy.cosmology.redshift_cache import cached_by_redshift
+
+# The maximum redshift and the redshift spacing of the table of the cumulative comoving distance integral used by
+# `FlatLambdaCDM.angular_diameter_distance_kpc_z1z2`. With cubic Hermite interpolation, distances interpolated from
+# the table have a relative error below 1e-8 compared to exact integration.
+distance_table_z_max = 20.0
+distance_table_dz = 0.005
+
+# The comoving distance tables of the most recently used cosmological parameters, which are shared by every cosmology
+# with the same parameters (e.g. the `Planck15` instances created by the dark matter mass-concentration functions).
+_comoving_distance_table_dict = OrderedDict()
+_comoving_distance_table_maxsize = 16
 
 
 class LensingCosmology:
@@ -35,6 +50,17 @@ class LensingCosmology:
     subclass.
     """
 
+    def _parameters_key(self) -> Tuple:
+        """
+        The parameters of the cosmology as a tuple of floats, used as part of the key of values cached by the
+        `cached_by_redshift` decorator (see `autogalaxy.cosmology.redshift_cache`).
+
+        Cosmologies which do not define their parameters raise a `TypeError`, meaning their values are not cached.
+        """
+        raise TypeError(
+            f"The cosmology {type(self).__name__} does not define a parameters key."
+        )
+
     def arcsec_per_kpc_proper(self, z: float, xp=np) -> float:
         """
         Angular separation in arcsec corresponding to 1 proper kpc at redshift z.
@@ -69,6 +95,7 @@ class LensingCosmology:
 
         return angular_diameter_distance_kpc / xp.asarray(206264.806247)
 
+    @cached_by_redshift
     def arcsec_per_kpc_from(self, redshift: float, xp=np) -> float:
         """
         Angular separation in arcsec corresponding to a proper kpc at redshift `z`.
@@ -79,6 +106,7 @@ class LensingCosmology:
         """
         return self.arcsec_per_kpc_proper(z=redshift, xp=xp)
 
+    @cached_by_redshift
     def kpc_per_arcsec_from(self, redshift: float, xp=np) -> float:
         """
         Separation in transverse proper kpc corresponding to an arcsec at redshift `z`.
@@ -150,6 +178,7 @@ class LensingCosmology:
         """
         return self.angular_diameter_distance_kpc_z1z2(redshift_0, redshift_1, xp=xp)
 
+    @cached_by_redshift
     def cosmic_average_density_from(self, redshift: float, xp=np):
         """
         Critical density of the Universe at redshift z in units of solar masses,
@@ -165,6 +194,7 @@ class LensingCosmology:
         kpc_per_arcsec = self.kpc_per_arcsec_from(redshift, xp=xp)
         return rho_kpc3 * kpc_per_arcsec**3
 
+    @cached_by_redshift
     def cosmic_average_density_solar_mass_per_kpc3_from(
         self,
         redshift: float,
@@ -208,6 +238,7 @@ class LensingCosmology:
 
         return rho_crit
 
+    @cached_by_redshift
     def critical_density(self, z: float, xp=np):
         """
         Critical density of the Universe at redshift z, returned in Msun / kpc^3.
@@ -243,6 +274,7 @@ class LensingCosmology:
         # rho_c = 3 H(z)^2 / (8 pi G)  [Msun / kpc^3]
         return (xp.asarray(3.0) * Hz**2) / (xp.asarray(8.0) * xp.pi * G)
 
+    @cached_by_redshift
     def critical_surface_density_between_redshifts_from(
         self,
         redshift_0: float,
@@ -265,6 +297,7 @@ class LensingCosmology:
 
         return sigma_crit_kpc2 * kpc_per_arcsec**2.0
 
+    @cached_by_redshift
     def critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
         self,
         redshift_0: float,
@@ -312,6 +345,7 @@ class LensingCosmology:
 
         return xp.where(D_ls_kpc == xp.asarray(0.0), xp.asarray(np.inf), sigma)
 
+    @cached_by_redshift
     def scaling_factor_between_redshifts_from(
         self,
         redshift_0: float,
@@ -559,9 +593,19 @@ class FlatLambdaCDM(LensingCosmology):
         z2: float,
         n_steps: int = 8193,  # odd by default
         xp=np,
+        use_distance_table: bool = True,
     ):
         """
-        D_A(z1,z2) in kpc for flat wCDM using Simpson's rule.
+        D_A(z1,z2) in kpc for flat wCDM.
+
+        The comoving distance integral of 1/E(z) between the two redshifts is interpolated from the table of its
+        cumulative values computed once per cosmology by `comoving_distance_table_from`, so that every distance
+        costs O(1) operations. Distances interpolated from the table have a relative error below 1e-8 compared to
+        exact integration.
+
+        The integral is instead computed with Simpson's rule on `n_steps` points if `use_distance_table=False`, if
+        either redshift is outside the table or if the cosmological parameters are JAX tracers (e.g. because they
+        are free parameters of a model being fitted).
 
         Includes:
         - photons via Tcmb0
@@ -573,16 +617,44 @@ class FlatLambdaCDM(LensingCosmology):
         - Flat universe: Omega_k = 0
         - Dark energy equation of state constant w0
         """
-        # Ensure odd number of samples for Simpson (safe: n_steps is a Python int)
-        if (n_steps % 2) == 0:
-            n_steps += 1
-
         z1a = xp.asarray(z1)
         z2a = xp.asarray(z2)
         same = z1a == z2a
 
         c_km_s = xp.asarray(299792.458)
 
+        H0 = xp.asarray(self.H0)
+
+        table = self.comoving_distance_table_from() if use_distance_table else None
+
+        if table is None:
+            integral = self._comoving_distance_integral_via_simpson_from(
+                z1=z1a, z2=z2a, n_steps=n_steps, xp=xp
+            )
+        else:
+            integral = self._comoving_distance_integral_via_table_from(
+                z1=z1a, z2=z2a, table=table, n_steps=n_steps, xp=xp
+            )
+
+        Dc_Mpc = (c_km_s / H0) * integral
+        Da_Mpc = Dc_Mpc / (xp.asarray(1.0) + z2a)
+        Da_kpc = Da_Mpc * xp.asarray(1.0e3)
+
+        return xp.where(same, xp.asarray(0.0), Da_kpc)
+
+    def _comoving_distance_integral_via_simpson_from(
+        self, z1, z2, n_steps: int = 8193, xp=np
+    ):
+        """
+        The integral of 1/E(z) from z1 to z2 computed using Simpson's rule on `n_steps` points.
+        """
+        z1a = xp.asarray(z1)
+        z2a = xp.asarray(z2)
+
+        # Ensure odd number of samples for Simpson (safe: n_steps is a Python int)
+        if (n_steps % 2) == 0:
+            n_steps += 1
+
         H0 = xp.asarray(self.H0)
         h = H0 / xp.asarray(100.0)
 
@@ -631,13 +703,138 @@ class FlatLambdaCDM(LensingCosmology):
         z_grid = xp.linspace(z1a, z2a, n_steps)
         integrand = xp.asarray(1.0) / E_local(z_grid)
 
-        integral = self._simpson_1d(integrand, z_grid, xp=xp)
+        return self._simpson_1d(integrand, z_grid, xp=xp)
 
-        Dc_Mpc = (c_km_s / H0) * integral
-        Da_Mpc = Dc_Mpc / (xp.asarray(1.0) + z2a)
-        Da_kpc = Da_Mpc * xp.asarray(1.0e3)
+    def _parameters_key(self) -> Tuple:
+        """
+        The cosmological parameters which set E(z), as a tuple of floats used to check that a cached comoving
+        distance table was computed for the current parameters and as part of the key of the values cached by the
+        `cached_by_redshift` decorator.
 
-        return xp.where(same, xp.asarray(0.0), Da_kpc)
+        Raises a `TypeError` if the parameters are JAX tracers, which cannot be converted to floats.
+        """
+        return (
+            float(self.H0),
+            float(self.Om0),
+            float(self.Tcmb0),
+            float(self.Neff),
+            tuple(float(m_nu) for m_nu in np.atleast_1d(self.m_nu)),
+            float(self.w0),
+        )
+
+    def comoving_distance_table_from(
+        self,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Returns a table of the cumulative integral of 1/E(z) from redshift zero, on a uniform grid of redshifts
+        from zero to `distance_table_z_max` with spacing `distance_table_dz`, as a tuple of the redshifts, the
+        integral at every redshift and 1/E(z) at every redshift.
+
+        The integral over every interval of the grid is computed using 5 point Gauss-Legendre quadrature, which is
+        exact to double precision. The table is computed once for every set of cosmological parameters and is
+        shared by all cosmologies with these parameters.
+
+        Returns `None` if the cosmological parameters are JAX tracers, in which case distances are computed by
+        exact integration.
+        """
+        try:
+            key = self._parameters_key()
+        except TypeError:
+            return None
+
+        if key in _comoving_distance_table_dict:
+            _comoving_distance_table_dict.move_to_end(key)
+            return _comoving_distance_table_dict[key]
+
+        total_intervals = int(round(distance_table_z_max / distance_table_dz))
+
+        z_nodes = np.linspace(0.0, distance_table_z_max, total_intervals + 1)
+
+        gauss_nodes, gauss_weights = np.polynomial.legendre.leggauss(5)
+
+        z_gauss = z_nodes[:-1, None] + 0.5 * distance_table_dz * (
+            gauss_nodes[None, :] + 1.0
+        )
+
+        integral_intervals = (
+            0.5
+            * distance_table_dz
+            * np.sum(gauss_weights[None, :] / self.E(z_gauss), axis=1)
+        )
+
+        table = (
+            z_nodes,
+            np.concatenate(([0.0], np.cumsum(integral_intervals))),
+            1.0 / self.E(z_nodes),
+        )
+
+        _comoving_distance_table_dict[key] = table
+
+        while len(_comoving_distance_table_dict) > _comoving_distance_table_maxsize:
+            _comoving_distance_table_dict.popitem(last=False)
+
+        return table
+
+    @staticmethod
+    def _comoving_distance_integral_via_interpolation_from(z, table, xp=np):
+        """
+        The integral of 1/E(z) from redshift zero to z, interpolated from a comoving distance table using cubic
+        Hermite interpolation, which uses the tabulated values of 1/E(z) as the derivative of the integral.
+        """
+        z_nodes, integral_nodes, inverse_E_nodes = table
+
+        z_scaled = z / distance_table_dz
+
+        index = xp.clip(xp.floor(z_scaled).astype(int), 0, z_nodes.shape[0] - 2)
+
+        t = z_scaled - index
+
+        integral_nodes = xp.asarray(integral_nodes)
+        inverse_E_nodes = xp.asarray(inverse_E_nodes)
+
+        return (
+            (2.0 * t**3 - 3.0 * t**2 + 1.0) * integral_nodes[index]
+            + (t**3 - 2.0 * t**2 + t) * distance_table_dz * inverse_E_nodes[index]
+            + (-2.0 * t**3 + 3.0 * t**2) * integral_nodes[index + 1]
+            + (t**3 - t**2) * distance_table_dz * inverse_E_nodes[index + 1]
+        )
+
+    def _comoving_distance_integral_via_table_from(
+        self, z1, z2, table, n_steps: int = 8193, xp=np
+    ):
+        """
+        The integral of 1/E(z) from z1 to z2 interpolated from a comoving distance table, which falls back to
+        Simpson's rule if either redshift is outside the table.
+
+        When using JAX, the two calculations are selected via `jax.lax.cond`, so that only one is performed.
+        """
+        in_table = xp.all(
+            (z1 >= 0.0)
+            & (z1 <= distance_table_z_max)
+            & (z2 >= 0.0)
+            & (z2 <= distance_table_z_max)
+        )
+
+        def integral_via_table():
+            return self._comoving_distance_integral_via_interpolation_from(
+                z=z2, table=table, xp=xp
+            ) - self._comoving_distance_integral_via_interpolation_from(
+                z=z1, table=table, xp=xp
+            )
+
+        def integral_via_simpson():
+            return self._comoving_distance_integral_via_simpson_from(
+                z1=z1, z2=z2, n_steps=n_steps, xp=xp
+            )
+
+        if xp is np:
+            if in_table:
+                return integral_via_table()
+            return integral_via_simpson()
+
+        import jax
+
+        return jax.lax.cond(in_table, integral_via_table, integral_via_simpson)
 
     def E(self, z: float, xp=np):
         """
@@ -0,0 +1,171 @@
+"""
+A cache of the quantities a cosmology computes at fixed redshifts, for example the kpc per arcsecond at the redshift
+of a lens galaxy or the critical surface density between the redshifts of a lens and source galaxy.
+
+In a model-fit the redshifts of the galaxies are usually fixed, yet these quantities were recomputed every time the
+likelihood function was called, for example by the dark matter profiles which convert a virial mass to lensing units
+(e.g. `NFWMCRLudlow`, `gNFWVirialMassConcSph` and `mcr_util.kappa_s_and_scale_radius_for_duffy`).
+
+Methods of `LensingCosmology` decorated with `cached_by_redshift` store their value in a bounded least-recently-used
+(LRU) cache, keyed on the method, the parameters of the cosmology and the redshifts input into the method:
+
+- When using NumPy the cache is transparent, returning the same values as the method.
+- When using JAX with redshifts and cosmological parameters which are not traced (e.g. fixed redshifts), the cached
+  NumPy value is returned as a constant, which is folded into the compiled function.
+- When using JAX with traced redshifts or cosmological parameters (e.g. because they are free parameters of the
+  model), the cache is bypassed.
+
+The cache can be filled before a model-fit begins via `prewarm`, which `Analysis.modify_before_fit` calls with the
+fixed redshifts of the galaxies in the model.
+"""
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from itertools import combinations
+import numpy as np
+from typing import List, Optional
+
+from autoconf import conf
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class RedshiftCache:
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        A bounded least-recently-used (LRU) cache of the quantities a cosmology computes at fixed redshifts.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of values stored, where the least recently used value is removed when it is exceeded.
+            If not input, it is loaded from the `cosmology` section of the `general.yaml` config.
+        """
+        self._maxsize = maxsize
+
+        self.value_dict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return conf.instance["general"]["cosmology"]["cache_size"]
+
+        return self._maxsize
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache in the same format as `functools.lru_cache`.
+        """
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self.value_dict),
+        )
+
+    def cache_clear(self):
+        """
+        Removes every value from the cache and resets its statistics.
+        """
+        self.value_dict.clear()
+
+        self.hits = 0
+        self.misses = 0
+
+    def value_from(self, key, func):
+        """
+        Returns the value of a key, computing it via `func` and caching it if it is not in the cache.
+        """
+        if key in self.value_dict:
+            self.hits += 1
+            self.value_dict.move_to_end(key)
+            return self.value_dict[key]
+
+        self.misses += 1
+
+        value = func()
+
+        self.value_dict[key] = value
+
+        while len(self.value_dict) > self.maxsize:
+            self.value_dict.popitem(last=False)
+
+        return value
+
+    @staticmethod
+    def prewarm(cosmology, redshift_list: List[float]):
+        """
+        Computes and caches the quantities used by dark matter profiles and multi-plane ray-tracing for every
+        redshift, every pair of redshifts and every triple of redshifts in `redshift_list`, so that they are
+        not computed when the likelihood function is first called (or compiled by JAX).
+
+        Parameters
+        ----------
+        cosmology
+            The cosmology whose quantities are cached.
+        redshift_list
+            The redshifts of the galaxies (e.g. the fixed redshifts of the galaxies of a model).
+        """
+        redshift_list = sorted(set(float(redshift) for redshift in redshift_list))
+
+        for redshift in redshift_list:
+            cosmology.arcsec_per_kpc_from(redshift=redshift)
+            cosmology.kpc_per_arcsec_from(redshift=redshift)
+            cosmology.critical_density(redshift)
+            cosmology.cosmic_average_density_from(redshift)
+
+        for redshift_0, redshift_1 in combinations(redshift_list, 2):
+            cosmology.critical_surface_density_between_redshifts_from(
+                redshift_0=redshift_0, redshift_1=redshift_1
+            )
+
+        for redshift_0, redshift_1, redshift_final in combinations(redshift_list, 3):
+            cosmology.scaling_factor_between_redshifts_from(
+                redshift_0=redshift_0,
+                redshift_1=redshift_1,
+                redshift_final=redshift_final,
+            )
+
+
+redshift_cache = RedshiftCache()
+
+
+def cached_by_redshift(func):
+    """
+    Caches the values of a `LensingCosmology` method in the `redshift_cache`, keyed on the name of the method, the
+    parameters of the cosmology and the redshifts input into the method (see the module docstring).
+
+    The value is always computed using NumPy and returned via `xp.asarray` when using JAX, therefore the cache is
+    bypassed for inputs which cannot be converted to floats (e.g. JAX tracers or arrays of redshifts).
+    """
+    argument_names = func.__code__.co_varnames[1 : func.__code__.co_argcount]
+
+    @wraps(func)
+    def wrapper(cosmology, *args, xp=np, **kwargs):
+        try:
+            key = (
+                func.__name__,
+                cosmology._parameters_key(),
+                tuple(
+                    sorted(
+                        (name, float(value))
+                        for name, value in list(zip(argument_names, args))
+                        + list(kwargs.items())
+                    )
+                ),
+            )
+        except TypeError:
+            return func(cosmology, *args, xp=xp, **kwargs)
+
+        value = redshift_cache.value_from(
+            key=key, func=lambda: func(cosmology, *args, xp=np, **kwargs)
+        )
+
+        if xp is np:
+            return value
+
+        return xp.asarray(value)
+
+    return wrapper
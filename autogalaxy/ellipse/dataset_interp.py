@@ -6,6 +6,74 @@ from autoconf import cached_property
 import autoarray as aa
 
 
+def bilinear_interp_from(
+    values: np.ndarray,
+    points: np.ndarray,
+    points_interp: Tuple[np.ndarray, np.ndarray],
+    xp=np,
+) -> np.ndarray:
+    """
+    Returns the bilinear interpolation of one or more 2D arrays of values at the input points, following the same
+    conventions as the `scipy.interpolate.RegularGridInterpolator` objects of the `DatasetInterp` class (linear
+    interpolation where points outside the grid have a value of zero).
+
+    Unlike the scipy interpolators, this function uses the array module `xp`, such that it can be called with
+    JAX arrays and therefore compiled via `jax.jit` and vectorized via `jax.vmap`.
+
+    Parameters
+    ----------
+    values
+        The values which are interpolated, of shape [..., total_points_interp_0, total_points_interp_1], where any
+        leading dimensions (e.g. stacked data and noise-map values) are interpolated together.
+    points
+        The 2D array of shape [total_points, 2] of points where the values are interpolated, in the same order as the
+        `points_interp`.
+    points_interp
+        The uniformly spaced 1D coordinates of the values along their final two dimensions (see
+        `DatasetInterp.points_interp`).
+    xp
+        The array module (e.g. `numpy` or `jax.numpy`) used to perform the interpolation.
+
+    Returns
+    -------
+    The interpolated values, of shape [..., total_points].
+    """
+    total_points_0 = values.shape[-2]
+    total_points_1 = values.shape[-1]
+
+    points_0 = xp.asarray(points_interp[0])
+    points_1 = xp.asarray(points_interp[1])
+
+    scale_0 = points_interp[0][1] - points_interp[0][0]
+    scale_1 = points_interp[1][1] - points_interp[1][0]
+
+    index_0 = xp.clip(
+        xp.floor((points[:, 0] - points_interp[0][0]) / scale_0), 0, total_points_0 - 2
+    ).astype("int32")
+    index_1 = xp.clip(
+        xp.floor((points[:, 1] - points_interp[1][0]) / scale_1), 0, total_points_1 - 2
+    ).astype("int32")
+
+    weight_0 = (points[:, 0] - points_0[index_0]) / scale_0
+    weight_1 = (points[:, 1] - points_1[index_1]) / scale_1
+
+    interpolated = (
+        (1.0 - weight_0) * (1.0 - weight_1) * values[..., index_0, index_1]
+        + (1.0 - weight_0) * weight_1 * values[..., index_0, index_1 + 1]
+        + weight_0 * (1.0 - weight_1) * values[..., index_0 + 1, index_1]
+        + weight_0 * weight_1 * values[..., index_0 + 1, index_1 + 1]
+    )
+
+    inside = (
+        (points[:, 0] >= points_interp[0][0])
+        & (points[:, 0] <= points_interp[0][-1])
+        & (points[:, 1] >= points_interp[1][0])
+        & (points[:, 1] <= points_interp[1][-1])
+    )
+
+    return xp.where(inside, interpolated, 0.0)
+
+
 class DatasetInterp:
     def __init__(self, dataset: aa.Imaging):
         """
@@ -85,3 +153,41 @@ class DatasetInterp:
             bounds_error=False,
             fill_value=0.0,
         )
+
+    @cached_property
+    def values_stack(self) -> np.ndarray:
+        """
+        The mask, data and noise-map stacked into a single array of shape [3, total_y_pixels, total_x_pixels], which
+        are interpolated together by `mask_data_and_noise_map_interp_from`.
+        """
+        return np.stack(
+            [
+                np.float64(self.dataset.data.mask),
+                np.float64(self.dataset.data.native),
+                np.float64(self.dataset.noise_map.native),
+            ]
+        )
+
+    def mask_data_and_noise_map_interp_from(
+        self, points: np.ndarray, xp=np
+    ) -> np.ndarray:
+        """
+        Returns the mask, data and noise-map interpolated at the input points, as an array of shape [3, total_points].
+
+        The values are the same as those of the `mask_interp`, `data_interp` and `noise_map_interp` interpolators,
+        but are computed via `bilinear_interp_from` using the array module `xp`, such that they can be computed
+        with JAX.
+
+        Parameters
+        ----------
+        points
+            The 2D array of shape [total_points, 2] of points where the values are interpolated.
+        xp
+            The array module (e.g. `numpy` or `jax.numpy`) used to perform the interpolation.
+        """
+        return bilinear_interp_from(
+            values=xp.asarray(self.values_stack),
+            points=points,
+            points_interp=self.points_interp,
+            xp=xp,
+        )
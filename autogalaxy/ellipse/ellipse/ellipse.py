@@ -163,14 +163,16 @@ class Ellipse(EllProfile):
 
         angles_from_x0 = self.angles_from_x0_from(pixel_scale=pixel_scale, n_i=n_i)
 
+        angle_radians = self.angle_radians()
+        minor_axis = self.minor_axis
+
         return np.divide(
-            self.major_axis * self.minor_axis,
+            self.major_axis * minor_axis,
             np.sqrt(
                 np.add(
                     self.major_axis**2.0
-                    * np.sin(angles_from_x0 - self.angle_radians()) ** 2.0,
-                    self.minor_axis**2.0
-                    * np.cos(angles_from_x0 - self.angle_radians()) ** 2.0,
+                    * np.sin(angles_from_x0 - angle_radians) ** 2.0,
+                    minor_axis**2.0 * np.cos(angles_from_x0 - angle_radians) ** 2.0,
                 )
             ),
         )
@@ -256,11 +258,74 @@ class Ellipse(EllProfile):
         The (y,x) coordinates of the points on the ellipse.
         """
 
-        x = self.x_from_major_axis_from(pixel_scale=pixel_scale, n_i=n_i)
-        y = self.y_from_major_axis_from(pixel_scale=pixel_scale, n_i=n_i)
+        angles_from_x0 = self.angles_from_x0_from(pixel_scale=pixel_scale, n_i=n_i)
+        ellipse_radii_from_major_axis = self.ellipse_radii_from_major_axis_from(
+            pixel_scale=pixel_scale, n_i=n_i
+        )
+
+        x = ellipse_radii_from_major_axis * np.cos(angles_from_x0) + self.centre[1]
+        y = (
+            -1.0 * (ellipse_radii_from_major_axis * np.sin(angles_from_x0))
+            - self.centre[0]
+        )
 
         idx = np.logical_or(np.isnan(x), np.isnan(y))
         if np.sum(idx) > 0.0:
             raise NotImplementedError()
 
         return np.stack(arrays=(y, x), axis=-1)
+
+    def points_and_weights_from_major_axis_from(
+        self, pixel_scale: float, total_points_max: int = 500, xp=np
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (y,x) coordinates of the points on the ellipse as a fixed length array, alongside an array of
+        weights which are 1.0 for the points that are on the ellipse and 0.0 for the remaining padded points.
+
+        The points with a weight of 1.0 are the same as those returned by `points_from_major_axis_from`
+        (with `n_i=0`), however their number depends on the `major_axis` and therefore cannot be traced by JAX.
+        Padding them to `total_points_max - 1` points means the shape of the arrays does not depend on the ellipse,
+        such that the points of many ellipses can be stacked, compiled via `jax.jit` and vectorized via `jax.vmap`.
+
+        Parameters
+        ----------
+        pixel_scale
+            The pixel scale of the data that the ellipse is fitted to and interpolated over.
+        total_points_max
+            The maximum total number of points on the ellipse (see `total_points_from`), which sets the fixed length
+            of the arrays.
+        xp
+            The array module (e.g. `numpy` or `jax.numpy`) used to compute the points.
+
+        Returns
+        -------
+        The (y,x) coordinates of the points on the ellipse and their weights.
+        """
+        circular_radius_pixels = (
+            2.0 * xp.pi * xp.sqrt((2.0 * self.major_axis**2.0) / 2.0) / pixel_scale
+        )
+
+        total_points = xp.minimum(
+            total_points_max, xp.floor(xp.round(circular_radius_pixels, 1))
+        )
+
+        index = xp.arange(total_points_max - 1)
+
+        angles_from_x0 = index * (2.0 * xp.pi / xp.maximum(total_points - 1.0, 1.0))
+
+        weights = xp.where(index < total_points - 1.0, 1.0, 0.0)
+
+        axis_ratio = self.axis_ratio(xp=xp)
+        angle_radians = self.angle_radians(xp=xp)
+
+        minor_axis = self.major_axis * xp.sqrt(1.0 - (1.0 - axis_ratio**2.0))
+
+        ellipse_radii = (self.major_axis * minor_axis) / xp.sqrt(
+            self.major_axis**2.0 * xp.sin(angles_from_x0 - angle_radians) ** 2.0
+            + minor_axis**2.0 * xp.cos(angles_from_x0 - angle_radians) ** 2.0
+        )
+
+        x = ellipse_radii * xp.cos(angles_from_x0) + self.centre[1]
+        y = -1.0 * (ellipse_radii * xp.sin(angles_from_x0)) - self.centre[0]
+
+        return xp.stack((y, x), axis=-1), weights
@@ -71,7 +71,7 @@ class EllipseMultipole:
         return angle
 
     def points_perturbed_from(
-        self, pixel_scale, points, ellipse: Ellipse, n_i: int = 0
+        self, pixel_scale, points, ellipse: Ellipse, n_i: int = 0, xp=np
     ) -> np.ndarray:
         """
         Returns the (y,x) coordinates of the input points, which are perturbed by the multipole of the ellipse.
@@ -84,35 +84,42 @@ class EllipseMultipole:
             The (y,x) coordinates of the ellipse that are perturbed by the multipole.
         ellipse
             The ellipse that is perturbed by the multipole, which is used to compute the angles of the ellipse.
+        xp
+            The array module (e.g. `numpy` or `jax.numpy`) used to compute the perturbed points.
 
         Returns
         -------
         The (y,x) coordinates of the input points, which are perturbed by the multipole.
         """
         symmetry = 360 / self.m
-        k_orig, phi_orig = multipole_k_m_and_phi_m_from(self.multipole_comps, self.m)
+        k_orig, phi_orig = multipole_k_m_and_phi_m_from(
+            self.multipole_comps, self.m, xp=xp
+        )
         comps_adjusted = multipole_comps_from(
             k_orig,
             symmetry
             - 2 * phi_orig
-            + (symmetry - (ellipse.angle() - phi_orig)),  # Re-align light to match mass
+            + (
+                symmetry - (ellipse.angle(xp=xp) - phi_orig)
+            ),  # Re-align light to match mass
             self.m,
+            xp=xp,
         )
 
         # 1) compute cartesian (polar) angle
-        theta = np.arctan2(points[:, 0], points[:, 1])  # <- true polar angle
+        theta = xp.arctan2(points[:, 0], points[:, 1])  # <- true polar angle
 
         # 2) multipole in that same frame
-        delta_theta = self.m * (theta - ellipse.angle_radians())
-        radial = comps_adjusted[1] * np.cos(delta_theta) + comps_adjusted[0] * np.sin(
+        delta_theta = self.m * (theta - ellipse.angle_radians(xp=xp))
+        radial = comps_adjusted[1] * xp.cos(delta_theta) + comps_adjusted[0] * xp.sin(
             delta_theta
         )
 
         # 3) perturb along the true radial direction
-        x = points[:, 1] + radial * np.cos(theta)
-        y = points[:, 0] + radial * np.sin(theta)
+        x = points[:, 1] + radial * xp.cos(theta)
+        y = points[:, 0] + radial * xp.sin(theta)
 
-        return np.stack((y, x), axis=-1)
+        return xp.stack((y, x), axis=-1)
 
 
 class EllipseMultipoleScaled(EllipseMultipole):
@@ -132,6 +139,9 @@ class EllipseMultipoleScaled(EllipseMultipole):
         its `true' value for a multipole at the given major axis value, which is then used to perturb an ellipse
         as per the normal `EllipseMultipole' class and below.
 
+        The conversion is performed when the multipole perturbs an ellipse, using the array module of the
+        perturbation (e.g. `jax.numpy`), such that the scaled multipole components can be traced by JAX.
+
         The multipole is added to the (y,x) coordinates of an ellipse that are already computed via the `Ellipse` class.
 
         The addition of the multipole is performed as follows:
@@ -152,20 +162,36 @@ class EllipseMultipoleScaled(EllipseMultipole):
         """
 
         self.scaled_multipole_comps = scaled_multipole_comps
+        self.major_axis = major_axis
+        self.m = m
+
+    def specific_multipole_comps_from(self, xp=np) -> Tuple[float, float]:
+        """
+        Returns the multipole components of this multipole at its `major_axis`, computed by converting the scaled
+        multipole components to a normalization `k`, multiplying it by the `major_axis` and converting back.
+
+        Parameters
+        ----------
+        xp
+            The array module (e.g. `numpy` or `jax.numpy`) used to perform the conversion.
+        """
         k, phi = multipole_k_m_and_phi_m_from(
-            multipole_comps=scaled_multipole_comps, m=m
+            multipole_comps=self.scaled_multipole_comps, m=self.m, xp=xp
         )
-        k_adjusted = k * major_axis
+        k_adjusted = k * self.major_axis
 
-        specific_multipole_comps = multipole_comps_from(k_adjusted, phi, m)
+        return multipole_comps_from(k_adjusted, phi, self.m, xp=xp)
 
-        super().__init__(m, specific_multipole_comps)
+    @property
+    def specific_multipole_comps(self) -> Tuple[float, float]:
+        return self.specific_multipole_comps_from()
 
-        self.specific_multipole_comps = specific_multipole_comps
-        self.m = m
+    @property
+    def multipole_comps(self) -> Tuple[float, float]:
+        return self.specific_multipole_comps
 
     def points_perturbed_from(
-        self, pixel_scale, points, ellipse: Ellipse, n_i: int = 0
+        self, pixel_scale, points, ellipse: Ellipse, n_i: int = 0, xp=np
     ) -> np.ndarray:
         """
         Returns the (y,x) coordinates of the input points, which are perturbed by the multipole of the ellipse.
@@ -178,6 +204,8 @@ class EllipseMultipoleScaled(EllipseMultipole):
             The (y,x) coordinates of the ellipse that are perturbed by the multipole.
         ellipse
             The ellipse that is perturbed by the multipole, which is used to compute the angles of the ellipse.
+        xp
+            The array module (e.g. `numpy` or `jax.numpy`) used to compute the perturbed points.
 
         Returns
         -------
@@ -185,20 +213,21 @@ class EllipseMultipoleScaled(EllipseMultipole):
         """
         symmetry = 360 / self.m
         k_orig, phi_orig = multipole_k_m_and_phi_m_from(
-            self.specific_multipole_comps, self.m
+            self.specific_multipole_comps_from(xp=xp), self.m, xp=xp
         )
         comps_adjusted = multipole_comps_from(
             k_orig,
-            symmetry - 2 * phi_orig + (symmetry - (ellipse.angle() - phi_orig)),
+            symmetry - 2 * phi_orig + (symmetry - (ellipse.angle(xp=xp) - phi_orig)),
             self.m,
+            xp=xp,
         )
 
         # 1) compute cartesian (polar) angle
-        theta = np.arctan2(points[:, 0], points[:, 1])  # <- true polar angle
+        theta = xp.arctan2(points[:, 0], points[:, 1])  # <- true polar angle
 
         # 2) multipole in that same frame
-        delta_theta = self.m * (theta - ellipse.angle_radians())
-        radial = comps_adjusted[1] * np.cos(delta_theta) + comps_adjusted[0] * np.sin(
+        delta_theta = self.m * (theta - ellipse.angle_radians(xp=xp))
+        radial = comps_adjusted[1] * xp.cos(delta_theta) + comps_adjusted[0] * xp.sin(
             delta_theta
         )
 
@@ -212,7 +241,7 @@ class EllipseMultipoleScaled(EllipseMultipole):
         #         )
 
         # 3) perturb along the true radial direction
-        x = points[:, 1] + radial * np.cos(theta)
-        y = points[:, 0] + radial * np.sin(theta)
+        x = points[:, 1] + radial * xp.cos(theta)
+        y = points[:, 0] + radial * xp.sin(theta)
 
-        return np.stack(arrays=(y, x), axis=-1)
+        return xp.stack((y, x), axis=-1)
@@ -13,7 +13,7 @@ appropriate for measuring galaxy morphology, position angles, axis ratios, and m
 directly from imaging data without fitting a parametric light profile model.
 """
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from autoconf import cached_property
 
@@ -30,6 +30,7 @@ class FitEllipse(aa.FitDataset):
         dataset: aa.Imaging,
         ellipse: Ellipse,
         multipole_list: Optional[List[EllipseMultipole]] = None,
+        interp: Optional[DatasetInterp] = None,
     ):
         """
         A fit to a `DatasetInterp` dataset, using a model image to represent the observed data and noise-map.
@@ -38,36 +39,40 @@ class FitEllipse(aa.FitDataset):
         ----------
         dataset
             The dataset containing the signal and noise-map that is fitted.
-
+        interp
+            The interpolators of the dataset's data, noise-map and mask. If not input they are created for this fit,
+            whereas inputting them (e.g. via `AnalysisEllipse`) means they are created once and shared by every fit.
         """
         super().__init__(dataset=dataset)
 
         self.ellipse = ellipse
         self.multipole_list = multipole_list
 
+        self._interp = interp
+
     @cached_property
     def interp(self) -> DatasetInterp:
         """
         Returns a class which handles the interpolation of values from the image data and noise-map, so that they
         can be mapped to each ellipse for the fit.
         """
+        if self._interp is not None:
+            return self._interp
+
         return DatasetInterp(dataset=self.dataset)
 
-    def points_from_major_axis_from(self) -> np.ndarray:
+    def points_via_n_i_from(self, n_i: int = 0) -> np.ndarray:
         """
-        Returns the (y,x) coordinates on the ellipse that are used to interpolate the data and noise-map values.
-
-        These points are computed by overlaying the ellipse over the 2D data and noise-map and computing the (y,x)
-        coordinates on the ellipse that are closest to the data points.
-
-        If multipole components are used, the points are also perturbed by the multipole components.
+        Returns the (y,x) coordinates on the ellipse, perturbed by the multipole components if they are used, where
+        `n_i` extra points are added to the ellipse (see `Ellipse.points_from_major_axis_from`).
 
-        Returns
-        -------
-        The (y,x) coordinates on the ellipse where the interpolation occurs.
+        Parameters
+        ----------
+        n_i
+            The number of extra points added to the ellipse.
         """
         points = self.ellipse.points_from_major_axis_from(
-            pixel_scale=self.dataset.pixel_scales[0],
+            pixel_scale=self.dataset.pixel_scales[0], n_i=n_i
         )
 
         if self.multipole_list is not None:
@@ -76,64 +81,91 @@ class FitEllipse(aa.FitDataset):
                     pixel_scale=self.dataset.pixel_scales[0],
                     points=points,
                     ellipse=self.ellipse,
+                    n_i=n_i,
                 )
 
-        if self.interp.mask_interp is not None:
-
-            i_total = 300
-
-            total_points_required = points.shape[0]
-
-            for i in range(1, i_total + 1):
+        return points
 
-                total_points = points.shape[0]
-                total_points_masked = np.sum(self.interp.mask_interp(points) > 0)
+    def points_from_major_axis_from(self) -> np.ndarray:
+        """
+        Returns the (y,x) coordinates on the ellipse that are used to interpolate the data and noise-map values.
 
-                if total_points_required == total_points - total_points_masked:
-                    continue
+        These points are computed by overlaying the ellipse over the 2D data and noise-map and computing the (y,x)
+        coordinates on the ellipse that are closest to the data points.
 
-                if total_points_required < total_points - total_points_masked:
+        If multipole components are used, the points are also perturbed by the multipole components.
 
-                    number_of_extra_points = (
-                        total_points - total_points_masked - total_points_required
-                    )
+        If points hit the mask, extra points are added to the ellipse until the number of points which do not hit the
+        mask is at least the number of points of the unmasked ellipse, and the points which hit the mask are removed.
 
-                    unmasked_indices = np.where(self.interp.mask_interp(points) == 0)[0]
-                    unmasked_indices = unmasked_indices[number_of_extra_points:]
+        Returns
+        -------
+        The (y,x) coordinates on the ellipse where the interpolation occurs.
+        """
+        points = self.points_via_n_i_from(n_i=0)
 
-                    points = points[unmasked_indices]
+        if self.interp.mask_interp is None:
+            return points
 
-                    continue
+        total_points_required = points.shape[0]
 
-                points = self.ellipse.points_from_major_axis_from(
-                    pixel_scale=self.dataset.pixel_scales[0], n_i=i
-                )
+        unmasked = self.interp.mask_interp(points) == 0
 
-                if self.multipole_list is not None:
-                    for multipole in self.multipole_list:
+        if np.sum(unmasked) < total_points_required:
+            points, unmasked = self.points_and_unmasked_via_extra_points_from(
+                total_points_required=total_points_required
+            )
 
-                        points = multipole.points_perturbed_from(
-                            pixel_scale=self.dataset.pixel_scales[0],
-                            points=points,
-                            ellipse=self.ellipse,
-                            n_i=i,
-                        )
+        points = points[unmasked]
 
-                if i == i_total:
+        return points[points.shape[0] - total_points_required :]
 
-                    raise ValueError(
-                        """
-                        The code has attempted to add over 300 extra points to the ellipse and still not found a set of points that
-                        do not hit the mask with the expected number of points. 
-        
-                        This is likely due to the mask being too large or a strange geometry, and the code is unable to find a
-                        set of points that do not hit the mask.
-                        """
-                    )
+    def points_and_unmasked_via_extra_points_from(
+        self, total_points_required: int, n_i_max: int = 299
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (y,x) coordinates on the ellipse with the fewest extra points (see `points_via_n_i_from`) for
+        which at least `total_points_required` points do not hit the mask, alongside a boolean array which is `True`
+        for the points which do not hit the mask.
 
-            points = points[self.interp.mask_interp(points) == 0]
+        The points of many values of `n_i` are passed to the mask interpolator together, in blocks whose size
+        doubles, such that only a few interpolator calls are required.
 
-        return points
+        Parameters
+        ----------
+        total_points_required
+            The number of points on the ellipse which must not hit the mask.
+        n_i_max
+            The maximum number of extra points added to the ellipse, above which an exception is raised.
+        """
+        n_i_start = 1
+        block_size = 8
+
+        while n_i_start <= n_i_max:
+            points_list = [
+                self.points_via_n_i_from(n_i=n_i)
+                for n_i in range(n_i_start, min(n_i_start + block_size, n_i_max + 1))
+            ]
+
+            unmasked_list = np.split(
+                self.interp.mask_interp(np.concatenate(points_list)) == 0,
+                np.cumsum([points.shape[0] for points in points_list])[:-1],
+            )
+
+            for points, unmasked in zip(points_list, unmasked_list):
+                if np.sum(unmasked) >= total_points_required:
+                    return points, unmasked
+
+            n_i_start += block_size
+            block_size *= 2
+
+        raise ValueError("""
+            The code has attempted to add over 300 extra points to the ellipse and still not found a set of points that
+            do not hit the mask with the expected number of points. 
+
+            This is likely due to the mask being too large or a strange geometry, and the code is unable to find a
+            set of points that do not hit the mask.
+            """)
 
     @cached_property
     def _points_from_major_axis(self) -> np.ndarray:
@@ -0,0 +1,322 @@
+"""
+Fit many isophotal ellipses to a 2D image dataset together, instead of creating a `FitEllipse` for every ellipse.
+
+Two routes are provided:
+
+- `log_likelihood_via_stacked_points_from`: computes the same points on every ellipse as `FitEllipse` (including the
+  extra points added to ellipses which overlap the mask) and concatenates them into one array. The data and
+  noise-map are interpolated at all points in one call of each scipy interpolator, with the mean subtraction and
+  chi-squared of every ellipse computed via segment reductions (`np.bincount`). This gives the same likelihood as
+  summing the likelihoods of each ellipse's `FitEllipse` and is used by `AnalysisEllipse` when JAX is not used.
+
+- `log_likelihood_from`: uses an array module `xp` such that the fit can be performed with JAX.
+
+`FitEllipse` fits one ellipse using variable length arrays of points and the scipy interpolators of `DatasetInterp`,
+neither of which can be traced by JAX. The `xp` route instead:
+
+1. Compute a fixed length array of (y,x) points for every ellipse, alongside weights which are 0.0 for the points
+   padding the array (see `Ellipse.points_and_weights_from_major_axis_from`).
+2. Stack the points of all ellipses and interpolate the mask, data and noise-map at all of them in one call of a
+   bilinear interpolation written with `xp` (see `DatasetInterp.mask_data_and_noise_map_interp_from`).
+3. Set the weights of points whose interpolation uses a masked pixel to 0.0, and compute each ellipse's residuals
+   and chi-squared using only the points with a weight of 1.0.
+
+The likelihood can therefore be compiled via `jax.jit` and vectorized over many samples of a model via `jax.vmap`.
+
+For ellipses which do not overlap the mask this gives the same likelihood as `FitEllipse`. For ellipses which do,
+the masked points are removed without `FitEllipse`'s extra points being added to the ellipse, as this changes the
+number of points and cannot be traced by JAX.
+"""
+import numpy as np
+from typing import List, Optional
+
+from autogalaxy.ellipse.dataset_interp import DatasetInterp
+from autogalaxy.ellipse.ellipse.ellipse import Ellipse
+from autogalaxy.ellipse.ellipse.ellipse_multipole import EllipseMultipole
+from autogalaxy.ellipse.fit_ellipse import FitEllipse
+
+
+def points_list_from(
+    interp: DatasetInterp,
+    ellipse_list: List[Ellipse],
+    multipole_lists: Optional[List[Optional[List[EllipseMultipole]]]] = None,
+) -> List[np.ndarray]:
+    """
+    Returns the (y,x) points on every ellipse in a list which are used to interpolate the data and noise-map, which
+    are the same as those of `FitEllipse.points_from_major_axis_from`.
+
+    Whether the points of each ellipse hit the mask is computed for all ellipses in one call of the mask
+    interpolator, with extra points only added to the ellipses which overlap the mask.
+
+    Parameters
+    ----------
+    interp
+        The interpolators of the dataset's data, noise-map and mask.
+    ellipse_list
+        The ellipses whose points are computed.
+    multipole_lists
+        For every ellipse, the multipoles which perturb it (or `None` if it is not perturbed).
+    """
+    if multipole_lists is None:
+        multipole_lists = [None] * len(ellipse_list)
+
+    fit_list = [
+        FitEllipse(
+            dataset=interp.dataset,
+            ellipse=ellipse,
+            multipole_list=multipole_list,
+            interp=interp,
+        )
+        for ellipse, multipole_list in zip(ellipse_list, multipole_lists)
+    ]
+
+    points_list = [fit.points_via_n_i_from(n_i=0) for fit in fit_list]
+
+    if interp.mask_interp is None or len(points_list) == 0:
+        return points_list
+
+    unmasked_list = np.split(
+        interp.mask_interp(np.concatenate(points_list)) == 0,
+        np.cumsum([points.shape[0] for points in points_list])[:-1],
+    )
+
+    for i, fit in enumerate(fit_list):
+        points = points_list[i]
+        unmasked = unmasked_list[i]
+
+        total_points_required = points.shape[0]
+
+        if np.sum(unmasked) < total_points_required:
+            points, unmasked = fit.points_and_unmasked_via_extra_points_from(
+                total_points_required=total_points_required
+            )
+
+        points = points[unmasked]
+
+        points_list[i] = points[points.shape[0] - total_points_required :]
+
+    return points_list
+
+
+def chi_squared_list_via_stacked_points_from(
+    interp: DatasetInterp,
+    ellipse_list: List[Ellipse],
+    multipole_lists: Optional[List[Optional[List[EllipseMultipole]]]] = None,
+) -> np.ndarray:
+    """
+    Returns the chi-squared of the fit of every ellipse in a list to a dataset, as a 1D array, which are the same
+    as the `chi_squared` of each ellipse's `FitEllipse`.
+
+    The points of all ellipses (see `points_list_from`) are concatenated and the data and noise-map interpolated at
+    them in one call, with the mean of every ellipse's data values and its chi-squared computed via segment
+    reductions. As for `FitEllipse`, NaN data values are omitted from the mean and NaN chi-squared values from
+    the chi-squared.
+
+    Parameters
+    ----------
+    interp
+        The interpolators of the dataset's data, noise-map and mask.
+    ellipse_list
+        The ellipses which are fitted to the dataset.
+    multipole_lists
+        For every ellipse, the multipoles which perturb it (or `None` if it is not perturbed).
+    """
+    points_list = points_list_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    total_ellipses = len(points_list)
+
+    if total_ellipses == 0:
+        return np.zeros(0)
+
+    segment_ids = np.repeat(
+        np.arange(total_ellipses), [points.shape[0] for points in points_list]
+    )
+
+    points = np.concatenate(points_list)
+
+    data = interp.data_interp(points)
+    noise_map = interp.noise_map_interp(points)
+
+    data_not_nan = ~np.isnan(data)
+
+    total_points = np.bincount(segment_ids[data_not_nan], minlength=total_ellipses)
+    mean = np.bincount(
+        segment_ids[data_not_nan],
+        weights=data[data_not_nan],
+        minlength=total_ellipses,
+    ) / np.maximum(total_points, 1)
+
+    chi_squared_map = ((data - mean[segment_ids]) / noise_map) ** 2.0
+
+    chi_squared_not_nan = ~np.isnan(chi_squared_map)
+
+    return np.bincount(
+        segment_ids[chi_squared_not_nan],
+        weights=chi_squared_map[chi_squared_not_nan],
+        minlength=total_ellipses,
+    )
+
+
+def log_likelihood_via_stacked_points_from(
+    interp: DatasetInterp,
+    ellipse_list: List[Ellipse],
+    multipole_lists: Optional[List[Optional[List[EllipseMultipole]]]] = None,
+) -> float:
+    """
+    Returns the log likelihood of the fit of every ellipse in a list to a dataset, which is the sum of the
+    log likelihoods of each ellipse's `FitEllipse`, computed via `chi_squared_list_via_stacked_points_from`.
+
+    Parameters
+    ----------
+    interp
+        The interpolators of the dataset's data, noise-map and mask.
+    ellipse_list
+        The ellipses which are fitted to the dataset.
+    multipole_lists
+        For every ellipse, the multipoles which perturb it (or `None` if it is not perturbed).
+    """
+    return float(
+        -0.5
+        * np.sum(
+            chi_squared_list_via_stacked_points_from(
+                interp=interp,
+                ellipse_list=ellipse_list,
+                multipole_lists=multipole_lists,
+            )
+        )
+    )
+
+
+def points_and_weights_from(
+    ellipse: Ellipse,
+    pixel_scale: float,
+    multipole_list: Optional[List[EllipseMultipole]] = None,
+    total_points_max: int = 500,
+    xp=np,
+):
+    """
+    Returns the fixed length array of (y,x) points on an ellipse, perturbed by its multipoles if they are input,
+    alongside the weights of the points (see `Ellipse.points_and_weights_from_major_axis_from`).
+
+    Parameters
+    ----------
+    ellipse
+        The ellipse whose points are computed.
+    pixel_scale
+        The pixel scale of the data that the ellipse is fitted to and interpolated over.
+    multipole_list
+        The multipoles which perturb the points of the ellipse.
+    total_points_max
+        The maximum total number of points on the ellipse, which sets the fixed length of the arrays.
+    xp
+        The array module (e.g. `numpy` or `jax.numpy`) used to compute the points.
+    """
+    points, weights = ellipse.points_and_weights_from_major_axis_from(
+        pixel_scale=pixel_scale, total_points_max=total_points_max, xp=xp
+    )
+
+    if multipole_list is not None:
+        for multipole in multipole_list:
+            points = multipole.points_perturbed_from(
+                pixel_scale=pixel_scale, points=points, ellipse=ellipse, xp=xp
+            )
+
+    return points, weights
+
+
+def chi_squared_list_from(
+    interp: DatasetInterp,
+    ellipse_list: List[Ellipse],
+    multipole_lists: Optional[List[Optional[List[EllipseMultipole]]]] = None,
+    total_points_max: int = 500,
+    xp=np,
+):
+    """
+    Returns the chi-squared of the fit of every ellipse in a list to a dataset, as a 1D array.
+
+    The points of all ellipses are interpolated in one call, with the residuals of every ellipse computed as its
+    interpolated data values minus their mean, using only the points with a weight of 1.0 (see the module docstring).
+
+    Parameters
+    ----------
+    interp
+        The interpolators of the dataset's data, noise-map and mask.
+    ellipse_list
+        The ellipses which are fitted to the dataset.
+    multipole_lists
+        For every ellipse, the multipoles which perturb it (or `None` if it is not perturbed).
+    total_points_max
+        The maximum total number of points on each ellipse, which sets the fixed length of the arrays.
+    xp
+        The array module (e.g. `numpy` or `jax.numpy`) used to perform the fit.
+    """
+    if multipole_lists is None:
+        multipole_lists = [None] * len(ellipse_list)
+
+    pixel_scale = interp.dataset.pixel_scales[0]
+
+    points_list, weights_list = zip(
+        *[
+            points_and_weights_from(
+                ellipse=ellipse,
+                pixel_scale=pixel_scale,
+                multipole_list=multipole_list,
+                total_points_max=total_points_max,
+                xp=xp,
+            )
+            for ellipse, multipole_list in zip(ellipse_list, multipole_lists)
+        ]
+    )
+
+    total_points = points_list[0].shape[0]
+
+    mask, data, noise_map = interp.mask_data_and_noise_map_interp_from(
+        points=xp.concatenate(points_list, axis=0), xp=xp
+    ).reshape(3, len(ellipse_list), total_points)
+
+    weights = xp.stack(weights_list) * xp.where(mask == 0.0, 1.0, 0.0)
+
+    total_weights = xp.sum(weights, axis=1)
+
+    mean = xp.sum(weights * data, axis=1) / xp.maximum(total_weights, 1.0)
+
+    noise_map = xp.where(weights > 0.0, noise_map, 1.0)
+
+    return xp.sum(weights * ((data - mean[:, None]) / noise_map) ** 2.0, axis=1)
+
+
+def log_likelihood_from(
+    interp: DatasetInterp,
+    ellipse_list: List[Ellipse],
+    multipole_lists: Optional[List[Optional[List[EllipseMultipole]]]] = None,
+    total_points_max: int = 500,
+    xp=np,
+) -> float:
+    """
+    Returns the log likelihood of the fit of every ellipse in a list to a dataset, which is the sum of the
+    log likelihoods of the individual ellipses, given by -0.5 times their chi-squared (see `FitEllipse`).
+
+    Parameters
+    ----------
+    interp
+        The interpolators of the dataset's data, noise-map and mask.
+    ellipse_list
+        The ellipses which are fitted to the dataset.
+    multipole_lists
+        For every ellipse, the multipoles which perturb it (or `None` if it is not perturbed).
+    total_points_max
+        The maximum total number of points on each ellipse, which sets the fixed length of the arrays.
+    xp
+        The array module (e.g. `numpy` or `jax.numpy`) used to perform the fit.
+    """
+    return -0.5 * xp.sum(
+        chi_squared_list_from(
+            interp=interp,
+            ellipse_list=ellipse_list,
+            multipole_lists=multipole_lists,
+            total_points_max=total_points_max,
+            xp=xp,
+        )
+    )
@@ -17,6 +17,11 @@ from typing import List, Optional
 import autofit as af
 import autoarray as aa
 
+from autoconf import cached_property
+
+from autogalaxy.ellipse import fit_ellipse_batch
+from autogalaxy.ellipse.dataset_interp import DatasetInterp
+from autogalaxy.ellipse.ellipse.ellipse_multipole import EllipseMultipole
 from autogalaxy.ellipse.fit_ellipse import FitEllipse
 from autogalaxy.ellipse.model.result import ResultEllipse
 from autogalaxy.ellipse.model.visualizer import VisualizerEllipse
@@ -53,12 +58,47 @@ class AnalysisEllipse(af.Analysis):
         title_prefix
             A string that is added before the title of all figures output by visualization, for example to
             put the name of the dataset and galaxy in the title.
+        use_jax
+            If `True`, the log likelihood is computed using JAX via the functions of the `fit_ellipse_batch` module,
+            which fit all ellipses together with a fixed number of points per ellipse.
         """
         self.dataset = dataset
         self.title_prefix = title_prefix
 
         super().__init__(use_jax=use_jax)
 
+    @cached_property
+    def interp(self) -> DatasetInterp:
+        """
+        The interpolators of the dataset's data, noise-map and mask, which are created once and shared by every
+        `FitEllipse` of every likelihood evaluation.
+        """
+        return DatasetInterp(dataset=self.dataset)
+
+    def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        This function is called immediately before the non-linear search begins and performs final tasks and checks
+        before it begins.
+
+        It creates the interpolators of the dataset's data, noise-map and mask, so that they are not created during
+        the first likelihood evaluation.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        model
+            The model object, which includes model components representing the ellipses that are fitted to
+            the imaging data.
+        """
+        self.interp.mask_interp
+        self.interp.data_interp
+        self.interp.noise_map_interp
+        self.interp.values_stack
+
+        return super().modify_before_fit(paths=paths, model=model)
+
     def log_likelihood_function(self, instance: af.ModelInstance) -> float:
         """
         Given an instance of the model, where the model parameters are set via a non-linear search, fit the model
@@ -74,6 +114,13 @@ class AnalysisEllipse(af.Analysis):
         via interpolation and subtracts these values from their mean values in order to quantify how well the ellipse
         traces around the data.
 
+        The ellipses are fitted together via `fit_ellipse_batch.log_likelihood_via_stacked_points_from`, which
+        gives the same log likelihood as the sum of the `FitEllipse` objects of `fit_list_from` but interpolates the
+        points of all ellipses in one call.
+
+        If JAX is used, the ellipses are instead fitted together via `fit_ellipse_batch.log_likelihood_from`,
+        which can be compiled via `jax.jit` and vectorized via `jax.vmap`.
+
         Certain models will fail to fit the dataset and raise an exception. For example the ellipse parameters may be
         ill defined and raise an Exception. In such circumstances the model is discarded and its likelihood value is
         passed to the non-linear search in a way that it ignores it (for example, using a value of -1.0e99).
@@ -89,8 +136,44 @@ class AnalysisEllipse(af.Analysis):
         float
             The log likelihood indicating how well this model instance fitted the imaging data.
         """
-        fit_list = self.fit_list_from(instance=instance)
-        return sum(fit.log_likelihood for fit in fit_list)
+        ellipse_list = [instance.ellipses[i] for i in range(len(instance.ellipses))]
+
+        if self._use_jax:
+            return fit_ellipse_batch.log_likelihood_from(
+                interp=self.interp,
+                ellipse_list=ellipse_list,
+                multipole_lists=self.multipole_lists_from(instance=instance),
+                xp=self._xp,
+            )
+
+        return fit_ellipse_batch.log_likelihood_via_stacked_points_from(
+            interp=self.interp,
+            ellipse_list=ellipse_list,
+            multipole_lists=self.multipole_lists_from(instance=instance),
+        )
+
+    def multipole_lists_from(
+        self, instance: af.ModelInstance
+    ) -> List[Optional[List[EllipseMultipole]]]:
+        """
+        Returns, for every ellipse of a model instance, the list of multipoles which perturb it, or `None` if the
+        model does not have multipoles.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        multipole_lists = []
+
+        for i in range(len(instance.ellipses)):
+            try:
+                multipole_lists.append(instance.multipoles[i])
+            except AttributeError:
+                multipole_lists.append(None)
+
+        return multipole_lists
 
     def fit_list_from(self, instance: af.ModelInstance) -> List[FitEllipse]:
         """
@@ -114,16 +197,14 @@ class AnalysisEllipse(af.Analysis):
         """
         fit_list = []
 
-        for i in range(len(instance.ellipses)):
-            ellipse = instance.ellipses[i]
-
-            try:
-                multipole_list = instance.multipoles[i]
-            except AttributeError:
-                multipole_list = None
+        multipole_lists = self.multipole_lists_from(instance=instance)
 
+        for i in range(len(instance.ellipses)):
             fit = FitEllipse(
-                dataset=self.dataset, ellipse=ellipse, multipole_list=multipole_list
+                dataset=self.dataset,
+                ellipse=instance.ellipses[i],
+                multipole_list=multipole_lists[i],
+                interp=self.interp,
             )
 
             fit_list.append(fit)
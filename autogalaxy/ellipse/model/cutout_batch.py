@@ -0,0 +1,519 @@
+"""
+Fit ellipse models to many cutouts of galaxies (e.g. thousands of cutouts of a survey), with one `AnalysisEllipse`
+model-fit per cutout, distributed over a pool of processes.
+
+The cutouts are input as either:
+
+- A directory of .fits files, where every file is one cutout named after the file.
+- A single .fits file containing a 3D cube of cutouts, of shape [total_cutouts, total_y_pixels, total_x_pixels],
+  where every cutout is named after the file and its index in the cube.
+
+Every process opens the .fits files via a read-only memory map and only reads the pixels of the cutout it fits, such
+that the pixel data of a cube is shared by all processes instead of being copied to each of them.
+
+The isophotes (ellipses and their multipoles) of the maximum likelihood model of every cutout are written to a .csv
+file as the fits complete, with one row per isophote. If the fits are interrupted and `fit_cutouts` is called again
+with the same output file, the cutouts whose isophotes are already in the file are not fitted again.
+
+Every row contains the total number of isophotes of its cutout, such that a cutout whose rows were only partly
+written when the fits were interrupted is removed from the file and fitted again.
+"""
+import csv
+import logging
+from collections import Counter, defaultdict
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import autofit as af
+import autoarray as aa
+
+from autoconf.fitsable import flip_for_ds9_from
+
+from autogalaxy.ellipse.model.analysis import AnalysisEllipse
+from autogalaxy import exc
+
+logger = logging.getLogger(__name__)
+
+
+def cutout_list_from(
+    cutouts_path: Union[Path, str], hdu: int = 0
+) -> List[Tuple[str, str, Optional[int]]]:
+    """
+    Returns the name, .fits file path and cube index (which is `None` for a directory of .fits files) of every
+    cutout in a directory of .fits files or a .fits cube (see the module docstring).
+
+    Parameters
+    ----------
+    cutouts_path
+        The path of the directory of .fits files or of the .fits cube.
+    hdu
+        The HDU of the .fits files containing the cutouts.
+    """
+    from astropy.io import fits
+
+    cutouts_path = Path(cutouts_path)
+
+    if cutouts_path.is_dir():
+        return [
+            (file_path.stem, str(file_path), None)
+            for file_path in sorted(cutouts_path.glob("*.fits"))
+        ]
+
+    with fits.open(cutouts_path, memmap=True) as hdu_list:
+        shape = hdu_list[hdu].shape
+
+    if len(shape) != 3:
+        raise exc.AnalysisException(
+            f"The cutouts .fits file {cutouts_path} has shape {shape}, but a 3D cube of cutouts is required."
+        )
+
+    return [
+        (f"{cutouts_path.stem}_{index}", str(cutouts_path), index)
+        for index in range(shape[0])
+    ]
+
+
+def values_via_cutout_from(
+    file_path: Union[Path, str], cube_index: Optional[int] = None, hdu: int = 0
+) -> np.ndarray:
+    """
+    Returns the 2D pixel values of a cutout, which are read from its .fits file via a read-only memory map, such
+    that only the pixels of this cutout are read from a .fits cube.
+
+    The values are flipped upside-down following the same convention as when arrays are loaded from .fits files
+    (e.g. `Array2D.from_fits`).
+
+    Parameters
+    ----------
+    file_path
+        The path of the .fits file containing the cutout.
+    cube_index
+        The index of the cutout in a .fits cube, or `None` if the .fits file contains one cutout.
+    hdu
+        The HDU of the .fits file containing the cutout.
+    """
+    from astropy.io import fits
+
+    with fits.open(file_path, memmap=True, mode="readonly") as hdu_list:
+        values = hdu_list[hdu].data
+
+        if cube_index is not None:
+            values = values[cube_index]
+
+        values = np.array(values, dtype="float")
+
+    return flip_for_ds9_from(values)
+
+
+def dataset_via_cutout_from(
+    file_path: Union[Path, str],
+    cube_index: Optional[int],
+    pixel_scales: aa.type.PixelScales,
+    noise_map_path: Optional[Union[Path, str]] = None,
+    noise_map_value: Optional[float] = None,
+    mask_radius: Optional[float] = None,
+    hdu: int = 0,
+) -> aa.Imaging:
+    """
+    Returns the `Imaging` dataset of a cutout, which is fitted by `AnalysisEllipse`.
+
+    Parameters
+    ----------
+    file_path
+        The path of the .fits file containing the cutout.
+    cube_index
+        The index of the cutout in a .fits cube, or `None` if the .fits file contains one cutout.
+    pixel_scales
+        The (y,x) arc-second to pixel units conversion factor of the cutouts.
+    noise_map_path
+        The path of the noise-maps, which is a directory of .fits files with the same file names as the cutouts or a
+        .fits cube with the same shape as the cube of cutouts.
+    noise_map_value
+        If `noise_map_path` is not input, the value of every pixel of the noise-map.
+    mask_radius
+        If input, a circular mask of this radius centred on the centre of the cutout is applied to the dataset.
+    hdu
+        The HDU of the .fits files containing the cutouts and noise-maps.
+    """
+    data = aa.Array2D.no_mask(
+        values=values_via_cutout_from(
+            file_path=file_path, cube_index=cube_index, hdu=hdu
+        ),
+        pixel_scales=pixel_scales,
+    )
+
+    if noise_map_path is not None:
+        if Path(noise_map_path).is_dir():
+            noise_map_path = Path(noise_map_path) / Path(file_path).name
+
+        noise_map = aa.Array2D.no_mask(
+            values=values_via_cutout_from(
+                file_path=noise_map_path, cube_index=cube_index, hdu=hdu
+            ),
+            pixel_scales=pixel_scales,
+        )
+    elif noise_map_value is not None:
+        noise_map = aa.Array2D.full(
+            fill_value=noise_map_value,
+            shape_native=data.shape_native,
+            pixel_scales=pixel_scales,
+        )
+    else:
+        raise exc.AnalysisException(
+            "Either a noise_map_path or noise_map_value must be input to fit the cutouts."
+        )
+
+    dataset = aa.Imaging(data=data, noise_map=noise_map)
+
+    if mask_radius is None:
+        return dataset
+
+    return dataset.apply_mask(
+        mask=aa.Mask2D.circular(
+            shape_native=data.shape_native,
+            pixel_scales=pixel_scales,
+            radius=mask_radius,
+        )
+    )
+
+
+def fieldnames_from(model: af.Collection) -> List[str]:
+    """
+    Returns the columns of the output .csv file of the isophotes of an ellipse model, which are the keys of the
+    dictionaries returned by `isophote_dict_list_from`.
+
+    The multipole columns are included for the largest number of multipoles which perturb an ellipse of the model,
+    such that every isophote of every cutout is written under the same columns.
+
+    Parameters
+    ----------
+    model
+        The model fitted to every cutout, which contains `ellipses` and optionally `multipoles`.
+    """
+    try:
+        total_multipoles = max(
+            (len(multipole_list) for multipole_list in model.multipoles), default=0
+        )
+    except AttributeError:
+        total_multipoles = 0
+
+    fieldnames = [
+        "name",
+        "total_isophotes",
+        "ellipse_index",
+        "centre_0",
+        "centre_1",
+        "ell_comps_0",
+        "ell_comps_1",
+        "major_axis",
+        "axis_ratio",
+        "angle",
+        "log_likelihood",
+    ]
+
+    for j in range(total_multipoles):
+        fieldnames += [
+            f"multipole_{j}_m",
+            f"multipole_{j}_comps_0",
+            f"multipole_{j}_comps_1",
+        ]
+
+    return fieldnames
+
+
+def isophote_dict_list_from(name: str, fit_list) -> List[Dict]:
+    """
+    Returns a list of dictionaries describing the isophotes of the fit of an ellipse model to a cutout, which are
+    the rows written to the output .csv file.
+
+    Every dictionary contains the name of the cutout, its total number of isophotes, the index and parameters of
+    the ellipse, the log likelihood of its `FitEllipse` and the order and components of each of its multipoles.
+
+    Parameters
+    ----------
+    name
+        The name of the cutout.
+    fit_list
+        The `FitEllipse` objects of every ellipse of the model (e.g. `ResultEllipse.max_log_likelihood_fit_list`).
+    """
+    isophote_dict_list = []
+
+    for i, fit in enumerate(fit_list):
+        ellipse = fit.ellipse
+
+        isophote_dict = {
+            "name": name,
+            "total_isophotes": len(fit_list),
+            "ellipse_index": i,
+            "centre_0": float(ellipse.centre[0]),
+            "centre_1": float(ellipse.centre[1]),
+            "ell_comps_0": float(ellipse.ell_comps[0]),
+            "ell_comps_1": float(ellipse.ell_comps[1]),
+            "major_axis": float(ellipse.major_axis),
+            "axis_ratio": float(ellipse.axis_ratio()),
+            "angle": float(ellipse.angle()),
+            "log_likelihood": float(fit.log_likelihood),
+        }
+
+        for j, multipole in enumerate(fit.multipole_list or []):
+            isophote_dict[f"multipole_{j}_m"] = multipole.m
+            isophote_dict[f"multipole_{j}_comps_0"] = float(
+                multipole.multipole_comps[0]
+            )
+            isophote_dict[f"multipole_{j}_comps_1"] = float(
+                multipole.multipole_comps[1]
+            )
+
+        isophote_dict_list.append(isophote_dict)
+
+    return isophote_dict_list
+
+
+def isophote_dict_list_via_cutout_from(
+    cutout: Tuple[str, str, Optional[int]],
+    model: af.Collection,
+    search_cls,
+    pixel_scales: aa.type.PixelScales,
+    search_kwargs: Optional[Dict] = None,
+    noise_map_path: Optional[Union[Path, str]] = None,
+    noise_map_value: Optional[float] = None,
+    mask_radius: Optional[float] = None,
+    hdu: int = 0,
+) -> Tuple[str, List[Dict]]:
+    """
+    Fits the ellipse model to a cutout via a non-linear search and returns the name of the cutout and the
+    dictionaries of the isophotes of its maximum likelihood model (see `isophote_dict_list_from`).
+
+    This is a module level function so that it can be pickled and sent to the processes of a
+    `ProcessPoolExecutor`. The non-linear search is created in the process, with the name of the cutout as its name.
+
+    If the fit raises an exception it is logged and an empty list of isophotes is returned, such that the cutout is
+    fitted again when the fits are resumed.
+
+    Parameters
+    ----------
+    cutout
+        The name, .fits file path and cube index of the cutout (see `cutout_list_from`).
+    """
+    name, file_path, cube_index = cutout
+
+    try:
+        dataset = dataset_via_cutout_from(
+            file_path=file_path,
+            cube_index=cube_index,
+            pixel_scales=pixel_scales,
+            noise_map_path=noise_map_path,
+            noise_map_value=noise_map_value,
+            mask_radius=mask_radius,
+            hdu=hdu,
+        )
+
+        search = search_cls(name=name, **(search_kwargs or {}))
+
+        result = search.fit(
+            model=model, analysis=AnalysisEllipse(dataset=dataset, title_prefix=name)
+        )
+
+        return name, isophote_dict_list_from(
+            name=name, fit_list=result.max_log_likelihood_fit_list
+        )
+
+    except Exception as e:
+        logger.warning(f"The fit to the cutout {name} failed ({e}) and is skipped.")
+
+        return name, []
+
+
+def name_list_via_output_from(output_path: Union[Path, str]) -> List[str]:
+    """
+    Returns the names of the cutouts whose isophotes are in the output .csv file, which are not fitted again when
+    the fits are resumed.
+
+    If the fits were interrupted while a row was being written, the incomplete final row is removed from the file.
+    The rows of a cutout which has fewer rows than its `total_isophotes` (because the fits were interrupted while
+    its rows were being written) are also removed, such that the cutout is fitted again.
+
+    Parameters
+    ----------
+    output_path
+        The path of the output .csv file.
+    """
+    output_path = Path(output_path)
+
+    if not output_path.exists():
+        return []
+
+    with open(output_path, "rb+") as f:
+        content = f.read()
+
+        if content and not content.endswith(b"\n"):
+            f.truncate(content.rfind(b"\n") + 1)
+
+    with open(output_path, newline="") as f:
+        reader = csv.DictReader(f)
+
+        fieldnames = reader.fieldnames
+        row_list = list(reader)
+
+    total_rows_dict = Counter()
+    total_isophotes_dict = defaultdict(set)
+
+    for row in row_list:
+        total_rows_dict[row["name"]] += 1
+        total_isophotes_dict[row["name"]].add(int(row["total_isophotes"]))
+
+    name_set = {
+        name
+        for name, total_rows in total_rows_dict.items()
+        if total_isophotes_dict[name] == {total_rows}
+    }
+
+    if len(name_set) < len(total_rows_dict):
+        with open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(row for row in row_list if row["name"] in name_set)
+
+    return sorted(name_set)
+
+
+def fit_cutouts(
+    cutouts_path: Union[Path, str],
+    output_path: Union[Path, str],
+    model: af.Collection,
+    search_cls,
+    pixel_scales: aa.type.PixelScales,
+    search_kwargs: Optional[Dict] = None,
+    noise_map_path: Optional[Union[Path, str]] = None,
+    noise_map_value: Optional[float] = None,
+    mask_radius: Optional[float] = None,
+    hdu: int = 0,
+    number_of_cores: int = 1,
+) -> List[str]:
+    """
+    Fits an ellipse model to every cutout in a directory of .fits files or a .fits cube, with one `AnalysisEllipse`
+    model-fit per cutout, and writes the isophotes of every fit to a .csv file as the fits complete (see the module
+    docstring).
+
+    Cutouts whose isophotes are already in the output .csv file are not fitted, such that the fits resume from where
+    they were interrupted.
+
+    The columns of the .csv file are given by `fieldnames_from`, or by the header of the output .csv file if the
+    fits are resumed. Columns which a cutout's isophotes do not have are left empty and isophote values which are
+    not a column of the file are omitted.
+
+    Parameters
+    ----------
+    cutouts_path
+        The path of the directory of .fits files or of the .fits cube containing the cutouts.
+    output_path
+        The path of the .csv file the isophotes are written to.
+    model
+        The model fitted to every cutout, which contains `ellipses` and optionally `multipoles` (see
+        `AnalysisEllipse`).
+    search_cls
+        The class of the non-linear search (e.g. `af.Nautilus`), which is created for every cutout with the name of
+        the cutout as its `name` and `search_kwargs` as its other inputs.
+    pixel_scales
+        The (y,x) arc-second to pixel units conversion factor of the cutouts.
+    search_kwargs
+        The inputs of the non-linear search other than its `name` (e.g. `path_prefix`, `n_live`).
+    noise_map_path
+        The path of the noise-maps, which is a directory of .fits files with the same file names as the cutouts or a
+        .fits cube with the same shape as the cube of cutouts.
+    noise_map_value
+        If `noise_map_path` is not input, the value of every pixel of the noise-map.
+    mask_radius
+        If input, a circular mask of this radius centred on the centre of every cutout is applied to its dataset.
+    hdu
+        The HDU of the .fits files containing the cutouts and noise-maps.
+    number_of_cores
+        The number of processes the cutouts are fitted over, where a value of 1 fits them serially.
+
+    Returns
+    -------
+    The names of the cutouts fitted by this call.
+    """
+    name_fitted_set = set(name_list_via_output_from(output_path=output_path))
+
+    cutout_list = [
+        cutout
+        for cutout in cutout_list_from(cutouts_path=cutouts_path, hdu=hdu)
+        if cutout[0] not in name_fitted_set
+    ]
+
+    logger.info(
+        f"Fitting {len(cutout_list)} cutouts ({len(name_fitted_set)} cutouts are already fitted)."
+    )
+
+    fit_kwargs = {
+        "model": model,
+        "search_cls": search_cls,
+        "pixel_scales": pixel_scales,
+        "search_kwargs": search_kwargs,
+        "noise_map_path": noise_map_path,
+        "noise_map_value": noise_map_value,
+        "mask_radius": mask_radius,
+        "hdu": hdu,
+    }
+
+    name_list = []
+
+    if Path(output_path).exists():
+        with open(output_path, newline="") as f:
+            fieldnames = csv.DictReader(f).fieldnames
+    else:
+        fieldnames = None
+
+    output_exists = fieldnames is not None
+    fieldnames = fieldnames or fieldnames_from(model=model)
+
+    def write(isophote_dict_list: List[Dict]) -> bool:
+        nonlocal output_exists
+
+        if len(isophote_dict_list) == 0:
+            return False
+
+        with open(output_path, "a", newline="") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=fieldnames, restval="", extrasaction="ignore"
+            )
+
+            if not output_exists:
+                writer.writeheader()
+                output_exists = True
+
+            writer.writerows(isophote_dict_list)
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        return True
+
+    if number_of_cores > 1:
+        with ProcessPoolExecutor(max_workers=number_of_cores) as executor:
+            future_list = [
+                executor.submit(
+                    isophote_dict_list_via_cutout_from, cutout=cutout, **fit_kwargs
+                )
+                for cutout in cutout_list
+            ]
+
+            for future in as_completed(future_list):
+                name, isophote_dict_list = future.result()
+
+                if write(isophote_dict_list=isophote_dict_list):
+                    name_list.append(name)
+    else:
+        for cutout in cutout_list:
+            name, isophote_dict_list = isophote_dict_list_via_cutout_from(
+                cutout=cutout, **fit_kwargs
+            )
+
+            if write(isophote_dict_list=isophote_dict_list):
+                name_list.append(name)
+
+    return name_list
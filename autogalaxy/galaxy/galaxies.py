@@ -19,7 +19,10 @@ import autoarray as aa
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.profiles.basis import Basis
 from autogalaxy.profiles.light.linear import LightProfileLinear
-from autogalaxy.operate.image import OperateImageGalaxies
+from autogalaxy.operate.image import (
+    OperateImageGalaxies,
+    image_2d_not_operated_and_operated_summed_from,
+)
 
 
 class Galaxies(List, OperateImageGalaxies):
@@ -136,6 +139,62 @@ class Galaxies(List, OperateImageGalaxies):
             self.image_2d_list_from(grid=grid, xp=xp, operated_only=operated_only)
         )
 
+    def image_2d_not_operated_and_operated_from(
+        self, grid: aa.type.Grid2DLike, xp=np
+    ) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+        """
+        Returns the summed 2D image of all light profiles of all galaxies which are not operated on and the summed
+        2D image of all light profiles which are already operated on (e.g. `LightProfileOperated` objects) as a tuple.
+
+        Every galaxy's light profiles are walked once, which is faster than calling `image_2d_from` with
+        `operated_only=False` and `operated_only=True`. Refer to `Galaxy.image_2d_not_operated_and_operated_from`
+        for a full description.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the images are evaluated.
+        """
+        return image_2d_not_operated_and_operated_summed_from(
+            image_2d_tuple_list=[
+                galaxy.image_2d_not_operated_and_operated_from(grid=grid, xp=xp)
+                for galaxy in self
+            ]
+        )
+
+    @property
+    def has_visibilities_via_uv(self) -> bool:
+        """
+        Whether every light profile of every galaxy has a closed-form Fourier transform (see
+        `LightProfile.visibilities_via_uv_from`), in which case `visibilities_from` computes the visibilities via
+        `visibilities_via_uv_from` instead of Fourier transforming the image of the galaxies.
+        """
+        return all(galaxy.has_visibilities_via_uv for galaxy in self)
+
+    def visibilities_via_uv_from(
+        self, transformer: aa.type.Transformer, xp=np
+    ) -> np.ndarray:
+        """
+        Returns the summed complex visibilities of all galaxies at the `uv_wavelengths` of a transformer, computed
+        using the closed-form Fourier transform of every light profile.
+
+        This requires every light profile to have a closed-form Fourier transform, which is checked via the
+        `has_visibilities_via_uv` property.
+
+        Parameters
+        ----------
+        transformer
+            The **PyAutoArray** `Transformer` object whose `uv_wavelengths` the visibilities are computed at and
+            whose `real_space_mask` sets the area of a pixel.
+        """
+        return sum(
+            (
+                galaxy.visibilities_via_uv_from(transformer=transformer, xp=xp)
+                for galaxy in self
+            ),
+            xp.zeros((transformer.uv_wavelengths.shape[0],), dtype=complex),
+        )
+
     def galaxy_image_2d_dict_from(
         self,
         grid: aa.type.Grid2DLike,
@@ -201,6 +260,36 @@ class Galaxies(List, OperateImageGalaxies):
         """
         return sum(map(lambda g: g.deflections_yx_2d_from(grid=grid, xp=xp), self))
 
+    @property
+    def has_analytical_hessian(self) -> bool:
+        """
+        Whether every mass profile of every galaxy has a closed-form Hessian (see
+        `MassProfile.analytical_hessian_2d_from`), in which case `LensCalc` uses `analytical_hessian_2d_from`
+        instead of numerical differentiation of the deflection angles.
+        """
+        return all(galaxy.has_analytical_hessian for galaxy in self)
+
+    def analytical_hessian_2d_from(
+        self, grid: aa.type.Grid2DLike, xp=np, **kwargs
+    ) -> Tuple:
+        """
+        Returns the summed closed-form Hessian of all galaxies from a 2D grid of Cartesian (y,x) coordinates, as a
+        4-entry tuple (hessian_yy, hessian_xy, hessian_yx, hessian_xx).
+
+        Like `deflections_yx_2d_from`, this does not account for multi-plane ray-tracing effects and requires every
+        mass profile to have a closed-form Hessian, which is checked via the `has_analytical_hessian` property.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the Hessian are evaluated.
+        """
+        hessian_list = [
+            galaxy.analytical_hessian_2d_from(grid=grid, xp=xp) for galaxy in self
+        ]
+
+        return tuple(sum(component) for component in zip(*hessian_list))
+
     @aa.grid_dec.to_grid
     def traced_grid_2d_from(
         self, grid: aa.type.Grid2DLike, xp=np
@@ -10,7 +10,7 @@ matching component types.
 The `Galaxies` class (in `galaxies.py`) wraps a list of `Galaxy` objects and provides the same aggregate
 interface over the whole ensemble.
 """
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 
@@ -20,7 +20,11 @@ import autoarray as aa
 import autofit as af
 
 from autogalaxy import exc
-from autogalaxy.operate.image import OperateImageList
+from autogalaxy import profiling
+from autogalaxy.operate.image import (
+    OperateImageList,
+    image_2d_not_operated_and_operated_summed_from,
+)
 from autogalaxy.profiles.geometry_profiles import GeometryProfile
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.light.linear import LightProfileLinear
@@ -204,7 +208,12 @@ class Galaxy(af.ModelObject, OperateImageList):
             zeros.
         """
         return [
-            light_profile.image_2d_from(grid=grid, xp=xp, operated_only=operated_only)
+            profiling.call(
+                light_profile.image_2d_from,
+                grid=grid,
+                xp=xp,
+                operated_only=operated_only,
+            )
             for light_profile in self.cls_list_from(
                 cls=LightProfile, cls_filtered=LightProfileLinear
             )
@@ -246,6 +255,74 @@ class Galaxy(af.ModelObject, OperateImageList):
             )
         return xp.zeros((grid.shape[0],))
 
+    def image_2d_not_operated_and_operated_from(
+        self, grid: aa.type.Grid2DLike, xp=np
+    ) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+        """
+        Returns the summed 2D image of the galaxy's light profiles which are not operated on and the summed 2D image
+        of its light profiles which are already operated on (e.g. `LightProfileOperated` objects) as a tuple.
+
+        This gives the same images as calling `image_2d_from` with `operated_only=False` and `operated_only=True`,
+        but walks the light profiles once, evaluating each light profile once and adding its image to the image of
+        its type, instead of evaluating arrays of zeros for light profiles of the other type.
+
+        Linear light profiles are omitted, as in `image_2d_list_from`. If the galaxy has no light profiles of a
+        type, `None` is returned for its image.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the images are evaluated.
+        """
+        return image_2d_not_operated_and_operated_summed_from(
+            image_2d_tuple_list=[
+                light_profile.image_2d_not_operated_and_operated_from(grid=grid, xp=xp)
+                for light_profile in self.cls_list_from(
+                    cls=LightProfile, cls_filtered=LightProfileLinear
+                )
+            ]
+        )
+
+    @property
+    def has_visibilities_via_uv(self) -> bool:
+        """
+        Whether every light profile of the galaxy which contributes to its image has a closed-form Fourier
+        transform (see `LightProfile.visibilities_via_uv_from`), in which case `visibilities_from` computes the
+        galaxy's visibilities via `visibilities_via_uv_from` instead of Fourier transforming its image.
+        """
+        return all(
+            light_profile.has_visibilities_via_uv
+            for light_profile in self.cls_list_from(
+                cls=LightProfile, cls_filtered=LightProfileLinear
+            )
+        )
+
+    def visibilities_via_uv_from(
+        self, transformer: aa.type.Transformer, xp=np
+    ) -> np.ndarray:
+        """
+        Returns the summed complex visibilities of the galaxy's light profiles at the `uv_wavelengths` of a
+        transformer, computed using each light profile's closed-form Fourier transform.
+
+        This requires every light profile to have a closed-form Fourier transform, which is checked via the
+        `has_visibilities_via_uv` property. Linear light profiles are omitted, as in `image_2d_list_from`.
+
+        Parameters
+        ----------
+        transformer
+            The **PyAutoArray** `Transformer` object whose `uv_wavelengths` the visibilities are computed at and
+            whose `real_space_mask` sets the area of a pixel.
+        """
+        return sum(
+            (
+                light_profile.visibilities_via_uv_from(transformer=transformer, xp=xp)
+                for light_profile in self.cls_list_from(
+                    cls=LightProfile, cls_filtered=LightProfileLinear
+                )
+            ),
+            xp.zeros((transformer.uv_wavelengths.shape[0],), dtype=complex),
+        )
+
     @aa.grid_dec.to_vector_yx
     def deflections_yx_2d_from(
         self, grid: aa.type.Grid2DLike, xp=np, **kwargs
@@ -270,13 +347,52 @@ class Galaxy(af.ModelObject, OperateImageList):
         if self.has(cls=MassProfile):
             return sum(
                 map(
-                    lambda p: p.deflections_yx_2d_from(grid=grid, xp=xp),
+                    lambda p: profiling.call(
+                        p.deflections_yx_2d_from, grid=grid, xp=xp
+                    ),
                     self.cls_list_from(cls=MassProfile),
                 )
             )
 
         return xp.zeros((grid.shape[0], 2))
 
+    @property
+    def has_analytical_hessian(self) -> bool:
+        """
+        Whether every mass profile of the galaxy has a closed-form Hessian (see
+        `MassProfile.analytical_hessian_2d_from`), in which case `LensCalc` uses `analytical_hessian_2d_from`
+        instead of numerical differentiation of the deflection angles.
+        """
+        return all(
+            mass_profile.has_analytical_hessian
+            for mass_profile in self.cls_list_from(cls=MassProfile)
+        )
+
+    def analytical_hessian_2d_from(
+        self, grid: aa.type.Grid2DLike, xp=np, **kwargs
+    ) -> Tuple:
+        """
+        Returns the summed closed-form Hessian of the galaxy's mass profiles from a 2D grid of Cartesian (y,x)
+        coordinates, as a 4-entry tuple (hessian_yy, hessian_xy, hessian_yx, hessian_xx).
+
+        This requires every mass profile to have a closed-form Hessian, which is checked via the
+        `has_analytical_hessian` property. If the galaxy has no mass profiles, numpy arrays of zeros are returned.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where values of the Hessian are evaluated.
+        """
+        if self.has(cls=MassProfile):
+            hessian_list = [
+                mass_profile.analytical_hessian_2d_from(grid=grid, xp=xp)
+                for mass_profile in self.cls_list_from(cls=MassProfile)
+            ]
+
+            return tuple(sum(component) for component in zip(*hessian_list))
+
+        return tuple(xp.zeros((grid.shape[0],)) for _ in range(4))
+
     @aa.grid_dec.to_array
     def convergence_2d_from(
         self, grid: aa.type.Grid2DLike, xp=np, **kwargs
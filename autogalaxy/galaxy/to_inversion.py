@@ -8,10 +8,20 @@ The key class is `GalaxiesToInversion`, which:
 2. Extracts all pixelization objects and constructs the `Mapper` objects they require.
 3. Passes these to `autoarray.inversion_from` to perform the linear algebra inversion.
 
+For interferometer datasets, linear light profiles whose Fourier transform is known in closed form (e.g. the
+Gaussians of a multi Gaussian expansion) compute their visibilities directly from the dataset's uv-wavelengths, which
+are passed to the inversion via `InversionInterferometerMappingOverride` instead of Fourier transforming their images.
+
+If an `InversionCache` is input (e.g. by `AnalysisImaging` and `AnalysisInterferometer`), the `Mapper` objects of
+pixelizations and their operated mapping matrix and curvature matrix are reused across calls of the likelihood
+function when their inputs do not change, via the `InversionImagingMappingCached` and
+`InversionInterferometerMappingCached` classes (see `autogalaxy.analysis.inversion_cache`).
+
 Standard (non-linear) light profiles are handled separately by the `Fit*` classes, which subtract them from
 the data before passing the residuals to this inversion pipeline.
 """
 from __future__ import annotations
+from functools import partial
 import numpy as np
 from typing import Dict, List, Optional, Type, Union
 
@@ -20,7 +30,10 @@ from autoconf import cached_property
 import autoarray as aa
 
 from autoarray.inversion.inversion.factory import inversion_from
+from autogalaxy import profiling
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
+from autogalaxy.analysis.inversion_cache import InversionCache, fingerprint_from
+from autogalaxy.operate.image import use_visibilities_via_uv
 from autogalaxy.profiles.light.linear import (
     LightProfileLinearObjFuncList,
 )
@@ -30,6 +43,197 @@ from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 
 
+class InversionInterferometerMappingOverride(aa.InversionInterferometerMapping):
+    @property
+    def operated_mapping_matrix_list(self) -> List[np.ndarray]:
+        """
+        The transformed mapping matrix of every linear object, which for a linear object with a `transformer` (e.g.
+        linear light profiles whose visibilities are computed via their closed-form Fourier transform) is its
+        `operated_mapping_matrix_override`, and for all other linear objects (e.g. a `Mapper`) is their
+        `mapping_matrix` Fourier transformed by the dataset's transformer.
+        """
+        return [
+            self.operated_mapping_matrix_via_linear_obj_from(linear_obj=linear_obj)
+            for linear_obj in self.linear_obj_list
+        ]
+
+    def operated_mapping_matrix_via_linear_obj_from(
+        self, linear_obj: aa.LinearObj
+    ) -> np.ndarray:
+        """
+        Returns the transformed mapping matrix of a linear object, which is its `operated_mapping_matrix_override`
+        if it has a `transformer` (e.g. linear light profiles whose visibilities are computed via their closed-form
+        Fourier transform) and otherwise its `mapping_matrix` Fourier transformed by the dataset's transformer.
+
+        Parameters
+        ----------
+        linear_obj
+            The linear object whose transformed mapping matrix is returned.
+        """
+        if getattr(linear_obj, "transformer", None) is not None:
+            return linear_obj.operated_mapping_matrix_override
+
+        return self.transformer.transform_mapping_matrix(
+            mapping_matrix=linear_obj.mapping_matrix, xp=self._xp
+        )
+
+
+class AbstractInversionMappingCached:
+    def __init__(
+        self,
+        dataset: Union[aa.Imaging, aa.Interferometer, aa.DatasetInterface],
+        linear_obj_list: List[aa.LinearObj],
+        inversion_cache: InversionCache,
+        mapper_cache_key_dict: Dict[aa.Mapper, tuple],
+        settings: aa.Settings = None,
+        xp=np,
+    ):
+        """
+        An inversion using the mapping matrix formalism which reuses the operated mapping matrix of every `Mapper`
+        in the `inversion_cache` and, if every linear object is such a `Mapper`, the `curvature_matrix`.
+
+        These matrices do not depend on the data or regularization, therefore when they are in the cache only the
+        `data_vector` and regularization dependent quantities are computed (see `autogalaxy.analysis.inversion_cache`).
+
+        Parameters
+        ----------
+        dataset
+            The dataset containing the data which the inversion is performed on.
+        linear_obj_list
+            The linear objects used to reconstruct the data's observed values.
+        inversion_cache
+            The cache which the operated mapping matrices and curvature matrix are stored in.
+        mapper_cache_key_dict
+            The key of every `Mapper` in the `inversion_cache`.
+        settings
+            The settings of the inversion, which controls how the linear algebra calculation is performed.
+        """
+        super().__init__(
+            dataset=dataset,
+            linear_obj_list=linear_obj_list,
+            settings=settings,
+            xp=xp,
+        )
+
+        self.inversion_cache = inversion_cache
+        self.mapper_cache_key_dict = mapper_cache_key_dict
+
+    @property
+    def operator(self):
+        """
+        The operator applied to the `mapping_matrix` of every linear object (e.g. a PSF or transformer), which keys
+        the cached operated mapping matrices.
+        """
+        raise NotImplementedError
+
+    @property
+    def operated_mapping_matrix_list(self) -> List[np.ndarray]:
+        """
+        The operated mapping matrix of every linear object, where those of the `Mapper` objects in the
+        `mapper_cache_key_dict` are loaded from the `inversion_cache` (or computed and stored in it).
+        """
+        operated_mapping_matrix_list = []
+
+        for linear_obj in self.linear_obj_list:
+            if linear_obj not in self.mapper_cache_key_dict:
+                operated_mapping_matrix_list.append(
+                    self.operated_mapping_matrix_via_linear_obj_from(
+                        linear_obj=linear_obj
+                    )
+                )
+                continue
+
+            operated_mapping_matrix_list.append(
+                self.inversion_cache.value_from(
+                    key=(
+                        "operated_mapping_matrix",
+                        self.mapper_cache_key_dict[linear_obj],
+                        self.inversion_cache.identity_from(self.operator),
+                    ),
+                    func=partial(
+                        self.operated_mapping_matrix_via_linear_obj_from,
+                        linear_obj=linear_obj,
+                    ),
+                )
+            )
+
+        return operated_mapping_matrix_list
+
+    def _curvature_matrix_from(self) -> np.ndarray:
+        return super().curvature_matrix
+
+    @cached_property
+    def curvature_matrix(self) -> np.ndarray:
+        """
+        The `curvature_matrix` of the inversion, which if every linear object is a `Mapper` in the
+        `mapper_cache_key_dict` is loaded from the `inversion_cache` (or computed and stored in it), keyed on the
+        `Mapper` objects, the operator and the values of the noise-map.
+
+        A copy of the cached `curvature_matrix` is returned, so that it cannot be changed by the linear algebra.
+        """
+        if not all(
+            linear_obj in self.mapper_cache_key_dict
+            for linear_obj in self.linear_obj_list
+        ):
+            return self._curvature_matrix_from()
+
+        try:
+            key = (
+                "curvature_matrix",
+                tuple(
+                    self.mapper_cache_key_dict[linear_obj]
+                    for linear_obj in self.linear_obj_list
+                ),
+                self.inversion_cache.identity_from(self.operator),
+                fingerprint_from(self.noise_map),
+                tuple(int(index) for index in self.no_regularization_index_list),
+            )
+        except TypeError:
+            return self._curvature_matrix_from()
+
+        return self.inversion_cache.value_from(
+            key=key, func=self._curvature_matrix_from
+        ).copy()
+
+
+class InversionImagingMappingCached(
+    AbstractInversionMappingCached, aa.InversionImagingMapping
+):
+    @property
+    def operator(self) -> aa.Convolver:
+        return self.psf
+
+    def operated_mapping_matrix_via_linear_obj_from(
+        self, linear_obj: aa.LinearObj
+    ) -> np.ndarray:
+        """
+        Returns the blurred mapping matrix of a linear object, which is its `operated_mapping_matrix_override` if
+        it has one and otherwise its `mapping_matrix` convolved with the dataset's PSF.
+
+        Parameters
+        ----------
+        linear_obj
+            The linear object whose blurred mapping matrix is returned.
+        """
+        if linear_obj.operated_mapping_matrix_override is not None:
+            return self.linear_func_operated_mapping_matrix_dict[linear_obj]
+
+        return self.psf.convolved_mapping_matrix_from(
+            mapping_matrix=linear_obj.mapping_matrix,
+            mask=self.mask,
+            use_mixed_precision=self.settings.use_mixed_precision,
+            xp=self._xp,
+        )
+
+
+class InversionInterferometerMappingCached(
+    AbstractInversionMappingCached, InversionInterferometerMappingOverride
+):
+    @property
+    def operator(self) -> Union[aa.TransformerNUFFT, aa.TransformerDFT]:
+        return self.transformer
+
+
 class AbstractToInversion:
     def __init__(
         self,
@@ -212,6 +416,7 @@ class GalaxiesToInversion(AbstractToInversion):
         galaxies: List[Galaxy],
         adapt_images: Optional[AdaptImages] = None,
         settings: aa.Settings = None,
+        inversion_cache: Optional[InversionCache] = None,
         xp=np,
     ):
         """
@@ -247,9 +452,16 @@ class GalaxiesToInversion(AbstractToInversion):
             the pixelization's pixels to the brightest regions of the image.
         settings
             The settings of the inversion, which controls how the linear algebra calculation is performed.
+        inversion_cache
+            A cache which reuses the `Mapper` objects of pixelizations and the matrices computed from them across
+            calls of the likelihood function when their inputs do not change (see
+            `autogalaxy.analysis.inversion_cache`). It is only used with NumPy.
         """
         self.galaxies = Galaxies(galaxies)
 
+        self.inversion_cache = inversion_cache
+        self.mapper_cache_key_dict = {}
+
         super().__init__(
             dataset=dataset,
             adapt_images=adapt_images,
@@ -331,6 +543,9 @@ class GalaxiesToInversion(AbstractToInversion):
                             light_profile_list=light_profile_list,
                             regularization=light_profile.regularization,
                             settings=self.settings,
+                            transformer=self.transformer_via_uv_from(
+                                light_profile_list=light_profile_list
+                            ),
                             xp=self._xp,
                         )
 
@@ -338,7 +553,35 @@ class GalaxiesToInversion(AbstractToInversion):
 
         return lp_linear_func_galaxy_dict
 
+    def transformer_via_uv_from(
+        self, light_profile_list: List[LightProfileLinear]
+    ) -> Optional[Union[aa.TransformerNUFFT, aa.TransformerDFT]]:
+        """
+        Returns the transformer of the interferometer dataset if the visibilities of a list of linear light
+        profiles are computed via their closed-form Fourier transform, else `None`.
+
+        This is the case if every light profile has a closed-form Fourier transform (its `has_visibilities_via_uv`
+        property is `True`) and the `use_visibilities_via_uv` setting of the `interferometer` section of
+        the `general.yaml` config is `True`.
+
+        Parameters
+        ----------
+        light_profile_list
+            The linear light profiles which are grouped into a `LightProfileLinearObjFuncList`.
+        """
+        if self.transformer is None or not use_visibilities_via_uv():
+            return None
+
+        if not all(
+            light_profile.has_visibilities_via_uv
+            for light_profile in light_profile_list
+        ):
+            return None
+
+        return self.transformer
+
     @cached_property
+    @profiling.profile_method
     def lp_linear_func_list_galaxy_dict(
         self,
     ) -> Dict[LightProfileLinearObjFuncList, Galaxy]:
@@ -381,6 +624,7 @@ class GalaxiesToInversion(AbstractToInversion):
         }
 
     @cached_property
+    @profiling.profile_method
     def image_plane_mesh_grid_list(
         self,
     ) -> Optional[List[aa.Grid2DIrregular]]:
@@ -496,7 +740,45 @@ class GalaxiesToInversion(AbstractToInversion):
             xp=self._xp,
         )
 
+    def mapper_cache_key_from(
+        self,
+        mesh: aa.AbstractMesh,
+        source_plane_data_grid: aa.Grid2D,
+        source_plane_mesh_grid: Optional[aa.Grid2DIrregular],
+        adapt_galaxy_image: Optional[aa.Array2D],
+    ) -> Optional[tuple]:
+        """
+        Returns the key of a `Mapper` in the `inversion_cache`, which fingerprints the mesh and grids it is computed
+        from (see `InversionCache.mapper_key_from`).
+
+        Returns `None` if there is no `inversion_cache`, if JAX is used or if the inputs cannot be fingerprinted,
+        in which case the `Mapper` is computed via `mapper_from` without using the cache.
+
+        Parameters
+        ----------
+        mesh
+            The mesh of the pixelization, which defines the pixels used to reconstruct the data (e.g. `Voronoi`).
+        source_plane_data_grid
+            The data-grid of the source-plane, which in PyAutoGalaxy is the dataset's `pixelization` grid.
+        source_plane_mesh_grid
+            The mesh-grid of the source-plane which reconstructs the data.
+        adapt_galaxy_image
+            The adapt image of the galaxy the pixelization belongs to.
+        """
+        if self.inversion_cache is None or self.use_jax:
+            return None
+
+        return self.inversion_cache.mapper_key_from(
+            mesh=mesh,
+            source_plane_data_grid=source_plane_data_grid,
+            source_plane_mesh_grid=source_plane_mesh_grid,
+            adapt_data=adapt_galaxy_image,
+            border_relocator=self.border_relocator,
+            settings=self.settings,
+        )
+
     @cached_property
+    @profiling.profile_method
     def mapper_galaxy_dict(self) -> Dict[aa.Mapper, Galaxy]:
         """
         Returns a dictionary associating each `Mapper` object with the galaxy it belongs to.
@@ -540,7 +822,8 @@ class GalaxiesToInversion(AbstractToInversion):
             except (AttributeError, KeyError):
                 adapt_galaxy_image = None
 
-            mapper = self.mapper_from(
+            mapper_func = partial(
+                self.mapper_from,
                 mesh=pixelization_list[mapper_index].mesh,
                 regularization=pixelization_list[mapper_index].regularization,
                 source_plane_data_grid=self.dataset.grids.pixelization,
@@ -549,11 +832,59 @@ class GalaxiesToInversion(AbstractToInversion):
                 image_plane_mesh_grid=mesh_grid_list[mapper_index],
             )
 
+            mapper_key = self.mapper_cache_key_from(
+                mesh=pixelization_list[mapper_index].mesh,
+                source_plane_data_grid=self.dataset.grids.pixelization,
+                source_plane_mesh_grid=mesh_grid_list[mapper_index],
+                adapt_galaxy_image=adapt_galaxy_image,
+            )
+
+            if mapper_key is None:
+                mapper = mapper_func()
+            else:
+                mapper = self.inversion_cache.mapper_from(
+                    key=mapper_key,
+                    func=mapper_func,
+                    regularization=pixelization_list[mapper_index].regularization,
+                )
+
+                self.mapper_cache_key_dict[mapper] = mapper_key
+
             mapper_galaxy_dict[mapper] = galaxy
 
         return mapper_galaxy_dict
 
-    @property
+    def use_inversion_mapping_override(
+        self, linear_obj_list: List[aa.LinearObj]
+    ) -> bool:
+        """
+        Returns whether an interferometer inversion uses an `InversionInterferometerMappingOverride`, which is the
+        case if the visibilities of any linear light profiles are computed via their closed-form Fourier transform
+        and the inversion would otherwise use the mapping matrix formalism (e.g. the dataset does not have a sparse
+        operator used for pixelizations).
+
+        Parameters
+        ----------
+        linear_obj_list
+            The linear objects which are used in the inversion.
+        """
+        if not any(
+            isinstance(linear_obj, LightProfileLinearObjFuncList)
+            and linear_obj.transformer is not None
+            for linear_obj in linear_obj_list
+        ):
+            return False
+
+        if getattr(self.dataset, "sparse_operator", None) is None:
+            return True
+
+        return all(
+            isinstance(linear_obj, aa.AbstractLinearObjFuncList)
+            for linear_obj in linear_obj_list
+        )
+
+    @cached_property
+    @profiling.profile_method
     def inversion(self) -> aa.AbstractInversion:
         """
         Returns an inversion object from the dataset, galaxies and inversion settings.
@@ -567,16 +898,54 @@ class GalaxiesToInversion(AbstractToInversion):
         with many of its functions required to set up the inputs to the inversion object, primarily
         the `linear_obj_list` and `linear_obj_galaxy_dict` properties.
 
+        For an interferometer dataset where the visibilities of linear light profiles are computed via their
+        closed-form Fourier transform (see `transformer_via_uv_from`), an `InversionInterferometerMappingOverride` is
+        used, which uses these visibilities instead of Fourier transforming the images of the linear light profiles.
+
+        If any `Mapper` is stored in the `inversion_cache` and the mapping matrix formalism is used, an
+        `InversionImagingMappingCached` or `InversionInterferometerMappingCached` is used, which reuses the operated
+        mapping matrices and curvature matrix computed from the cached `Mapper` objects.
+
         Returns
         -------
         The inversion object which fits the dataset using the galaxies.
         """
-        inversion = inversion_from(
-            dataset=self.dataset,
-            linear_obj_list=self.linear_obj_list,
-            settings=self.settings,
-            xp=self._xp,
-        )
+        linear_obj_list = self.linear_obj_list
+
+        if (
+            len(self.mapper_cache_key_dict) > 0
+            and getattr(self.dataset, "sparse_operator", None) is None
+        ):
+            inversion_cls = (
+                InversionImagingMappingCached
+                if self.transformer is None
+                else InversionInterferometerMappingCached
+            )
+
+            inversion = inversion_cls(
+                dataset=self.dataset,
+                linear_obj_list=linear_obj_list,
+                inversion_cache=self.inversion_cache,
+                mapper_cache_key_dict=self.mapper_cache_key_dict,
+                settings=self.settings,
+                xp=self._xp,
+            )
+        elif self.transformer is not None and self.use_inversion_mapping_override(
+            linear_obj_list=linear_obj_list
+        ):
+            inversion = InversionInterferometerMappingOverride(
+                dataset=self.dataset,
+                linear_obj_list=linear_obj_list,
+                settings=self.settings,
+                xp=self._xp,
+            )
+        else:
+            inversion = inversion_from(
+                dataset=self.dataset,
+                linear_obj_list=linear_obj_list,
+                settings=self.settings,
+                xp=self._xp,
+            )
 
         inversion.linear_obj_galaxy_dict = self.linear_obj_galaxy_dict
 
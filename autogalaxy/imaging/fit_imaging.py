@@ -17,12 +17,12 @@ evaluated inside `log_likelihood_function` and returned to the non-linear search
 import numpy as np
 from typing import Dict, List, Optional
 
-from autoconf import cached_property
-
 import autoarray as aa
 
-from autogalaxy.abstract_fit import AbstractFitInversion
+from autogalaxy import profiling
+from autogalaxy.abstract_fit import AbstractFitInversion, cached_fit_property
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
+from autogalaxy.analysis.inversion_cache import InversionCache
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.to_inversion import GalaxiesToInversion
@@ -41,6 +41,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         dataset_model: Optional[aa.DatasetModel] = None,
         adapt_images: Optional[AdaptImages] = None,
         settings: aa.Settings = None,
+        inversion_cache: Optional[InversionCache] = None,
         xp=np,
     ):
         """
@@ -80,6 +81,9 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             reconstructed galaxy's morphology.
         settings
             Settings controlling how an inversion is fitted for example which linear algebra formalism is used.
+        inversion_cache
+            A cache which reuses the matrices of pixelizations which do not change between fits (e.g. in a model-fit
+            where only the regularization varies), see `autogalaxy.analysis.inversion_cache`.
         """
 
         self.galaxies = Galaxies(galaxies=galaxies)
@@ -98,8 +102,9 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
 
         self.adapt_images = adapt_images
         self.settings = settings or aa.Settings()
+        self.inversion_cache = inversion_cache
 
-    @property
+    @cached_fit_property
     def blurred_image(self) -> aa.Array2D:
         """
         Returns the image of the light profiles of all galaxies in the fit, convolved with the imaging dataset's PSF.
@@ -123,14 +128,14 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             xp=self._xp,
         )
 
-    @property
+    @cached_fit_property
     def profile_subtracted_image(self) -> aa.Array2D:
         """
         Returns the dataset's image data with all blurred light profile images in the fit subtracted.
         """
         return self.data - self.blurred_image
 
-    @property
+    @cached_fit_property
     def galaxies_to_inversion(self) -> GalaxiesToInversion:
         """
         Returns a `GalaxiesToInversion` object that converts the galaxies containing linear light profiles or
@@ -152,10 +157,11 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
             galaxies=self.galaxies,
             adapt_images=self.adapt_images,
             settings=self.settings,
+            inversion_cache=self.inversion_cache,
             xp=self._xp,
         )
 
-    @cached_property
+    @cached_fit_property
     def inversion(self) -> Optional[aa.AbstractInversion]:
         """
         If the galaxies have linear objects which are used to fit the data (e.g. a linear light profile / pixelization)
@@ -169,7 +175,7 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         if self.perform_inversion:
             return self.galaxies_to_inversion.inversion
 
-    @property
+    @cached_fit_property
     def model_data(self) -> aa.Array2D:
         """
         Returns the model-image that is used to fit the data.
@@ -181,9 +187,14 @@ class FitImaging(aa.FitImaging, AbstractFitInversion):
         """
 
         if self.perform_inversion:
-            return (
-                self.blurred_image + self.inversion.mapped_reconstructed_operated_data
-            )
+            inversion = self.inversion
+
+            with profiling.stage(name=f"{type(self).__name__}.linear_algebra"):
+                mapped_reconstructed_operated_data = (
+                    inversion.mapped_reconstructed_operated_data
+                )
+
+            return self.blurred_image + mapped_reconstructed_operated_data
 
         return self.blurred_image
 
@@ -19,6 +19,7 @@ from typing import Optional
 import autofit as af
 import autoarray as aa
 
+from autogalaxy import profiling
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
 from autogalaxy.analysis.analysis.dataset import AnalysisDataset
 from autogalaxy.cosmology.model import LensingCosmology
@@ -83,6 +84,7 @@ class AnalysisImaging(AnalysisDataset):
     def imaging(self):
         return self.dataset
 
+    @profiling.profile_method
     def log_likelihood_function(self, instance: af.ModelInstance) -> float:
         """
         Given an instance of the model, where the model parameters are set via a non-linear search, fit the model
@@ -155,6 +157,7 @@ class AnalysisImaging(AnalysisDataset):
             dataset_model=dataset_model,
             adapt_images=adapt_images,
             settings=self.settings,
+            inversion_cache=self.inversion_cache,
             xp=self._xp,
         )
 
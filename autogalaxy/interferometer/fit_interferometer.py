@@ -14,12 +14,12 @@ Fit an interferometer (ALMA/JVLA uv-plane) dataset with a model consisting of on
 import numpy as np
 from typing import Dict, List, Optional
 
-from autoconf import cached_property
-
 import autoarray as aa
 
-from autogalaxy.abstract_fit import AbstractFitInversion
+from autogalaxy import profiling
+from autogalaxy.abstract_fit import AbstractFitInversion, cached_fit_property
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
+from autogalaxy.analysis.inversion_cache import InversionCache
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.to_inversion import GalaxiesToInversion
@@ -33,6 +33,7 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         dataset_model: Optional[aa.DatasetModel] = None,
         adapt_images: Optional[AdaptImages] = None,
         settings: aa.Settings = None,
+        inversion_cache: Optional[InversionCache] = None,
         xp=np,
     ):
         """
@@ -73,6 +74,9 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             reconstructed galaxy's morphology.
         settings
             Settings controlling how an inversion is fitted for example which linear algebra formalism is used.
+        inversion_cache
+            A cache which reuses the matrices of pixelizations which do not change between fits (e.g. in a model-fit
+            where only the regularization varies), see `autogalaxy.analysis.inversion_cache`.
         """
 
         self.galaxies = Galaxies(galaxies=galaxies)
@@ -89,8 +93,9 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
 
         self.adapt_images = adapt_images
         self.settings = settings or aa.Settings()
+        self.inversion_cache = inversion_cache
 
-    @property
+    @cached_fit_property
     def profile_visibilities(self) -> aa.Visibilities:
         """
         Returns the visibilities of every light profile of every galaxy, which are computed by performing
@@ -100,14 +105,14 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             grid=self.grids.lp, transformer=self.dataset.transformer, xp=self._xp
         )
 
-    @property
+    @cached_fit_property
     def profile_subtracted_visibilities(self) -> aa.Visibilities:
         """
         Returns the interferometer dataset's visibilities with all transformed light profile images subtracted.
         """
         return self.data - self.profile_visibilities
 
-    @property
+    @cached_fit_property
     def galaxies_to_inversion(self) -> GalaxiesToInversion:
         dataset = aa.DatasetInterface(
             data=self.profile_subtracted_visibilities,
@@ -122,10 +127,11 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
             galaxies=self.galaxies,
             adapt_images=self.adapt_images,
             settings=self.settings,
+            inversion_cache=self.inversion_cache,
             xp=self._xp,
         )
 
-    @cached_property
+    @cached_fit_property
     def inversion(self) -> Optional[aa.AbstractInversion]:
         """
         If the galaxies have linear objects which are used to fit the data (e.g. a linear light profile / pixelization)
@@ -137,7 +143,7 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         if self.perform_inversion:
             return self.galaxies_to_inversion.inversion
 
-    @property
+    @cached_fit_property
     def model_data(self) -> aa.Visibilities:
         """
         Returns the model data that is used to fit the data.
@@ -149,10 +155,14 @@ class FitInterferometer(aa.FitInterferometer, AbstractFitInversion):
         """
 
         if self.perform_inversion:
-            return (
-                self.profile_visibilities
-                + self.inversion.mapped_reconstructed_operated_data
-            )
+            inversion = self.inversion
+
+            with profiling.stage(name=f"{type(self).__name__}.linear_algebra"):
+                mapped_reconstructed_operated_data = (
+                    inversion.mapped_reconstructed_operated_data
+                )
+
+            return self.profile_visibilities + mapped_reconstructed_operated_data
 
         return self.profile_visibilities
 
@@ -18,6 +18,7 @@ from autoconf.dictable import to_dict
 import autofit as af
 import autoarray as aa
 
+from autogalaxy import profiling
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
 from autogalaxy.analysis.analysis.dataset import AnalysisDataset
 from autogalaxy.cosmology.model import LensingCosmology
@@ -86,6 +87,7 @@ class AnalysisInterferometer(AnalysisDataset):
     def interferometer(self):
         return self.dataset
 
+    @profiling.profile_method
     def log_likelihood_function(self, instance: af.ModelInstance) -> float:
         """
         Given an instance of the model, where the model parameters are set via a non-linear search, fit the model
@@ -153,6 +155,7 @@ class AnalysisInterferometer(AnalysisDataset):
             galaxies=galaxies,
             adapt_images=adapt_images,
             settings=self.settings,
+            inversion_cache=self.inversion_cache,
             xp=self._xp,
         )
 
@@ -16,8 +16,9 @@ transforming images.
 """
 from __future__ import annotations
 import numpy as np
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from autoconf import conf
 from autoarray import Array2D
 
 if TYPE_CHECKING:
@@ -25,6 +26,105 @@ if TYPE_CHECKING:
 
 import autoarray as aa
 
+from autogalaxy import profiling
+
+
+def use_visibilities_via_uv() -> bool:
+    """
+    Whether light objects whose light profiles all have a closed-form Fourier transform (e.g. Gaussians and bases of
+    them) compute their visibilities directly from the uv-wavelengths of an interferometer dataset, which is set
+    via the `use_visibilities_via_uv` setting of the `interferometer` section of the `general.yaml` config.
+    """
+    return conf.instance["general"]["interferometer"]["use_visibilities_via_uv"]
+
+
+def visibilities_list_via_stacked_transform_from(
+    image_2d_list: List[aa.Array2D], transformer: aa.type.Transformer, xp=np
+) -> List[aa.Visibilities]:
+    """
+    Fourier transforms a list of 2D images to a list of visibilities using a single call of the transformer.
+
+    The images are stacked into an (n_images, n_pixels) block, which is transformed as a mapping matrix via the
+    transformer's `transform_mapping_matrix` method. For a `TransformerDFT` this is a single batched matrix product
+    of the stacked images with the Fourier terms of the grid, instead of recomputing these terms for every image.
+
+    When using NumPy, images which are all zeros (e.g. those of galaxies with no light profiles) are removed from
+    the block before it is transformed, via a boolean mask of the images rather than a Python branch per image, and
+    have visibilities of zeros. When using JAX every image is transformed, as the shape of the block cannot depend
+    on its values.
+
+    Parameters
+    ----------
+    image_2d_list
+        The 2D images which are Fourier transformed, which are all evaluated on the transformer's real-space mask.
+    transformer
+        The **PyAutoArray** `Transformer` object describing how the 2D images are Fourier transformed to visiblities
+        in the uv-plane.
+    """
+    total_visibilities = transformer.uv_wavelengths.shape[0]
+
+    if len(image_2d_list) == 0:
+        return []
+
+    images = xp.stack(
+        [xp.asarray(getattr(image_2d, "array", image_2d)) for image_2d in image_2d_list]
+    )
+
+    if xp is np:
+        has_light = np.any(images != 0.0, axis=1)
+
+        visibilities = np.zeros((len(image_2d_list), total_visibilities), dtype=complex)
+
+        if np.any(has_light):
+            visibilities[has_light] = transformer.transform_mapping_matrix(
+                mapping_matrix=images[has_light].T
+            ).T
+    else:
+        visibilities = transformer.transform_mapping_matrix(
+            mapping_matrix=images.T, xp=xp
+        ).T
+
+    return [
+        aa.Visibilities(visibilities=visibilities[index])
+        for index in range(len(image_2d_list))
+    ]
+
+
+def image_2d_not_operated_and_operated_summed_from(
+    image_2d_tuple_list: List[Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]],
+) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+    """
+    Sums a list of (not operated, operated) image tuples, as returned by the
+    `image_2d_not_operated_and_operated_from` method of light objects, into a single tuple.
+
+    An entry of `None` denotes that a light object has no light of that type, and is skipped rather than being
+    added as an array of zeros. If no entry of a type has light, `None` is returned for it.
+
+    Parameters
+    ----------
+    image_2d_tuple_list
+        The list of (not operated, operated) image tuples which are summed.
+    """
+    image_2d_not_operated = None
+    image_2d_operated = None
+
+    for image_2d_not_operated_i, image_2d_operated_i in image_2d_tuple_list:
+        if image_2d_not_operated_i is not None:
+            image_2d_not_operated = (
+                image_2d_not_operated_i
+                if image_2d_not_operated is None
+                else image_2d_not_operated + image_2d_not_operated_i
+            )
+
+        if image_2d_operated_i is not None:
+            image_2d_operated = (
+                image_2d_operated_i
+                if image_2d_operated is None
+                else image_2d_operated + image_2d_operated_i
+            )
+
+    return image_2d_not_operated, image_2d_operated
+
 
 class OperateImage:
     """
@@ -67,6 +167,43 @@ class OperateImage:
         """
         raise NotImplementedError
 
+    def image_2d_not_operated_and_operated_from(
+        self, grid: aa.Grid2D, xp=np
+    ) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+        """
+        Returns the 2D image of the light profiles which are not operated and the 2D image of the light profiles
+        which are already operated (e.g. `LightProfileOperated` objects) as a tuple.
+
+        This is equivalent to calling `image_2d_from` with `operated_only=False` and `operated_only=True`, but
+        light objects which contain light profiles (e.g. `LightProfile`, `Galaxy`, `Galaxies`) override it so that
+        their light profiles are only walked and evaluated once, with each image added to the image of its type.
+        Images are not computed for light profiles of the other type as arrays of zeros.
+
+        If a light object has no light of a type, `None` is returned for its image.
+
+        This default implementation calls `image_2d_from` twice and is used by light objects which do not
+        override it.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where the images are evaluated.
+        """
+        from autogalaxy.profiles.light.operated import (
+            LightProfileOperated,
+        )
+
+        image_2d_not_operated = self.image_2d_from(
+            grid=grid, xp=xp, operated_only=False
+        )
+
+        if self.has(cls=LightProfileOperated):
+            return image_2d_not_operated, self.image_2d_from(
+                grid=grid, xp=xp, operated_only=True
+            )
+
+        return image_2d_not_operated, None
+
     def _blurred_image_2d_from(
         self,
         image_2d: aa.Array2D,
@@ -90,8 +227,11 @@ class OperateImage:
             The PSF convolver that performs the 2D convolution.
         """
 
-        values = psf.convolved_image_from(
-            image=image_2d, blurring_image=blurring_image_2d, xp=xp
+        values = profiling.call(
+            psf.convolved_image_from,
+            image=image_2d,
+            blurring_image=blurring_image_2d,
+            xp=xp,
         )
         return Array2D(values=values, mask=image_2d.mask)
 
@@ -121,13 +261,17 @@ class OperateImage:
         blurring_grid
             The 2D (y,x) coordinates neighboring the (masked) grid whose light is blurred into the image.
         """
-        from autogalaxy.profiles.light.operated import (
-            LightProfileOperated,
-        )
+        (
+            image_2d_not_operated,
+            image_2d_operated,
+        ) = self.image_2d_not_operated_and_operated_from(grid=grid, xp=xp)
+
+        if image_2d_not_operated is None:
+            if image_2d_operated is None:
+                return Array2D(values=xp.zeros((grid.shape[0],)), mask=grid.mask)
+
+            return image_2d_operated
 
-        image_2d_not_operated = self.image_2d_from(
-            grid=grid, xp=xp, operated_only=False
-        )
         blurring_image_2d_not_operated = self.image_2d_from(
             grid=blurring_grid, xp=xp, operated_only=False
         )
@@ -139,8 +283,7 @@ class OperateImage:
             xp=xp,
         )
 
-        if self.has(cls=LightProfileOperated):
-            image_2d_operated = self.image_2d_from(grid=grid, xp=xp, operated_only=True)
+        if image_2d_operated is not None:
             return blurred_image_2d + image_2d_operated
 
         return blurred_image_2d
@@ -233,6 +376,12 @@ class OperateImage:
         `Galaxy` object with only mass profiles) the Fourier transformed is skipped for efficiency and a `Visibilities`
         object with all zeros is returned.
 
+        If every light profile of the light object has a closed-form Fourier transform (its `has_visibilities_via_uv`
+        property is `True`, for example Gaussians and bases of them) and the `use_visibilities_via_uv` setting of
+        the `interferometer` section of the `general.yaml` config is `True`, the visibilities are instead computed
+        directly from the transformer's `uv_wavelengths` via `visibilities_via_uv_from`, skipping the evaluation of
+        the image on the grid and its Fourier transform.
+
         Parameters
         ----------
         grid
@@ -245,6 +394,15 @@ class OperateImage:
         from autogalaxy.profiles.light.abstract import LightProfile
 
         if self.has(cls=LightProfile) or isinstance(self, LightProfile):
+            if use_visibilities_via_uv() and getattr(
+                self, "has_visibilities_via_uv", False
+            ):
+                return aa.Visibilities(
+                    visibilities=self.visibilities_via_uv_from(
+                        transformer=transformer, xp=xp
+                    )
+                )
+
             image_2d = self.image_2d_from(grid=grid, xp=xp)
             return transformer.visibilities_from(image=image_2d, xp=xp)
 
@@ -375,10 +533,13 @@ class OperateImageList(OperateImage):
         The grid must be a `Grid2D` objects for certain Fourier transforms to be valid. It therefore cannot be a
         `Grid2DIrregular` objects.
 
-        If the image is all zeros (e.g. because this light object has no light profiles, for example it is a
+        If an image is all zeros (e.g. because this light object has no light profiles, for example it is a
         `Galaxy` object with only mass profiles) the Fourier transformed is skipped for efficiency and a `Visibilities`
         object with all zeros is returned.
 
+        All images are Fourier transformed together in one call of the transformer (see
+        `visibilities_list_via_stacked_transform_from`).
+
         Parameters
         ----------
         grid
@@ -387,21 +548,11 @@ class OperateImageList(OperateImage):
             The **PyAutoArray** `Transformer` object describing how the 2D image is Fourier transformed to visiblities
             in the uv-plane.
         """
-        image_2d_list = self.image_2d_list_from(grid=grid)
-
-        visibilities_list = []
-
-        for image_2d in image_2d_list:
-            if not xp.any(image_2d.array):
-                visibilities = aa.Visibilities.zeros(
-                    shape_slim=(transformer.uv_wavelengths.shape[0],)
-                )
-            else:
-                visibilities = transformer.visibilities_from(image=image_2d, xp=xp)
-
-            visibilities_list.append(visibilities)
-
-        return visibilities_list
+        return visibilities_list_via_stacked_transform_from(
+            image_2d_list=self.image_2d_list_from(grid=grid),
+            transformer=transformer,
+            xp=xp,
+        )
 
 
 class OperateImageGalaxies(OperateImageList):
@@ -496,6 +647,9 @@ class OperateImageGalaxies(OperateImageList):
         `Galaxy` object with only mass profiles) the Fourier transformed is skipped for efficiency and a `Visibilities`
         object with all zeros is returned.
 
+        The images of all galaxies are Fourier transformed together in one call of the transformer (see
+        `visibilities_list_via_stacked_transform_from`).
+
         Parameters
         ----------
         grid
@@ -507,19 +661,10 @@ class OperateImageGalaxies(OperateImageList):
 
         galaxy_image_2d_dict = self.galaxy_image_2d_dict_from(grid=grid, xp=xp)
 
-        galaxy_visibilities_dict = {}
-
-        for galaxy_key in galaxy_image_2d_dict.keys():
-            image_2d = galaxy_image_2d_dict[galaxy_key]
-
-            if not xp.any(image_2d.array):
-                visibilities = aa.Visibilities.zeros(
-                    shape_slim=(transformer.uv_wavelengths.shape[0],)
-                )
-
-            else:
-                visibilities = transformer.visibilities_from(image=image_2d)
-
-            galaxy_visibilities_dict[galaxy_key] = visibilities
+        visibilities_list = visibilities_list_via_stacked_transform_from(
+            image_2d_list=list(galaxy_image_2d_dict.values()),
+            transformer=transformer,
+            xp=xp,
+        )
 
-        return galaxy_visibilities_dict
+        return dict(zip(galaxy_image_2d_dict.keys(), visibilities_list))
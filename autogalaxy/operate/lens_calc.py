@@ -5,7 +5,8 @@ Given any object that exposes `deflections_yx_2d_from` (a `MassProfile`, `Galaxy
 `Tracer`), `LensCalc` computes:
 
 - **Hessian** (four components: H_yy, H_xy, H_yx, H_xx) — the matrix of second derivatives of the
-  lensing potential, computed by finite differences (NumPy) or automatic differentiation (JAX).
+  lensing potential, computed in closed form when every mass profile provides one, otherwise by finite
+  differences (NumPy) or automatic differentiation (JAX).
 - **Convergence via Hessian** — κ = 0.5 (H_yy + H_xx), independent of the analytic profile formula.
 - **Shear** — γ₁ = 0.5 (H_xx − H_yy), γ₂ = H_xy.
 - **Magnification** — μ = 1 / det(I − H).
@@ -14,13 +15,17 @@ Given any object that exposes `deflections_yx_2d_from` (a `MassProfile`, `Galaxy
 - **Einstein radius** — the effective radius from the area enclosed by the tangential critical curve.
 - **Fermat potential** — φ(θ) = ½|θ − β|² − ψ(θ), using the optional potential callable.
 
+The quantities derived from the Hessian are computed via a `LensingMaps` object, which evaluates the Hessian once per
+grid, with the lensing maps of the most recent grid cached inside `LensCalc`.
+
 The class is constructed with `LensCalc.from_mass_obj(mass)` or `LensCalc.from_tracer(tracer)`.
 """
 from functools import wraps
 import logging
 import numpy as np
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
+from autoconf import cached_property
 from autoconf import conf
 
 import autoarray as aa
@@ -51,51 +56,208 @@ def grid_scaled_2d_for_marching_squares_from(
     return aa.Grid2DIrregular(values=grid_scaled_1d)
 
 
+def evaluation_grid_from(
+    grid: aa.type.Grid2DLike, pixel_scale: Union[Tuple[float, float], float] = 0.05
+) -> aa.Grid2D:
+    """
+    Returns the uniform grid on which critical curves, caustics and Einstein radii are evaluated, which covers the
+    zoomed-in extent of the input grid's mask at the resolution `pixel_scale`.
+
+    The evaluation grid is capped at `max_evaluation_grid_size` pixels per dimension (see `config -> general.yaml`).
+
+    Parameters
+    ----------
+    grid
+        The grid whose mask defines the extent of the evaluation grid.
+    pixel_scale
+        The pixel scale of the evaluation grid.
+    """
+    pixel_scale_ratio = grid.pixel_scale / pixel_scale
+
+    zoom = aa.Zoom2D(mask=grid.mask)
+
+    zoom_shape_native = zoom.shape_native
+    shape_native = (
+        int(pixel_scale_ratio * zoom_shape_native[0]),
+        int(pixel_scale_ratio * zoom_shape_native[1]),
+    )
+
+    max_evaluation_grid_size = conf.instance["general"]["grid"][
+        "max_evaluation_grid_size"
+    ]
+
+    # This is a hack to prevent the evaluation gird going beyond 1000 x 1000 pixels, which slows the code
+    # down a lot. Need a better moe robust way to set this up for any general lens.
+
+    if shape_native[0] > max_evaluation_grid_size:
+        pixel_scale = pixel_scale_ratio / (
+            shape_native[0] / float(max_evaluation_grid_size)
+        )
+        shape_native = (max_evaluation_grid_size, max_evaluation_grid_size)
+
+    grid = aa.Grid2D.uniform(
+        shape_native=shape_native,
+        pixel_scales=(pixel_scale, pixel_scale),
+        origin=zoom.offset_scaled,
+    )
+
+    grid.is_evaluation_grid = True
+
+    return grid
+
+
+def quadtree_pixel_scale_from(pixel_scale: Union[Tuple[float, float], float]) -> float:
+    """
+    Returns the pixel scale of the evaluation grid whose cells are refined when critical curves are computed to a
+    `precision` via adaptive quadtree refinement (see `autogalaxy.operate.quadtree`).
+
+    The refinement only evaluates the Hessian near the critical curves, therefore the evaluation grid it starts from
+    only needs to resolve the smallest critical curve of interest. It is created at the `quadtree_pixel_scale` of the
+    `grid` section of the `general.yaml` config, unless the input `pixel_scale` is coarser.
+
+    Parameters
+    ----------
+    pixel_scale
+        The pixel scale of the evaluation grid input by the user.
+    """
+    if isinstance(pixel_scale, tuple):
+        pixel_scale = pixel_scale[0]
+
+    return max(pixel_scale, conf.instance["general"]["grid"]["quadtree_pixel_scale"])
+
+
 def evaluation_grid(func):
     @wraps(func)
     def wrapper(
-        lensing_obj, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        lensing_obj,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ):
         if hasattr(grid, "is_evaluation_grid"):
             if grid.is_evaluation_grid:
-                return func(lensing_obj, grid, pixel_scale)
+                return func(lensing_obj, grid, pixel_scale, precision)
 
-        pixel_scale_ratio = grid.pixel_scale / pixel_scale
+        # Critical curves computed to a precision refine a coarse evaluation grid, instead of first computing the
+        # Hessian on every pixel of a dense evaluation grid.
 
-        zoom = aa.Zoom2D(mask=grid.mask)
+        if precision is not None:
+            pixel_scale = quadtree_pixel_scale_from(pixel_scale=pixel_scale)
 
-        zoom_shape_native = zoom.shape_native
-        shape_native = (
-            int(pixel_scale_ratio * zoom_shape_native[0]),
-            int(pixel_scale_ratio * zoom_shape_native[1]),
-        )
+        # The evaluation grid of the most recent input grid is reused, so that the lensing maps cached for it by
+        # `LensCalc.lensing_maps_from` are reused by every method called with the same grid.
 
-        max_evaluation_grid_size = conf.instance["general"]["grid"][
-            "max_evaluation_grid_size"
-        ]
+        evaluation_grid_cache = getattr(lensing_obj, "_evaluation_grid_cache", None)
 
-        # This is a hack to prevent the evaluation gird going beyond 1000 x 1000 pixels, which slows the code
-        # down a lot. Need a better moe robust way to set this up for any general lens.
+        if (
+            evaluation_grid_cache is not None
+            and evaluation_grid_cache[0] is grid
+            and evaluation_grid_cache[1] == pixel_scale
+        ):
+            return func(lensing_obj, evaluation_grid_cache[2], pixel_scale, precision)
 
-        if shape_native[0] > max_evaluation_grid_size:
-            pixel_scale = pixel_scale_ratio / (
-                shape_native[0] / float(max_evaluation_grid_size)
-            )
-            shape_native = (max_evaluation_grid_size, max_evaluation_grid_size)
+        input_grid = grid
+        input_pixel_scale = pixel_scale
 
-        grid = aa.Grid2D.uniform(
-            shape_native=shape_native,
-            pixel_scales=(pixel_scale, pixel_scale),
-            origin=zoom.offset_scaled,
-        )
+        grid = evaluation_grid_from(grid=grid, pixel_scale=pixel_scale)
 
-        grid.is_evaluation_grid = True
+        lensing_obj._evaluation_grid_cache = (input_grid, input_pixel_scale, grid)
 
-        return func(lensing_obj, grid, pixel_scale)
+        return func(lensing_obj, grid, pixel_scale, precision)
 
     return wrapper
 
 
+class LensingMaps:
+    def __init__(self, hessian_yy, hessian_xy, hessian_yx, hessian_xx, xp=np):
+        """
+        The lensing maps derived from a single evaluation of the Hessian of a lensing object on a grid, which are the
+        convergence, shear, tangential and radial eigen values, magnification and Jacobian.
+
+        Every map is computed from the four Hessian components the first time it is accessed and then cached, meaning
+        that computing all of them (e.g. to compute the tangential and radial critical curves and caustics of a lens)
+        requires the deflection angles to only be differentiated once.
+
+        Maps are returned as raw arrays of the input array module `xp`, with wrapping in `autoarray` data structures
+        performed by the `LensCalc` methods which use them.
+
+        Parameters
+        ----------
+        hessian_yy, hessian_xy, hessian_yx, hessian_xx
+            The four components of the Hessian, as returned by `LensCalc.hessian_from`.
+        xp
+            The array module (``numpy`` or ``jax.numpy``) of the Hessian components.
+        """
+        self.hessian_yy = hessian_yy
+        self.hessian_xy = hessian_xy
+        self.hessian_yx = hessian_yx
+        self.hessian_xx = hessian_xx
+
+        self._xp = xp
+
+    @cached_property
+    def convergence(self):
+        """
+        The convergence `0.5 * (hessian_yy + hessian_xx)` (see equation 56 https://inspirehep.net/literature/419263).
+        """
+        return 0.5 * (self.hessian_yy + self.hessian_xx)
+
+    @cached_property
+    def shear_yx(self):
+        """
+        The (gamma_2, gamma_1) shear vectors `(hessian_xy, 0.5 * (hessian_xx - hessian_yy))` with shape
+        [total_coordinates, 2] (see equation 57 https://inspirehep.net/literature/419263).
+        """
+        gamma_1 = 0.5 * (self.hessian_xx - self.hessian_yy)
+        gamma_2 = self.hessian_xy
+
+        return self._xp.stack([gamma_2, gamma_1], axis=-1)
+
+    @cached_property
+    def shear_magnitudes(self):
+        """
+        The magnitude of every shear vector.
+        """
+        return self._xp.sqrt(self.shear_yx[:, 0] ** 2 + self.shear_yx[:, 1] ** 2)
+
+    @cached_property
+    def tangential_eigen_value(self):
+        """
+        The tangential eigen values of the lensing Jacobian, `1 - convergence - shear`.
+        """
+        return 1 - self.convergence - self.shear_magnitudes
+
+    @cached_property
+    def radial_eigen_value(self):
+        """
+        The radial eigen values of the lensing Jacobian, `1 - convergence + shear`.
+        """
+        return 1 - self.convergence + self.shear_magnitudes
+
+    @cached_property
+    def jacobian(self) -> List:
+        """
+        The lensing Jacobian `A = I - H` as a 2x2 list of lists,
+        `[[1 - hessian_xx, -hessian_xy], [-hessian_yx, 1 - hessian_yy]]`.
+        """
+        return [
+            [1 - self.hessian_xx, -self.hessian_xy],
+            [-self.hessian_yx, 1 - self.hessian_yy],
+        ]
+
+    @cached_property
+    def magnification(self):
+        """
+        The magnification, which is the inverse of the determinant of the lensing Jacobian (see equation 60
+        https://inspirehep.net/literature/419263).
+        """
+        det_A = (1 - self.hessian_xx) * (
+            1 - self.hessian_yy
+        ) - self.hessian_xy * self.hessian_yx
+
+        return 1 / det_A
+
+
 class LensCalc:
     """
     Computes lensing quantities from a deflection-angle callable and an optional potential callable.
@@ -113,11 +275,22 @@ class LensCalc:
     potential_2d_from
         Optional callable with signature ``(grid, xp=np, **kwargs)`` that returns the 2D
         lensing potential on the given grid.  Required only for ``fermat_potential_from``.
+    hessian_2d_from
+        Optional callable with signature ``(grid, xp=np, **kwargs)`` that returns the Hessian
+        of the lensing potential in closed form as a 4-entry tuple
+        ``(hessian_yy, hessian_xy, hessian_yx, hessian_xx)``.  If supplied, ``hessian_from``
+        uses it instead of numerical differentiation of the deflection angles.
     """
 
-    def __init__(self, deflections_yx_2d_from, potential_2d_from=None):
+    def __init__(
+        self, deflections_yx_2d_from, potential_2d_from=None, hessian_2d_from=None
+    ):
         self.deflections_yx_2d_from = deflections_yx_2d_from
         self.potential_2d_from = potential_2d_from
+        self.hessian_2d_from = hessian_2d_from
+
+        self._evaluation_grid_cache = None
+        self._lensing_maps_cache = None
 
     @classmethod
     def from_mass_obj(cls, mass_obj):
@@ -125,10 +298,20 @@ class LensCalc:
 
         If the object also exposes ``potential_2d_from``, it is captured so that
         ``fermat_potential_from`` is available on the returned instance.
+
+        If every mass profile of the object has a closed-form Hessian (its ``has_analytical_hessian``
+        property is ``True``), ``analytical_hessian_2d_from`` is captured so that ``hessian_from``
+        and every quantity derived from it use it.
         """
+        hessian_2d_from = None
+
+        if getattr(mass_obj, "has_analytical_hessian", False):
+            hessian_2d_from = mass_obj.analytical_hessian_2d_from
+
         return cls(
             deflections_yx_2d_from=mass_obj.deflections_yx_2d_from,
             potential_2d_from=getattr(mass_obj, "potential_2d_from", None),
+            hessian_2d_from=hessian_2d_from,
         )
 
     @classmethod
@@ -258,19 +441,16 @@ class LensCalc:
             The 2D grid of (y,x) arc-second coordinates the deflection angles and tangential eigen values are computed
             on.
         xp
-            The array module (``numpy`` or ``jax.numpy``). Passed through to ``convergence_2d_via_hessian_from``
-            and ``shear_yx_2d_via_hessian_from``. When ``xp`` is not ``numpy`` the result is a raw array rather
-            than an ``aa.Array2D`` wrapper.
+            The array module (``numpy`` or ``jax.numpy``). Passed through to ``lensing_maps_from``. When ``xp`` is
+            not ``numpy`` the result is a raw array rather than an ``aa.Array2D`` wrapper.
         """
-        convergence = self.convergence_2d_via_hessian_from(grid=grid, xp=xp)
-        shear_yx = self.shear_yx_2d_via_hessian_from(grid=grid, xp=xp)
+        tangential_eigen_value = self.lensing_maps_from(
+            grid=grid, xp=xp
+        ).tangential_eigen_value
 
         if xp is np:
-            return aa.Array2D(
-                values=1 - convergence - shear_yx.magnitudes, mask=grid.mask
-            )
-        magnitudes = xp.sqrt(shear_yx[:, 0] ** 2 + shear_yx[:, 1] ** 2)
-        return 1 - convergence - magnitudes
+            return aa.Array2D(values=tangential_eigen_value, mask=grid.mask)
+        return tangential_eigen_value
 
     def radial_eigen_value_from(self, grid, xp=np) -> aa.Array2D:
         """
@@ -283,19 +463,14 @@ class LensCalc:
         grid
             The 2D grid of (y,x) arc-second coordinates the deflection angles and radial eigen values are computed on.
         xp
-            The array module (``numpy`` or ``jax.numpy``). Passed through to ``convergence_2d_via_hessian_from``
-            and ``shear_yx_2d_via_hessian_from``. When ``xp`` is not ``numpy`` the result is a raw array rather
-            than an ``aa.Array2D`` wrapper.
+            The array module (``numpy`` or ``jax.numpy``). Passed through to ``lensing_maps_from``. When ``xp`` is
+            not ``numpy`` the result is a raw array rather than an ``aa.Array2D`` wrapper.
         """
-        convergence = self.convergence_2d_via_hessian_from(grid=grid, xp=xp)
-        shear = self.shear_yx_2d_via_hessian_from(grid=grid, xp=xp)
+        radial_eigen_value = self.lensing_maps_from(grid=grid, xp=xp).radial_eigen_value
 
         if xp is np:
-            return aa.Array2D(
-                values=1 - convergence + shear.magnitudes, mask=grid.mask
-            )
-        magnitudes = xp.sqrt(shear[:, 0] ** 2 + shear[:, 1] ** 2)
-        return 1 - convergence + magnitudes
+            return aa.Array2D(values=radial_eigen_value, mask=grid.mask)
+        return radial_eigen_value
 
     def magnification_2d_from(self, grid, xp=np) -> aa.Array2D:
         """
@@ -310,25 +485,23 @@ class LensCalc:
             The array module (``numpy`` or ``jax.numpy``). Passed through to ``hessian_from``. When ``xp`` is
             not ``numpy`` the result is a raw array rather than an ``aa.Array2D`` wrapper.
         """
-        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
-            grid=grid, xp=xp
-        )
-
-        det_A = (1 - hessian_xx) * (1 - hessian_yy) - hessian_xy * hessian_yx
+        magnification = self.lensing_maps_from(grid=grid, xp=xp).magnification
 
         if xp is np:
-            return aa.Array2D(values=1 / det_A, mask=grid.mask)
-        return 1 / det_A
+            return aa.Array2D(values=magnification, mask=grid.mask)
+        return magnification
 
     def deflections_yx_scalar(self, y, x, pixel_scales):
         """
         Returns the deflection angles at a single (y, x) arc-second coordinate as a JAX array of
         shape (2,), where index 0 is the y-deflection and index 1 is the x-deflection.
 
-        This is an internal method used by `hessian_from` to enable JAX auto-differentiation via
-        `jax.jacfwd`. The function must accept y and x as two separate scalar inputs (rather than
-        a single combined array) so that JAX treats the function as R² -> R² and computes a proper
-        2x2 Jacobian matrix.
+        This enables JAX auto-differentiation via `jax.jacfwd` at a single coordinate. The function
+        must accept y and x as two separate scalar inputs (rather than a single combined array) so that
+        JAX treats the function as R² -> R² and computes a proper 2x2 Jacobian matrix.
+
+        `hessian_from` does not use this function, as differentiating the whole grid in batches via
+        forward-mode JVPs is much faster to trace and evaluate on large grids.
 
         Parameters
         ----------
@@ -347,7 +520,7 @@ class LensCalc:
         )
         return self.deflections_yx_2d_from(grid, xp=jnp).squeeze()
 
-    def hessian_from(self, grid, xp=np) -> Tuple:
+    def hessian_from(self, grid, xp=np, chunk_size: Optional[int] = None) -> Tuple:
         """
         Returns the Hessian of the lensing object, where the Hessian is the second partial derivatives of the
         potential (see equation 55 https://inspirehep.net/literature/419263):
@@ -357,14 +530,21 @@ class LensCalc:
         The Hessian is returned as a 4-entry tuple reflecting its structure as a 2x2 matrix:
         (hessian_yy, hessian_xy, hessian_yx, hessian_xx).
 
-        Two computational paths are available, selected via the `xp` parameter:
+        If a closed-form Hessian callable was supplied (e.g. via ``from_mass_obj`` for a mass object
+        whose every mass profile has ``has_analytical_hessian``), it is used for both NumPy and JAX, which
+        requires a single pass over the grid. Otherwise two computational paths are available, selected
+        via the `xp` parameter:
 
         - **NumPy** (``xp=np``, default): finite-difference approximation. Deflection angles are
           evaluated at four shifted positions around each grid coordinate (±y, ±x) and the
           central difference is taken. JAX is not imported.
 
-        - **JAX** (``xp=jnp``): exact derivatives via ``jax.jacfwd`` applied to
-          ``deflections_yx_scalar``, vectorised over the grid with ``jnp.vectorize``.
+        - **JAX** (``xp=jnp``): exact derivatives via two forward-mode JVPs (along y and along x) of
+          the deflection angle function evaluated on the whole grid at once. Because the deflection
+          angle at each coordinate depends only on that coordinate, the Jacobian of the grid
+          deflections is block diagonal and the two JVPs give every Hessian component. The grid is
+          processed in chunks of ``chunk_size`` coordinates with ``jax.lax.map``, so peak memory stays
+          bounded on large evaluation grids.
 
         Both paths support uniform ``Grid2D`` and irregular ``Grid2DIrregular`` grids.
 
@@ -375,39 +555,90 @@ class LensCalc:
         xp
             The array module (``numpy`` or ``jax.numpy``). Controls which computational path is
             used and the type of the returned arrays.
+        chunk_size
+            The number of coordinates differentiated together by the JAX path. If not input, the
+            ``hessian_chunk_size`` value of the ``general.yaml`` config's ``grid`` section is used.
         """
+        if self.hessian_2d_from is not None:
+            return self._hessian_via_analytic(grid=grid, xp=xp)
         if xp is np:
             return self._hessian_via_finite_difference(grid=grid)
-        return self._hessian_via_jax(grid=grid, xp=xp)
+        return self._hessian_via_jax(grid=grid, xp=xp, chunk_size=chunk_size)
+
+    def _hessian_via_analytic(self, grid, xp) -> Tuple:
+        grid = aa.Grid2DIrregular(values=xp.stack([grid[:, 0], grid[:, 1]], axis=1))
+
+        return self.hessian_2d_from(grid=grid, xp=xp)
 
-    def _hessian_via_jax(self, grid, xp) -> Tuple:
+    def _hessian_via_jax(self, grid, xp, chunk_size: Optional[int] = None) -> Tuple:
         import jax
         import jax.numpy as jnp
 
-        pixel_scales = getattr(grid, "pixel_scales", (0.05, 0.05))
+        if chunk_size is None:
+            chunk_size = conf.instance["general"]["grid"]["hessian_chunk_size"]
 
         y = jnp.array(grid[:, 0])
         x = jnp.array(grid[:, 1])
 
-        def _hessian_single(y_scalar, x_scalar):
+        total_coordinates = y.shape[0]
+        chunk_size = max(1, min(int(chunk_size), total_coordinates))
+        total_chunks = -(-total_coordinates // chunk_size)
+        total_padding = total_chunks * chunk_size - total_coordinates
+
+        # The grid is padded to a whole number of chunks by repeating its final coordinate, so padded entries
+        # never land on a singular point (e.g. a profile centre) and produce NaNs.
+        y = jnp.concatenate((y, jnp.repeat(y[-1:], total_padding)))
+        x = jnp.concatenate((x, jnp.repeat(x[-1:], total_padding)))
+
+        def deflections_from(y_chunk, x_chunk):
+            deflections = self.deflections_yx_2d_from(
+                aa.Grid2DIrregular(values=jnp.stack((y_chunk, x_chunk), axis=-1)),
+                xp=jnp,
+            )
+            return getattr(deflections, "array", deflections)
+
+        def hessian_chunk_from(yx_chunk):
+            y_chunk, x_chunk = yx_chunk
+
+            ones = jnp.ones_like(y_chunk)
+            zeros = jnp.zeros_like(y_chunk)
+
+            _, deflections_dy = jax.jvp(
+                deflections_from, (y_chunk, x_chunk), (ones, zeros)
+            )
+            _, deflections_dx = jax.jvp(
+                deflections_from, (y_chunk, x_chunk), (zeros, ones)
+            )
+
             return jnp.stack(
-                jax.jacfwd(self.deflections_yx_scalar, argnums=(0, 1))(
-                    y_scalar, x_scalar, pixel_scales
+                (
+                    deflections_dy[:, 0],
+                    deflections_dy[:, 1],
+                    deflections_dx[:, 0],
+                    deflections_dx[:, 1],
                 )
             )
 
-        h = jnp.vectorize(_hessian_single, signature="(),()->(i,i)")(y, x)
+        h = jax.lax.map(
+            hessian_chunk_from,
+            (
+                y.reshape(total_chunks, chunk_size),
+                x.reshape(total_chunks, chunk_size),
+            ),
+        )
+
+        # h has shape (total_chunks, 4, chunk_size) and is reshaped to (4, N):
+        #   h[0] = d(defl_y)/dy  = hessian_yy
+        #   h[1] = d(defl_x)/dy  = hessian_xy
+        #   h[2] = d(defl_y)/dx  = hessian_yx
+        #   h[3] = d(defl_x)/dx  = hessian_xx
+        h = jnp.moveaxis(h, 1, 0).reshape(4, -1)[:, :total_coordinates]
 
-        # h has shape (N, 2, 2):
-        #   h[..., 0, 0] = d(defl_y)/dy  = hessian_yy
-        #   h[..., 0, 1] = d(defl_x)/dy  = hessian_xy
-        #   h[..., 1, 0] = d(defl_y)/dx  = hessian_yx
-        #   h[..., 1, 1] = d(defl_x)/dx  = hessian_xx
         return (
-            xp.array(h[..., 0, 0]),
-            xp.array(h[..., 0, 1]),
-            xp.array(h[..., 1, 0]),
-            xp.array(h[..., 1, 1]),
+            xp.array(h[0]),
+            xp.array(h[1]),
+            xp.array(h[2]),
+            xp.array(h[3]),
         )
 
     def _hessian_via_finite_difference(self, grid, buffer: float = 0.01) -> Tuple:
@@ -436,6 +667,62 @@ class LensCalc:
 
         return hessian_yy, hessian_xy, hessian_yx, hessian_xx
 
+    def lensing_maps_from(self, grid, xp=np) -> LensingMaps:
+        """
+        Returns the `LensingMaps` of the lensing object on a grid, from which the convergence, shear, tangential and
+        radial eigen values, magnification and Jacobian are derived using a single evaluation of `hessian_from`.
+
+        When using NumPy, the lensing maps of the most recent grid are cached, keyed on the identity of the grid
+        object, so that every quantity computed on the same grid (e.g. the tangential and radial critical curves and
+        caustics and the Einstein radius) reuses one Hessian. A grid must therefore not be changed in-place between
+        calls. Lensing maps computed with JAX are not cached, as they may contain tracers.
+
+        Parameters
+        ----------
+        grid
+            The 2D grid of (y,x) arc-second coordinates the Hessian is computed on.
+        xp
+            The array module (``numpy`` or ``jax.numpy``). Passed through to ``hessian_from``.
+        """
+        if (
+            xp is np
+            and self._lensing_maps_cache is not None
+            and self._lensing_maps_cache[0] is grid
+        ):
+            return self._lensing_maps_cache[1]
+
+        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
+            grid=grid, xp=xp
+        )
+
+        lensing_maps = LensingMaps(
+            hessian_yy=hessian_yy,
+            hessian_xy=hessian_xy,
+            hessian_yx=hessian_yx,
+            hessian_xx=hessian_xx,
+            xp=xp,
+        )
+
+        if xp is np:
+            self._lensing_maps_cache = (grid, lensing_maps)
+
+        return lensing_maps
+
+    def set_lensing_maps(self, grid, lensing_maps: LensingMaps):
+        """
+        Sets the cached `LensingMaps` of a grid to lensing maps computed elsewhere, for example for many lensing
+        objects at once via `jax.vmap` (see `autogalaxy.operate.lens_calc_batch`), so that quantities derived from
+        them (e.g. critical curves and Einstein radii) do not recompute the Hessian.
+
+        Parameters
+        ----------
+        grid
+            The 2D grid of (y,x) arc-second coordinates the lensing maps were computed on.
+        lensing_maps
+            The lensing maps of this lensing object on the grid.
+        """
+        self._lensing_maps_cache = (grid, lensing_maps)
+
     def jacobian_from(self, grid, xp=np) -> List:
         """
         Returns the lensing Jacobian of the lensing object as a 2x2 list of lists.
@@ -456,16 +743,7 @@ class LensCalc:
             The array module (``numpy`` or ``jax.numpy``). Passed through to
             ``hessian_from``.
         """
-        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
-            grid=grid, xp=xp
-        )
-
-        a11 = 1 - hessian_xx
-        a12 = -hessian_xy
-        a21 = -hessian_yx
-        a22 = 1 - hessian_yy
-
-        return [[a11, a12], [a21, a22]]
+        return self.lensing_maps_from(grid=grid, xp=xp).jacobian
 
     def convergence_2d_via_hessian_from(self, grid, xp=np) -> aa.ArrayIrregular:
         """
@@ -489,11 +767,7 @@ class LensCalc:
             `hessian_from`. When `xp` is not `numpy` (e.g. inside a `jax.jit` trace) the result is returned
             as a raw array rather than an `aa.ArrayIrregular` wrapper.
         """
-        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
-            grid=grid, xp=xp
-        )
-
-        convergence = 0.5 * (hessian_yy + hessian_xx)
+        convergence = self.lensing_maps_from(grid=grid, xp=xp).convergence
 
         if xp is np:
             return aa.ArrayIrregular(values=convergence)
@@ -528,15 +802,7 @@ class LensCalc:
             `hessian_from`. When `xp` is not `numpy` (e.g. inside a `jax.jit` trace) the result is returned
             as a raw array of shape `(N, 2)` rather than a `ShearYX2DIrregular` wrapper.
         """
-
-        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
-            grid=grid, xp=xp
-        )
-
-        gamma_1 = 0.5 * (hessian_xx - hessian_yy)
-        gamma_2 = hessian_xy
-
-        shear_yx_2d = xp.stack([gamma_2, gamma_1], axis=-1)
+        shear_yx_2d = self.lensing_maps_from(grid=grid, xp=xp).shear_yx
 
         if xp is np:
             return ShearYX2DIrregular(values=shear_yx_2d, grid=grid)
@@ -562,15 +828,11 @@ class LensCalc:
         grid
             The 2D grid of (y,x) arc-second coordinates the deflection angles and magnification map are computed on.
         """
-        hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
-            grid=grid, xp=xp
-        )
-
-        det_A = (1 - hessian_xx) * (1 - hessian_yy) - hessian_xy * hessian_yx
+        magnification = self.lensing_maps_from(grid=grid, xp=xp).magnification
 
         if xp is np:
-            return aa.ArrayIrregular(values=1.0 / det_A)
-        return 1.0 / det_A
+            return aa.ArrayIrregular(values=magnification)
+        return magnification
 
     def contour_list_from(self, grid, contour_array):
         grid_contour = aa.Grid2DContour(
@@ -582,9 +844,70 @@ class LensCalc:
 
         return grid_contour.contour_list
 
+    def critical_curve_list_via_quadtree_from(
+        self, grid: aa.Grid2D, eigen_value: str, precision: float
+    ) -> List[aa.Grid2DIrregular]:
+        """
+        Returns the critical curves which are the zero contours of the tangential or radial eigen values of the lensing
+        Jacobian, computed via adaptive quadtree refinement (see `autogalaxy.operate.quadtree`).
+
+        The eigen values on the uniform input grid are computed via `lensing_maps_from` (and therefore reused if they
+        were computed before). Every cell of the grid the critical curves pass through is then recursively split into
+        2x2 sub-cells until the cells are smaller than the input precision, with the Hessian only computed at the
+        corners of the refined cells.
+
+        When a `precision` is input, the `evaluation_grid` decorator creates the input grid at the coarse pixel scale
+        given by `quadtree_pixel_scale_from`, such that the Hessian is not computed on every pixel of a dense grid.
+
+        Parameters
+        ----------
+        grid
+            The uniform 2D grid of (y,x) arc-second coordinates whose cells are refined, which is typically the
+            evaluation grid created by the `evaluation_grid` decorator.
+        eigen_value
+            The `LensingMaps` attribute whose zero contours are the critical curves, which is either
+            `tangential_eigen_value` or `radial_eigen_value`.
+        precision
+            The arc-second size the refined cells must be smaller than.
+        """
+        from autogalaxy.operate import quadtree
+
+        def eigen_values_from(grid_values: np.ndarray) -> np.ndarray:
+            hessian_yy, hessian_xy, hessian_yx, hessian_xx = self.hessian_from(
+                grid=aa.Grid2DIrregular(values=grid_values)
+            )
+
+            return getattr(
+                LensingMaps(
+                    hessian_yy=hessian_yy,
+                    hessian_xy=hessian_xy,
+                    hessian_yx=hessian_yx,
+                    hessian_xx=hessian_xx,
+                ),
+                eigen_value,
+            )
+
+        eigen_values = getattr(self.lensing_maps_from(grid=grid), eigen_value)
+
+        grid_native = np.asarray(grid.native.array)
+
+        contour_list = quadtree.zero_contour_list_via_quadtree_from(
+            values_from=eigen_values_from,
+            values_native=np.asarray(eigen_values).reshape(grid.shape_native),
+            y_top=grid_native[0, 0, 0],
+            x_left=grid_native[0, 0, 1],
+            pixel_scale=grid.pixel_scales[0],
+            precision=precision,
+        )
+
+        return [aa.Grid2DIrregular(values=contour) for contour in contour_list]
+
     @evaluation_grid
     def tangential_critical_curve_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[aa.Grid2DIrregular]:
         """
         Returns all tangential critical curves of the lensing system, which are computed as follows:
@@ -603,14 +926,26 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             critical curve to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
+        if precision is not None:
+            return self.critical_curve_list_via_quadtree_from(
+                grid=grid, eigen_value="tangential_eigen_value", precision=precision
+            )
+
         tangential_eigen_values = self.tangential_eigen_value_from(grid=grid)
 
         return self.contour_list_from(grid=grid, contour_array=tangential_eigen_values)
 
     @evaluation_grid
     def radial_critical_curve_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[aa.Grid2DIrregular]:
         """
         Returns all radial critical curves of the lensing system, which are computed as follows:
@@ -629,14 +964,26 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             critical curve to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
+        if precision is not None:
+            return self.critical_curve_list_via_quadtree_from(
+                grid=grid, eigen_value="radial_eigen_value", precision=precision
+            )
+
         radial_eigen_values = self.radial_eigen_value_from(grid=grid)
 
         return self.contour_list_from(grid=grid, contour_array=radial_eigen_values)
 
     @evaluation_grid
     def tangential_caustic_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[aa.Grid2DIrregular]:
         """
         Returns all tangential caustics of the lensing system, which are computed as follows:
@@ -657,10 +1004,14 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
 
         tangential_critical_curve_list = self.tangential_critical_curve_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
 
         tangential_caustic_list = []
@@ -678,7 +1029,10 @@ class LensCalc:
 
     @evaluation_grid
     def radial_caustic_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[aa.Grid2DIrregular]:
         """
         Returns all radial caustics of the lensing system, which are computed as follows:
@@ -699,10 +1053,14 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
 
         radial_critical_curve_list = self.radial_critical_curve_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
 
         radial_caustic_list = []
@@ -720,7 +1078,10 @@ class LensCalc:
 
     @evaluation_grid
     def radial_critical_curve_area_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float]
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float],
+        precision: Optional[float] = None,
     ) -> List[float]:
         """
         Returns the surface area within each radial critical curve as a list, the calculation of which is described in
@@ -740,16 +1101,23 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
         radial_critical_curve_list = self.radial_critical_curve_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
 
         return self.area_within_curve_list_from(curve_list=radial_critical_curve_list)
 
     @evaluation_grid
     def tangential_critical_curve_area_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[float]:
         """
         Returns the surface area within each tangential critical curve as a list, the calculation of which is
@@ -768,9 +1136,13 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
         tangential_critical_curve_list = self.tangential_critical_curve_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
 
         return self.area_within_curve_list_from(
@@ -791,7 +1163,10 @@ class LensCalc:
 
     @evaluation_grid
     def einstein_radius_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ):
         """
         Returns a list of the Einstein radii corresponding to the area within each tangential critical curve.
@@ -816,10 +1191,14 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
         try:
             area_list = self.tangential_critical_curve_area_list_from(
-                grid=grid, pixel_scale=pixel_scale
+                grid=grid, pixel_scale=pixel_scale, precision=precision
             )
             return [np.sqrt(area / np.pi) for area in area_list]
         except TypeError:
@@ -827,7 +1206,10 @@ class LensCalc:
 
     @evaluation_grid
     def einstein_radius_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ):
         """
         Returns the Einstein radius corresponding to the area within the tangential critical curve.
@@ -855,9 +1237,15 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
 
-        einstein_radii_list = self.einstein_radius_list_from(grid=grid)
+        einstein_radii_list = self.einstein_radius_list_from(
+            grid=grid, precision=precision
+        )
 
         if len(einstein_radii_list) > 1:
             logger.info(
@@ -871,7 +1259,10 @@ class LensCalc:
 
     @evaluation_grid
     def einstein_mass_angular_list_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> List[float]:
         """
         Returns a list of the angular Einstein massses corresponding to the area within each tangential critical curve.
@@ -899,15 +1290,22 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
         einstein_radius_list = self.einstein_radius_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
         return [np.pi * einstein_radius**2 for einstein_radius in einstein_radius_list]
 
     @evaluation_grid
     def einstein_mass_angular_from(
-        self, grid, pixel_scale: Union[Tuple[float, float], float] = 0.05
+        self,
+        grid,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+        precision: Optional[float] = None,
     ) -> float:
         """
         Returns the Einstein radius corresponding to the area within the tangential critical curve.
@@ -935,9 +1333,13 @@ class LensCalc:
         pixel_scale
             If input, the `evaluation_grid` decorator creates the 2D grid at this resolution, therefore enabling the
             caustic to be computed more accurately using a higher resolution grid.
+        precision
+            If input, the critical curves are computed by adaptively refining the cells of the evaluation grid they
+            pass through until they are smaller than this arc-second precision (see `autogalaxy.operate.quadtree`),
+            instead of using marching squares on the evaluation grid.
         """
         einstein_mass_angular_list = self.einstein_mass_angular_list_from(
-            grid=grid, pixel_scale=pixel_scale
+            grid=grid, pixel_scale=pixel_scale, precision=precision
         )
 
         if len(einstein_mass_angular_list) > 1:
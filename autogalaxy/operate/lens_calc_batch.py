@@ -0,0 +1,271 @@
+"""
+Batched lensing calculations, which compute the Einstein radii and angular Einstein masses of many lensing objects
+(e.g. every sample of a non-linear search's posterior) on one shared evaluation grid.
+
+Two routes are provided:
+
+- `einstein_radius_and_mass_list_from`: takes a list of mass objects (e.g. `Galaxies`) and computes each one's
+  Einstein radius via `LensCalc`, serially or in parallel over a process pool.
+
+- `einstein_radius_and_mass_list_via_parameters_from`: takes a function which maps a parameter vector to a mass object
+  and a stacked 2D array of parameter vectors. The Hessians of all samples on the evaluation grid are computed together
+  via `jax.jit(jax.vmap(...))`, in batches of `lens_calc_batch_size` samples (see `config -> general.yaml`), with the
+  critical curves of every sample then computed from these Hessians. If JAX is not installed or the mass object
+  cannot be traced by JAX, this falls back to `einstein_radius_and_mass_list_from`.
+"""
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple, Union
+
+from autoconf import conf
+
+import autoarray as aa
+
+from autogalaxy.operate.lens_calc import LensCalc
+from autogalaxy.operate.lens_calc import LensingMaps
+from autogalaxy.operate.lens_calc import evaluation_grid_from
+from autogalaxy.operate.lens_calc import quadtree_pixel_scale_from
+
+logger = logging.getLogger(__name__)
+
+
+def _einstein_radius_and_mass_from(
+    lens_calc: LensCalc, grid: aa.Grid2D, precision: Optional[float] = None
+) -> Tuple[float, float]:
+    """
+    Returns the Einstein radius and angular Einstein mass of a lensing object on an evaluation grid, following the
+    conventions of `LensCalc.einstein_radius_from` (the sum of the Einstein radii of all tangential critical curves)
+    and `LensCalc.einstein_mass_angular_from` (the mass within the first tangential critical curve).
+
+    A lensing object without a tangential critical curve has an Einstein radius and mass of zero.
+    """
+    einstein_radius_list = lens_calc.einstein_radius_list_from(
+        grid=grid, precision=precision
+    )
+
+    if len(einstein_radius_list) == 0:
+        return 0.0, 0.0
+
+    return sum(einstein_radius_list), np.pi * einstein_radius_list[0] ** 2
+
+
+def _einstein_radius_and_mass_via_mass_obj_from(
+    mass_obj, grid: aa.Grid2D, precision: Optional[float] = None
+) -> Tuple[float, float]:
+    """
+    Returns the Einstein radius and angular Einstein mass of a mass object, which is a module level function so that
+    it can be pickled and sent to the processes of a `ProcessPoolExecutor`.
+    """
+    grid.is_evaluation_grid = True
+
+    return _einstein_radius_and_mass_from(
+        lens_calc=LensCalc.from_mass_obj(mass_obj), grid=grid, precision=precision
+    )
+
+
+def einstein_radius_and_mass_list_from(
+    mass_obj_list: List,
+    grid: aa.type.Grid2DLike,
+    pixel_scale: Union[Tuple[float, float], float] = 0.05,
+    precision: Optional[float] = None,
+    number_of_cores: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the Einstein radius and angular Einstein mass of every mass object in a list (e.g. the `Galaxies` of
+    every sample of a posterior), as two 1D arrays.
+
+    The evaluation grid (see `LensCalc.einstein_radius_from`) is created once from the input grid and shared by all
+    mass objects. If `number_of_cores` is above 1, the mass objects are distributed over a process pool of this many
+    processes, which requires them to be picklable.
+
+    Parameters
+    ----------
+    mass_obj_list
+        The mass objects (e.g. `Galaxies`, `Galaxy` or mass profiles) whose Einstein radii are computed.
+    grid
+        The 2D grid whose mask sets the extent of the evaluation grid the critical curves are computed on.
+    pixel_scale
+        The pixel scale of the evaluation grid, where if `precision` is input the coarser pixel scale given by
+        `quadtree_pixel_scale_from` is used, as for `LensCalc.einstein_radius_from`.
+    precision
+        If input, the critical curves are adaptively refined to this arc-second precision (see
+        `autogalaxy.operate.quadtree`).
+    number_of_cores
+        The number of processes the Einstein radii are computed over.
+    """
+    if precision is not None:
+        pixel_scale = quadtree_pixel_scale_from(pixel_scale=pixel_scale)
+
+    evaluation_grid = evaluation_grid_from(grid=grid, pixel_scale=pixel_scale)
+
+    if number_of_cores > 1:
+        with ProcessPoolExecutor(max_workers=number_of_cores) as executor:
+            result_list = list(
+                executor.map(
+                    _einstein_radius_and_mass_via_mass_obj_from,
+                    mass_obj_list,
+                    [evaluation_grid] * len(mass_obj_list),
+                    [precision] * len(mass_obj_list),
+                )
+            )
+    else:
+        result_list = [
+            _einstein_radius_and_mass_via_mass_obj_from(
+                mass_obj=mass_obj, grid=evaluation_grid, precision=precision
+            )
+            for mass_obj in mass_obj_list
+        ]
+
+    if len(result_list) == 0:
+        return np.zeros(0), np.zeros(0)
+
+    einstein_radii, einstein_masses = map(np.array, zip(*result_list))
+
+    return einstein_radii, einstein_masses
+
+
+def hessian_batch_via_jax_from(
+    mass_obj_from: Callable,
+    parameters: np.ndarray,
+    grid: aa.type.Grid2DLike,
+    batch_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Returns the Hessians of many lensing objects on a shared grid, computed via `jax.jit(jax.vmap(...))` in batches
+    of `batch_size` parameter vectors, as a NumPy array of shape [4, total_samples, total_pixels] whose first axis
+    is ordered (hessian_yy, hessian_xy, hessian_yx, hessian_xx).
+
+    The final batch is padded with copies of the last parameter vector, so that every batch has the same shape and
+    the function is only compiled once.
+
+    Parameters
+    ----------
+    mass_obj_from
+        A function `mass_obj_from(parameters, xp)` which returns the mass object (e.g. `Galaxies`) of a 1D vector
+        of parameters using the array module `xp`, for example
+        `lambda v, xp: ag.Galaxies(model.instance_from_vector(vector=v, xp=xp).galaxies)`.
+    parameters
+        The 2D array of shape [total_samples, total_parameters] of parameter vectors.
+    grid
+        The 2D grid of (y,x) arc-second coordinates the Hessians are computed on.
+    batch_size
+        The number of parameter vectors whose Hessians are computed together, where `None` uses the
+        ``lens_calc_batch_size`` value of the ``general.yaml`` config's ``grid`` section.
+    """
+    import jax
+    import jax.numpy as jnp
+
+    if batch_size is None:
+        batch_size = conf.instance["general"]["grid"]["lens_calc_batch_size"]
+
+    parameters = np.asarray(parameters)
+    total_samples = parameters.shape[0]
+    batch_size = max(1, min(batch_size, total_samples))
+
+    grid_jax = jnp.asarray(np.asarray(grid.array))
+
+    def hessian_from(vector):
+        lens_calc = LensCalc.from_mass_obj(mass_obj_from(vector, jnp))
+        return jnp.stack(lens_calc.hessian_from(grid=grid_jax, xp=jnp))
+
+    hessian_vmap_from = jax.jit(jax.vmap(hessian_from))
+
+    hessian_list = []
+
+    for start in range(0, total_samples, batch_size):
+        batch = parameters[start : start + batch_size]
+        total_batch = batch.shape[0]
+
+        if total_batch < batch_size:
+            batch = np.concatenate(
+                [batch, np.repeat(batch[-1:], batch_size - total_batch, axis=0)]
+            )
+
+        hessian_list.append(np.asarray(hessian_vmap_from(batch))[:total_batch])
+
+    return np.moveaxis(np.concatenate(hessian_list, axis=0), 0, 1)
+
+
+def einstein_radius_and_mass_list_via_parameters_from(
+    mass_obj_from: Callable,
+    parameters: np.ndarray,
+    grid: aa.type.Grid2DLike,
+    pixel_scale: Union[Tuple[float, float], float] = 0.05,
+    precision: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    number_of_cores: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the Einstein radius and angular Einstein mass of the mass object of every parameter vector in a stacked
+    2D array (e.g. the samples of a posterior), as two 1D arrays.
+
+    The Hessians of all mass objects on the shared evaluation grid are computed together via `jax.vmap` (see
+    `hessian_batch_via_jax_from`) and set as the lensing maps of each mass object's `LensCalc`, from which its
+    tangential critical curves and Einstein radius are computed without recomputing the Hessian.
+
+    If JAX is not installed or the mass objects cannot be traced by JAX (e.g. a mass profile converts its parameters
+    to Python floats), the mass objects are instead created with NumPy and passed to
+    `einstein_radius_and_mass_list_from`, which uses a process pool of `number_of_cores` processes.
+
+    Parameters
+    ----------
+    mass_obj_from
+        A function `mass_obj_from(parameters, xp)` which returns the mass object (e.g. `Galaxies`) of a 1D vector
+        of parameters using the array module `xp`.
+    parameters
+        The 2D array of shape [total_samples, total_parameters] of parameter vectors.
+    grid
+        The 2D grid whose mask sets the extent of the evaluation grid the critical curves are computed on.
+    pixel_scale
+        The pixel scale of the evaluation grid, where if `precision` is input the coarser pixel scale given by
+        `quadtree_pixel_scale_from` is used, as for `LensCalc.einstein_radius_from`.
+    precision
+        If input, the critical curves are adaptively refined to this arc-second precision (see
+        `autogalaxy.operate.quadtree`), where the refinement evaluates each mass object with NumPy.
+    batch_size
+        The number of parameter vectors whose Hessians are computed together via `jax.vmap`.
+    number_of_cores
+        The number of processes used if falling back to a process pool.
+    """
+    parameters = np.asarray(parameters)
+
+    if precision is not None:
+        pixel_scale = quadtree_pixel_scale_from(pixel_scale=pixel_scale)
+
+    evaluation_grid = evaluation_grid_from(grid=grid, pixel_scale=pixel_scale)
+
+    try:
+        hessians = hessian_batch_via_jax_from(
+            mass_obj_from=mass_obj_from,
+            parameters=parameters,
+            grid=evaluation_grid,
+            batch_size=batch_size,
+        )
+    except (ImportError, TypeError) as e:
+        logger.info(
+            f"Einstein radii could not be computed via jax.vmap ({e}), falling back to a process pool."
+        )
+
+        return einstein_radius_and_mass_list_from(
+            mass_obj_list=[mass_obj_from(vector, np) for vector in parameters],
+            grid=grid,
+            pixel_scale=pixel_scale,
+            precision=precision,
+            number_of_cores=number_of_cores,
+        )
+
+    einstein_radii = np.zeros(parameters.shape[0])
+    einstein_masses = np.zeros(parameters.shape[0])
+
+    for i, vector in enumerate(parameters):
+        lens_calc = LensCalc.from_mass_obj(mass_obj_from(vector, np))
+        lens_calc.set_lensing_maps(
+            grid=evaluation_grid, lensing_maps=LensingMaps(*hessians[:, i])
+        )
+
+        einstein_radii[i], einstein_masses[i] = _einstein_radius_and_mass_from(
+            lens_calc=lens_calc, grid=evaluation_grid, precision=precision
+        )
+
+    return einstein_radii, einstein_masses
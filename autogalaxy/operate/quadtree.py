@@ -0,0 +1,551 @@
+"""
+Adaptive quadtree refinement of the zero contours of a 2D function, used by `LensCalc` to compute critical curves
+(the zero contours of the tangential and radial eigen values of the lensing Jacobian) to high precision.
+
+Computing a contour with marching squares on a uniform grid requires the function to be evaluated on every pixel of
+the grid, even though the contour only passes through a tiny fraction of them. Reaching sub-milliarcsecond precision
+this way requires grids of many millions of pixels.
+
+Instead, the function is evaluated on a coarse uniform grid and every cell whose corners do not all share the same
+sign is split into 2x2 sub-cells, of which only those the contour passes through are split again, until the cells are
+smaller than the target precision. The number of function evaluations therefore scales with the length of the
+contour divided by the precision, rather than the area of the grid divided by the precision squared.
+
+After every refinement, the neighbours of a cell across any of its edges the contour crosses are refined too, even if
+their parent cell had no sign change. This follows contours which cross the same edge of a coarse cell twice and
+ensures every contour found is traced continuously.
+
+At the finest level, marching squares is performed on every refined cell, with the positions the contour crosses
+cell edges linearly interpolated, and the segments of every cell are chained into contours.
+
+Contours which do not cross any cell edge of the coarse grid (e.g. a radial critical curve much smaller than a coarse
+pixel) are not found, therefore the coarse grid must resolve the smallest contour of interest.
+"""
+import numpy as np
+from typing import Callable, List, Tuple
+
+from autogalaxy import exc
+
+
+def total_levels_from(pixel_scale: float, precision: float) -> int:
+    """
+    Returns the number of times the cells of a coarse grid with the input pixel scale are split into 2x2 sub-cells
+    for the finest cells to be smaller than the input precision.
+
+    Parameters
+    ----------
+    pixel_scale
+        The arc-second size of the cells of the coarse grid.
+    precision
+        The arc-second size the finest cells must be smaller than.
+    """
+    if precision <= 0.0:
+        raise exc.GridException(
+            "The precision of an adaptive quadtree refinement must be positive."
+        )
+
+    return max(0, int(np.ceil(np.log2(pixel_scale / precision))))
+
+
+class NodeValues:
+    def __init__(
+        self,
+        values_from: Callable,
+        y_top: float,
+        x_left: float,
+        pixel_scale: float,
+        total_nodes_x: int,
+    ):
+        """
+        Stores the values of a function at the nodes (cell corners) of a quadtree, where every node is indexed by its
+        integer (row, column) coordinates on the lattice of the finest level.
+
+        Values of nodes which have not been computed are computed in a single call to `values_from`, with every node
+        only ever computed once.
+
+        Parameters
+        ----------
+        values_from
+            A function which takes an array of (y,x) coordinates of shape [total_nodes, 2] and returns the values of
+            the function at them.
+        y_top
+            The y coordinate of the top row of nodes.
+        x_left
+            The x coordinate of the left column of nodes.
+        pixel_scale
+            The arc-second spacing of the nodes on the lattice of the finest level.
+        total_nodes_x
+            The number of columns of nodes of the lattice of the finest level, used to compute the integer key of
+            each node.
+        """
+        self.values_from = values_from
+        self.y_top = y_top
+        self.x_left = x_left
+        self.pixel_scale = pixel_scale
+        self.total_nodes_x = total_nodes_x
+
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros(0)
+
+    def keys_from(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        return rows.astype(np.int64) * self.total_nodes_x + columns.astype(np.int64)
+
+    def add(self, rows: np.ndarray, columns: np.ndarray, values: np.ndarray):
+        """
+        Stores the input values of nodes which were computed elsewhere (e.g. the nodes of the coarse grid).
+        """
+        keys = np.concatenate((self.keys, self.keys_from(rows, columns)))
+        values = np.concatenate((self.values, values))
+
+        keys, indexes = np.unique(keys, return_index=True)
+
+        self.keys = keys
+        self.values = values[indexes]
+
+    def values_at(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """
+        Returns the values of the function at the input nodes, computing the values of nodes which are not stored.
+        """
+        keys = self.keys_from(rows, columns)
+
+        indexes = np.searchsorted(self.keys, keys)
+        indexes = np.minimum(indexes, max(len(self.keys) - 1, 0))
+
+        if len(self.keys) > 0:
+            is_stored = self.keys[indexes] == keys
+        else:
+            is_stored = np.zeros(keys.shape, dtype=bool)
+
+        if not np.all(is_stored):
+            keys_new = np.unique(keys[~is_stored])
+
+            rows_new = keys_new // self.total_nodes_x
+            columns_new = keys_new % self.total_nodes_x
+
+            grid = np.stack(
+                (
+                    self.y_top - rows_new * self.pixel_scale,
+                    self.x_left + columns_new * self.pixel_scale,
+                ),
+                axis=-1,
+            )
+
+            self.add(
+                rows=rows_new,
+                columns=columns_new,
+                values=np.asarray(self.values_from(grid), dtype=np.float64),
+            )
+
+            indexes = np.searchsorted(self.keys, keys)
+
+        return self.values[indexes]
+
+
+def cells_corner_values_from(
+    node_values: NodeValues, rows: np.ndarray, columns: np.ndarray, stride: int
+) -> np.ndarray:
+    """
+    Returns the values at the top-left, top-right, bottom-right and bottom-left corners of every input cell, as an
+    array of shape [total_cells, 4], where cells are indexed by the lattice coordinates of their top-left corner
+    divided by `stride`, the number of finest-level nodes per cell.
+    """
+    row_list = [rows, rows, rows + 1, rows + 1]
+    column_list = [columns, columns + 1, columns + 1, columns]
+
+    return np.stack(
+        [
+            node_values.values_at(rows=row * stride, columns=column * stride)
+            for row, column in zip(row_list, column_list)
+        ],
+        axis=-1,
+    )
+
+
+def is_crossed_from(corner_values: np.ndarray) -> np.ndarray:
+    """
+    Returns whether the zero contour crosses each cell, which is the case if the corners of the cell do not all share
+    the same sign.
+    """
+    is_positive = corner_values > 0.0
+
+    return np.any(is_positive, axis=-1) & ~np.all(is_positive, axis=-1)
+
+
+def crossed_neighbours_from(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    corner_values: np.ndarray,
+    total_rows: int,
+    total_columns: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the cells neighbouring every input cell across each of its edges the zero contour crosses, excluding
+    cells outside the lattice.
+    """
+    is_positive = corner_values > 0.0
+
+    # Edges are the top (corners 0-1), right (1-2), bottom (2-3) and left (3-0) edges of every cell.
+
+    neighbour_rows = []
+    neighbour_columns = []
+
+    for corner_0, corner_1, row_shift, column_shift in (
+        (0, 1, -1, 0),
+        (1, 2, 0, 1),
+        (2, 3, 1, 0),
+        (3, 0, 0, -1),
+    ):
+        is_edge_crossed = is_positive[:, corner_0] != is_positive[:, corner_1]
+
+        neighbour_rows.append(rows[is_edge_crossed] + row_shift)
+        neighbour_columns.append(columns[is_edge_crossed] + column_shift)
+
+    neighbour_rows = np.concatenate(neighbour_rows)
+    neighbour_columns = np.concatenate(neighbour_columns)
+
+    is_inside = (
+        (neighbour_rows >= 0)
+        & (neighbour_rows < total_rows)
+        & (neighbour_columns >= 0)
+        & (neighbour_columns < total_columns)
+    )
+
+    return neighbour_rows[is_inside], neighbour_columns[is_inside]
+
+
+def crossed_cells_from(
+    node_values: NodeValues,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    stride: int,
+    total_rows: int,
+    total_columns: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the candidate cells the zero contour crosses and their corner values, and adds every cell neighbouring a
+    crossed cell across a crossed edge until no crossed edge borders a cell which is not a candidate.
+
+    Parameters
+    ----------
+    node_values
+        The stored values of the function at the nodes of the quadtree.
+    rows, columns
+        The coordinates of the candidate cells on the lattice of the current level.
+    stride
+        The number of finest-level nodes per cell of the current level.
+    total_rows, total_columns
+        The number of rows and columns of cells of the lattice of the current level.
+    """
+    cell_keys = rows.astype(np.int64) * total_columns + columns
+    cell_keys = np.unique(cell_keys)
+
+    rows = cell_keys // total_columns
+    columns = cell_keys % total_columns
+
+    corner_values = cells_corner_values_from(
+        node_values=node_values, rows=rows, columns=columns, stride=stride
+    )
+
+    is_crossed = is_crossed_from(corner_values=corner_values)
+
+    crossed_rows = rows[is_crossed]
+    crossed_columns = columns[is_crossed]
+    crossed_corner_values = corner_values[is_crossed]
+
+    new_rows, new_columns = crossed_rows, crossed_columns
+    new_corner_values = crossed_corner_values
+
+    while len(new_rows) > 0:
+        neighbour_rows, neighbour_columns = crossed_neighbours_from(
+            rows=new_rows,
+            columns=new_columns,
+            corner_values=new_corner_values,
+            total_rows=total_rows,
+            total_columns=total_columns,
+        )
+
+        neighbour_keys = np.setdiff1d(
+            neighbour_rows.astype(np.int64) * total_columns + neighbour_columns,
+            cell_keys,
+        )
+
+        cell_keys = np.union1d(cell_keys, neighbour_keys)
+
+        new_rows = neighbour_keys // total_columns
+        new_columns = neighbour_keys % total_columns
+
+        new_corner_values = cells_corner_values_from(
+            node_values=node_values, rows=new_rows, columns=new_columns, stride=stride
+        )
+
+        crossed_rows = np.concatenate((crossed_rows, new_rows))
+        crossed_columns = np.concatenate((crossed_columns, new_columns))
+        crossed_corner_values = np.concatenate(
+            (crossed_corner_values, new_corner_values)
+        )
+
+    return crossed_rows, crossed_columns, crossed_corner_values
+
+
+def segments_from(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    corner_values: np.ndarray,
+    total_nodes_x: int,
+) -> List[Tuple[int, int]]:
+    """
+    Returns the marching squares segments of every crossed cell of the finest level, as pairs of the integer ids of
+    the two cell edges each segment connects.
+
+    Horizontal edges have the id `2 * (row * total_nodes_x + column)` and vertical edges this id plus one, where
+    (row, column) are the lattice coordinates of the top or left node of the edge.
+
+    Saddle cells, where the contour crosses all four edges, are disambiguated using the mean of the corner values
+    as the value at the cell centre.
+    """
+    top = 2 * (rows.astype(np.int64) * total_nodes_x + columns)
+    bottom = 2 * ((rows.astype(np.int64) + 1) * total_nodes_x + columns)
+    left = top + 1
+    right = 2 * (rows.astype(np.int64) * total_nodes_x + columns + 1) + 1
+
+    edges = np.stack((top, right, bottom, left), axis=-1)
+
+    is_positive = corner_values > 0.0
+
+    is_edge_crossed = np.stack(
+        [is_positive[:, i] != is_positive[:, (i + 1) % 4] for i in range(4)], axis=-1
+    )
+
+    is_saddle = np.all(is_edge_crossed, axis=-1)
+
+    segments = edges[~is_saddle][is_edge_crossed[~is_saddle]].reshape(-1, 2)
+
+    # In a saddle cell the top-left and bottom-right corners share a sign. If the centre shares it too, the contours
+    # cut off the top-right and bottom-left corners, otherwise the top-left and bottom-right corners.
+
+    saddle_edges = edges[is_saddle]
+
+    is_centre_shared = (np.mean(corner_values[is_saddle], axis=-1) > 0.0) == (
+        is_positive[is_saddle, 0]
+    )
+
+    top_edge, right_edge, bottom_edge, left_edge = saddle_edges.T
+
+    saddle_segments = np.concatenate(
+        (
+            np.where(
+                is_centre_shared[:, None],
+                np.stack((top_edge, right_edge), axis=-1),
+                np.stack((top_edge, left_edge), axis=-1),
+            ),
+            np.where(
+                is_centre_shared[:, None],
+                np.stack((bottom_edge, left_edge), axis=-1),
+                np.stack((bottom_edge, right_edge), axis=-1),
+            ),
+        )
+    )
+
+    segment_list = [
+        (int(edge_0), int(edge_1))
+        for edge_0, edge_1 in np.concatenate((segments, saddle_segments))
+    ]
+
+    return segment_list
+
+
+def edge_crossing_grid_from(
+    node_values: NodeValues, edge_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the (y,x) coordinates where the zero contour crosses every input edge of the finest level, linearly
+    interpolated between the values of the two nodes of the edge.
+    """
+    is_vertical = (edge_ids % 2).astype(bool)
+
+    node_ids = edge_ids // 2
+
+    rows = node_ids // node_values.total_nodes_x
+    columns = node_ids % node_values.total_nodes_x
+
+    values_0 = node_values.values_at(rows=rows, columns=columns)
+    values_1 = node_values.values_at(
+        rows=rows + is_vertical, columns=columns + ~is_vertical
+    )
+
+    fraction = values_0 / (values_0 - values_1)
+
+    return np.stack(
+        (
+            node_values.y_top
+            - (rows + is_vertical * fraction) * node_values.pixel_scale,
+            node_values.x_left
+            + (columns + ~is_vertical * fraction) * node_values.pixel_scale,
+        ),
+        axis=-1,
+    )
+
+
+def contour_edge_ids_list_from(segment_list: List[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Chains marching squares segments, which each connect two cell edges, into contours, returning every contour as
+    the ordered list of the edges it crosses.
+
+    Closed contours have their first edge repeated at their end. Contours which leave the grid are open and start
+    and end at an edge on the grid boundary.
+    """
+    neighbours = {}
+
+    for edge_0, edge_1 in segment_list:
+        neighbours.setdefault(edge_0, []).append(edge_1)
+        neighbours.setdefault(edge_1, []).append(edge_0)
+
+    is_visited = set()
+
+    contour_edge_ids_list = []
+
+    # Open contours are traced first, starting from their end on the grid boundary, followed by closed contours.
+
+    start_edge_list = [edge for edge, edges in neighbours.items() if len(edges) == 1]
+    start_edge_list += list(neighbours.keys())
+
+    for start_edge in start_edge_list:
+        if start_edge in is_visited:
+            continue
+
+        contour_edge_ids = [start_edge]
+        is_visited.add(start_edge)
+
+        previous_edge = None
+        edge = start_edge
+
+        while True:
+            next_edge_list = [
+                next_edge
+                for next_edge in neighbours[edge]
+                if next_edge != previous_edge
+            ]
+
+            if len(next_edge_list) == 0:
+                break
+
+            next_edge = next_edge_list[0]
+
+            if next_edge == start_edge:
+                contour_edge_ids.append(start_edge)
+                break
+
+            if next_edge in is_visited:
+                break
+
+            contour_edge_ids.append(next_edge)
+            is_visited.add(next_edge)
+
+            previous_edge = edge
+            edge = next_edge
+
+        contour_edge_ids_list.append(contour_edge_ids)
+
+    return contour_edge_ids_list
+
+
+def zero_contour_list_via_quadtree_from(
+    values_from: Callable,
+    values_native: np.ndarray,
+    y_top: float,
+    x_left: float,
+    pixel_scale: float,
+    precision: float,
+) -> List[np.ndarray]:
+    """
+    Returns the zero contours of a 2D function, computed by adaptively refining the cells of a coarse uniform grid
+    the contours pass through until they are smaller than the input precision (see the module docstring).
+
+    Each contour is returned as an ordered array of (y,x) coordinates with shape [total_points, 2], where the first
+    point of closed contours is repeated at their end, following the convention of marching squares.
+
+    Parameters
+    ----------
+    values_from
+        A function which takes an array of (y,x) coordinates of shape [total_points, 2] and returns the values of
+        the function at them.
+    values_native
+        The values of the function on the coarse grid, as a 2D array of shape [total_y_pixels, total_x_pixels]
+        whose [0, 0] entry is the top-left pixel.
+    y_top
+        The y coordinate of the centre of the top row of pixels of the coarse grid.
+    x_left
+        The x coordinate of the centre of the left column of pixels of the coarse grid.
+    pixel_scale
+        The arc-second size of the pixels of the coarse grid.
+    precision
+        The arc-second size the finest cells must be smaller than.
+    """
+    values_native = np.asarray(values_native, dtype=np.float64)
+
+    total_levels = total_levels_from(pixel_scale=pixel_scale, precision=precision)
+
+    stride = 2**total_levels
+
+    total_rows = values_native.shape[0] - 1
+    total_columns = values_native.shape[1] - 1
+
+    node_values = NodeValues(
+        values_from=values_from,
+        y_top=y_top,
+        x_left=x_left,
+        pixel_scale=pixel_scale / stride,
+        total_nodes_x=total_columns * stride + 1,
+    )
+
+    rows, columns = np.indices(values_native.shape)
+
+    node_values.add(
+        rows=rows.ravel() * stride,
+        columns=columns.ravel() * stride,
+        values=values_native.ravel(),
+    )
+
+    rows, columns = np.indices((total_rows, total_columns))
+
+    rows, columns, corner_values = crossed_cells_from(
+        node_values=node_values,
+        rows=rows.ravel(),
+        columns=columns.ravel(),
+        stride=stride,
+        total_rows=total_rows,
+        total_columns=total_columns,
+    )
+
+    for level in range(total_levels):
+        stride //= 2
+        total_rows *= 2
+        total_columns *= 2
+
+        rows = np.concatenate([2 * rows + row_shift for row_shift in (0, 0, 1, 1)])
+        columns = np.concatenate(
+            [2 * columns + column_shift for column_shift in (0, 1, 0, 1)]
+        )
+
+        rows, columns, corner_values = crossed_cells_from(
+            node_values=node_values,
+            rows=rows,
+            columns=columns,
+            stride=stride,
+            total_rows=total_rows,
+            total_columns=total_columns,
+        )
+
+    segment_list = segments_from(
+        rows=rows,
+        columns=columns,
+        corner_values=corner_values,
+        total_nodes_x=node_values.total_nodes_x,
+    )
+
+    return [
+        edge_crossing_grid_from(
+            node_values=node_values, edge_ids=np.asarray(contour_edge_ids)
+        )
+        for contour_edge_ids in contour_edge_ids_list_from(segment_list=segment_list)
+    ]
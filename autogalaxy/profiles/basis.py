@@ -10,10 +10,11 @@ linear inversion (a single matrix solve), making the inference highly efficient
 components are included.
 """
 import numpy as np
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import autoarray as aa
 
+from autogalaxy.operate.image import image_2d_not_operated_and_operated_summed_from
 from autogalaxy.profiles.light.abstract import LightProfile
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
 
@@ -152,6 +153,68 @@ class Basis(LightProfile, MassProfile):
             for light_profile in self.light_profile_list
         ]
 
+    def image_2d_not_operated_and_operated_from(
+        self, grid: aa.type.Grid2DLike, xp=np
+    ) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+        """
+        Returns the summed image of all light profiles in the basis which are not operated on and the summed image
+        of all light profiles which are already operated on as a tuple, from a 2D grid of Cartesian (y,x) coordinates.
+
+        Each light profile is evaluated once and linear light profiles are skipped, with `None` returned for an
+        image if no light profile of that type is in the basis.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates in the original reference frame of the grid.
+        """
+        return image_2d_not_operated_and_operated_summed_from(
+            image_2d_tuple_list=[
+                light_profile.image_2d_not_operated_and_operated_from(grid=grid, xp=xp)
+                for light_profile in self.light_profile_list
+                if not isinstance(light_profile, lp_linear.LightProfileLinear)
+            ]
+        )
+
+    @property
+    def has_visibilities_via_uv(self) -> bool:
+        """
+        Whether every light profile in the basis which contributes to its image (e.g. is not a linear light profile)
+        has a closed-form Fourier transform, in which case the visibilities of the basis are computed via
+        `visibilities_via_uv_from`.
+        """
+        return all(
+            light_profile.has_visibilities_via_uv
+            for light_profile in self.light_profile_list
+            if not isinstance(light_profile, lp_linear.LightProfileLinear)
+        )
+
+    def visibilities_via_uv_from(
+        self, transformer: aa.type.Transformer, xp=np
+    ) -> np.ndarray:
+        """
+        Returns the summed complex visibilities of all light profiles in the basis at the `uv_wavelengths` of a
+        transformer, computed using each light profile's closed-form Fourier transform (see
+        `LightProfile.visibilities_via_uv_from`).
+
+        As for `image_2d_list_from`, linear light profiles are skipped, with visibilities of zeros returned if the
+        basis contains only linear light profiles.
+
+        Parameters
+        ----------
+        transformer
+            The **PyAutoArray** `Transformer` object whose `uv_wavelengths` the visibilities are computed at and
+            whose `real_space_mask` sets the area of a pixel.
+        """
+        return sum(
+            (
+                light_profile.visibilities_via_uv_from(transformer=transformer, xp=xp)
+                for light_profile in self.light_profile_list
+                if not isinstance(light_profile, lp_linear.LightProfileLinear)
+            ),
+            xp.zeros((transformer.uv_wavelengths.shape[0],), dtype=complex),
+        )
+
     def convergence_2d_from(
         self, grid: aa.type.Grid2DLike, xp=np, **kwargs
     ) -> aa.Array2D:
@@ -13,6 +13,7 @@ from typing import Optional, Tuple
 
 import autoarray as aa
 
+from autogalaxy import profiling
 from autogalaxy.operate.image import OperateImage
 from autogalaxy.profiles.geometry_profiles import EllProfile
 
@@ -84,6 +85,64 @@ class LightProfile(EllProfile, OperateImage):
         """
         raise NotImplementedError()
 
+    def image_2d_not_operated_and_operated_from(
+        self, grid: aa.type.Grid2DLike, xp=np
+    ) -> Tuple[Optional[aa.Array2D], Optional[aa.Array2D]]:
+        """
+        Returns the light profile's 2D image as the first entry of a tuple if it is not operated on, or as its
+        second entry if it is a `LightProfileOperated`, with `None` returned for the other entry.
+
+        The image is evaluated once, instead of once per `operated_only` input of `image_2d_from`.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates in the original reference frame of the grid.
+        """
+        from autogalaxy.profiles.light.operated import LightProfileOperated
+
+        image_2d = profiling.call(self.image_2d_from, grid=grid, xp=xp)
+
+        if isinstance(self, LightProfileOperated):
+            return None, image_2d
+
+        return image_2d, None
+
+    def visibilities_via_uv_from(
+        self, transformer: aa.type.Transformer, xp=np
+    ) -> np.ndarray:
+        """
+        Returns the light profile's complex visibilities at the `uv_wavelengths` of a transformer, computed using the
+        closed-form Fourier transform of the light profile rather than evaluating its image on a real-space grid
+        and Fourier transforming it.
+
+        The visibilities follow the convention of the transformer's direct Fourier transform, whereby the
+        visibilities are the sum of the image's pixel values, meaning the Fourier transform of the light profile
+        is divided by the area of a pixel of the transformer's `real_space_mask`. Unlike the transformer, the
+        light profile's emission outside the `real_space_mask` is included.
+
+        Only light profiles with a known closed-form Fourier transform implement this method, which is checked via
+        the `has_visibilities_via_uv` property.
+
+        Parameters
+        ----------
+        transformer
+            The **PyAutoArray** `Transformer` object whose `uv_wavelengths` the visibilities are computed at and
+            whose `real_space_mask` sets the area of a pixel.
+        """
+        raise NotImplementedError
+
+    @property
+    def has_visibilities_via_uv(self) -> bool:
+        """
+        Whether this light profile implements `visibilities_via_uv_from`, meaning its visibilities can be computed
+        from its closed-form Fourier transform.
+        """
+        return (
+            type(self).visibilities_via_uv_from
+            is not LightProfile.visibilities_via_uv_from
+        )
+
     def image_2d_via_radii_from(self, grid_radii: np.ndarray, xp=np) -> np.ndarray:
         """
         Returns the light profile's 2D image from a 1D grid of coordinates which are the radial distance of each
@@ -24,8 +24,10 @@ from autogalaxy.profiles.light.operated.abstract import (
 )
 
 from autogalaxy.profiles.light.abstract import LightProfile
+from autogalaxy.profiles.light.standard.gaussian import Gaussian
 
 from autogalaxy import exc
+from autogalaxy import profiling
 
 
 class LightProfileLinear(LightProfile):
@@ -160,6 +162,7 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
         light_profile_list: List[LightProfileLinear],
         regularization=Optional[aa.reg.Regularization],
         settings=aa.Settings(),
+        transformer: Optional[aa.type.Transformer] = None,
         xp=np,
     ):
         """
@@ -205,6 +208,11 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
             A list of the linear light profiles that are used to fit the data via linear algebra.
         regularization
             The regularization scheme which may be applied to this linear object in order to smooth its solution.
+        transformer
+            If input, the transformer of an interferometer dataset at whose `uv_wavelengths` the visibilities of every
+            light profile are computed via its closed-form Fourier transform, which are used as the
+            `operated_mapping_matrix_override` (see `transformed_mapping_matrix`). This requires every light profile
+            to have a closed-form Fourier transform.
         """
         for light_profile in light_profile_list:
             if not isinstance(light_profile, LightProfileLinear):
@@ -224,6 +232,7 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
         self.blurring_grid = blurring_grid
         self.psf = psf
         self.light_profile_list = light_profile_list
+        self.transformer = transformer
 
     @property
     def params(self) -> int:
@@ -258,7 +267,7 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
         """
         return self.grid.mask.pixels_in_mask
 
-    @property
+    @cached_property
     def mapping_matrix(self) -> np.ndarray:
         """
         Returns the `mapping_matrix` of the linear light profiles, where each column is the image of each light profile
@@ -277,16 +286,152 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
         The `mapping_matrix` of the linear light profiles.
         """
 
-        image_2d_list = []
+        image_2d_list = [
+            image_2d.slim.array for image_2d in self.image_2d_list_from(grid=self.grid)
+        ]
 
-        for pixel, light_profile in enumerate(self.light_profile_list):
+        return self._xp.stack(image_2d_list, axis=1)
 
-            image_2d = light_profile.image_2d_from(grid=self.grid, xp=self._xp).slim
+    @cached_property
+    def blurring_mapping_matrix(self) -> np.ndarray:
+        """
+        Returns the `blurring_mapping_matrix` of the linear light profiles, where each column is the image of each
+        light profile evaluated on the blurring grid.
 
-            image_2d_list.append(image_2d.array)
+        This contains the flux of each light profile outside the mask which is blurred into it by the PSF, and is
+        therefore used alongside the `mapping_matrix` to compute the `operated_mapping_matrix_override`.
+
+        Returns
+        -------
+        The `blurring_mapping_matrix` of the linear light profiles.
+        """
+        image_2d_list = [
+            image_2d.slim.array
+            for image_2d in self.image_2d_list_from(grid=self.blurring_grid)
+        ]
 
         return self._xp.stack(image_2d_list, axis=1)
 
+    @cached_property
+    def has_shared_gaussian_geometry(self) -> bool:
+        """
+        Returns whether every light profile is a linear `Gaussian` of the same class with the same `centre` and
+        `ell_comps`, which is the case for the `Basis` of a multi Gaussian expansion (MGE) created by `mge_model_from`.
+
+        Values are compared by identity before equality, so that profiles sharing the same JAX traced parameters are
+        also detected, whereas profiles whose traced parameters are different objects are not.
+        """
+
+        def values_shared(values_0, values_1):
+            for value_0, value_1 in zip(values_0, values_1):
+                if value_0 is value_1:
+                    continue
+                if not isinstance(value_0, (int, float, np.number)) or not isinstance(
+                    value_1, (int, float, np.number)
+                ):
+                    return False
+                if value_0 != value_1:
+                    return False
+            return True
+
+        light_profile_0 = self.light_profile_list[0]
+
+        if len(self.light_profile_list) < 2 or not isinstance(
+            light_profile_0, Gaussian
+        ):
+            return False
+
+        for light_profile in self.light_profile_list[1:]:
+            if type(light_profile) is not type(light_profile_0):
+                return False
+
+            if not values_shared(
+                light_profile.centre, light_profile_0.centre
+            ) or not values_shared(light_profile.ell_comps, light_profile_0.ell_comps):
+                return False
+
+        return True
+
+    @profiling.profile_method
+    def image_2d_list_from(self, grid: aa.type.Grid2DLike) -> List[aa.Array2D]:
+        """
+        Returns the image of every linear light profile evaluated on an input grid, as a list.
+
+        If every light profile is a Gaussian sharing the same geometry (see `has_shared_gaussian_geometry`), which
+        is the case for a multi Gaussian expansion (MGE), the grid is transformed to their reference frame once and
+        all Gaussians are evaluated together as a single (n_gaussians, n_pixels) array operation. Otherwise, the
+        `image_2d_from` method of each light profile is called, which transforms the grid for every profile.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) grid the images of the light profiles are evaluated on.
+        """
+        if not self.has_shared_gaussian_geometry:
+            return [
+                profiling.call(light_profile.image_2d_from, grid=grid, xp=self._xp)
+                for light_profile in self.light_profile_list
+            ]
+
+        xp = self._xp
+
+        light_profile_0 = self.light_profile_list[0]
+
+        grid_over_sampled = grid.over_sampled if isinstance(grid, aa.Grid2D) else grid
+
+        transformed_grid = light_profile_0.transformed_to_reference_frame_grid_from(
+            grid=grid_over_sampled, xp=xp
+        )
+
+        grid_radii = light_profile_0.eccentric_radii_grid_from(
+            grid=transformed_grid, xp=xp
+        ).array
+
+        intensities = xp.asarray(
+            [light_profile._intensity for light_profile in self.light_profile_list]
+        )
+        sigmas = xp.asarray(
+            [light_profile.sigma for light_profile in self.light_profile_list]
+        ) / xp.sqrt(light_profile_0.axis_ratio(xp))
+
+        image_2d_array = xp.multiply(
+            intensities[:, None],
+            xp.exp(-0.5 * xp.square(xp.divide(grid_radii[None, :], sigmas[:, None]))),
+        )
+
+        if not isinstance(grid, aa.Grid2D):
+            return [aa.ArrayIrregular(values=image_2d) for image_2d in image_2d_array]
+
+        return [
+            grid.over_sampler.binned_array_2d_from(array=image_2d, xp=xp)
+            for image_2d in image_2d_array
+        ]
+
+    @cached_property
+    def transformed_mapping_matrix(self) -> np.ndarray:
+        """
+        Returns the transformed mapping matrix of the linear light profiles, where each column is the complex
+        visibilities of each light profile at the `uv_wavelengths` of the `transformer`.
+
+        The visibilities are computed using the closed-form Fourier transform of each light profile (see
+        `LightProfile.visibilities_via_uv_from`), such that the image of each light profile is not evaluated on the
+        grid and Fourier transformed. For an interferometer dataset with many visibilities this is much faster than
+        transforming the `mapping_matrix`.
+
+        Returns
+        -------
+        The transformed mapping matrix of dimensions (total_visibilities, total_light_profiles).
+        """
+        return self._xp.stack(
+            [
+                light_profile.visibilities_via_uv_from(
+                    transformer=self.transformer, xp=self._xp
+                )
+                for light_profile in self.light_profile_list
+            ],
+            axis=1,
+        )
+
     @cached_property
     def operated_mapping_matrix_override(self) -> Optional[np.ndarray]:
         """
@@ -301,31 +446,30 @@ class LightProfileLinearObjFuncList(aa.AbstractLinearObjFuncList):
         flux is outside the region that defines the `mapping_matrix` and thus this override is required to properly
         incorporate it.
 
+        If a `transformer` is input, the linear light profiles fit an interferometer dataset and the
+        `transformed_mapping_matrix`, whose columns are the visibilities of each light profile, is returned instead.
+
+        The `mapping_matrix` and `blurring_mapping_matrix` are stacked into a single native cube which is convolved
+        with the PSF in one call, instead of convolving the image of every light profile separately, which is the
+        dominant cost of fitting imaging data with many linear light profiles (e.g. a multi Gaussian expansion).
+
         Returns
         -------
         A blurred mapping matrix of dimensions (total_mask_pixels, 1) which overrides the mapping matrix calculations
         performed in the linear equation solvers.
         """
 
+        if self.transformer is not None:
+            return self.transformed_mapping_matrix
+
         if isinstance(self.light_profile_list[0], LightProfileOperated):
             return self.mapping_matrix
 
-        blurred_image_2d_list = []
-
-        for pixel, light_profile in enumerate(self.light_profile_list):
-            image_2d = light_profile.image_2d_from(grid=self.grid, xp=self._xp)
-
-            blurring_image_2d = light_profile.image_2d_from(
-                grid=self.blurring_grid, xp=self._xp
-            )
-
-            blurred_image_2d = self.psf.convolved_image_from(
-                image=image_2d,
-                blurring_image=blurring_image_2d,
-                use_mixed_precision=self.settings.use_mixed_precision,
-                xp=self._xp,
-            )
-
-            blurred_image_2d_list.append(blurred_image_2d.array)
-
-        return self._xp.stack(blurred_image_2d_list, axis=1)
+        return self.psf.convolved_mapping_matrix_from(
+            mapping_matrix=self.mapping_matrix,
+            mask=self.grid.mask,
+            blurring_mapping_matrix=self.blurring_mapping_matrix,
+            blurring_mask=self.blurring_grid.mask,
+            use_mixed_precision=self.settings.use_mixed_precision,
+            xp=self._xp,
+        )
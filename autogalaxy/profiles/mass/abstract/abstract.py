@@ -123,6 +123,114 @@ class MassProfile(EllProfile):
         """
         raise NotImplementedError
 
+    def analytical_hessian_2d_from(self, grid, xp=np, **kwargs) -> Tuple:
+        """
+        Returns the Hessian of the lensing potential of the mass profile from a 2D grid of Cartesian (y,x)
+        coordinates, computed using a closed-form expression rather than numerical differentiation:
+
+            H_ij = ∂²ψ / ∂θ_i ∂θ_j
+
+        The Hessian is returned as a 4-entry tuple (hessian_yy, hessian_xy, hessian_yx, hessian_xx), matching
+        `LensCalc.hessian_from`.
+
+        Only mass profiles with a known closed form implement this method, which is checked via the
+        `has_analytical_hessian` property. `LensCalc` uses it automatically when available, meaning magnification
+        maps, critical curves and Einstein radii do not require the four extra deflection angle calculations of the
+        finite difference Hessian (or automatic differentiation when using JAX).
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where the Hessian is evaluated.
+        """
+        raise NotImplementedError
+
+    @property
+    def has_analytical_hessian(self) -> bool:
+        """
+        Whether this mass profile implements `analytical_hessian_2d_from`, meaning its Hessian can be computed
+        in closed form.
+        """
+        return (
+            type(self).analytical_hessian_2d_from
+            is not MassProfile.analytical_hessian_2d_from
+        )
+
+    def grid_shifted_from_centre_from(
+        self, grid, xp=np, radial_minimum: float = 1.0e-8
+    ) -> aa.Grid2DIrregular:
+        """
+        Returns the input grid with every coordinate within `radial_minimum` of the profile centre shifted by
+        `radial_minimum` in both y and x.
+
+        The closed-form Hessians of spherical and power-law mass profiles divide by the radius from the centre and
+        use the convergence and deflection angles, which diverge or are NaN at the centre, therefore they are
+        evaluated on this grid so that a coordinate at the centre gives finite values.
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates which are shifted.
+        radial_minimum
+            The radius from the centre within which coordinates are shifted.
+        """
+        grid = aa.Grid2DIrregular(grid)
+
+        y = grid.array[:, 0] - self.centre[0]
+        x = grid.array[:, 1] - self.centre[1]
+
+        at_centre = y**2 + x**2 < radial_minimum**2
+
+        y = xp.where(at_centre, radial_minimum, y)
+        x = xp.where(at_centre, radial_minimum, x)
+
+        return aa.Grid2DIrregular(
+            values=xp.stack((y + self.centre[0], x + self.centre[1]), axis=-1)
+        )
+
+    def hessian_rotated_from_reference_frame_from(
+        self, hessian_yy, hessian_xy, hessian_xx, xp=np
+    ) -> Tuple:
+        """
+        Rotate the components of a Hessian computed in the reference frame of the profile (e.g. aligned with its
+        major axis) back to the frame of the original coordinates.
+
+        Unlike a vector (e.g. deflection angles), the Hessian is a rank-2 tensor and transforms as H = R H' R^T,
+        where R is the rotation matrix of the profile's position angle.
+
+        Parameters
+        ----------
+        hessian_yy
+            The yy component of the Hessian in the profile's reference frame.
+        hessian_xy
+            The xy (and yx) component of the Hessian in the profile's reference frame.
+        hessian_xx
+            The xx component of the Hessian in the profile's reference frame.
+        """
+        cos_phi, sin_phi = self._cos_and_sin_to_x_axis(xp=xp)
+
+        hessian_xx_rotated = (
+            cos_phi**2 * hessian_xx
+            - 2.0 * cos_phi * sin_phi * hessian_xy
+            + sin_phi**2 * hessian_yy
+        )
+        hessian_yy_rotated = (
+            sin_phi**2 * hessian_xx
+            + 2.0 * cos_phi * sin_phi * hessian_xy
+            + cos_phi**2 * hessian_yy
+        )
+        hessian_xy_rotated = (
+            cos_phi * sin_phi * (hessian_xx - hessian_yy)
+            + (cos_phi**2 - sin_phi**2) * hessian_xy
+        )
+
+        return (
+            hessian_yy_rotated,
+            hessian_xy_rotated,
+            hessian_xy_rotated,
+            hessian_xx_rotated,
+        )
+
     def convergence_func(self, grid_radius: float) -> float:
         """
         Returns the convergence of the mass profile as a function of the radial coordinate.
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 import numpy as np
 from typing import Callable, List, Tuple
 
+from autogalaxy.profiles.mass.abstract.decomposition_cache import cse_cache
+
 
 class MassProfileCSE(ABC):
     @staticmethod
@@ -62,6 +64,9 @@ class MassProfileCSE(ABC):
         """
         Decompose the convergence of a mass profile into cored steep elliptical (cse) profiles.
 
+        Decompositions are stored in the least-recently-used `cse_cache`, keyed on the mass profile's parameters and
+        the inputs below, so that repeated calls for the same profile do not solve the least squares problem again.
+
         This uses an input function `func` which is specific to the inherited mass profile, and defines the function
         which is solved for in order to decompose its convergence into cses.
 
@@ -84,6 +89,48 @@ class MassProfileCSE(ABC):
             A list of amplitudes and core radii of every cored steep elliptical (cse) the mass profile is decomposed
             into.
         """
+        return cse_cache.decomposition_from(
+            profile=self,
+            decompose=lambda profile: self._decompose_convergence_via_lstsq_from(
+                func=func,
+                radii_min=radii_min,
+                radii_max=radii_max,
+                total_cses=total_cses,
+                sample_points=sample_points,
+            ),
+            settings={
+                "radii_min": radii_min,
+                "radii_max": radii_max,
+                "total_cses": total_cses,
+                "sample_points": sample_points,
+            },
+        )
+
+    def _decompose_convergence_via_lstsq_from(
+        self,
+        func: Callable,
+        radii_min: float,
+        radii_max: float,
+        total_cses: int = 25,
+        sample_points: int = 100,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decompose the convergence of a mass profile into cored steep elliptical (cse) profiles by solving the linear
+        least squares problem of `_decompose_convergence_via_cse_from`, without using the `cse_cache`.
+
+        Parameters
+        ----------
+        func
+            The function representing the profile that is decomposed into CSEs.
+        radii_min:
+            The minimum radius to fit
+        radii_max:
+            The maximum radius to fit
+        total_cses
+            The number of CSEs used to approximate the input func.
+        sample_points: int (should be larger than 'total_cses')
+            The number of data points to fit
+        """
         from scipy.linalg import lstsq
 
         error_sigma = 0.1  # error spread. Could be any value.
@@ -99,15 +146,9 @@ class MassProfileCSE(ABC):
         # Different from Masamune's (2106.11464) method, I set S to a series fixed values. So that
         # the decomposition can be solved linearly.
 
-        coefficient_matrix = np.zeros((sample_points, total_cses))
-
-        for j in range(total_cses):
-            coefficient_matrix[:, j] = self.convergence_cse_1d_from(
-                r_samples, core_radius_list[j]
-            )
-
-        for k in range(sample_points):
-            coefficient_matrix[k] /= y_samples_func[k] * error_sigma
+        coefficient_matrix = self.convergence_cse_1d_from(
+            r_samples[:, None], core_radius_list[None, :]
+        ) / (y_samples_func[:, None] * error_sigma)
 
         results = lstsq(coefficient_matrix, y_samples.T)
 
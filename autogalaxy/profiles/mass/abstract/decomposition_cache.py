@@ -0,0 +1,305 @@
+"""
+Caches of the decompositions of mass profiles into many simpler profiles, for example the multi-Gaussian expansion
+(MGE) of `MGEDecomposer` and the cored steep ellipsoid (CSE) decomposition of `MassProfileCSE`.
+
+A decomposition only depends on the parameters of the mass profile (e.g. the `sersic_index` and `effective_radius`
+of a Sersic or the `scale_radius` and `inner_slope` of a gNFW) and the settings of the decomposition (e.g. the list
+of Gaussian sigmas), but historically it was recomputed every time deflection angles were computed. This is wasteful
+whenever the same profile is used many times, for example when critical curves are computed, a fit is visualized or
+`LensCalc` methods are called repeatedly on the same instance.
+
+A `DecompositionCache` stores the most recently used decompositions in a bounded least-recently-used (LRU) cache,
+keyed on the parameters of the profile and settings of the decomposition, and counts its hits and misses.
+
+Where all but one parameter of a profile are fixed and the remaining parameter is sampled densely (e.g. the
+`inner_slope` of a gNFW with a fixed `scale_radius`), an interpolation grid over that parameter can be added to the
+cache via `add_interpolation_grid`. The decomposition is then precomputed at every value of the grid once and
+decompositions at any value in its range are linearly interpolated, instead of being computed.
+
+Only decompositions computed with NumPy are cached, as the parameters of a profile traced by JAX are not known.
+"""
+from collections import OrderedDict, namedtuple
+import copy
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+from autoconf import conf
+
+from autogalaxy import exc
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "interpolated", "maxsize", "currsize"]
+)
+
+
+def hashable_from(value):
+    """
+    Returns a hashable version of a profile parameter or decomposition setting, converting arrays and lists to tuples
+    of floats.
+
+    A `TypeError` is raised for values which cannot be converted (e.g. JAX tracers), meaning the decomposition is
+    not cached.
+    """
+    if isinstance(value, (bool, str)) or value is None:
+        return value
+
+    if isinstance(value, np.ndarray):
+        return (value.shape,) + tuple(value.astype(np.float64).ravel().tolist())
+
+    if isinstance(value, (tuple, list)):
+        return tuple(hashable_from(element) for element in value)
+
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+
+    raise TypeError(f"The value {value} cannot be used as a decomposition cache key.")
+
+
+def parameters_key_from(profile, exclude: Tuple[str, ...] = ("centre",)) -> tuple:
+    """
+    Returns the key of a profile's parameters in a `DecompositionCache`, which is its class name and the sorted
+    (name, value) pairs of its attributes.
+
+    The `centre` of a profile never changes its decomposition, which is computed in its reference frame, and is
+    therefore excluded.
+    """
+    return (type(profile).__name__,) + tuple(
+        sorted(
+            (name, hashable_from(value))
+            for name, value in vars(profile).items()
+            if name not in exclude
+        )
+    )
+
+
+class DecompositionCache:
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        A bounded least-recently-used (LRU) cache of the decompositions of mass profiles, where every decomposition is
+        a tuple of the amplitudes and scales (e.g. Gaussian sigmas or CSE core radii) of the profiles a mass profile
+        is decomposed into.
+
+        Parameters
+        ----------
+        maxsize
+            The maximum number of decompositions stored, where the least recently used decomposition is removed when
+            it is exceeded. If not input, it is loaded from the `decomposition` section of the `general.yaml` config.
+        """
+        self._maxsize = maxsize
+
+        self.decomposition_dict = OrderedDict()
+        self.interpolation_grid_dict = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.interpolated = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            return conf.instance["general"]["decomposition"]["cache_size"]
+
+        return self._maxsize
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache in the same format as `functools.lru_cache`, with the addition of the
+        number of decompositions which were interpolated from an interpolation grid.
+        """
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            interpolated=self.interpolated,
+            maxsize=self.maxsize,
+            currsize=len(self.decomposition_dict),
+        )
+
+    def cache_clear(self):
+        """
+        Removes every decomposition and interpolation grid from the cache and resets its statistics.
+        """
+        self.decomposition_dict.clear()
+        self.interpolation_grid_dict.clear()
+
+        self.hits = 0
+        self.misses = 0
+        self.interpolated = 0
+
+    def decomposition_from(
+        self, profile, decompose: Callable, settings: Dict
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the decomposition of a mass profile, using the cached decomposition if the same profile was decomposed
+        with the same settings before, interpolating it if an interpolation grid covering the profile has been added,
+        and otherwise computing and caching it.
+
+        Profiles whose parameters cannot be used as a key (e.g. because they are JAX tracers) are decomposed without
+        using the cache.
+
+        Parameters
+        ----------
+        profile
+            The mass profile which is decomposed.
+        decompose
+            A function which takes a mass profile as its only input and returns its decomposition, as a tuple of the
+            amplitudes and scales of the profiles it is decomposed into.
+        settings
+            The settings of the decomposition (e.g. the list of Gaussian sigmas), which are part of the cache key.
+        """
+        try:
+            parameters_key = parameters_key_from(profile=profile)
+            settings_key = hashable_from(sorted(settings.items()))
+        except TypeError:
+            return decompose(profile)
+
+        key = (parameters_key, settings_key)
+
+        if key in self.decomposition_dict:
+            self.hits += 1
+            self.decomposition_dict.move_to_end(key)
+            return self.decomposition_dict[key]
+
+        decomposition = self.interpolated_decomposition_from(
+            profile=profile, settings_key=settings_key
+        )
+
+        if decomposition is not None:
+            self.interpolated += 1
+            return decomposition
+
+        self.misses += 1
+
+        amplitudes, scales = decompose(profile)
+
+        decomposition = (
+            self.read_only_array_from(amplitudes),
+            self.read_only_array_from(scales),
+        )
+
+        self.decomposition_dict[key] = decomposition
+
+        while len(self.decomposition_dict) > self.maxsize:
+            self.decomposition_dict.popitem(last=False)
+
+        return decomposition
+
+    @staticmethod
+    def read_only_array_from(values) -> np.ndarray:
+        """
+        Returns a read-only copy of the amplitudes or scales of a decomposition, so that cached decompositions cannot
+        be changed in-place by the code using them.
+        """
+        values = np.array(values, dtype=np.float64)
+        values.setflags(write=False)
+        return values
+
+    def add_interpolation_grid(
+        self,
+        profile,
+        parameter: str,
+        values,
+        decompose: Callable,
+        settings: Dict,
+    ):
+        """
+        Precomputes the decomposition of a mass profile at every value of one of its parameters in `values`, such
+        that the decomposition of any profile whose other parameters are identical to the input `profile` is linearly
+        interpolated from these decompositions.
+
+        This requires the scales of the decomposition (e.g. the Gaussian sigmas) to not depend on the parameter, which
+        is the case for an MGE with a fixed list of sigmas.
+
+        Parameters
+        ----------
+        profile
+            The mass profile whose parameters, other than `parameter`, define the profiles the grid is used for.
+        parameter
+            The name of the parameter the grid is over (e.g. `inner_slope`).
+        values
+            The values of the parameter the decomposition is precomputed at, which must be increasing.
+        decompose
+            A function which takes a mass profile as its only input and returns its decomposition.
+        settings
+            The settings of the decomposition (e.g. the list of Gaussian sigmas).
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        if values.ndim != 1 or len(values) < 2 or np.any(np.diff(values) <= 0.0):
+            raise exc.ProfileException(
+                "The values of a decomposition interpolation grid must be a 1D increasing list of at least two values."
+            )
+
+        amplitudes_list = []
+        scales = None
+
+        for value in values:
+            profile_value = copy.copy(profile)
+            setattr(profile_value, parameter, float(value))
+
+            amplitudes, scales_value = decompose(profile_value)
+
+            if scales is not None and not np.allclose(scales_value, scales):
+                raise exc.ProfileException(
+                    f"The scales of the decomposition depend on the parameter {parameter}, therefore it cannot be "
+                    f"interpolated."
+                )
+
+            amplitudes_list.append(np.asarray(amplitudes, dtype=np.float64))
+            scales = np.asarray(scales_value, dtype=np.float64)
+
+        key = (
+            parameters_key_from(profile=profile, exclude=("centre", parameter)),
+            hashable_from(sorted(settings.items())),
+        )
+
+        self.interpolation_grid_dict[key] = (
+            parameter,
+            values,
+            np.stack(amplitudes_list),
+            self.read_only_array_from(scales),
+        )
+
+    def interpolated_decomposition_from(
+        self, profile, settings_key
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the decomposition of a mass profile linearly interpolated from an interpolation grid, or `None` if no
+        interpolation grid covers the profile.
+        """
+        for (parameters_key, grid_settings_key), (
+            parameter,
+            values,
+            amplitudes,
+            scales,
+        ) in self.interpolation_grid_dict.items():
+            if grid_settings_key != settings_key:
+                continue
+
+            value = getattr(profile, parameter, None)
+
+            if value is None or not (values[0] <= value <= values[-1]):
+                continue
+
+            if (
+                parameters_key_from(profile=profile, exclude=("centre", parameter))
+                != parameters_key
+            ):
+                continue
+
+            index = min(
+                np.searchsorted(values, value, side="right") - 1, len(values) - 2
+            )
+            weight = (value - values[index]) / (values[index + 1] - values[index])
+
+            return (
+                self.read_only_array_from(
+                    (1.0 - weight) * amplitudes[index] + weight * amplitudes[index + 1]
+                ),
+                scales,
+            )
+
+        return None
+
+
+mge_cache = DecompositionCache()
+cse_cache = DecompositionCache()
@@ -1,7 +1,14 @@
 import numpy as np
+from typing import Optional
 
+from autoconf import conf
 import autoarray as aa
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
+from autogalaxy.profiles.mass.abstract.decomposition_cache import mge_cache
+
+# The approximate peak memory in bytes used per (Gaussian, pixel) element when computing `zeta_from`, which allocates
+# a number of complex128 temporary arrays (e.g. inside `wofz`).
+zeta_bytes_per_element = 256
 
 
 class MGEDecomposer:
@@ -158,11 +165,16 @@ class MGEDecomposer:
         three_D: bool,
         ellipticity_convention: str,
         func_terms: int = 28,
+        chunk_size: Optional[int] = None,
         **kwargs,
     ):
         """
         Calculates the deflection angle of an arbitrary elliptical convergence / 3d density
         profile via a summation of Gaussian convergences
+
+        The deflection angles of every Gaussian are computed on an array of shape (n_gaussians, n_pixels), which
+        for over-sampled grids can require gigabytes of memory. The grid is therefore processed in blocks of
+        `chunk_size` pixels (see `deflections_summed_from`), which bounds peak memory without changing the result.
         ----------
         sigma_log_list : list
             A log spaced list of Gaussian sigmas
@@ -173,6 +185,10 @@ class MGEDecomposer:
             of the sigmas. Most profiles need a sigmas factor of axis_ratio(), some sqrt(axis_ratio())
         func_terms
             The number of terms used to approximate the input func, 28 is sufficient for 64bits
+        chunk_size
+            The number of pixels whose deflection angles are computed together. If not input, it is set from the
+            `deflections_memory_budget` value of the `general.yaml` config's `mge` section via
+            `pixel_chunk_size_from`.
 
         Returns
         -------
@@ -194,27 +210,224 @@ class MGEDecomposer:
         )
         sigmas = sigmas_factor * sigma_log_array
 
-        deflection_angles = (
-            amps[:, None]
+        # Add Gaussian profiles
+        deflections = self.deflections_summed_from(
+            grid=grid,
+            amplitudes=amps[:, None]
             * sigmas[:, None]
-            * xp.sqrt((2.0 * xp.pi) / (1.0 - q**2.0))
-            * self.zeta_from(grid=grid, sigma_log_list=sigmas, xp=xp)
+            * xp.sqrt((2.0 * xp.pi) / (1.0 - q**2.0)),
+            sigmas=sigmas,
+            xp=xp,
+            chunk_size=chunk_size,
         )
 
-        # Add Gaussian profiles
-        deflections = xp.sum(deflection_angles, axis=0)
-
         return self.mass_profile.rotated_grid_from_reference_frame_from(
             xp.vstack((-1.0 * xp.imag(deflections), xp.real(deflections))).T,
             xp=xp,
         )
 
+    @staticmethod
+    def pixel_chunk_size_from(
+        total_gaussians: int, memory_budget: Optional[float] = None
+    ) -> int:
+        """
+        Returns the number of pixels whose MGE deflection angles can be computed together, such that the
+        (n_gaussians, n_pixels) arrays allocated by `zeta_from` stay within a memory budget.
+
+        Parameters
+        ----------
+        total_gaussians
+            The number of Gaussians the mass profile is decomposed into.
+        memory_budget
+            The memory budget in bytes. If not input, the `deflections_memory_budget` value of the `general.yaml`
+            config's `mge` section is used.
+        """
+        if memory_budget is None:
+            memory_budget = conf.instance["general"]["mge"]["deflections_memory_budget"]
+
+        return max(
+            1, int(float(memory_budget) // (zeta_bytes_per_element * total_gaussians))
+        )
+
+    def deflections_summed_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        amplitudes,
+        sigmas,
+        xp=np,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Returns the summed complex deflection angles of every Gaussian of the decomposition, streaming over blocks of
+        `chunk_size` pixels so that only a (n_gaussians, chunk_size) array is held in memory at once.
+
+        The deflection angle of each pixel does not depend on any other pixel and the sum over Gaussians is
+        performed in the same order for every block, therefore the result is bit-identical to evaluating every
+        pixel at once. Using NumPy the blocks are looped over, using JAX they are mapped over via `jax.lax.map` so
+        that the computation is traced once.
+
+        Blocks are at least two pixels wide and the final block is aligned to the end of the grid (recomputing a
+        few pixels of the previous block), because NumPy sums a single column of shape (n_gaussians, 1) in a
+        different (pairwise) order, which would change the result in the last bit.
+
+        Parameters
+        ----------
+        grid
+            The grid of (y,x) arc-second coordinates, in the reference frame of the mass profile.
+        amplitudes
+            The amplitudes multiplying the deflection angles of every Gaussian, with shape (n_gaussians, 1).
+        sigmas
+            The sigma of every Gaussian in the minor-axis convention, with shape (n_gaussians,).
+        chunk_size
+            The number of pixels whose deflection angles are computed together. If not input, it is set from the
+            memory budget via `pixel_chunk_size_from`.
+        """
+        grid_array = grid.array
+
+        total_pixels = grid_array.shape[0]
+
+        if chunk_size is None:
+            chunk_size = self.pixel_chunk_size_from(total_gaussians=sigmas.shape[0])
+
+        chunk_size = max(2, min(int(chunk_size), total_pixels))
+
+        def deflections_chunk_from(grid_chunk):
+            return xp.sum(
+                amplitudes
+                * self.zeta_from(
+                    grid=aa.Grid2DIrregular(values=grid_chunk),
+                    sigma_log_list=sigmas,
+                    xp=xp,
+                ),
+                axis=0,
+            )
+
+        if chunk_size >= total_pixels:
+            return deflections_chunk_from(grid_array)
+
+        if xp is np:
+            deflections = np.zeros(total_pixels, dtype=np.complex128)
+
+            for start in range(0, total_pixels, chunk_size):
+                start = min(start, total_pixels - chunk_size)
+
+                deflections[start : start + chunk_size] = deflections_chunk_from(
+                    grid_array[start : start + chunk_size]
+                )
+
+            return deflections
+
+        import jax
+
+        total_chunks = -(-total_pixels // chunk_size)
+        total_padding = total_chunks * chunk_size - total_pixels
+
+        grid_array = xp.concatenate(
+            (grid_array, xp.repeat(grid_array[-1:], total_padding, axis=0))
+        )
+
+        deflections = jax.lax.map(
+            deflections_chunk_from, grid_array.reshape(total_chunks, chunk_size, 2)
+        )
+
+        return deflections.reshape(-1)[:total_pixels]
+
     def decompose_convergence_via_mge(
         self, sigma_log_list, three_D: bool, func_terms: int = 28, xp=np
     ):
         """
         Decomposes the convergence profile of an arbitrary elliptical function into a sum of
-        Gaussian convergence profiles
+        Gaussian convergence profiles.
+
+        When using NumPy, decompositions are stored in the least-recently-used `mge_cache` keyed on the mass
+        profile's parameters and the inputs below, so that repeated calls for the same profile (e.g. when computing
+        critical curves) do not recompute the decomposition.
+
+        Parameters
+        ----------
+        sigma_log_list : list
+            A log spaced list of Gaussian sigmas
+        three_D : bool
+            if input function is a three-dimensional density profile, yes
+        func_terms
+            The number of terms used to approximate the input func, 28 is sufficient for 64bits
+
+        Returns
+        -------
+        """
+        if xp is not np:
+            return self._decompose_convergence_via_mge_from(
+                sigma_log_list=sigma_log_list,
+                three_D=three_D,
+                func_terms=func_terms,
+                xp=xp,
+            )
+
+        return mge_cache.decomposition_from(
+            profile=self.mass_profile,
+            decompose=lambda mass_profile: MGEDecomposer(
+                mass_profile=mass_profile
+            )._decompose_convergence_via_mge_from(
+                sigma_log_list=sigma_log_list, three_D=three_D, func_terms=func_terms
+            ),
+            settings={
+                "sigma_log_list": np.asarray(sigma_log_list),
+                "three_D": three_D,
+                "func_terms": func_terms,
+            },
+        )
+
+    def add_interpolation_grid(
+        self,
+        parameter: str,
+        values,
+        sigma_log_list,
+        three_D: bool,
+        func_terms: int = 28,
+    ):
+        """
+        Precomputes the MGE decomposition of the mass profile at every value of one of its parameters in `values`
+        and adds them to the `mge_cache` as an interpolation grid.
+
+        Every subsequent decomposition with the same inputs, of a profile whose parameters other than `parameter` are
+        identical to this mass profile, is then linearly interpolated from the grid instead of being computed.
+
+        Parameters
+        ----------
+        parameter
+            The name of the mass profile parameter the grid is over (e.g. `inner_slope`).
+        values
+            The increasing values of the parameter the decomposition is precomputed at.
+        sigma_log_list : list
+            A log spaced list of Gaussian sigmas
+        three_D : bool
+            if input function is a three-dimensional density profile, yes
+        func_terms
+            The number of terms used to approximate the input func, 28 is sufficient for 64bits
+        """
+        mge_cache.add_interpolation_grid(
+            profile=self.mass_profile,
+            parameter=parameter,
+            values=values,
+            decompose=lambda mass_profile: MGEDecomposer(
+                mass_profile=mass_profile
+            )._decompose_convergence_via_mge_from(
+                sigma_log_list=sigma_log_list, three_D=three_D, func_terms=func_terms
+            ),
+            settings={
+                "sigma_log_list": np.asarray(sigma_log_list),
+                "three_D": three_D,
+                "func_terms": func_terms,
+            },
+        )
+
+    def _decompose_convergence_via_mge_from(
+        self, sigma_log_list, three_D: bool, func_terms: int = 28, xp=np
+    ):
+        """
+        Decomposes the convergence profile of an arbitrary elliptical function into a sum of
+        Gaussian convergence profiles, without using the `mge_cache`.
+
         Parameters
         ----------
         sigma_log_list : list
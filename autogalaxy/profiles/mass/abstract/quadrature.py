@@ -0,0 +1,200 @@
+"""
+Vectorized fixed-order quadrature used by mass profiles whose deflection angles, potentials or convergences are
+defined by one dimensional integrals over the unit interval.
+
+Many mass profiles (e.g. `gNFW`, `NFW`, `Sersic`, `PowerLawCore`) compute their lensing quantities via integrals of
+the form:
+
+    I(y, x) = ∫_0^1 f(u; y, x) du
+
+where `f` is an integrand which depends on the (y,x) coordinate the quantity is evaluated at. Historically these
+were evaluated with `scipy.integrate.quad` inside a Python loop over every coordinate, which is slow for large
+(over-sampled) grids and is incompatible with JAX.
+
+The functions in this module instead evaluate the integral for every coordinate at once, by broadcasting a fixed set
+of tabulated quadrature nodes against the input arrays such that the integrand is evaluated on an array of shape
+(n_pixels, n_nodes) and reduced with a weighted sum. This requires the integrand to be written with array operations
+(e.g. `xp.where` instead of `if` statements), but then works with both NumPy and JAX (`xp=jnp`).
+
+Two quadrature rules are supported:
+
+- `tanh_sinh` (default): the double exponential rule of Takahasi & Mori (1974), which converges exponentially even
+  when the integrand has (integrable) singularities or cusps at the end points of the interval. This is the case
+  for most mass profile integrands, whose elliptical radius `eta(u)` behaves as `sqrt(u)` near `u = 0`.
+- `gauss_legendre`: Gauss-Legendre quadrature, which is optimal for smooth integrands.
+
+The number of nodes of each rule is chosen from an input relative accuracy target `epsrel`, mirroring the `epsrel`
+input of `scipy.integrate.quad`. The function `integral_via_quad_from` evaluates the same integrals using
+`scipy.integrate.quad` one coordinate at a time and is used to test the accuracy of the vectorized engine.
+"""
+
+from functools import lru_cache
+import numpy as np
+from typing import Callable, Tuple
+
+from autogalaxy import exc
+
+# The default relative accuracy target, which matches the default `epsrel` of `scipy.integrate.quad`.
+epsrel_default = 1.49e-8
+
+
+@lru_cache(maxsize=None)
+def _tanh_sinh_nodes_and_weights_from(level: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the nodes and weights of the tanh-sinh quadrature rule on the interval [0, 1], using a step size
+    of h = 2^-level in the transformed coordinate.
+
+    Nodes which round to the end points 0.0 or 1.0 in double precision are removed, so that integrands which are
+    singular at the end points are never evaluated there.
+    """
+    step = 2.0**-level
+
+    t = np.arange(-3.2, 3.2 + 0.5 * step, step)
+
+    sinh_t = 0.5 * np.pi * np.sinh(t)
+
+    nodes = 1.0 / (1.0 + np.exp(-2.0 * sinh_t))
+    weights = step * 0.25 * np.pi * np.cosh(t) / np.cosh(sinh_t) ** 2
+
+    keep = (nodes > 0.0) & (nodes < 1.0)
+
+    return nodes[keep], weights[keep]
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre_nodes_and_weights_from(
+    total_nodes: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the nodes and weights of the Gauss-Legendre quadrature rule with `total_nodes` nodes, mapped from the
+    interval [-1, 1] to [0, 1].
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(total_nodes)
+
+    return 0.5 * (nodes + 1.0), 0.5 * weights
+
+
+def nodes_and_weights_from(
+    epsrel: float = epsrel_default, rule: str = "tanh_sinh"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the tabulated nodes and weights of a quadrature rule on the interval [0, 1], where the number of nodes
+    is chosen to reach a relative accuracy target of `epsrel`.
+
+    For the tanh-sinh rule the step size h is chosen such that the discretization error, which scales as
+    exp(-pi^2 / 2h) for integrands analytic inside the unit interval, reaches `epsrel` with a safety factor of two
+    to account for end-point singularities. For the Gauss-Legendre rule the number of nodes scales with the number of
+    digits required.
+
+    The nodes and weights are cached, so repeated calls with the same inputs are free.
+
+    Parameters
+    ----------
+    epsrel
+        The relative accuracy target of the integral.
+    rule
+        The quadrature rule used, either `tanh_sinh` or `gauss_legendre`.
+    """
+    digits = -np.log(max(epsrel, 1.0e-15))
+
+    if rule == "tanh_sinh":
+        step = np.pi**2 / (4.0 * digits)
+
+        return _tanh_sinh_nodes_and_weights_from(
+            level=max(1, int(np.ceil(np.log2(1.0 / step))))
+        )
+
+    if rule == "gauss_legendre":
+        return _gauss_legendre_nodes_and_weights_from(
+            total_nodes=int(16 * np.ceil(digits / 4.0))
+        )
+
+    raise exc.ProfileException(
+        f"The quadrature rule {rule} is not supported, it must be one of (tanh_sinh, gauss_legendre)."
+    )
+
+
+def integral_from(
+    func: Callable,
+    *args,
+    xp=np,
+    epsrel: float = epsrel_default,
+    rule: str = "tanh_sinh",
+    **kwargs,
+):
+    """
+    Returns the integral of `func(u, *args, **kwargs)` over the interval u = [0, 1], evaluated for every element of
+    the array inputs in `args` at once.
+
+    Every array input in `args` (e.g. the y and x coordinates of a grid, each of shape [n_pixels]) has a trailing
+    axis added, so that the integrand is evaluated on an array of shape [n_pixels, n_nodes] and the integral is
+    returned as an array of shape [n_pixels]. Scalar inputs (e.g. the axis-ratio of the profile) and all keyword
+    inputs (e.g. a tabulated function the integrand interpolates) are passed to the integrand unchanged.
+
+    The integrand must therefore be written using array operations which broadcast, for example using `xp.where`
+    instead of `if` statements.
+
+    Parameters
+    ----------
+    func
+        The integrand, with signature `func(u, *args, xp=xp, **kwargs)`.
+    args
+        The arrays and scalars passed to the integrand, where arrays are broadcast against the quadrature nodes.
+    xp
+        The array module (`numpy` or `jax.numpy`) used to evaluate the integral.
+    epsrel
+        The relative accuracy target of the integral.
+    rule
+        The quadrature rule used, either `tanh_sinh` or `gauss_legendre`.
+    kwargs
+        Inputs passed to the integrand unchanged.
+    """
+    nodes, weights = nodes_and_weights_from(epsrel=epsrel, rule=rule)
+
+    args = [xp.asarray(arg)[..., None] if np.ndim(arg) > 0 else arg for arg in args]
+
+    integrand = func(xp.asarray(nodes), *args, xp=xp, **kwargs)
+
+    return xp.sum(integrand * xp.asarray(weights), axis=-1)
+
+
+def integral_via_quad_from(
+    func: Callable, *args, epsrel: float = epsrel_default, **kwargs
+) -> np.ndarray:
+    """
+    Returns the integral of `func(u, *args, **kwargs)` over the interval u = [0, 1] using `scipy.integrate.quad`,
+    looping over every element of the array inputs in `args`.
+
+    This is the reference implementation the vectorized `integral_from` engine is tested against, and takes the same
+    inputs. It is slow and only supports NumPy.
+
+    Parameters
+    ----------
+    func
+        The integrand, with signature `func(u, *args, xp=xp, **kwargs)`.
+    args
+        The arrays and scalars passed to the integrand, where arrays are looped over.
+    epsrel
+        The relative accuracy target of the integral.
+    kwargs
+        Inputs passed to the integrand unchanged.
+    """
+    from scipy.integrate import quad
+
+    total_elements = max(
+        [np.shape(arg)[0] for arg in args if np.ndim(arg) > 0], default=1
+    )
+
+    integral = np.zeros(total_elements)
+
+    for i in range(total_elements):
+        args_i = tuple(arg[i] if np.ndim(arg) > 0 else arg for arg in args)
+
+        integral[i] = quad(
+            lambda u: float(func(u, *args_i, xp=np, **kwargs)),
+            a=0.0,
+            b=1.0,
+            epsrel=epsrel,
+        )[0]
+
+    return integral
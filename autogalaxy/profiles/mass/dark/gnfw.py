@@ -3,7 +3,9 @@ from typing import Tuple
 
 import autoarray as aa
 
+from autogalaxy.profiles.mass.abstract import quadrature
 from autogalaxy.profiles.mass.dark.abstract import AbstractgNFW
+from autogalaxy.profiles.mass.dark import gnfw_util
 from autogalaxy.profiles.mass import MGEDecomposer
 
 
@@ -45,44 +47,26 @@ class gNFW(AbstractgNFW):
 
         """
 
-        def surface_density_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (
-                (3 - inner_slope)
-                * (x + kappa_radius / scale_radius) ** (inner_slope - 4)
-                * (1 - np.sqrt(1 - x * x))
-            )
-
         def calculate_deflection_component(npow, yx_index):
-
-            from scipy.integrate import quad
-
-            deflection_grid = np.zeros(grid.shape[0])
-
-            for i in range(grid.shape[0]):
-                deflection_grid[i] = (
-                    2.0
-                    * self.kappa_s
-                    * self.axis_ratio(xp)
-                    * grid[i, yx_index]
-                    * quad(
-                        self.deflection_func,
-                        a=0.0,
-                        b=1.0,
-                        args=(
-                            grid.array[i, 0],
-                            grid.array[i, 1],
-                            npow,
-                            self.axis_ratio(xp),
-                            minimum_log_eta,
-                            maximum_log_eta,
-                            tabulate_bins,
-                            surface_density_integral,
-                        ),
-                        epsrel=gNFW.epsrel,
-                    )[0]
+            return (
+                2.0
+                * self.kappa_s
+                * self.axis_ratio(xp)
+                * grid.array[:, yx_index]
+                * quadrature.integral_from(
+                    self.deflection_func,
+                    grid.array[:, 0],
+                    grid.array[:, 1],
+                    npow,
+                    self.axis_ratio(xp),
+                    minimum_log_eta,
+                    maximum_log_eta,
+                    tabulate_bins,
+                    xp=xp,
+                    surface_density_integral=surface_density_integral,
+                    epsrel=gNFW.epsrel,
                 )
-
-                return deflection_grid
+            )
 
         (
             eta_min,
@@ -92,32 +76,31 @@ class gNFW(AbstractgNFW):
             bin_size,
         ) = self.tabulate_integral(grid, tabulate_bins)
 
-        surface_density_integral = np.zeros((tabulate_bins,))
-
-        for i in range(tabulate_bins):
-            from scipy.integrate import quad
-
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                surface_density_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=gNFW.epsrel,
-            )[0]
+        eta = self.tabulated_eta_from(
+            minimum_log_eta, maximum_log_eta, tabulate_bins, xp=xp
+        )
 
-            surface_density_integral[i] = (
-                (eta / self.scale_radius) ** (1 - self.inner_slope)
-            ) * (((1 + eta / self.scale_radius) ** (self.inner_slope - 3)) + integral)
+        surface_density_integral = gnfw_util.surface_density_integral_from(
+            inner_slope=self.inner_slope, eta=eta / self.scale_radius, xp=xp
+        )
 
         deflection_y = calculate_deflection_component(npow=1.0, yx_index=0)
         deflection_x = calculate_deflection_component(npow=0.0, yx_index=1)
 
         return self.rotated_grid_from_reference_frame_from(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T),
+            xp.multiply(1.0, xp.vstack((deflection_y, deflection_x)).T), xp=xp
         )
 
+    @staticmethod
+    def tabulated_eta_from(minimum_log_eta, maximum_log_eta, tabulate_bins, xp=np):
+        """
+        Returns the values of eta that the inner integral of the gNFW is tabulated at, where the i-th bin of
+        the table corresponds to eta = 10 ** (minimum_log_eta + (i - 1) * bin_size).
+        """
+        bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
+
+        return 10.0 ** (minimum_log_eta + (xp.arange(tabulate_bins) - 1.0) * bin_size)
+
     @staticmethod
     def deflection_func(
         u,
@@ -129,46 +112,28 @@ class gNFW(AbstractgNFW):
         maximum_log_eta,
         tabulate_bins,
         surface_density_integral,
+        xp=np,
     ):
-        _eta_u = np.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
-        bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
-        i = 1 + int((np.log10(_eta_u) - minimum_log_eta) / bin_size)
-        r1 = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-        r2 = r1 * 10.0**bin_size
-        kap = surface_density_integral[i] + (
-            surface_density_integral[i + 1] - surface_density_integral[i]
-        ) * (_eta_u - r1) / (r2 - r1)
+        _eta_u = xp.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
+        kap = xp.interp(
+            _eta_u,
+            gNFW.tabulated_eta_from(
+                minimum_log_eta, maximum_log_eta, tabulate_bins, xp=xp
+            ),
+            surface_density_integral,
+        )
         return kap / (1.0 - (1.0 - axis_ratio**2) * u) ** (npow + 0.5)
 
     def convergence_func(self, grid_radius: float, xp=np) -> float:
+        grid_radius = (1.0 / self.scale_radius) * xp.asarray(grid_radius.array)
 
-        from scipy.integrate import quad
-
-        def integral_y(y, eta):
-            return (y + eta) ** (self.inner_slope - 4) * (1 - xp.sqrt(1 - y**2))
-
-        grid_radius = xp.array((1.0 / self.scale_radius) * grid_radius.array)
-
-        for index in range(grid_radius.shape[0]):
-            integral_y_value = quad(
-                integral_y,
-                a=0.0,
-                b=1.0,
-                args=grid_radius[index],
-                epsrel=gNFW.epsrel,
-            )[0]
-
-            grid_radius[index] = (
-                2.0
-                * self.kappa_s
-                * (grid_radius[index] ** (1 - self.inner_slope))
-                * (
-                    (1 + grid_radius[index]) ** (self.inner_slope - 3)
-                    + ((3 - self.inner_slope) * integral_y_value)
-                )
+        return (
+            2.0
+            * self.kappa_s
+            * gnfw_util.surface_density_integral_from(
+                inner_slope=self.inner_slope, eta=grid_radius, xp=xp
             )
-
-        return grid_radius
+        )
 
     @aa.over_sample
     @aa.grid_dec.to_array
@@ -188,14 +153,6 @@ class gNFW(AbstractgNFW):
 
         """
 
-        from scipy import special
-        from scipy.integrate import quad
-
-        def deflection_integrand(x, kappa_radius, scale_radius, inner_slope):
-            return (x + kappa_radius / scale_radius) ** (inner_slope - 3) * (
-                (1 - np.sqrt(1 - x**2)) / x
-            )
-
         (
             eta_min,
             eta_max,
@@ -204,52 +161,26 @@ class gNFW(AbstractgNFW):
             bin_size,
         ) = self.tabulate_integral(grid, tabulate_bins)
 
-        potential_grid = np.zeros(grid.shape[0])
-
-        deflection_integral = np.zeros((tabulate_bins,))
-
-        for i in range(tabulate_bins):
-            eta = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-
-            integral = quad(
-                deflection_integrand,
-                a=0.0,
-                b=1.0,
-                args=(eta, self.scale_radius, self.inner_slope),
-                epsrel=gNFW.epsrel,
-            )[0]
-
-            deflection_integral[i] = (
-                (eta / self.scale_radius) ** (2 - self.inner_slope)
-            ) * (
-                (1.0 / (3 - self.inner_slope))
-                * special.hyp2f1(
-                    3 - self.inner_slope,
-                    3 - self.inner_slope,
-                    4 - self.inner_slope,
-                    -(eta / self.scale_radius),
-                )
-                + integral
-            )
+        eta = self.tabulated_eta_from(
+            minimum_log_eta, maximum_log_eta, tabulate_bins, xp=xp
+        )
 
-        for i in range(grid.shape[0]):
-            potential_grid[i] = (2.0 * self.kappa_s * self.axis_ratio(xp)) * quad(
-                self.potential_func,
-                a=0.0,
-                b=1.0,
-                args=(
-                    grid.array[i, 0],
-                    grid.array[i, 1],
-                    self.axis_ratio(xp),
-                    minimum_log_eta,
-                    maximum_log_eta,
-                    tabulate_bins,
-                    deflection_integral,
-                ),
-                epsrel=gNFW.epsrel,
-            )[0]
+        deflection_integral = gnfw_util.deflection_integral_from(
+            inner_slope=self.inner_slope, eta=eta / self.scale_radius, xp=xp
+        )
 
-        return potential_grid
+        return (2.0 * self.kappa_s * self.axis_ratio(xp)) * quadrature.integral_from(
+            self.potential_func,
+            grid.array[:, 0],
+            grid.array[:, 1],
+            self.axis_ratio(xp),
+            minimum_log_eta,
+            maximum_log_eta,
+            tabulate_bins,
+            xp=xp,
+            potential_integral=deflection_integral,
+            epsrel=gNFW.epsrel,
+        )
 
     @staticmethod
     def potential_func(
@@ -261,15 +192,16 @@ class gNFW(AbstractgNFW):
         maximum_log_eta,
         tabulate_bins,
         potential_integral,
+        xp=np,
     ):
-        _eta_u = np.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
-        bin_size = (maximum_log_eta - minimum_log_eta) / (tabulate_bins - 1)
-        i = 1 + int((np.log10(_eta_u) - minimum_log_eta) / bin_size)
-        r1 = 10.0 ** (minimum_log_eta + (i - 1) * bin_size)
-        r2 = r1 * 10.0**bin_size
-        angle = potential_integral[i] + (
-            potential_integral[i + 1] - potential_integral[i]
-        ) * (_eta_u - r1) / (r2 - r1)
+        _eta_u = xp.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
+        angle = xp.interp(
+            _eta_u,
+            gNFW.tabulated_eta_from(
+                minimum_log_eta, maximum_log_eta, tabulate_bins, xp=xp
+            ),
+            potential_integral,
+        )
         return _eta_u * (angle / u) / (1.0 - (1.0 - axis_ratio**2) * u) ** 0.5
 
 
@@ -320,41 +252,21 @@ class gNFWSph(gNFW):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
 
-        eta = np.multiply(
-            1.0 / self.scale_radius, self.radial_grid_from(grid, **kwargs).array
+        eta = xp.multiply(
+            1.0 / self.scale_radius,
+            self.radial_grid_from(grid, xp=xp, **kwargs).array,
         )
 
-        deflection_grid = np.zeros(grid.shape[0])
-
-        for i in range(grid.shape[0]):
-            deflection_grid[i] = np.multiply(
-                4.0 * self.kappa_s * self.scale_radius, self.deflection_func_sph(eta[i])
-            )
+        deflection_grid = xp.multiply(
+            4.0 * self.kappa_s * self.scale_radius,
+            self.deflection_func_sph(eta, xp=xp),
+        )
 
         return self._cartesian_grid_via_radial_from(
             grid=grid, radius=deflection_grid, xp=xp
         )
 
-    @staticmethod
-    def deflection_integrand(y, eta, inner_slope):
-        return (y + eta) ** (inner_slope - 3) * ((1 - np.sqrt(1 - y**2)) / y)
-
-    def deflection_func_sph(self, eta):
-
-        from scipy import special
-        from scipy.integrate import quad
-
-        integral_y_2 = quad(
-            self.deflection_integrand,
-            a=0.0,
-            b=1.0,
-            args=(eta, self.inner_slope),
-            epsrel=1.49e-6,
-        )[0]
-        return eta ** (2 - self.inner_slope) * (
-            (1.0 / (3 - self.inner_slope))
-            * special.hyp2f1(
-                3 - self.inner_slope, 3 - self.inner_slope, 4 - self.inner_slope, -eta
-            )
-            + integral_y_2
+    def deflection_func_sph(self, eta, xp=np):
+        return gnfw_util.deflection_integral_from(
+            inner_slope=self.inner_slope, eta=eta, xp=xp
         )
@@ -0,0 +1,341 @@
+"""
+Tabulated inner integrals of the generalized NFW (gNFW) profile.
+
+The convergence, deflection angles and potential of the gNFW profile all depend on two inner integrals of the
+dimensionless radius eta = r / scale_radius, which are (see Keeton 2001, https://arxiv.org/abs/astro-ph/0102341):
+
+- The surface density integral:
+
+    F(eta) = eta^(1 - γ) * [(1 + eta)^(γ - 3) + (3 - γ) ∫_0^1 (x + eta)^(γ - 4) (1 - sqrt(1 - x^2)) dx]
+
+- The deflection integral:
+
+    G(eta) = eta^(2 - γ) * [2F1(3 - γ, 3 - γ; 4 - γ; -eta) / (3 - γ) + ∫_0^1 (x + eta)^(γ - 3) (1 - sqrt(1 - x^2)) / x dx]
+
+where γ is the `inner_slope` of the profile. Both integrals depend only on γ and eta, and not on any other parameter
+of the profile, meaning they can be tabulated once over a 2D grid of (γ, log10 eta) values and then interpolated
+for every gNFW evaluation, instead of being recomputed via numerical integration every time the profile is used
+(e.g. every likelihood evaluation of a non-linear search).
+
+The tables are built lazily the first time they are used (which takes under a second) and are then cached for the
+lifetime of the Python process. Each table has 200 x 243 float64 entries (about 0.4 MB) and is built one inner slope
+at a time, so that the quadrature used to build it only evaluates the integrands on arrays of about 25,000 values.
+The power-law behaviour eta^(1 - γ) and eta^(2 - γ) is factored out analytically and the logarithm of the
+remaining, slowly varying, part of each integral is interpolated with bicubic (Catmull-Rom) interpolation, giving a
+relative accuracy better than 1e-5 over the tabulated range.
+
+Inputs outside of the tabulated range are handled as follows:
+
+- Complex values of eta (e.g. from the MGE decomposition of the convergence) are not tabulated and are always
+  computed directly via numerical quadrature.
+- When using NumPy, real inputs outside the tabulated range are computed directly via numerical quadrature.
+- When using JAX, whether an input is inside the tabulated range cannot be checked before the function is traced,
+  therefore real inputs outside of it are returned as NaN, rather than clamped to the edges of the tables (which
+  gives values which are wrong by orders of magnitude). This only affects inner slopes outside [-1.0, 2.94] and
+  dimensionless radii below 1e-8 (e.g. a coordinate at the profile centre, where NumPy also returns a NaN or
+  infinite value) or above 1e4.
+"""
+
+from functools import lru_cache
+import numpy as np
+from typing import Tuple
+
+from autogalaxy.profiles.mass.abstract import quadrature
+
+inner_slope_min = -1.0
+inner_slope_max = 2.94
+inner_slope_step = 0.02
+
+log10_eta_min = -8.0
+log10_eta_max = 4.0
+log10_eta_step = 0.05
+
+
+def surface_density_integrand(x, eta, inner_slope, xp=np):
+    return (3 - inner_slope) * (x + eta) ** (inner_slope - 4) * (1 - xp.sqrt(1 - x * x))
+
+
+def deflection_integrand(x, eta, inner_slope, xp=np):
+    return (x + eta) ** (inner_slope - 3) * ((1 - xp.sqrt(1 - x**2)) / x)
+
+
+def surface_density_integral_via_quadrature_from(
+    inner_slope, eta, xp=np, epsrel: float = 1.0e-10
+):
+    """
+    Returns the surface density integral F(eta) of the gNFW profile, computed via numerical quadrature.
+
+    Parameters
+    ----------
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius the integral is computed at.
+    epsrel
+        The relative accuracy target of the quadrature.
+    """
+    integral = quadrature.integral_from(
+        surface_density_integrand, eta, inner_slope, xp=xp, epsrel=epsrel
+    )
+
+    return (eta ** (1 - inner_slope)) * (((1 + eta) ** (inner_slope - 3)) + integral)
+
+
+def deflection_integral_via_quadrature_from(
+    inner_slope, eta, epsrel: float = 1.0e-10
+) -> np.ndarray:
+    """
+    Returns the deflection integral G(eta) of the gNFW profile, computed via numerical quadrature.
+
+    This uses `scipy.special.hyp2f1` and therefore only supports NumPy.
+
+    Parameters
+    ----------
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius the integral is computed at.
+    epsrel
+        The relative accuracy target of the quadrature.
+    """
+    from scipy import special
+
+    integral = quadrature.integral_from(
+        deflection_integrand, eta, inner_slope, epsrel=epsrel
+    )
+
+    return (eta ** (2 - inner_slope)) * (
+        (1.0 / (3 - inner_slope))
+        * special.hyp2f1(
+            3 - inner_slope,
+            3 - inner_slope,
+            4 - inner_slope,
+            -eta,
+        )
+        + integral
+    )
+
+
+def tabulated_inner_slopes() -> np.ndarray:
+    """
+    The inner slopes γ the gNFW integrals are tabulated at, including one padding row either side of the
+    range [inner_slope_min, inner_slope_max] for the bicubic stencil.
+    """
+    total = int(round((inner_slope_max - inner_slope_min) / inner_slope_step))
+
+    return inner_slope_min + inner_slope_step * np.arange(-1, total + 2)
+
+
+def tabulated_log10_etas() -> np.ndarray:
+    """
+    The values of log10(eta) the gNFW integrals are tabulated at, including one padding column either side of the
+    range [log10_eta_min, log10_eta_max] for the bicubic stencil.
+    """
+    total = int(round((log10_eta_max - log10_eta_min) / log10_eta_step))
+
+    return log10_eta_min + log10_eta_step * np.arange(-1, total + 2)
+
+
+@lru_cache(maxsize=None)
+def log_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the tables of the gNFW surface density and deflection integrals over a 2D grid of
+    (inner_slope, log10 eta) values.
+
+    The power-law terms eta^(1 - γ) and eta^(2 - γ) and the factor 1 / (3 - γ) are divided out before the logarithm
+    is taken, so that the tables only contain the slowly varying part of each integral.
+
+    The tables are built once, the first time this function is called, and cached for the lifetime of the process.
+    They are built one inner slope at a time, which bounds the memory of the quadrature (see the module docstring).
+    """
+    from scipy import special
+
+    inner_slopes = tabulated_inner_slopes()
+    eta = 10.0 ** tabulated_log10_etas()
+
+    log_surface_density_table = np.zeros((inner_slopes.shape[0], eta.shape[0]))
+    log_deflection_table = np.zeros((inner_slopes.shape[0], eta.shape[0]))
+
+    for i, inner_slope in enumerate(inner_slopes):
+        surface_density = (1 + eta) ** (inner_slope - 3) + quadrature.integral_from(
+            surface_density_integrand, eta, inner_slope, epsrel=1.0e-12
+        )
+
+        deflection = special.hyp2f1(
+            3 - inner_slope,
+            3 - inner_slope,
+            4 - inner_slope,
+            -eta,
+        ) + (3 - inner_slope) * quadrature.integral_from(
+            deflection_integrand, eta, inner_slope, epsrel=1.0e-12
+        )
+
+        log_surface_density_table[i] = np.log(surface_density)
+        log_deflection_table[i] = np.log(deflection)
+
+    return log_surface_density_table, log_deflection_table
+
+
+def in_table_range_mask_from(inner_slope, eta, xp=np):
+    """
+    Returns a boolean array which is `True` for every value of eta (and its inner slope) inside the range covered by
+    the tabulated integrals, which supports JAX tracers.
+
+    Parameters
+    ----------
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius which are checked.
+    """
+    return (
+        (inner_slope_min <= inner_slope)
+        & (inner_slope <= inner_slope_max)
+        & (10.0**log10_eta_min <= eta)
+        & (eta <= 10.0**log10_eta_max)
+    )
+
+
+def in_table_range(inner_slope, eta) -> bool:
+    """
+    Returns whether an inner slope and every value of eta are inside the range covered by the tabulated integrals.
+
+    Complex values of eta (e.g. from the MGE decomposition of the convergence) are not tabulated. This check uses
+    NumPy and must not be called on JAX tracers.
+    """
+    if np.iscomplexobj(eta):
+        return False
+
+    return bool(np.all(in_table_range_mask_from(inner_slope=inner_slope, eta=eta)))
+
+
+def _catmull_rom_weights_from(t, xp=np):
+    return (
+        0.5 * (-(t**3) + 2.0 * t**2 - t),
+        0.5 * (3.0 * t**3 - 5.0 * t**2 + 2.0),
+        0.5 * (-3.0 * t**3 + 4.0 * t**2 + t),
+        0.5 * (t**3 - t**2),
+    )
+
+
+def interpolated_from(table: np.ndarray, inner_slope, eta, xp=np):
+    """
+    Returns the bicubic (Catmull-Rom) interpolation of a tabulated integral at the input inner slope(s) and
+    dimensionless radii eta.
+
+    Inputs outside the tabulated range are clamped to its edges, therefore callers must check `in_table_range`
+    first when using NumPy, or mask the output with `in_table_range_mask_from` when using JAX.
+
+    Parameters
+    ----------
+    table
+        One of the tables returned by `log_tables`.
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius the integral is interpolated at.
+    """
+    table = xp.asarray(table)
+
+    index_slope = (inner_slope - inner_slope_min) / inner_slope_step + 1.0
+    index_slope = xp.clip(index_slope, 1.0, table.shape[0] - 2.0)
+
+    index_eta = (xp.log10(eta) - log10_eta_min) / log10_eta_step + 1.0
+    index_eta = xp.clip(index_eta, 1.0, table.shape[1] - 2.0)
+
+    i = xp.clip(xp.floor(index_slope).astype(int), 1, table.shape[0] - 3)
+    j = xp.clip(xp.floor(index_eta).astype(int), 1, table.shape[1] - 3)
+
+    weights_slope = _catmull_rom_weights_from(index_slope - i, xp=xp)
+    weights_eta = _catmull_rom_weights_from(index_eta - j, xp=xp)
+
+    interpolated = 0.0
+
+    for p, weight_slope in enumerate(weights_slope):
+        for q, weight_eta in enumerate(weights_eta):
+            interpolated = (
+                interpolated + weight_slope * weight_eta * table[i - 1 + p, j - 1 + q]
+            )
+
+    return interpolated
+
+
+def surface_density_integral_from(inner_slope, eta, xp=np):
+    """
+    Returns the surface density integral F(eta) of the gNFW profile, interpolated from the tabulated integrals.
+
+    Complex values of eta, and when using NumPy inputs outside the tabulated range, are computed directly via
+    numerical quadrature. When using JAX, real inputs outside the tabulated range are returned as NaN.
+
+    Parameters
+    ----------
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius the integral is computed at.
+    """
+    if xp.iscomplexobj(eta) or (
+        xp is np and not in_table_range(inner_slope=inner_slope, eta=eta)
+    ):
+        return surface_density_integral_via_quadrature_from(
+            inner_slope=inner_slope, eta=eta, xp=xp
+        )
+
+    log_surface_density_table, _ = log_tables()
+
+    integral = (eta ** (1 - inner_slope)) * xp.exp(
+        interpolated_from(
+            table=log_surface_density_table, inner_slope=inner_slope, eta=eta, xp=xp
+        )
+    )
+
+    if xp is np:
+        return integral
+
+    return xp.where(
+        in_table_range_mask_from(inner_slope=inner_slope, eta=eta, xp=xp),
+        integral,
+        xp.nan,
+    )
+
+
+def deflection_integral_from(inner_slope, eta, xp=np):
+    """
+    Returns the deflection integral G(eta) of the gNFW profile, interpolated from the tabulated integrals.
+
+    Complex values of eta, and when using NumPy inputs outside the tabulated range, are computed directly via
+    numerical quadrature (which only supports NumPy). When using JAX, real inputs outside the tabulated range are
+    returned as NaN.
+
+    Parameters
+    ----------
+    inner_slope
+        The inner slope γ of the gNFW profile, which can be a float or an array with the same shape as `eta`.
+    eta
+        The dimensionless radii r / scale_radius the integral is computed at.
+    """
+    if xp.iscomplexobj(eta) or (
+        xp is np and not in_table_range(inner_slope=inner_slope, eta=eta)
+    ):
+        return deflection_integral_via_quadrature_from(inner_slope=inner_slope, eta=eta)
+
+    _, log_deflection_table = log_tables()
+
+    integral = (
+        (eta ** (2 - inner_slope))
+        * xp.exp(
+            interpolated_from(
+                table=log_deflection_table, inner_slope=inner_slope, eta=eta, xp=xp
+            )
+        )
+        / (3 - inner_slope)
+    )
+
+    if xp is np:
+        return integral
+
+    return xp.where(
+        in_table_range_mask_from(inner_slope=inner_slope, eta=eta, xp=xp),
+        integral,
+        xp.nan,
+    )
@@ -0,0 +1,591 @@
+"""
+The Ludlow et al. (2016) concentration-mass-redshift relation of dark matter halos for the Planck 2015 cosmology,
+tabulated as the log10 of the concentration of halos with masses `M_{200c}` from 10^4 to 10^16 solar masses and
+redshifts from 0 to 8.
+
+The table is used by `mcr_util.ludlow16_concentration_from` to compute the concentration of halos with pure array
+operations, so that profiles using the Ludlow16 relation (e.g. `NFWMCRLudlow`) can be traced and vectorized by JAX.
+It was generated using `colossus` via `mcr_util.ludlow16_log10_concentration_table_from_colossus` and should be
+regenerated with it if its range or resolution are changed.
+"""
+
+import numpy as np
+
+log10_mass_min = 4.0
+log10_mass_step = 0.25
+
+redshift_min = 0.0
+redshift_step = 0.1
+
+# Each row is a redshift and each column a log10 mass.
+# fmt: off
+log10_concentration = np.array([
+    [
+        1.370086, 1.362104, 1.353873, 1.345388, 1.336645, 1.327725, 1.318546, 1.309109, 1.299414, 1.289458,
+        1.279234, 1.268719, 1.257875, 1.246662, 1.235111, 1.223171, 1.210789, 1.197934, 1.184653, 1.170974,
+        1.156717, 1.142063, 1.126771, 1.110967, 1.094411, 1.077239, 1.059365, 1.040720, 1.021291, 1.001057,
+        0.979983, 0.958006, 0.935029, 0.911178, 0.886229, 0.860298, 0.833253, 0.805236, 0.776249, 0.746327,
+        0.715564, 0.684064, 0.652063, 0.619800, 0.587559, 0.555677, 0.524525, 0.494517, 0.466082,
+    ],
+    [
+        1.356360, 1.348414, 1.340243, 1.331811, 1.323114, 1.314164, 1.304965, 1.295521, 1.285832, 1.275895,
+        1.265704, 1.255237, 1.244457, 1.233327, 1.221808, 1.209866, 1.197477, 1.184695, 1.171527, 1.157832,
+        1.143693, 1.129082, 1.113884, 1.098135, 1.081737, 1.064600, 1.046839, 1.028352, 1.009085, 0.989019,
+        0.968125, 0.946347, 0.923655, 0.900070, 0.875410, 0.849852, 0.823206, 0.795653, 0.767180, 0.737830,
+        0.707713, 0.676947, 0.645695, 0.614194, 0.582776, 0.551827, 0.521588, 0.492388, 0.464741,
+    ],
+    [
+        1.341443, 1.333462, 1.325238, 1.316775, 1.308141, 1.299243, 1.290090, 1.280684, 1.271026, 1.261114,
+        1.250942, 1.240487, 1.229713, 1.218580, 1.207048, 1.195142, 1.182876, 1.170157, 1.156945, 1.143359,
+        1.129299, 1.114686, 1.099644, 1.083924, 1.067624, 1.050668, 1.032977, 1.014556, 0.995429, 0.975537,
+        0.954822, 0.933319, 0.910920, 0.887556, 0.863218, 0.838010, 0.811797, 0.784650, 0.756705, 0.727932,
+        0.698452, 0.668399, 0.637936, 0.607291, 0.576763, 0.546694, 0.517373, 0.489078, 0.462101,
+    ],
+    [
+        1.325359, 1.317386, 1.309249, 1.300849, 1.292187, 1.283270, 1.274106, 1.264699, 1.255049, 1.245153,
+        1.235005, 1.224585, 1.213857, 1.202784, 1.191327, 1.179455, 1.167144, 1.154457, 1.141386, 1.127803,
+        1.113778, 1.099310, 1.084247, 1.068687, 1.052456, 1.035527, 1.018034, 0.999797, 0.980817, 0.961084,
+        0.940578, 0.919256, 0.897046, 0.873916, 0.849990, 0.825046, 0.799305, 0.772603, 0.745134, 0.716954,
+        0.688116, 0.658769, 0.629082, 0.599271, 0.569613, 0.540427, 0.511982, 0.484642, 0.458610,
+    ],
+    [
+        1.308563, 1.300639, 1.292467, 1.284041, 1.275359, 1.266437, 1.257329, 1.247968, 1.238353, 1.228484,
+        1.218353, 1.207940, 1.197208, 1.186117, 1.174710, 1.162914, 1.150696, 1.138028, 1.124922, 1.111476,
+        1.097491, 1.083067, 1.068127, 1.052609, 1.036450, 1.019724, 1.002275, 0.984117, 0.965278, 0.945731,
+        0.925406, 0.904282, 0.882378, 0.859599, 0.835892, 0.811370, 0.785973, 0.759795, 0.732788, 0.705170,
+        0.676989, 0.648352, 0.619434, 0.590446, 0.561641, 0.533350, 0.505912, 0.479441, 0.454244,
+    ],
+    [
+        1.291246, 1.283290, 1.275092, 1.266667, 1.258066, 1.249205, 1.240092, 1.230732, 1.221125, 1.211270,
+        1.201162, 1.190778, 1.180084, 1.169043, 1.157615, 1.145771, 1.133629, 1.121055, 1.108015, 1.094530,
+        1.080685, 1.066266, 1.051444, 1.035957, 1.019977, 1.003276, 0.985944, 0.967998, 0.949329, 0.929936,
+        0.909809, 0.888916, 0.867201, 0.844622, 0.821315, 0.797140, 0.772136, 0.746410, 0.719979, 0.692866,
+        0.665325, 0.637406, 0.609258, 0.581084, 0.553143, 0.525818, 0.499228, 0.473629, 0.449363,
+    ],
+    [
+        1.273563, 1.265580, 1.257436, 1.249083, 1.240467, 1.231598, 1.222482, 1.213125, 1.203526, 1.193686,
+        1.183598, 1.173242, 1.162585, 1.151588, 1.140216, 1.128439, 1.116236, 1.103706, 1.090767, 1.077338,
+        1.063497, 1.049229, 1.034378, 1.019083, 1.003111, 0.986545, 0.969386, 0.951524, 0.932972, 0.913730,
+        0.893793, 0.873135, 0.851708, 0.829481, 0.806423, 0.782584, 0.758051, 0.732720, 0.706836, 0.680350,
+        0.653351, 0.626164, 0.598786, 0.571419, 0.544382, 0.517924, 0.492148, 0.467548, 0.444081,
+    ],
+    [
+        1.255707, 1.247803, 1.239689, 1.231318, 1.222690, 1.213814, 1.204696, 1.195343, 1.185754, 1.175932,
+        1.165863, 1.155532, 1.144909, 1.133956, 1.122637, 1.110923, 1.098797, 1.086233, 1.073339, 1.060025,
+        1.046194, 1.032007, 1.017272, 1.002022, 0.986142, 0.969736, 0.952636, 0.934874, 0.916546, 0.897516,
+        0.877785, 0.857332, 0.836114, 0.814107, 0.791450, 0.768014, 0.743780, 0.719034, 0.693553, 0.667718,
+        0.641386, 0.614827, 0.588219, 0.561648, 0.535489, 0.509870, 0.485050, 0.461203, 0.438665,
+    ],
+    [
+        1.237939, 1.230048, 1.221912, 1.213524, 1.204885, 1.196004, 1.186951, 1.177650, 1.168103, 1.158308,
+        1.148261, 1.137943, 1.127317, 1.116348, 1.105031, 1.093381, 1.081330, 1.068856, 1.055929, 1.042684,
+        1.028985, 1.014759, 1.000190, 0.984936, 0.969268, 0.952897, 0.935935, 0.918401, 0.900190, 0.881311,
+        0.861770, 0.841550, 0.820616, 0.798954, 0.776550, 0.753415, 0.729731, 0.705347, 0.680475, 0.655124,
+        0.629478, 0.603550, 0.577710, 0.551918, 0.526612, 0.501796, 0.477905, 0.454927, 0.433117,
+    ],
+    [
+        1.220292, 1.212373, 1.204215, 1.195811, 1.187246, 1.178438, 1.169382, 1.160085, 1.150546, 1.140767,
+        1.130743, 1.120453, 1.109866, 1.098944, 1.087652, 1.075962, 1.063949, 1.051565, 1.038744, 1.025451,
+        1.011862, 0.997771, 0.983193, 0.968136, 0.952476, 0.936237, 0.919454, 0.902005, 0.883908, 0.865233,
+        0.845923, 0.825934, 0.805238, 0.783832, 0.761822, 0.739136, 0.715781, 0.691876, 0.667537, 0.642713,
+        0.617731, 0.592475, 0.567363, 0.542327, 0.517848, 0.493882, 0.470776, 0.448682, 0.427723,
+    ],
+    [
+        1.202805, 1.194858, 1.186729, 1.178420, 1.169852, 1.161035, 1.151976, 1.142682, 1.133153, 1.123390,
+        1.113388, 1.103129, 1.092579, 1.081706, 1.070473, 1.058855, 1.046834, 1.034439, 1.021725, 1.008559,
+        0.994905, 0.980970, 0.966462, 0.951501, 0.935926, 0.919863, 0.903133, 0.885852, 0.868000, 0.849505,
+        0.830381, 0.810621, 0.790205, 0.769130, 0.747400, 0.725025, 0.702110, 0.678721, 0.654824, 0.630644,
+        0.606227, 0.581669, 0.557252, 0.532965, 0.509261, 0.486152, 0.463821, 0.442458, 0.422262,
+    ],
+    [
+        1.185536, 1.177676, 1.169597, 1.161265, 1.152681, 1.143854, 1.134793, 1.125502, 1.116011, 1.106285,
+        1.096311, 1.086070, 1.075529, 1.064695, 1.053522, 1.041978, 1.030045, 1.017704, 1.004936, 0.991898,
+        0.978391, 0.964398, 0.950077, 0.935120, 0.919756, 0.903714, 0.887201, 0.870084, 0.852339, 0.833985,
+        0.815101, 0.795597, 0.775444, 0.754647, 0.733246, 0.711321, 0.688847, 0.665862, 0.642474, 0.618891,
+        0.595049, 0.571175, 0.547448, 0.523922, 0.500920, 0.478618, 0.457115, 0.436568, 0.417132,
+    ],
+    [
+        1.168707, 1.160836, 1.152725, 1.144370, 1.135775, 1.127022, 1.118025, 1.108788, 1.099314, 1.089604,
+        1.079655, 1.069448, 1.058950, 1.048129, 1.036948, 1.025384, 1.013524, 1.001290, 0.988641, 0.975547,
+        0.962151, 0.948311, 0.933960, 0.919229, 0.903851, 0.888043, 0.871619, 0.854591, 0.837103, 0.818999,
+        0.800303, 0.781018, 0.761134, 0.740661, 0.719619, 0.698031, 0.675932, 0.653370, 0.630582, 0.607515,
+        0.584257, 0.561043, 0.537998, 0.515214, 0.492890, 0.471317, 0.450575, 0.430763, 0.411996,
+    ],
+    [
+        1.152184, 1.144273, 1.136162, 1.127896, 1.119374, 1.110606, 1.101602, 1.092366, 1.082901, 1.073209,
+        1.063284, 1.053111, 1.042658, 1.031893, 1.020783, 1.009304, 0.997441, 0.985177, 0.972639, 0.959694,
+        0.946293, 0.932537, 0.918354, 0.903619, 0.888467, 0.872702, 0.856441, 0.839650, 0.822253, 0.804294,
+        0.785864, 0.766850, 0.747248, 0.727075, 0.706356, 0.685122, 0.663416, 0.641411, 0.619098, 0.596555,
+        0.573883, 0.551301, 0.528924, 0.506857, 0.485284, 0.464400, 0.444362, 0.425285, 0.407266,
+    ],
+    [
+        1.135960, 1.128152, 1.120101, 1.111803, 1.103257, 1.094475, 1.085466, 1.076287, 1.066872, 1.057221,
+        1.047332, 1.037188, 1.026756, 1.016004, 1.004906, 0.993512, 0.981753, 0.969611, 0.957065, 0.944128,
+        0.930902, 0.917208, 0.903077, 0.888535, 0.873402, 0.857848, 0.841710, 0.825024, 0.807887, 0.790167,
+        0.771895, 0.753083, 0.733734, 0.713875, 0.693495, 0.672675, 0.651451, 0.629880, 0.608042, 0.586028,
+        0.563940, 0.541952, 0.520223, 0.498841, 0.477976, 0.457800, 0.438442, 0.419994, 0.402564,
+    ],
+    [
+        1.120266, 1.112406, 1.104314, 1.096018, 1.087549, 1.078835, 1.069884, 1.060703, 1.051295, 1.041660,
+        1.031798, 1.021690, 1.011307, 1.000618, 0.989590, 0.978202, 0.966440, 0.954319, 0.941916, 0.929106,
+        0.915860, 0.902289, 0.888300, 0.873772, 0.858872, 0.843354, 0.827424, 0.810935, 0.793869, 0.776410,
+        0.758406, 0.739869, 0.720804, 0.701238, 0.681204, 0.660746, 0.639916, 0.618781, 0.597422, 0.575934,
+        0.554422, 0.533007, 0.511878, 0.491144, 0.470938, 0.451409, 0.432701, 0.414980, 0.398226,
+    ],
+    [
+        1.104828, 1.097016, 1.089011, 1.080757, 1.072258, 1.063523, 1.054561, 1.045388, 1.036032, 1.026444,
+        1.016622, 1.006549, 0.996196, 0.985530, 0.974542, 0.963248, 0.951600, 0.939583, 0.927178, 0.914376,
+        0.901321, 0.887824, 0.873860, 0.859567, 0.844665, 0.829404, 0.813521, 0.797255, 0.780441, 0.763082,
+        0.745308, 0.727056, 0.708288, 0.689036, 0.669341, 0.649250, 0.628820, 0.608121, 0.587240, 0.566273,
+        0.545323, 0.524510, 0.503968, 0.483843, 0.464285, 0.445432, 0.427377, 0.410167, 0.393990,
+    ],
+    [
+        1.089910, 1.082084, 1.074027, 1.065762, 1.057335, 1.048666, 1.039763, 1.030634, 1.021282, 1.011710,
+        1.001914, 0.991880, 0.981578, 0.970979, 0.960053, 0.948779, 0.937146, 0.925140, 0.912857, 0.900221,
+        0.887175, 0.873727, 0.859982, 0.845702, 0.831021, 0.815813, 0.800177, 0.783957, 0.767401, 0.750299,
+        0.732691, 0.714666, 0.696201, 0.677270, 0.657919, 0.638197, 0.618168, 0.597906, 0.577497, 0.557039,
+        0.536633, 0.516395, 0.496451, 0.476933, 0.457973, 0.439688, 0.422148, 0.405651, 0.389994,
+    ],
+    [
+        1.075248, 1.067500, 1.059522, 1.051300, 1.042836, 1.034141, 1.025230, 1.016158, 1.006858, 0.997334,
+        0.987583, 0.977589, 0.967325, 0.956759, 0.945862, 0.934618, 0.923105, 0.911241, 0.899012, 0.886395,
+        0.873429, 0.860173, 0.846455, 0.832323, 0.817770, 0.802691, 0.787217, 0.771236, 0.754768, 0.737926,
+        0.720581, 0.702763, 0.684556, 0.665949, 0.646942, 0.627592, 0.607962, 0.588129, 0.568183, 0.548219,
+        0.528335, 0.508641, 0.489254, 0.470293, 0.451872, 0.434237, 0.417376, 0.401267, 0.386249,
+    ],
+    [
+        1.061131, 1.053321, 1.045288, 1.037140, 1.028742, 1.020108, 1.011248, 1.002167, 0.992870, 0.983360,
+        0.973634, 0.963679, 0.953467, 0.942970, 0.932161, 0.921019, 0.909538, 0.897705, 0.885505, 0.873008,
+        0.860196, 0.846977, 0.833350, 0.819401, 0.804900, 0.790054, 0.774656, 0.758915, 0.742625, 0.725973,
+        0.708892, 0.691348, 0.673358, 0.655073, 0.636410, 0.617427, 0.598190, 0.578778, 0.559280, 0.539789,
+        0.520401, 0.501217, 0.482344, 0.464005, 0.446227, 0.429092, 0.412683, 0.397255, 0.382579,
+    ],
+    [
+        1.047294, 1.039559, 1.031592, 1.023388, 1.014949, 1.006370, 0.997568, 0.988542, 0.979297, 0.969836,
+        0.960157, 0.950247, 0.940079, 0.929623, 0.918853, 0.907751, 0.896308, 0.884513, 0.872477, 0.860089,
+        0.847321, 0.834151, 0.820745, 0.806857, 0.792519, 0.777807, 0.762582, 0.746999, 0.730945, 0.714443,
+        0.697626, 0.680351, 0.662645, 0.644637, 0.626312, 0.607689, 0.588836, 0.569832, 0.550764, 0.531724,
+        0.512818, 0.494205, 0.475924, 0.458077, 0.440755, 0.424177, 0.408376, 0.393323, 0.379241,
+    ],
+    [
+        1.033842, 1.026091, 1.018194, 1.010055, 1.001675, 0.993068, 0.984242, 0.975227, 0.966036, 0.956626,
+        0.946998, 0.937137, 0.927015, 0.916606, 0.905881, 0.894824, 0.883488, 0.871846, 0.859864, 0.847526,
+        0.834813, 0.821850, 0.808511, 0.794697, 0.780569, 0.765953, 0.750944, 0.735489, 0.719667, 0.703347,
+        0.686776, 0.669768, 0.652340, 0.634628, 0.616633, 0.598360, 0.579877, 0.561264, 0.542606, 0.524084,
+        0.505705, 0.487557, 0.469732, 0.452325, 0.435641, 0.419540, 0.404198, 0.389671, 0.376041,
+    ],
+    [
+        1.020812, 1.013064, 1.005098, 0.997024, 0.988705, 0.980154, 0.971382, 0.962397, 0.953203, 0.943803,
+        0.934197, 0.924373, 0.914303, 0.903963, 0.893328, 0.882381, 0.871117, 0.859529, 0.847603, 0.835325,
+        0.822766, 0.809912, 0.796651, 0.782985, 0.768998, 0.754493, 0.739692, 0.724382, 0.708784, 0.692692,
+        0.676333, 0.659585, 0.642428, 0.625027, 0.607352, 0.589415, 0.571288, 0.553065, 0.534915, 0.516821,
+        0.498869, 0.481144, 0.463832, 0.447027, 0.430704, 0.415136, 0.400242, 0.386211, 0.372908,
+    ],
+    [
+        1.008081, 1.000396, 0.992485, 0.984343, 0.976045, 0.967551, 0.958834, 0.949901, 0.940759, 0.931410,
+        0.921854, 0.912080, 0.902061, 0.891772, 0.881189, 0.870296, 0.859089, 0.847560, 0.835698, 0.823527,
+        0.811111, 0.798337, 0.785165, 0.771681, 0.757803, 0.743441, 0.728822, 0.713671, 0.698290, 0.682418,
+        0.666287, 0.649789, 0.632893, 0.615817, 0.598447, 0.580832, 0.563056, 0.545311, 0.527543, 0.509838,
+        0.492276, 0.475114, 0.458278, 0.441825, 0.426096, 0.410896, 0.396540, 0.382820, 0.370023,
+    ],
+    [
+        0.995656, 0.988032, 0.980178, 0.972091, 0.963773, 0.955265, 0.946603, 0.937723, 0.928633, 0.919336,
+        0.909833, 0.900111, 0.890145, 0.879911, 0.869384, 0.858550, 0.847405, 0.835942, 0.824151, 0.812145,
+        0.799809, 0.787125, 0.774052, 0.760738, 0.746981, 0.732795, 0.718326, 0.703359, 0.688174, 0.672514,
+        0.656623, 0.640364, 0.623757, 0.606975, 0.589896, 0.572585, 0.555265, 0.537866, 0.520452, 0.503145,
+        0.486134, 0.469345, 0.452889, 0.437034, 0.421597, 0.406973, 0.392911, 0.379708, 0.367308,
+    ],
+    [
+        0.983628, 0.975975, 0.968178, 0.960144, 0.951877, 0.943389, 0.934691, 0.925865, 0.916828, 0.907584,
+        0.898134, 0.888467, 0.878557, 0.868380, 0.857913, 0.847142, 0.836064, 0.824673, 0.813028, 0.801105,
+        0.788858, 0.776271, 0.763338, 0.750151, 0.736525, 0.722504, 0.708196, 0.693408, 0.678424, 0.662964,
+        0.647324, 0.631292, 0.615000, 0.598480, 0.581674, 0.564769, 0.547778, 0.530699, 0.513682, 0.496866,
+        0.480188, 0.463818, 0.447892, 0.432311, 0.417471, 0.403124, 0.389570, 0.376752, 0.364661,
+    ],
+    [
+        0.971938, 0.964265, 0.956483, 0.948501, 0.940284, 0.931845, 0.923195, 0.914343, 0.905344, 0.896153,
+        0.886758, 0.877147, 0.867295, 0.857178, 0.846774, 0.836070, 0.825063, 0.813769, 0.802237, 0.790401,
+        0.778250, 0.765769, 0.752973, 0.739910, 0.726425, 0.712556, 0.698419, 0.683823, 0.669025, 0.653784,
+        0.638372, 0.622554, 0.606582, 0.590307, 0.573815, 0.557270, 0.540567, 0.523861, 0.507287, 0.490776,
+        0.474538, 0.458617, 0.443005, 0.427990, 0.413420, 0.399560, 0.386387, 0.373866, 0.362074,
+    ],
+    [
+        0.960541, 0.952915, 0.945095, 0.937163, 0.928994, 0.920603, 0.912001, 0.903197, 0.894196, 0.885041,
+        0.875702, 0.866147, 0.856355, 0.846300, 0.835962, 0.825328, 0.814398, 0.803218, 0.791771, 0.780027,
+        0.767978, 0.755608, 0.742937, 0.730005, 0.716668, 0.702939, 0.688980, 0.674588, 0.659957, 0.644966,
+        0.629744, 0.614194, 0.598476, 0.582429, 0.566330, 0.550040, 0.533664, 0.517382, 0.501086, 0.485017,
+        0.469166, 0.453582, 0.438471, 0.423753, 0.409641, 0.396163, 0.383274, 0.371117, 0.359770,
+    ],
+    [
+        0.949434, 0.941852, 0.934052, 0.926125, 0.918003, 0.909658, 0.901103, 0.892346, 0.883394, 0.874252,
+        0.864960, 0.855463, 0.845731, 0.835741, 0.825471, 0.814911, 0.804059, 0.792978, 0.781619, 0.769973,
+        0.758030, 0.745779, 0.733217, 0.720423, 0.707240, 0.693648, 0.679863, 0.665680, 0.651204, 0.636466,
+        0.621420, 0.606176, 0.590659, 0.574948, 0.559107, 0.543074, 0.527130, 0.511097, 0.495227, 0.479503,
+        0.463997, 0.448861, 0.434064, 0.419772, 0.406044, 0.392835, 0.380372, 0.368618, 0.357557,
+    ],
+    [
+        0.938614, 0.931072, 0.923312, 0.915383, 0.907305, 0.899006, 0.890496, 0.881786, 0.872882, 0.863789,
+        0.854526, 0.845088, 0.835417, 0.825492, 0.815292, 0.804807, 0.794038, 0.783039, 0.771772, 0.760226,
+        0.748395, 0.736266, 0.723812, 0.711147, 0.698123, 0.684712, 0.671048, 0.657080, 0.642744, 0.628261,
+        0.613397, 0.598437, 0.583115, 0.567754, 0.552118, 0.536512, 0.520789, 0.505146, 0.489599, 0.474211,
+        0.459115, 0.444299, 0.429898, 0.415989, 0.402515, 0.389772, 0.377659, 0.366184, 0.355404,
+    ],
+    [
+        0.928074, 0.920569, 0.912847, 0.904930, 0.896894, 0.888638, 0.880172, 0.871507, 0.862651, 0.853608,
+        0.844391, 0.835011, 0.825402, 0.815544, 0.805415, 0.795007, 0.784322, 0.773389, 0.762216, 0.750775,
+        0.739057, 0.727055, 0.714741, 0.702163, 0.689302, 0.676074, 0.662518, 0.648765, 0.634644, 0.620328,
+        0.605754, 0.590950, 0.575971, 0.560788, 0.545509, 0.530139, 0.514752, 0.499432, 0.484195, 0.469194,
+        0.454408, 0.439966, 0.425941, 0.412270, 0.399289, 0.386853, 0.375010, 0.363809, 0.353303,
+    ],
+    [
+        0.917808, 0.910336, 0.902648, 0.894760, 0.886763, 0.878546, 0.870123, 0.861503, 0.852692, 0.843698,
+        0.834545, 0.825223, 0.815676, 0.805884, 0.795828, 0.785498, 0.774899, 0.764029, 0.752940, 0.741604,
+        0.730003, 0.718130, 0.705959, 0.693454, 0.680757, 0.667715, 0.654316, 0.640716, 0.626840, 0.612644,
+        0.598355, 0.583743, 0.569046, 0.554105, 0.539127, 0.524017, 0.508976, 0.493923, 0.479067, 0.464355,
+        0.449929, 0.435847, 0.422050, 0.408884, 0.396173, 0.383997, 0.372418, 0.361517, 0.351302,
+    ],
+    [
+        0.907807, 0.900365, 0.892708, 0.884861, 0.876901, 0.868722, 0.860339, 0.851762, 0.842996, 0.834050,
+        0.824977, 0.815712, 0.806226, 0.796501, 0.786517, 0.776267, 0.765754, 0.754979, 0.743941, 0.732699,
+        0.721216, 0.709473, 0.697446, 0.685101, 0.672470, 0.659613, 0.646423, 0.632911, 0.619276, 0.605325,
+        0.591177, 0.576881, 0.562316, 0.547737, 0.532921, 0.518204, 0.503366, 0.488708, 0.474104, 0.459750,
+        0.445660, 0.431812, 0.418506, 0.405581, 0.393117, 0.381258, 0.370063, 0.359471, 0.349511,
+    ],
+    [
+        0.898061, 0.890645, 0.883017, 0.875226, 0.867298, 0.859155, 0.850811, 0.842274, 0.833552, 0.824686,
+        0.815674, 0.806465, 0.797041, 0.787381, 0.777470, 0.767299, 0.756873, 0.746194, 0.735261, 0.724072,
+        0.712680, 0.701068, 0.689186, 0.677002, 0.664493, 0.651749, 0.638766, 0.625470, 0.611931, 0.598247,
+        0.584280, 0.570205, 0.555950, 0.541522, 0.527093, 0.512501, 0.498089, 0.483629, 0.469397, 0.455342,
+        0.441498, 0.428106, 0.415026, 0.402336, 0.390272, 0.378759, 0.367819, 0.357480, 0.347771,
+    ],
+    [
+        0.888560, 0.881168, 0.873564, 0.865841, 0.857944, 0.849834, 0.841525, 0.833028, 0.824363, 0.815585,
+        0.806623, 0.797470, 0.788105, 0.778511, 0.768671, 0.758579, 0.748240, 0.737656, 0.726828, 0.715755,
+        0.704434, 0.692898, 0.681159, 0.669135, 0.656804, 0.644161, 0.631324, 0.618255, 0.604897, 0.591357,
+        0.577680, 0.563751, 0.549764, 0.535622, 0.521373, 0.507181, 0.492899, 0.478841, 0.464858, 0.451070,
+        0.437639, 0.424459, 0.411636, 0.399379, 0.387585, 0.376319, 0.365628, 0.355538, 0.346076,
+    ],
+    [
+        0.879294, 0.871921, 0.864341, 0.856695, 0.848826, 0.840747, 0.832472, 0.824011, 0.815456, 0.806724,
+        0.797811, 0.788711, 0.779405, 0.769875, 0.760106, 0.750093, 0.739840, 0.729351, 0.718627, 0.707669,
+        0.696474, 0.685041, 0.673348, 0.661481, 0.649325, 0.636878, 0.624139, 0.611229, 0.598118, 0.584748,
+        0.571237, 0.557616, 0.543771, 0.529907, 0.515955, 0.501923, 0.488051, 0.474177, 0.460494, 0.447067,
+        0.433835, 0.420958, 0.408534, 0.396510, 0.384954, 0.373932, 0.363486, 0.353642, 0.344423,
+    ],
+    [
+        0.870252, 0.862895, 0.855402, 0.847777, 0.839932, 0.831882, 0.823639, 0.815287, 0.806778, 0.798089,
+        0.789224, 0.780176, 0.770927, 0.761460, 0.751761, 0.741825, 0.731656, 0.721261, 0.710640, 0.699795,
+        0.688725, 0.677429, 0.665887, 0.654071, 0.642038, 0.629782, 0.617255, 0.604460, 0.591499, 0.578393,
+        0.565067, 0.551602, 0.538082, 0.524388, 0.510679, 0.496995, 0.483268, 0.469740, 0.456355, 0.443114,
+        0.430234, 0.417692, 0.405490, 0.393694, 0.382373, 0.371614, 0.361427, 0.351786, 0.342808,
+    ],
+    [
+        0.861420, 0.854077, 0.846680, 0.839073, 0.831250, 0.823226, 0.815073, 0.806786, 0.798314, 0.789666,
+        0.780847, 0.771849, 0.762656, 0.753251, 0.743620, 0.733765, 0.723678, 0.713371, 0.702851, 0.692117,
+        0.681170, 0.670007, 0.658614, 0.646962, 0.635036, 0.622852, 0.610530, 0.597963, 0.585157, 0.572167,
+        0.559119, 0.545883, 0.532473, 0.519115, 0.505644, 0.492118, 0.478777, 0.465472, 0.452260, 0.439424,
+        0.426811, 0.414480, 0.402496, 0.391013, 0.380022, 0.369534, 0.359577, 0.350158, 0.341281,
+    ],
+    [
+        0.852788, 0.845535, 0.838162, 0.830571, 0.822768, 0.814812, 0.806744, 0.798487, 0.790051, 0.781442,
+        0.772667, 0.763718, 0.754631, 0.745330, 0.735796, 0.726026, 0.716025, 0.705801, 0.695357, 0.684696,
+        0.673818, 0.662759, 0.651509, 0.640017, 0.628268, 0.616263, 0.604007, 0.591596, 0.579030, 0.566260,
+        0.553299, 0.540318, 0.527213, 0.513973, 0.500750, 0.487569, 0.474382, 0.461314, 0.448496, 0.435852,
+        0.423438, 0.411373, 0.399751, 0.388529, 0.377764, 0.367504, 0.357773, 0.348576, 0.339915,
+    ],
+    [
+        0.844352, 0.837201, 0.829836, 0.822258, 0.814498, 0.806650, 0.798606, 0.790377, 0.781974, 0.773403,
+        0.764724, 0.755895, 0.746867, 0.737627, 0.728161, 0.718466, 0.708550, 0.698419, 0.688078, 0.677530,
+        0.666777, 0.655819, 0.644643, 0.633222, 0.621639, 0.609821, 0.597773, 0.585501, 0.573015, 0.560485,
+        0.547798, 0.534956, 0.522002, 0.509083, 0.496087, 0.483050, 0.470178, 0.457417, 0.444780, 0.432325,
+        0.420262, 0.408505, 0.397098, 0.386097, 0.375555, 0.365519, 0.356011, 0.347035, 0.338586,
+    ],
+    [
+        0.836198, 0.829048, 0.821689, 0.814124, 0.806499, 0.798668, 0.790645, 0.782443, 0.774084, 0.765645,
+        0.757036, 0.748251, 0.739275, 0.730093, 0.720692, 0.711070, 0.701236, 0.691195, 0.680954, 0.670515,
+        0.659883, 0.649057, 0.638026, 0.626766, 0.615265, 0.603526, 0.591643, 0.579588, 0.567340, 0.554914,
+        0.542351, 0.529787, 0.517098, 0.504307, 0.491513, 0.478818, 0.466151, 0.453561, 0.441183, 0.429088,
+        0.417238, 0.405688, 0.394494, 0.383709, 0.373388, 0.363575, 0.354288, 0.345530, 0.337292,
+    ],
+    [
+        0.828214, 0.821063, 0.813708, 0.806285, 0.798668, 0.790852, 0.782849, 0.774723, 0.766487, 0.758080,
+        0.749509, 0.740767, 0.731840, 0.722714, 0.713376, 0.703845, 0.694108, 0.684160, 0.674009, 0.663658,
+        0.653120, 0.642422, 0.631529, 0.620423, 0.609091, 0.597540, 0.585776, 0.573810, 0.561728, 0.549545,
+        0.537224, 0.524775, 0.512229, 0.499741, 0.487207, 0.474665, 0.462169, 0.449919, 0.437815, 0.425912,
+        0.414261, 0.402916, 0.391934, 0.381410, 0.371315, 0.361680, 0.352601, 0.344059, 0.336029,
+    ],
+    [
+        0.820390, 0.813235, 0.806001, 0.798602, 0.790993, 0.783189, 0.775290, 0.767253, 0.759042, 0.750665,
+        0.742130, 0.733429, 0.724609, 0.715597, 0.706367, 0.696919, 0.687262, 0.677403, 0.667350, 0.657108,
+        0.646680, 0.636071, 0.625268, 0.614250, 0.603007, 0.591632, 0.580062, 0.568309, 0.556386, 0.544309,
+        0.532134, 0.519951, 0.507670, 0.495318, 0.482928, 0.470663, 0.458487, 0.446412, 0.434491, 0.422778,
+        0.411381, 0.400332, 0.389627, 0.379311, 0.369424, 0.359995, 0.351030, 0.342617, 0.334796,
+    ],
+    [
+        0.812711, 0.805650, 0.798463, 0.791065, 0.783462, 0.775783, 0.767943, 0.759923, 0.751735, 0.743387,
+        0.734963, 0.726388, 0.717627, 0.708667, 0.699497, 0.690117, 0.680535, 0.670762, 0.660803, 0.650664,
+        0.640350, 0.629865, 0.619198, 0.608331, 0.597255, 0.585975, 0.574503, 0.562850, 0.551140, 0.539297,
+        0.527339, 0.515280, 0.503130, 0.491018, 0.478927, 0.466854, 0.454844, 0.442942, 0.431274, 0.419867,
+        0.408716, 0.397868, 0.387367, 0.377256, 0.367574, 0.358349, 0.349583, 0.341261, 0.333590,
+    ],
+    [
+        0.805242, 0.798255, 0.791061, 0.783660, 0.776200, 0.768556, 0.760726, 0.752722, 0.744609, 0.736396,
+        0.728022, 0.719483, 0.710764, 0.701853, 0.692740, 0.683424, 0.673951, 0.664281, 0.654423, 0.644383,
+        0.634168, 0.623781, 0.613212, 0.602478, 0.591557, 0.580449, 0.569164, 0.557716, 0.546118, 0.534390,
+        0.522556, 0.510745, 0.498862, 0.486933, 0.474992, 0.463077, 0.451305, 0.439703, 0.428270, 0.417052,
+        0.406096, 0.395446, 0.385147, 0.375241, 0.365763, 0.356739, 0.348171, 0.340038, 0.332409,
+    ],
+    [
+        0.797986, 0.790984, 0.783780, 0.776536, 0.769090, 0.761448, 0.753627, 0.745759, 0.737730, 0.729538,
+        0.721192, 0.712686, 0.704038, 0.695249, 0.686251, 0.677046, 0.667644, 0.658055, 0.648287, 0.638348,
+        0.628242, 0.617975, 0.607538, 0.596913, 0.586095, 0.575091, 0.563913, 0.552586, 0.541193, 0.529685,
+        0.518084, 0.506405, 0.494659, 0.482873, 0.471170, 0.459537, 0.447985, 0.436558, 0.425306, 0.414277,
+        0.403514, 0.393062, 0.382964, 0.373261, 0.363986, 0.355163, 0.346790, 0.338845, 0.331300,
+    ],
+    [
+        0.790845, 0.783826, 0.776786, 0.769539, 0.762088, 0.754492, 0.746818, 0.738968, 0.730952, 0.722781,
+        0.714517, 0.706141, 0.697586, 0.688840, 0.679894, 0.670749, 0.661415, 0.651903, 0.642220, 0.632375,
+        0.622372, 0.612218, 0.601904, 0.591416, 0.580746, 0.569905, 0.558905, 0.547760, 0.536485, 0.525099,
+        0.513625, 0.502107, 0.490605, 0.479078, 0.467559, 0.456087, 0.444702, 0.433450, 0.422378, 0.411577,
+        0.401050, 0.390816, 0.380910, 0.371363, 0.362240, 0.353618, 0.345440, 0.337681, 0.330310,
+    ],
+    [
+        0.783806, 0.776954, 0.769901, 0.762642, 0.755276, 0.747786, 0.740113, 0.732269, 0.724308, 0.716274,
+        0.708084, 0.699735, 0.691214, 0.682509, 0.673627, 0.664600, 0.655380, 0.645978, 0.636404, 0.626666,
+        0.616770, 0.606722, 0.596516, 0.586135, 0.575575, 0.564845, 0.553959, 0.542930, 0.531833, 0.520651,
+        0.509396, 0.498082, 0.486722, 0.475343, 0.463979, 0.452667, 0.441504, 0.430505, 0.419685, 0.409086,
+        0.398746, 0.388702, 0.378985, 0.369627, 0.360649, 0.352099, 0.344116, 0.336543, 0.329345,
+    ],
+    [
+        0.777051, 0.770178, 0.763105, 0.755965, 0.748661, 0.741165, 0.733491, 0.725783, 0.717918, 0.709896,
+        0.701725, 0.693401, 0.685006, 0.676426, 0.667648, 0.658674, 0.649516, 0.640185, 0.630691, 0.621040,
+        0.611241, 0.601300, 0.591209, 0.580956, 0.570536, 0.559958, 0.549238, 0.538389, 0.527429, 0.516376,
+        0.505253, 0.494077, 0.482860, 0.471680, 0.460554, 0.449488, 0.438521, 0.427694, 0.417051, 0.406635,
+        0.396480, 0.386624, 0.377096, 0.367926, 0.359133, 0.350727, 0.342816, 0.335429, 0.328404,
+    ],
+    [
+        0.770383, 0.763483, 0.756557, 0.749441, 0.742122, 0.734679, 0.727153, 0.719454, 0.711594, 0.703588,
+        0.695554, 0.687361, 0.678996, 0.670450, 0.661714, 0.652791, 0.643723, 0.634509, 0.625129, 0.615591,
+        0.605904, 0.596076, 0.586098, 0.575959, 0.565653, 0.555192, 0.544591, 0.533865, 0.523031, 0.512138,
+        0.501213, 0.490246, 0.479248, 0.468248, 0.457278, 0.446374, 0.435573, 0.424918, 0.414453, 0.404218,
+        0.394248, 0.384579, 0.375240, 0.366257, 0.357648, 0.349420, 0.341558, 0.334337, 0.327484,
+    ],
+    [
+        0.763786, 0.757056, 0.750121, 0.742982, 0.735775, 0.728420, 0.720885, 0.713184, 0.705443, 0.697569,
+        0.689546, 0.681370, 0.673030, 0.664593, 0.655982, 0.647179, 0.638196, 0.629046, 0.619738, 0.610281,
+        0.600683, 0.590952, 0.581082, 0.571060, 0.560883, 0.550563, 0.540114, 0.529552, 0.518894, 0.508160,
+        0.497371, 0.486545, 0.475694, 0.464845, 0.454032, 0.443289, 0.432656, 0.422173, 0.411899, 0.401846,
+        0.392047, 0.382564, 0.373413, 0.364617, 0.356191, 0.348141, 0.340446, 0.333265, 0.326584,
+    ],
+    [
+        0.757473, 0.750707, 0.743744, 0.736767, 0.729584, 0.722212, 0.714738, 0.707181, 0.699462, 0.691591,
+        0.683588, 0.675547, 0.667337, 0.658948, 0.650372, 0.641613, 0.632682, 0.623622, 0.614433, 0.605094,
+        0.595613, 0.585999, 0.576246, 0.566342, 0.556284, 0.546085, 0.535759, 0.525324, 0.514796, 0.504196,
+        0.493547, 0.482864, 0.472174, 0.461523, 0.450912, 0.440374, 0.429945, 0.419662, 0.409563, 0.399683,
+        0.390052, 0.380695, 0.371635, 0.363003, 0.354760, 0.346886, 0.339360, 0.332211, 0.325702,
+    ],
+    [
+        0.751211, 0.744452, 0.737651, 0.730642, 0.723435, 0.716205, 0.708804, 0.701236, 0.693517, 0.685787,
+        0.677908, 0.669877, 0.661684, 0.653323, 0.644876, 0.636240, 0.627430, 0.618457, 0.609332, 0.600065,
+        0.590664, 0.581139, 0.571482, 0.561685, 0.551744, 0.541672, 0.531484, 0.521196, 0.510825, 0.500392,
+        0.489917, 0.479417, 0.468904, 0.458405, 0.447949, 0.437571, 0.427306, 0.417190, 0.407262, 0.397555,
+        0.388098, 0.378915, 0.370028, 0.361451, 0.353353, 0.345656, 0.338296, 0.331235, 0.324838,
+    ],
+    [
+        0.745072, 0.738433, 0.731592, 0.724613, 0.717560, 0.710316, 0.702898, 0.695438, 0.687855, 0.680120,
+        0.672242, 0.664278, 0.656218, 0.647981, 0.639561, 0.630961, 0.622195, 0.613287, 0.604285, 0.595140,
+        0.585860, 0.576454, 0.566918, 0.557242, 0.547423, 0.537474, 0.527412, 0.517252, 0.507014, 0.496716,
+        0.486382, 0.476026, 0.465662, 0.455315, 0.445016, 0.434799, 0.424698, 0.414750, 0.404993, 0.395459,
+        0.386176, 0.377167, 0.368451, 0.360042, 0.351968, 0.344448, 0.337255, 0.330346, 0.323989,
+    ],
+    [
+        0.739126, 0.732441, 0.725687, 0.718801, 0.711716, 0.704508, 0.697237, 0.689797, 0.682202, 0.674533,
+        0.666793, 0.658902, 0.650850, 0.642630, 0.634304, 0.625831, 0.617188, 0.608388, 0.599441, 0.590358,
+        0.581148, 0.571821, 0.562371, 0.552791, 0.543099, 0.533278, 0.523345, 0.513318, 0.503215, 0.493056,
+        0.482864, 0.472655, 0.462441, 0.452249, 0.442115, 0.432060, 0.422117, 0.412338, 0.402753, 0.393392,
+        0.384283, 0.375448, 0.366903, 0.358661, 0.350726, 0.343260, 0.336233, 0.329478, 0.323155,
+    ],
+    [
+        0.733200, 0.726651, 0.719928, 0.713004, 0.706038, 0.698916, 0.691619, 0.684209, 0.676756, 0.669152,
+        0.661405, 0.653531, 0.645615, 0.637525, 0.629255, 0.620810, 0.612202, 0.603474, 0.594652, 0.585693,
+        0.576606, 0.567401, 0.558073, 0.548614, 0.539022, 0.529311, 0.519497, 0.509597, 0.499629, 0.489612,
+        0.479568, 0.469512, 0.459456, 0.449423, 0.439442, 0.429543, 0.419758, 0.410119, 0.400658, 0.391402,
+        0.382416, 0.373755, 0.365381, 0.357306, 0.349531, 0.342091, 0.335231, 0.328628, 0.322335,
+    ],
+    [
+        0.727520, 0.720946, 0.714216, 0.707448, 0.700477, 0.693323, 0.686165, 0.678848, 0.671375, 0.663786,
+        0.656179, 0.648422, 0.640506, 0.632425, 0.624240, 0.615923, 0.607441, 0.598806, 0.590030, 0.581124,
+        0.572098, 0.562970, 0.553770, 0.544438, 0.534974, 0.525392, 0.515709, 0.505941, 0.496108, 0.486229,
+        0.476327, 0.466416, 0.456507, 0.446626, 0.436799, 0.427058, 0.417432, 0.407954, 0.398655, 0.389561,
+        0.380692, 0.372086, 0.363884, 0.355976, 0.348360, 0.341028, 0.334247, 0.327797, 0.321539,
+    ],
+    [
+        0.721869, 0.715350, 0.708736, 0.701919, 0.695002, 0.687995, 0.680812, 0.673476, 0.666146, 0.658665,
+        0.651043, 0.643284, 0.635504, 0.627553, 0.619426, 0.611129, 0.602674, 0.594146, 0.585497, 0.576715,
+        0.567813, 0.558798, 0.549668, 0.540414, 0.531037, 0.521550, 0.511968, 0.502310, 0.492601, 0.482863,
+        0.473104, 0.463340, 0.453582, 0.443853, 0.434183, 0.424600, 0.415134, 0.405818, 0.396682, 0.387750,
+        0.379042, 0.370572, 0.362409, 0.354668, 0.347212, 0.340029, 0.333280, 0.326983, 0.320859,
+    ],
+    [
+        0.716381, 0.709910, 0.703242, 0.696565, 0.689701, 0.682654, 0.675571, 0.668369, 0.661011, 0.653526,
+        0.646043, 0.638412, 0.630625, 0.622675, 0.614654, 0.606485, 0.598155, 0.589678, 0.581065, 0.572327,
+        0.563519, 0.554632, 0.545630, 0.536504, 0.527254, 0.517895, 0.508443, 0.498916, 0.489331, 0.479709,
+        0.470068, 0.460425, 0.450789, 0.441183, 0.431632, 0.422166, 0.412863, 0.403709, 0.394736, 0.385966,
+        0.377419, 0.369107, 0.361040, 0.353382, 0.346086, 0.339052, 0.332329, 0.326185, 0.320195,
+    ],
+    [
+        0.710983, 0.704512, 0.698000, 0.691283, 0.684435, 0.677535, 0.670459, 0.663223, 0.656003, 0.648637,
+        0.641132, 0.633508, 0.625857, 0.618038, 0.610046, 0.601887, 0.593616, 0.585268, 0.576782, 0.568169,
+        0.559439, 0.550604, 0.541660, 0.532599, 0.523477, 0.514250, 0.504932, 0.495539, 0.486091, 0.476607,
+        0.467107, 0.457607, 0.448116, 0.438657, 0.429255, 0.419937, 0.410728, 0.401655, 0.392814, 0.384208,
+        0.375822, 0.367668, 0.359753, 0.352115, 0.344979, 0.338095, 0.331427, 0.325403, 0.319546,
+    ],
+    [
+        0.705692, 0.699315, 0.692741, 0.686134, 0.679369, 0.672421, 0.665433, 0.658337, 0.651087, 0.643725,
+        0.636359, 0.628846, 0.621179, 0.613372, 0.605513, 0.597483, 0.589296, 0.580967, 0.572508, 0.564002,
+        0.555402, 0.546694, 0.537876, 0.528942, 0.519891, 0.510738, 0.501500, 0.492194, 0.482866, 0.473523,
+        0.464166, 0.454811, 0.445468, 0.436158, 0.426907, 0.417740, 0.408683, 0.399763, 0.391003, 0.382473,
+        0.374249, 0.366253, 0.358490, 0.350961, 0.343891, 0.337156, 0.330624, 0.324635, 0.318912,
+    ],
+    [
+        0.700525, 0.694120, 0.687700, 0.681075, 0.674315, 0.667513, 0.660535, 0.653407, 0.646299, 0.639041,
+        0.631645, 0.624175, 0.616643, 0.608946, 0.601080, 0.593058, 0.585003, 0.576802, 0.568468, 0.560012,
+        0.551445, 0.542782, 0.534096, 0.525292, 0.516371, 0.507349, 0.498242, 0.489067, 0.479842, 0.470585,
+        0.461317, 0.452051, 0.442841, 0.433682, 0.424582, 0.415569, 0.406666, 0.397898, 0.389290, 0.380861,
+        0.372697, 0.364859, 0.357249, 0.349865, 0.342820, 0.336235, 0.329838, 0.323880, 0.318292,
+    ],
+    [
+        0.695432, 0.689141, 0.682651, 0.676132, 0.669459, 0.662602, 0.655725, 0.648727, 0.641576, 0.634355,
+        0.627096, 0.619693, 0.612138, 0.604517, 0.596783, 0.588882, 0.580829, 0.572639, 0.564421, 0.556094,
+        0.547654, 0.539112, 0.530465, 0.521707, 0.512859, 0.503971, 0.494998, 0.485958, 0.476869, 0.467749,
+        0.458619, 0.449492, 0.440377, 0.431295, 0.422280, 0.413420, 0.404672, 0.396058, 0.387602, 0.379322,
+        0.371229, 0.363486, 0.356029, 0.348789, 0.341765, 0.335330, 0.329068, 0.323138, 0.317684,
+    ],
+    [
+        0.690472, 0.684151, 0.677813, 0.671272, 0.664616, 0.657903, 0.651016, 0.644019, 0.637008, 0.629849,
+        0.622553, 0.615252, 0.607830, 0.600245, 0.592497, 0.584699, 0.576775, 0.568710, 0.560517, 0.552207,
+        0.543862, 0.535450, 0.526933, 0.518303, 0.509562, 0.500726, 0.491811, 0.482863, 0.473912, 0.464932,
+        0.455942, 0.446957, 0.437984, 0.429044, 0.420160, 0.411352, 0.402699, 0.394240, 0.385938, 0.377807,
+        0.369860, 0.362131, 0.354828, 0.347733, 0.340837, 0.334440, 0.328314, 0.322408, 0.317088,
+    ],
+    [
+        0.685582, 0.679366, 0.672953, 0.666537, 0.659944, 0.653170, 0.646421, 0.639512, 0.632451, 0.625387,
+        0.618226, 0.610922, 0.603500, 0.596050, 0.588430, 0.580647, 0.572718, 0.564775, 0.556710, 0.548526,
+        0.540234, 0.531844, 0.523404, 0.514907, 0.506298, 0.497592, 0.488807, 0.479959, 0.471065, 0.462144,
+        0.453285, 0.444443, 0.435614, 0.426818, 0.418078, 0.409414, 0.400849, 0.392443, 0.384294, 0.376315,
+        0.368513, 0.360893, 0.353644, 0.346695, 0.339933, 0.333564, 0.327574, 0.321688, 0.316504,
+    ],
+    [
+        0.680805, 0.674582, 0.668318, 0.661850, 0.655314, 0.648681, 0.641875, 0.635024, 0.628100, 0.621030,
+        0.613875, 0.606707, 0.599385, 0.591904, 0.584350, 0.576698, 0.568894, 0.560954, 0.552899, 0.544846,
+        0.536683, 0.528420, 0.520055, 0.511584, 0.503042, 0.494471, 0.485819, 0.477104, 0.468344, 0.459556,
+        0.450759, 0.441966, 0.433264, 0.424615, 0.416019, 0.407500, 0.399079, 0.390774, 0.382670, 0.374842,
+        0.367186, 0.359707, 0.352476, 0.345674, 0.339047, 0.332700, 0.326847, 0.321068, 0.315930,
+    ],
+    [
+        0.676117, 0.669968, 0.663641, 0.657322, 0.650802, 0.644159, 0.637494, 0.630664, 0.623722, 0.616790,
+        0.609716, 0.602503, 0.595285, 0.587935, 0.580418, 0.572745, 0.565066, 0.557253, 0.549314, 0.541260,
+        0.533133, 0.525001, 0.516766, 0.508423, 0.499973, 0.491432, 0.482844, 0.474265, 0.465641, 0.456989,
+        0.448328, 0.439671, 0.431024, 0.422430, 0.413982, 0.405609, 0.397331, 0.389169, 0.381138, 0.373387,
+        0.365879, 0.358540, 0.351369, 0.344668, 0.338176, 0.331849, 0.326133, 0.320471, 0.315367,
+    ],
+    [
+        0.671501, 0.665389, 0.659188, 0.652786, 0.646383, 0.639820, 0.633086, 0.626393, 0.619547, 0.612557,
+        0.605590, 0.598509, 0.591276, 0.583952, 0.576568, 0.569020, 0.561326, 0.553548, 0.545739, 0.537812,
+        0.529779, 0.521651, 0.513484, 0.505273, 0.496953, 0.488540, 0.480051, 0.471502, 0.462954, 0.454441,
+        0.445918, 0.437398, 0.428888, 0.420406, 0.411971, 0.403738, 0.395606, 0.387585, 0.379693, 0.371950,
+        0.364590, 0.357392, 0.350353, 0.343676, 0.337320, 0.331091, 0.325431, 0.319887, 0.314812,
+    ],
+    [
+        0.667014, 0.660921, 0.654720, 0.648462, 0.642006, 0.635511, 0.628914, 0.622156, 0.615389, 0.608533,
+        0.601538, 0.594499, 0.587399, 0.580138, 0.572716, 0.565292, 0.557725, 0.550022, 0.542196, 0.534367,
+        0.526463, 0.518461, 0.510360, 0.502155, 0.493944, 0.485664, 0.477306, 0.468887, 0.460423, 0.451933,
+        0.443526, 0.435145, 0.426773, 0.418429, 0.410130, 0.401895, 0.393900, 0.386023, 0.378270, 0.370653,
+        0.363317, 0.356260, 0.349353, 0.342697, 0.336477, 0.330370, 0.324740, 0.319314, 0.314266,
+    ],
+    [
+        0.662536, 0.656546, 0.650399, 0.644107, 0.637793, 0.631292, 0.624719, 0.618096, 0.611319, 0.604490,
+        0.597629, 0.590625, 0.583509, 0.576381, 0.569086, 0.561632, 0.554120, 0.546546, 0.538846, 0.531032,
+        0.523150, 0.515279, 0.507306, 0.499227, 0.491045, 0.482799, 0.474575, 0.466289, 0.457957, 0.449597,
+        0.441226, 0.432911, 0.424679, 0.416473, 0.408311, 0.400211, 0.392211, 0.384479, 0.376867, 0.369384,
+        0.362059, 0.355144, 0.348371, 0.341731, 0.335648, 0.329662, 0.324059, 0.318752, 0.313729,
+    ],
+    [
+        0.658248, 0.652202, 0.646137, 0.639931, 0.633553, 0.627193, 0.620655, 0.614016, 0.607375, 0.600586,
+        0.593706, 0.586835, 0.579810, 0.572629, 0.565452, 0.558125, 0.550652, 0.543069, 0.535499, 0.527811,
+        0.520018, 0.512131, 0.504262, 0.496313, 0.488258, 0.480112, 0.471891, 0.463707, 0.455509, 0.447282,
+        0.439042, 0.430802, 0.422603, 0.414538, 0.406514, 0.398549, 0.390661, 0.382953, 0.375481, 0.368134,
+        0.360913, 0.354044, 0.347403, 0.340883, 0.334830, 0.328967, 0.323387, 0.318199, 0.313198,
+    ],
+    [
+        0.653926, 0.648028, 0.641926, 0.635784, 0.629520, 0.623071, 0.616671, 0.610106, 0.603413, 0.596759,
+        0.589962, 0.583033, 0.576142, 0.569088, 0.561871, 0.554615, 0.547270, 0.539788, 0.532184, 0.524595,
+        0.516930, 0.509168, 0.501308, 0.493408, 0.485484, 0.477467, 0.469373, 0.461219, 0.453077, 0.444985,
+        0.436879, 0.428769, 0.420664, 0.412620, 0.404736, 0.396908, 0.389152, 0.381484, 0.374114, 0.366902,
+        0.359810, 0.352957, 0.346450, 0.340052, 0.334024, 0.328283, 0.322724, 0.317656, 0.312675,
+    ],
+    [
+        0.649795, 0.643824, 0.637867, 0.631703, 0.625489, 0.619176, 0.612689, 0.606239, 0.599652, 0.592920,
+        0.586256, 0.579447, 0.572488, 0.565543, 0.558453, 0.551205, 0.543887, 0.536534, 0.529054, 0.521460,
+        0.513848, 0.506215, 0.498480, 0.490641, 0.482721, 0.474837, 0.466872, 0.458846, 0.450772, 0.442704,
+        0.434733, 0.426757, 0.418783, 0.410824, 0.402975, 0.395285, 0.387663, 0.380124, 0.372762, 0.365687,
+        0.358724, 0.351884, 0.345511, 0.339236, 0.333229, 0.327611, 0.322070, 0.317123, 0.312158,
+    ],
+    [
+        0.645676, 0.639810, 0.633782, 0.627760, 0.621536, 0.615263, 0.608910, 0.602393, 0.595904, 0.589302,
+        0.582560, 0.575863, 0.569031, 0.562041, 0.555033, 0.547911, 0.540642, 0.533280, 0.525929, 0.518460,
+        0.510887, 0.503269, 0.495664, 0.487951, 0.480134, 0.472227, 0.464387, 0.456490, 0.448544, 0.440566,
+        0.432604, 0.424764, 0.416922, 0.409093, 0.401294, 0.393680, 0.386193, 0.378784, 0.371465, 0.364488,
+        0.357655, 0.350922, 0.344585, 0.338432, 0.332444, 0.326949, 0.321449, 0.316597, 0.311647,
+    ],
+    [
+        0.641630, 0.635810, 0.629882, 0.623794, 0.617709, 0.611434, 0.605116, 0.598731, 0.592190, 0.585674,
+        0.579061, 0.572305, 0.565570, 0.558707, 0.551680, 0.544618, 0.537475, 0.530196, 0.522808, 0.515468,
+        0.508019, 0.500473, 0.492857, 0.485274, 0.477583, 0.469800, 0.461941, 0.454150, 0.446334, 0.438484,
+        0.430615, 0.422787, 0.415079, 0.407382, 0.399710, 0.392092, 0.384741, 0.377463, 0.370268, 0.363304,
+        0.356601, 0.349989, 0.343672, 0.337642, 0.331670, 0.326298, 0.320903, 0.316081, 0.311212,
+    ],
+    [
+        0.637710, 0.631867, 0.626002, 0.620007, 0.613864, 0.607726, 0.601409, 0.595058, 0.588648, 0.582089,
+        0.575557, 0.568928, 0.562147, 0.555372, 0.548471, 0.541410, 0.534311, 0.527158, 0.519878, 0.512486,
+        0.505161, 0.497740, 0.490218, 0.482607, 0.475046, 0.467389, 0.459653, 0.451854, 0.444141, 0.436420,
+        0.428678, 0.420924, 0.413254, 0.405689, 0.398146, 0.390641, 0.383305, 0.376158, 0.369089, 0.362134,
+        0.355561, 0.349071, 0.342771, 0.336865, 0.330999, 0.325657, 0.320367, 0.315572, 0.310799,
+    ],
+    [
+        0.633766, 0.628066, 0.622159, 0.616246, 0.610186, 0.604001, 0.597819, 0.591467, 0.585096, 0.578666,
+        0.572093, 0.565548, 0.558893, 0.552078, 0.545262, 0.538327, 0.531243, 0.524124, 0.516970, 0.509698,
+        0.502322, 0.495017, 0.487620, 0.480116, 0.472520, 0.464993, 0.457383, 0.449707, 0.441979, 0.434373,
+        0.426760, 0.419131, 0.411492, 0.404014, 0.396601, 0.389221, 0.381887, 0.374871, 0.367927, 0.361059,
+        0.354536, 0.348167, 0.341881, 0.336099, 0.330343, 0.325026, 0.319841, 0.315071, 0.310395,
+    ],
+    [
+        0.630002, 0.624244, 0.618476, 0.612501, 0.606544, 0.600429, 0.594217, 0.587997, 0.581618, 0.575238,
+        0.568793, 0.562201, 0.555638, 0.548948, 0.542094, 0.535246, 0.528286, 0.521190, 0.514068, 0.506921,
+        0.499666, 0.492313, 0.485034, 0.477654, 0.470168, 0.462610, 0.455129, 0.447578, 0.439972, 0.432341,
+        0.424858, 0.417357, 0.409842, 0.402354, 0.395073, 0.387819, 0.380605, 0.373598, 0.366781, 0.360031,
+        0.353525, 0.347278, 0.341083, 0.335345, 0.329698, 0.324405, 0.319324, 0.314578, 0.309999,
+    ],
+    [
+        0.626257, 0.620566, 0.614776, 0.608936, 0.602894, 0.596908, 0.590746, 0.584518, 0.578269, 0.571867,
+        0.565489, 0.559023, 0.552403, 0.545819, 0.539088, 0.532197, 0.525335, 0.518361, 0.511260, 0.504152,
+        0.497021, 0.489788, 0.482457, 0.475205, 0.467842, 0.460383, 0.452888, 0.445465, 0.437984, 0.430460,
+        0.422973, 0.415600, 0.408210, 0.400815, 0.393561, 0.386434, 0.379342, 0.372340, 0.365651, 0.359020,
+        0.352526, 0.346402, 0.340318, 0.334602, 0.329065, 0.323792, 0.318817, 0.314092, 0.309610,
+    ],
+    [
+        0.622529, 0.616942, 0.611180, 0.605358, 0.599448, 0.593374, 0.587345, 0.581144, 0.574913, 0.568639,
+        0.562218, 0.555845, 0.549348, 0.542691, 0.536087, 0.529317, 0.522400, 0.515539, 0.508560, 0.501463,
+        0.494386, 0.487276, 0.480061, 0.472767, 0.465531, 0.458194, 0.450773, 0.443366, 0.436012, 0.428610,
+        0.421178, 0.413860, 0.406596, 0.399323, 0.392063, 0.385066, 0.378096, 0.371166, 0.364535, 0.358024,
+        0.351562, 0.345538, 0.339565, 0.333870, 0.328442, 0.323188, 0.318319, 0.313614, 0.309229,
+    ],
+    [
+        0.618976, 0.613300, 0.607676, 0.601841, 0.595992, 0.590020, 0.583935, 0.577864, 0.571630, 0.565407,
+        0.559112, 0.552669, 0.546295, 0.539759, 0.533086, 0.526443, 0.519645, 0.512721, 0.505868, 0.498891,
+        0.491805, 0.484775, 0.477683, 0.470479, 0.463231, 0.456019, 0.448719, 0.441348, 0.434055, 0.426778,
+        0.419466, 0.412134, 0.404998, 0.397847, 0.390697, 0.383712, 0.376866, 0.370052, 0.363432, 0.357042,
+        0.350690, 0.344687, 0.338825, 0.333147, 0.327830, 0.322592, 0.317830, 0.313142, 0.308855,
+    ],
+])
+# fmt: on
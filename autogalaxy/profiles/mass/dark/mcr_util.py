@@ -54,86 +54,125 @@ def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_so
     return kappa_s, scale_radius, radius_at_200
 
 
-def _ludlow16_cosmology_callback(
-    mass_at_200,
-    redshift_object,
-    redshift_source,
-):
-    """
-    Pure NumPy / Python function.
-    Must NEVER see JAX tracers.
+def ludlow16_log10_concentration_table_from_colossus(
+    log10_mass_list, redshift_list
+) -> np.ndarray:
     """
+    Returns the log10 of the Ludlow et al. (2016) concentration of halos with masses `M_{200c}` (in solar masses) at
+    every value of `log10_mass_list` and redshifts at every value of `redshift_list`, computed using `colossus` for
+    the Planck 2015 cosmology, as a 2D array whose rows are redshifts and columns masses.
 
-    import numpy as np
+    This is used to generate the table of the `ludlow16_table` module, which `ludlow16_concentration_from`
+    interpolates.
+    """
     from colossus.cosmology import cosmology as col_cosmology
     from colossus.halo.concentration import concentration as col_concentration
-    from autogalaxy.cosmology.model import Planck15
 
-    # -----------------------
-    # Colossus cosmology
-    # -----------------------
     col_cosmo = col_cosmology.setCosmology("planck15")
 
-    m_input = mass_at_200 * col_cosmo.h
-    concentration = col_concentration(
-        m_input,
-        "200c",
-        redshift_object,
-        model="ludlow16",
+    mass_input = 10.0 ** np.asarray(log10_mass_list) * col_cosmo.h
+
+    return np.array(
+        [
+            np.log10(col_concentration(mass_input, "200c", redshift, model="ludlow16"))
+            for redshift in redshift_list
+        ]
+    )
+
+
+def ludlow16_concentration_from(mass_at_200, redshift_object, xp=np):
+    """
+    Returns the Ludlow et al. (2016) concentration of a halo of mass `M_{200c}` (in solar masses) at a redshift,
+    bilinearly interpolated in log10 mass and redshift from the table of the `ludlow16_table` module.
+
+    This uses only array operations, therefore it can be traced, compiled and vectorized by JAX, unlike computing
+    the concentration with `colossus`. The interpolated concentrations differ from those computed by `colossus` by
+    less than 0.1%.
+
+    Masses and redshifts outside the table (10^4 to 10^16 solar masses and redshifts from 0 to 8) are clipped to
+    its edges.
+    """
+    from autogalaxy.profiles.mass.dark import ludlow16_table
+
+    log10_concentration = xp.asarray(ludlow16_table.log10_concentration)
+
+    total_redshifts, total_masses = log10_concentration.shape
+
+    mass_index = (
+        xp.log10(mass_at_200) - ludlow16_table.log10_mass_min
+    ) / ludlow16_table.log10_mass_step
+    redshift_index = (
+        xp.asarray(redshift_object) - ludlow16_table.redshift_min
+    ) / ludlow16_table.redshift_step
+
+    mass_index = xp.clip(mass_index, 0.0, total_masses - 1.0)
+    redshift_index = xp.clip(redshift_index, 0.0, total_redshifts - 1.0)
+
+    mass_index_0 = xp.clip(xp.floor(mass_index).astype(int), 0, total_masses - 2)
+    redshift_index_0 = xp.clip(
+        xp.floor(redshift_index).astype(int), 0, total_redshifts - 2
+    )
+
+    mass_weight = mass_index - mass_index_0
+    redshift_weight = redshift_index - redshift_index_0
+
+    log10_concentration_interp = (
+        (1.0 - redshift_weight)
+        * (1.0 - mass_weight)
+        * log10_concentration[redshift_index_0, mass_index_0]
+        + (1.0 - redshift_weight)
+        * mass_weight
+        * log10_concentration[redshift_index_0, mass_index_0 + 1]
+        + redshift_weight
+        * (1.0 - mass_weight)
+        * log10_concentration[redshift_index_0 + 1, mass_index_0]
+        + redshift_weight
+        * mass_weight
+        * log10_concentration[redshift_index_0 + 1, mass_index_0 + 1]
+    )
+
+    return 10.0**log10_concentration_interp
+
+
+def ludlow16_cosmology_from(mass_at_200, redshift_object, redshift_source, xp=np):
+    """
+    Returns the Ludlow et al. (2016) concentration of a halo of mass `M_{200c}` and the quantities of the Planck 2015
+    cosmology used to convert it to lensing units: the critical density at the halo redshift (Msun / kpc^3), the
+    critical surface density between the halo and source redshifts (Msun / kpc^2) and the kpc per arcsecond at the
+    halo redshift.
+
+    All quantities are computed with array operations, so that NFW mass-concentration profiles remain in one compiled
+    JAX graph. For fixed redshifts the cosmological quantities are cached (see
+    `autogalaxy.cosmology.redshift_cache`) and are therefore constants of the compiled graph.
+    """
+    from autogalaxy.cosmology.model import Planck15
+
+    concentration = ludlow16_concentration_from(
+        mass_at_200=mass_at_200, redshift_object=redshift_object, xp=xp
     )
 
-    # -----------------------
-    # AutoGalaxy cosmology (no astropy.units)
-    # -----------------------
     cosmology = Planck15()
 
-    # Msun / kpc^3 (your xp drop-in should return this directly)
-    cosmic_average_density = cosmology.critical_density(redshift_object, xp=np)
+    # Msun / kpc^3
+    cosmic_average_density = cosmology.critical_density(redshift_object, xp=xp)
 
     # Msun / kpc^2
     critical_surface_density = (
         cosmology.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
             redshift_0=redshift_object,
             redshift_1=redshift_source,
-            xp=np,
+            xp=xp,
         )
     )
 
     # kpc / arcsec
-    kpc_per_arcsec = cosmology.kpc_per_arcsec_from(redshift=redshift_object, xp=np)
+    kpc_per_arcsec = cosmology.kpc_per_arcsec_from(redshift=redshift_object, xp=xp)
 
     return (
-        np.float64(concentration),
-        np.float64(cosmic_average_density),
-        np.float64(critical_surface_density),
-        np.float64(kpc_per_arcsec),
-    )
-
-
-def ludlow16_cosmology_jax(
-    mass_at_200,
-    redshift_object,
-    redshift_source,
-):
-    """
-    JAX-safe wrapper around Colossus + Astropy cosmology.
-    """
-    import jax
-    import jax.numpy as jnp
-    from jax import ShapeDtypeStruct
-
-    return jax.pure_callback(
-        _ludlow16_cosmology_callback,
-        (
-            ShapeDtypeStruct((), jnp.float64),  # concentration
-            ShapeDtypeStruct((), jnp.float64),  # rho_crit(z)
-            ShapeDtypeStruct((), jnp.float64),  # Sigma_crit
-            ShapeDtypeStruct((), jnp.float64),  # kpc/arcsec
-        ),
-        mass_at_200,
-        redshift_object,
-        redshift_source,
-        vmap_method="sequential",
+        concentration,
+        cosmic_average_density,
+        critical_surface_density,
+        kpc_per_arcsec,
     )
 
 
@@ -152,31 +191,20 @@ def kappa_s_and_scale_radius_for_ludlow(
         xp = jnp
 
     # ------------------------------------
-    # Cosmology + concentration (callback)
+    # Cosmology + concentration
     # ------------------------------------
 
-    if xp is np:
-        (
-            concentration,
-            cosmic_average_density,
-            critical_surface_density,
-            kpc_per_arcsec,
-        ) = _ludlow16_cosmology_callback(
-            mass_at_200,
-            redshift_object,
-            redshift_source,
-        )
-    else:
-        (
-            concentration,
-            cosmic_average_density,
-            critical_surface_density,
-            kpc_per_arcsec,
-        ) = ludlow16_cosmology_jax(
-            mass_at_200,
-            redshift_object,
-            redshift_source,
-        )
+    (
+        concentration,
+        cosmic_average_density,
+        critical_surface_density,
+        kpc_per_arcsec,
+    ) = ludlow16_cosmology_from(
+        mass_at_200=mass_at_200,
+        redshift_object=redshift_object,
+        redshift_source=redshift_source,
+        xp=xp,
+    )
 
     # Apply scatter (JAX-safe)
     concentration = 10.0 ** (xp.log10(concentration) + scatter_sigma * 0.15)
@@ -224,32 +252,21 @@ def kappa_s_scale_radius_and_core_radius_for_ludlow(
 
         xp = jnp
 
-        # ------------------------------------
-        # Cosmology + concentration (callback)
-        # ------------------------------------
-
-    if xp is np:
-        (
-            concentration,
-            cosmic_average_density,
-            critical_surface_density,
-            kpc_per_arcsec,
-        ) = _ludlow16_cosmology_callback(
-            mass_at_200,
-            redshift_object,
-            redshift_source,
-        )
-    else:
-        (
-            concentration,
-            cosmic_average_density,
-            critical_surface_density,
-            kpc_per_arcsec,
-        ) = ludlow16_cosmology_jax(
-            mass_at_200,
-            redshift_object,
-            redshift_source,
-        )
+    # ------------------------------------
+    # Cosmology + concentration
+    # ------------------------------------
+
+    (
+        concentration,
+        cosmic_average_density,
+        critical_surface_density,
+        kpc_per_arcsec,
+    ) = ludlow16_cosmology_from(
+        mass_at_200=mass_at_200,
+        redshift_object=redshift_object,
+        redshift_source=redshift_source,
+        xp=xp,
+    )
 
     # Apply scatter (JAX-safe)
     concentration = 10.0 ** (xp.log10(concentration) + scatter_sigma * 0.15)
@@ -4,6 +4,7 @@ from typing import Tuple
 import autoarray as aa
 
 from autogalaxy.profiles.mass.dark.gnfw import gNFW
+from autogalaxy.profiles.mass.abstract import quadrature
 from autogalaxy.profiles.mass.abstract.cse import MassProfileCSE
 
 from autogalaxy.profiles.mass.dark import nfw_hk24_util
@@ -123,35 +124,28 @@ class NFW(gNFW, MassProfileCSE):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        from scipy.integrate import quad
 
         def calculate_deflection_component(npow, index):
-            deflection_grid = np.array(self.axis_ratio(xp) * grid.array[:, index])
-
-            for i in range(grid.shape[0]):
-                deflection_grid[i] *= (
-                    self.kappa_s
-                    * quad(
-                        self.deflection_func,
-                        a=0.0,
-                        b=1.0,
-                        args=(
-                            grid.array[i, 0],
-                            grid.array[i, 1],
-                            npow,
-                            self.axis_ratio(xp),
-                            self.scale_radius,
-                        ),
-                    )[0]
+            return (
+                self.axis_ratio(xp)
+                * grid.array[:, index]
+                * self.kappa_s
+                * quadrature.integral_from(
+                    self.deflection_func,
+                    grid.array[:, 0],
+                    grid.array[:, 1],
+                    npow,
+                    self.axis_ratio(xp),
+                    self.scale_radius,
+                    xp=xp,
                 )
-
-            return deflection_grid
+            )
 
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
         return self.rotated_grid_from_reference_frame_from(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T)
+            xp.multiply(1.0, xp.vstack((deflection_y, deflection_x)).T), xp=xp
         )
 
     @aa.grid_dec.to_vector_yx
@@ -160,21 +154,40 @@ class NFW(gNFW, MassProfileCSE):
         return self._deflections_2d_via_cse_from(grid=grid, **kwargs)
 
     @staticmethod
-    def deflection_func(u, y, x, npow, axis_ratio, scale_radius):
-        _eta_u = (1.0 / scale_radius) * np.sqrt(
+    def eta_u_2_from(eta_u, xp=np):
+        """
+        Returns the function F(eta) of the NFW lensing integrals, which is:
+
+          • (1 / sqrt(eta^2 − 1)) * arccos(1 / eta)   if eta > 1
+          • (1 / sqrt(1 − eta^2)) * arccosh(1 / eta)  if eta < 1
+          • 1                                         if eta == 1
+
+        Both branches are evaluated with clipped inputs and combined with `xp.where`, so this can be evaluated on
+        arrays of any shape with NumPy or JAX. The arccos / arccosh forms are used as they remain numerically
+        stable as eta tends to zero.
+        """
+        root = xp.sqrt(xp.abs(eta_u**2 - 1))
+        root = xp.where(root > 0.0, root, 1.0)
+
+        inv_eta_u = 1.0 / eta_u
+
+        return xp.where(
+            eta_u > 1,
+            xp.arccos(xp.minimum(inv_eta_u, 1.0)) / root,
+            xp.where(
+                eta_u < 1,
+                xp.arccosh(xp.maximum(inv_eta_u, 1.0)) / root,
+                1.0,
+            ),
+        )
+
+    @staticmethod
+    def deflection_func(u, y, x, npow, axis_ratio, scale_radius, xp=np):
+        _eta_u = (1.0 / scale_radius) * xp.sqrt(
             (u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u))))
         )
 
-        if _eta_u > 1:
-            _eta_u_2 = (1.0 / np.sqrt(_eta_u**2 - 1)) * np.arctan(
-                np.sqrt(_eta_u**2 - 1)
-            )
-        elif _eta_u < 1:
-            _eta_u_2 = (1.0 / np.sqrt(1 - _eta_u**2)) * np.arctanh(
-                np.sqrt(1 - _eta_u**2)
-            )
-        else:
-            _eta_u_2 = 1
+        _eta_u_2 = NFW.eta_u_2_from(eta_u=_eta_u, xp=xp)
 
         return (
             2.0
@@ -226,43 +239,24 @@ class NFW(gNFW, MassProfileCSE):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        from scipy.integrate import quad
-
-        potential_grid = np.zeros(grid.shape[0])
-
-        for i in range(grid.shape[0]):
-            potential_grid[i] = quad(
-                self.potential_func,
-                a=0.0,
-                b=1.0,
-                args=(
-                    grid.array[i, 0],
-                    grid.array[i, 1],
-                    self.axis_ratio(xp),
-                    self.kappa_s,
-                    self.scale_radius,
-                ),
-                epsrel=1.49e-5,
-            )[0]
-
-        return potential_grid
+        return quadrature.integral_from(
+            self.potential_func,
+            grid.array[:, 0],
+            grid.array[:, 1],
+            self.axis_ratio(xp),
+            self.kappa_s,
+            self.scale_radius,
+            xp=xp,
+            epsrel=1.49e-5,
+        )
 
     @staticmethod
-    def potential_func(u, y, x, axis_ratio, kappa_s, scale_radius):
-        _eta_u = (1.0 / scale_radius) * np.sqrt(
+    def potential_func(u, y, x, axis_ratio, kappa_s, scale_radius, xp=np):
+        _eta_u = (1.0 / scale_radius) * xp.sqrt(
             (u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u))))
         )
 
-        if _eta_u > 1:
-            _eta_u_2 = (1.0 / np.sqrt(_eta_u**2 - 1)) * np.arctan(
-                np.sqrt(_eta_u**2 - 1)
-            )
-        elif _eta_u < 1:
-            _eta_u_2 = (1.0 / np.sqrt(1 - _eta_u**2)) * np.arctanh(
-                np.sqrt(1 - _eta_u**2)
-            )
-        else:
-            _eta_u_2 = 1
+        _eta_u_2 = NFW.eta_u_2_from(eta_u=_eta_u, xp=xp)
 
         return (
             4.0
@@ -270,7 +264,7 @@ class NFW(gNFW, MassProfileCSE):
             * scale_radius
             * (axis_ratio / 2.0)
             * (_eta_u / u)
-            * ((np.log(_eta_u / 2.0) + _eta_u_2) / _eta_u)
+            * ((xp.log(_eta_u / 2.0) + _eta_u_2) / _eta_u)
             / ((1 - (1 - axis_ratio**2) * u) ** 0.5)
         )
 
@@ -464,6 +458,41 @@ class NFWSph(NFW):
         grid_radius = grid_radius + 0j
         return xp.real(self.coord_func_h(grid_radius=grid_radius, xp=xp))
 
+    def analytical_hessian_2d_from(self, grid: aa.type.Grid2DLike, xp=np, **kwargs):
+        """
+        Calculate the hessian matrix on a grid of (y,x) arc-second coordinates.
+
+        For a spherical profile the Hessian has eigenvalue alpha / r tangentially and 2 * kappa - alpha / r
+        radially, where alpha is the magnitude of the deflection angle, r the radius from the centre and kappa
+        the convergence. This gives every component of the Hessian in closed form from one deflection angle and one
+        convergence calculation:
+
+        H = (alpha / r) * I + (2 * kappa - 2 * alpha / r) * (r r^T) / r^2
+
+        Parameters
+        ----------
+        grid
+            The grid of (y,x) arc-second coordinates the hessian is computed on.
+        """
+        grid = self.grid_shifted_from_centre_from(grid=grid, xp=xp)
+
+        alpha = self.deflections_yx_2d_from(grid=grid, xp=xp, **kwargs)
+        convergence = self.convergence_2d_from(grid=grid, xp=xp, **kwargs).array
+
+        x = grid.array[:, 1] - self.centre[1]
+        y = grid.array[:, 0] - self.centre[0]
+
+        radius_squared = x**2 + y**2
+
+        alpha_over_radius = (x * alpha.array[:, 1] + y * alpha.array[:, 0]) / radius_squared
+        radial_term = (2.0 * convergence - 2.0 * alpha_over_radius) / radius_squared
+
+        hessian_xx = alpha_over_radius + radial_term * x**2
+        hessian_yy = alpha_over_radius + radial_term * y**2
+        hessian_xy = radial_term * x * y
+
+        return hessian_yy, hessian_xy, hessian_xy, hessian_xx
+
     @aa.over_sample
     @aa.grid_dec.to_array
     @aa.grid_dec.transform
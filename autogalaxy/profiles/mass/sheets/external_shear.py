@@ -74,3 +74,24 @@ class ExternalShear(MassProfile):
             grid=xp.vstack((deflection_y, deflection_x)).T,
             xp=xp,
         )
+
+    def analytical_hessian_2d_from(self, grid: aa.type.Grid2DLike, xp=np, **kwargs):
+        """
+        Calculate the hessian matrix on a grid of (y,x) arc-second coordinates.
+
+        In the reference frame of the shear the Hessian is constant, with hessian_xx = -hessian_yy equal to the
+        shear magnitude, and it is rotated back to the original frame using the shear angle.
+
+        Parameters
+        ----------
+        grid
+            The grid of (y,x) arc-second coordinates the hessian is computed on.
+        """
+        magnitude = xp.full(shape=grid.shape[0], fill_value=self.magnitude(xp=xp))
+
+        return self.hessian_rotated_from_reference_frame_from(
+            hessian_yy=-magnitude,
+            hessian_xy=xp.zeros(shape=grid.shape[0]),
+            hessian_xx=magnitude,
+            xp=xp,
+        )
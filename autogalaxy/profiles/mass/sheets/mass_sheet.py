@@ -39,3 +39,24 @@ class MassSheet(MassProfile):
         return self._cartesian_grid_via_radial_from(
             grid=grid, radius=self.kappa * grid_radii, xp=xp
         )
+
+    def analytical_hessian_2d_from(self, grid: aa.type.Grid2DLike, xp=np, **kwargs):
+        """
+        Calculate the hessian matrix on a grid of (y,x) arc-second coordinates.
+
+        The deflection angles of a mass sheet are kappa * r, therefore its Hessian is kappa times the identity.
+
+        Parameters
+        ----------
+        grid
+            The grid of (y,x) arc-second coordinates the hessian is computed on.
+        """
+        hessian_diagonal = xp.full(shape=grid.shape[0], fill_value=self.kappa)
+        hessian_off_diagonal = xp.zeros(shape=grid.shape[0])
+
+        return (
+            hessian_diagonal,
+            hessian_off_diagonal,
+            hessian_off_diagonal,
+            hessian_diagonal,
+        )
@@ -5,6 +5,7 @@ from typing import Tuple
 import autoarray as aa
 
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
+from autogalaxy.profiles.mass.abstract import quadrature
 from autogalaxy.profiles.mass.stellar.abstract import StellarProfile
 
 
@@ -96,36 +97,29 @@ class Gaussian(MassProfile, StellarProfile):
         Note: sigma is divided by sqrt(q) here.
 
         """
-        from scipy.integrate import quad
 
         def calculate_deflection_component(npow, index):
-            deflection_grid = np.array(self.axis_ratio(xp) * grid.array[:, index])
-
-            for i in range(grid.shape[0]):
-                deflection_grid[i] *= (
-                    self.intensity
-                    * self.mass_to_light_ratio
-                    * quad(
-                        self.deflection_func,
-                        a=0.0,
-                        b=1.0,
-                        args=(
-                            grid.array[i, 0],
-                            grid.array[i, 1],
-                            npow,
-                            self.axis_ratio(xp),
-                            self.sigma / xp.sqrt(self.axis_ratio(xp)),
-                        ),
-                    )[0]
+            return (
+                self.axis_ratio(xp)
+                * grid.array[:, index]
+                * self.intensity
+                * self.mass_to_light_ratio
+                * quadrature.integral_from(
+                    self.deflection_func,
+                    grid.array[:, 0],
+                    grid.array[:, 1],
+                    npow,
+                    self.axis_ratio(xp),
+                    self.sigma / xp.sqrt(self.axis_ratio(xp)),
+                    xp=xp,
                 )
-
-            return deflection_grid
+            )
 
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
         return self.rotated_grid_from_reference_frame_from(
-            np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T), xp=xp
+            xp.multiply(1.0, xp.vstack((deflection_y, deflection_x)).T), xp=xp
         )
 
     @staticmethod
@@ -346,7 +346,10 @@ class PIEMass(MassProfile):
             xp=xp,
         )
 
-        return hessian_yy, hessian_xy, hessian_yx, hessian_xx
+        # This is in axes aligned to the major/minor axis, so rotate back to the real axes
+        return self.hessian_rotated_from_reference_frame_from(
+            hessian_yy=hessian_yy, hessian_xy=hessian_xy, hessian_xx=hessian_xx, xp=xp
+        )
 
     def analytical_magnification_2d_from(
         self, grid: "aa.type.Grid2DLike", xp=np, **kwargs
@@ -525,7 +528,10 @@ class dPIEMass(MassProfile):
         hessian_yx = t05 * (g05c_c - g05cut_c)
         hessian_yy = t05 * (g05c_d - g05cut_d)
 
-        return hessian_yy, hessian_xy, hessian_yx, hessian_xx
+        # This is in axes aligned to the major/minor axis, so rotate back to the real axes
+        return self.hessian_rotated_from_reference_frame_from(
+            hessian_yy=hessian_yy, hessian_xy=hessian_xy, hessian_xx=hessian_xx, xp=xp
+        )
 
     def analytical_magnification_2d_from(
         self, grid: "aa.type.Grid2DLike", xp=np, **kwargs
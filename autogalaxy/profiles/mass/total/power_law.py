@@ -52,6 +52,44 @@ class PowerLaw(PowerLawCore):
 
         return (x * alpha_x + y * alpha_y) / (3 - self.slope)
 
+    def analytical_hessian_2d_from(self, grid: aa.type.Grid2DLike, xp=np, **kwargs):
+        """
+        Calculate the hessian matrix on a grid of (y,x) arc-second coordinates.
+
+        The potential of a power-law is homogeneous of degree (3 - slope) about its centre, therefore by Euler's
+        theorem the Hessian satisfies H r = (2 - slope) * alpha, where r are the coordinates relative to the centre
+        and alpha the deflection angles. Combined with the trace of the Hessian, which is twice the convergence,
+        this gives every component of the Hessian in closed form from one deflection angle and one convergence
+        calculation.
+
+        Parameters
+        ----------
+        grid
+            The grid of (y,x) arc-second coordinates the hessian is computed on.
+        """
+        grid = self.grid_shifted_from_centre_from(grid=grid, xp=xp)
+
+        alpha = self.deflections_yx_2d_from(grid=grid, xp=xp, **kwargs)
+        convergence = self.convergence_2d_from(grid=grid, xp=xp, **kwargs).array
+
+        alpha_x = alpha.array[:, 1]
+        alpha_y = alpha.array[:, 0]
+
+        x = grid.array[:, 1] - self.centre[1]
+        y = grid.array[:, 0] - self.centre[0]
+
+        radius_squared = x**2 + y**2
+
+        hessian_xx = (
+            (2 - self.slope) * (x * alpha_x - y * alpha_y) + 2.0 * convergence * y**2
+        ) / radius_squared
+        hessian_xy = (
+            (2 - self.slope) * (y * alpha_x + x * alpha_y) - 2.0 * convergence * x * y
+        ) / radius_squared
+        hessian_yy = 2.0 * convergence - hessian_xx
+
+        return hessian_yy, hessian_xy, hessian_xy, hessian_xx
+
     @aa.grid_dec.to_vector_yx
     @aa.grid_dec.transform
     def deflections_yx_2d_from(self, grid: aa.type.Grid2DLike, xp=np, **kwargs):
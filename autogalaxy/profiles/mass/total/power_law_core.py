@@ -4,6 +4,7 @@ from typing import Tuple
 import autoarray as aa
 
 from autogalaxy.profiles.mass.abstract.abstract import MassProfile
+from autogalaxy.profiles.mass.abstract import quadrature
 
 
 class PowerLawCore(MassProfile):
@@ -63,7 +64,7 @@ class PowerLawCore(MassProfile):
         """
         grid_eta = self.elliptical_radii_grid_from(grid=grid, xp=xp, **kwargs)
 
-        return self.convergence_func(grid_radius=grid_eta)
+        return self.convergence_func(grid_radius=grid_eta, xp=xp)
 
     @aa.over_sample
     @aa.grid_dec.to_array
@@ -77,23 +78,15 @@ class PowerLawCore(MassProfile):
         grid
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
-        from scipy.integrate import quad
-
-        potential_grid = np.zeros(grid.shape[0])
-
-        for i in range(grid.shape[0]):
-            potential_grid[i] = quad(
-                self.potential_func,
-                a=0.0,
-                b=1.0,
-                args=(
-                    grid.array[i, 0],
-                    grid.array[i, 1],
-                    self.axis_ratio(xp),
-                    self.slope,
-                    self.core_radius,
-                ),
-            )[0]
+        potential_grid = quadrature.integral_from(
+            self.potential_func,
+            grid.array[:, 0],
+            grid.array[:, 1],
+            self.axis_ratio(xp),
+            self.slope,
+            self.core_radius,
+            xp=xp,
+        )
 
         return self.einstein_radius_rescaled(xp) * self.axis_ratio(xp) * potential_grid
 
@@ -109,38 +102,29 @@ class PowerLawCore(MassProfile):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        from scipy.integrate import quad
 
         def calculate_deflection_component(npow, index):
-            einstein_radius_rescaled = self.einstein_radius_rescaled(xp)
-
-            deflection_grid = np.array(self.axis_ratio(xp) * grid.array[:, index])
-
-            for i in range(grid.shape[0]):
-                deflection_grid[i] *= (
-                    einstein_radius_rescaled
-                    * quad(
-                        self.deflection_func,
-                        a=0.0,
-                        b=1.0,
-                        args=(
-                            grid.array[i, 0],
-                            grid.array[i, 1],
-                            npow,
-                            self.axis_ratio(xp),
-                            self.slope,
-                            self.core_radius,
-                        ),
-                    )[0]
+            return (
+                self.einstein_radius_rescaled(xp)
+                * self.axis_ratio(xp)
+                * grid.array[:, index]
+                * quadrature.integral_from(
+                    self.deflection_func,
+                    grid.array[:, 0],
+                    grid.array[:, 1],
+                    npow,
+                    self.axis_ratio(xp),
+                    self.slope,
+                    self.core_radius,
+                    xp=xp,
                 )
-
-            return deflection_grid
+            )
 
         deflection_y = calculate_deflection_component(1.0, 0)
         deflection_x = calculate_deflection_component(0.0, 1)
 
         return self.rotated_grid_from_reference_frame_from(
-            grid=np.multiply(1.0, np.vstack((deflection_y, deflection_x)).T), xp=xp
+            grid=xp.multiply(1.0, xp.vstack((deflection_y, deflection_x)).T), xp=xp
         )
 
     def convergence_func(self, grid_radius: float, xp=np) -> float:
@@ -149,8 +133,8 @@ class PowerLawCore(MassProfile):
         ) ** (-(self.slope - 1) / 2.0)
 
     @staticmethod
-    def potential_func(u, y, x, axis_ratio, slope, core_radius):
-        eta = np.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
+    def potential_func(u, y, x, axis_ratio, slope, core_radius, xp=np):
+        eta = xp.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
         return (
             (eta / u)
             * ((3.0 - slope) * eta) ** -1.0
@@ -162,8 +146,8 @@ class PowerLawCore(MassProfile):
         )
 
     @staticmethod
-    def deflection_func(u, y, x, npow, axis_ratio, slope, core_radius):
-        _eta_u = np.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
+    def deflection_func(u, y, x, npow, axis_ratio, slope, core_radius, xp=np):
+        _eta_u = xp.sqrt((u * ((x**2) + (y**2 / (1 - (1 - axis_ratio**2) * u)))))
         return (core_radius**2 + _eta_u**2) ** (-(slope - 1) / 2.0) / (
             (1 - (1 - axis_ratio**2) * u) ** (npow + 0.5)
         )
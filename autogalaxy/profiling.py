@@ -0,0 +1,230 @@
+"""
+Opt-in timing instrumentation of the stages of a fit, used to find where the run time of a model-fit is spent.
+
+Profiling is enabled via the `enabled` context manager, inside which the wall time and number of calls of every
+instrumented stage are recorded by a `Profiler`:
+
+.. code-block:: python
+
+    with ag.profiling.enabled() as profiler:
+        result = search.fit(model=model, analysis=analysis)
+
+    print(profiler.report)
+
+The instrumented stages are:
+
+- The intermediate quantities of `FitImaging` and `FitInterferometer` (e.g. `blurred_image`, `inversion`,
+  `model_data`), which are decorated with `cached_fit_property`.
+- The linear algebra of their inversion (`FitImaging.linear_algebra`), which computes the mapping matrices of its
+  linear objects, the curvature matrix and data vector and solves for the reconstruction. The set up of the
+  inversion and its linear objects (e.g. creating the mappers) is instead recorded by `FitImaging.inversion`.
+- The `GalaxiesToInversion` steps which set up the linear objects of an inversion (e.g. the mappers).
+- The PSF convolution of images.
+- The `image_2d_from` and `deflections_yx_2d_from` methods of every light and mass profile class evaluated by a
+  galaxy, which are recorded under the name of the profile class (e.g. `Sersic.image_2d_from`).
+- The `log_likelihood_function` of `AnalysisImaging` and `AnalysisInterferometer`.
+
+The time of a stage includes the time of the stages it calls, for example the time of `FitImaging.model_data`
+includes the time of `FitImaging.inversion`.
+
+If profiling is enabled when a model-fit finishes, the report is output to the file `profiling.results` in the
+search's output folder, alongside `model.results`.
+
+When profiling is not enabled, every instrumented stage performs a single check of the module's `_profiler`
+attribute, so the instrumentation has a negligible overhead.
+
+Profiling records the times of the Python calls of a stage, therefore when the likelihood function is compiled via
+JAX it only times the tracing of the function. It is also recorded per process, so stages evaluated by the
+processes of a parallel non-linear search are not included.
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, Optional, Union
+
+_profiler = None
+
+
+class Profiler:
+    def __init__(self):
+        """
+        Records the total wall time and number of calls of every stage of a fit evaluated while profiling is enabled,
+        keyed by the name of the stage.
+        """
+        self.call_dict = Counter()
+        self.time_dict = defaultdict(float)
+
+    def add(self, name: str, time: float):
+        """
+        Add a call of a stage which took `time` seconds to the profiler.
+
+        Parameters
+        ----------
+        name
+            The name of the stage, for example `FitImaging.blurred_image`.
+        time
+            The wall time in seconds of the call.
+        """
+        self.call_dict[name] += 1
+        self.time_dict[name] += time
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Context manager which records the wall time of the code it wraps as a call of the stage `name`.
+
+        Parameters
+        ----------
+        name
+            The name of the stage, for example `FitImaging.blurred_image`.
+        """
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name=name, time=perf_counter() - start)
+
+    @property
+    def report_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        The number of calls, total wall time and wall time per call of every stage, sorted by descending total time.
+        """
+        return {
+            name: {
+                "calls": self.call_dict[name],
+                "time": time,
+                "time_per_call": time / self.call_dict[name],
+            }
+            for name, time in sorted(
+                self.time_dict.items(), key=lambda item: item[1], reverse=True
+            )
+        }
+
+    @property
+    def report(self) -> str:
+        """
+        The report of every stage as a table of their number of calls, total wall time and wall time per call, sorted
+        by descending total time.
+        """
+        width = max([len(name) for name in self.time_dict] + [len("Stage")])
+
+        line_list = [
+            f"{'Stage':<{width}}  {'Calls':>10}  {'Time (s)':>12}  {'Time Per Call (s)':>18}"
+        ]
+
+        for name, value_dict in self.report_dict.items():
+            line_list.append(
+                f"{name:<{width}}  {value_dict['calls']:>10}  {value_dict['time']:>12.6f}  "
+                f"{value_dict['time_per_call']:>18.8f}"
+            )
+
+        return "\n".join(line_list) + "\n"
+
+    def output_to(self, file_path: Union[Path, str]):
+        """
+        Output the report of the profiler to a text file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the file the report is written to.
+        """
+        with open(file_path, "w") as f:
+            f.write(self.report)
+
+
+@contextmanager
+def enabled(profiler: Optional[Profiler] = None):
+    """
+    Context manager which enables profiling of the stages of a fit evaluated inside it, yielding the `Profiler` the
+    stages are recorded in.
+
+    On exit, the profiling that was in place before the context manager was entered is restored.
+
+    Parameters
+    ----------
+    profiler
+        The profiler the stages are recorded in, where a new `Profiler` is created if it is not input (an existing
+        profiler is input to accumulate the stages of multiple model-fits).
+    """
+    global _profiler
+
+    previous_profiler = _profiler
+
+    _profiler = profiler or Profiler()
+
+    try:
+        yield _profiler
+    finally:
+        _profiler = previous_profiler
+
+
+def current() -> Optional[Profiler]:
+    """
+    Returns the `Profiler` stages are currently recorded in, or `None` if profiling is not enabled.
+    """
+    return _profiler
+
+
+def stage(name: str):
+    """
+    Context manager which records the wall time of the code it wraps as a call of the stage `name` if profiling
+    is enabled, and does nothing otherwise.
+
+    Parameters
+    ----------
+    name
+        The name of the stage, for example `FitImaging.linear_algebra`.
+    """
+    if _profiler is None:
+        return nullcontext()
+
+    return _profiler.stage(name=name)
+
+
+def call(func: Callable, *args, **kwargs):
+    """
+    Returns the output of calling `func` with the input arguments, recording the call as a stage if profiling is
+    enabled.
+
+    If `func` is a bound method the stage is named after the class of the object it is bound to, for example
+    `call(sersic.image_2d_from, grid=grid)` records the stage `Sersic.image_2d_from`, so that the stages of every
+    profile class are recorded separately.
+
+    Parameters
+    ----------
+    func
+        The function or bound method which is called.
+    """
+    if _profiler is None:
+        return func(*args, **kwargs)
+
+    try:
+        name = f"{type(func.__self__).__name__}.{func.__name__}"
+    except AttributeError:
+        name = func.__qualname__
+
+    with _profiler.stage(name=name):
+        return func(*args, **kwargs)
+
+
+def profile_method(func: Callable):
+    """
+    Decorator which records every call of a method as a stage if profiling is enabled, named after the class of
+    the object the method is called on (e.g. `AnalysisImaging.log_likelihood_function`).
+
+    It can be placed beneath a `cached_property` or `property` decorator to record the evaluation of the property.
+    """
+
+    @wraps(func)
+    def wrapper(obj, *args, **kwargs):
+        if _profiler is None:
+            return func(obj, *args, **kwargs)
+
+        with _profiler.stage(name=f"{type(obj).__name__}.{func.__name__}"):
+            return func(obj, *args, **kwargs)
+
+    return wrapper
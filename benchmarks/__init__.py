@@ -0,0 +1,21 @@
+"""
+Benchmarks of the likelihood functions and lensing calculations of **PyAutoGalaxy**, written for airspeed velocity
+(asv, https://asv.readthedocs.io).
+
+Every benchmark is a class whose `time_*` methods are timed and whose `peakmem_*` methods report the peak memory of
+the process. The `params` of each class (e.g. the mask radius, over sampling size, number of Gaussians of a
+multi-Gaussian expansion (MGE) and whether NumPy or JAX is used) are run as a grid of benchmarks.
+
+The suite is run from the root of the repository via:
+
+    asv run --config benchmarks/asv.conf.json
+
+Where `asv run --config benchmarks/asv.conf.json v2025.1.1..main` compares releases and `asv publish` outputs the
+results as a website, such that performance regressions are visible per release. During development the benchmarks
+of the checked out source code are run via `asv run --config benchmarks/asv.conf.json --python=same --quick`.
+
+Datasets are simulated from the galaxies of `autogalaxy.fixtures` with a fixed noise seed (see `benchmarks.util`),
+so every run of a benchmark fits the same data. JAX benchmarks are compiled via `jax.jit` in `setup` and run on the
+CPU unless another device is configured, so their timings do not include compilation. A benchmark whose model cannot
+be compiled by JAX is skipped.
+"""
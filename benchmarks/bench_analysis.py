@@ -0,0 +1,83 @@
+"""
+Benchmarks of the `log_likelihood_function` of `AnalysisImaging` and `AnalysisInterferometer`, fitting a galaxy whose
+light is a multi-Gaussian expansion (MGE) of linear Gaussians, as called by a non-linear search.
+"""
+import autogalaxy as ag
+
+from benchmarks import util
+
+
+class AnalysisImagingSuite:
+    params = (
+        util.backend_list,
+        util.mask_radius_list,
+        util.over_sample_size_list,
+        util.total_gaussians_list,
+    )
+    param_names = ["backend", "mask_radius", "over_sample_size", "total_gaussians"]
+
+    timeout = 600
+
+    def setup(self, backend, mask_radius, over_sample_size, total_gaussians):
+        util.xp_from(backend=backend)
+
+        analysis = ag.AnalysisImaging(
+            dataset=util.imaging_from(
+                mask_radius=mask_radius, over_sample_size=over_sample_size
+            ),
+            use_jax=backend == "jax",
+        )
+
+        model = util.mge_model_from(
+            mask_radius=mask_radius, total_gaussians=total_gaussians
+        )
+
+        self.log_likelihood_function, self.parameters = (
+            util.log_likelihood_function_from(
+                analysis=analysis, model=model, backend=backend
+            )
+        )
+
+    def time_log_likelihood_function(self, *args):
+        util.block_until_ready(self.log_likelihood_function(self.parameters))
+
+    def peakmem_log_likelihood_function(self, *args):
+        util.block_until_ready(self.log_likelihood_function(self.parameters))
+
+
+class AnalysisInterferometerSuite:
+    params = (
+        util.backend_list,
+        util.mask_radius_list,
+        [1000, 10000],
+        util.total_gaussians_list,
+    )
+    param_names = ["backend", "mask_radius", "total_visibilities", "total_gaussians"]
+
+    timeout = 600
+
+    def setup(self, backend, mask_radius, total_visibilities, total_gaussians):
+        util.xp_from(backend=backend)
+
+        analysis = ag.AnalysisInterferometer(
+            dataset=util.interferometer_from(
+                mask_radius=mask_radius, total_visibilities=total_visibilities
+            ),
+            use_jax=backend == "jax",
+        )
+
+        model = util.mge_model_from(
+            mask_radius=mask_radius, total_gaussians=total_gaussians
+        )
+
+        self.log_likelihood_function, self.parameters = (
+            util.log_likelihood_function_from(
+                analysis=analysis, model=model, backend=backend
+            )
+        )
+
+    def time_log_likelihood_function(self, *args):
+        util.block_until_ready(self.log_likelihood_function(self.parameters))
+
+    def peakmem_log_likelihood_function(self, *args):
+        util.block_until_ready(self.log_likelihood_function(self.parameters))
@@ -0,0 +1,80 @@
+"""
+Benchmarks of fitting isophotal ellipses to an imaging dataset, via a `FitEllipse` for every ellipse, via the stacked
+NumPy route of `fit_ellipse_batch` used by `AnalysisEllipse` and via its array module route, which JAX compiles.
+"""
+import numpy as np
+
+import autogalaxy as ag
+
+from autogalaxy.ellipse import fit_ellipse_batch
+
+from benchmarks import util
+
+
+def ellipse_list_from(major_axis_list):
+    return [
+        ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.1, 0.05), major_axis=major_axis)
+        for major_axis in major_axis_list
+    ]
+
+
+class FitEllipseSuite:
+    params = (util.mask_radius_list, [10, 50])
+    param_names = ["mask_radius", "total_ellipses"]
+
+    def setup(self, mask_radius, total_ellipses):
+        self.interp = ag.DatasetInterp(
+            dataset=util.imaging_from(mask_radius=mask_radius)
+        )
+
+        self.ellipse_list = ellipse_list_from(
+            major_axis_list=np.linspace(0.2, 0.9 * mask_radius, total_ellipses)
+        )
+
+    def time_fit_ellipse(self, *args):
+        for ellipse in self.ellipse_list:
+            ag.FitEllipse(
+                dataset=self.interp.dataset, ellipse=ellipse, interp=self.interp
+            ).log_likelihood
+
+    def time_log_likelihood_via_stacked_points(self, *args):
+        fit_ellipse_batch.log_likelihood_via_stacked_points_from(
+            interp=self.interp, ellipse_list=self.ellipse_list
+        )
+
+    def peakmem_fit_ellipse(self, *args):
+        for ellipse in self.ellipse_list:
+            ag.FitEllipse(
+                dataset=self.interp.dataset, ellipse=ellipse, interp=self.interp
+            ).log_likelihood
+
+
+class FitEllipseBatchSuite:
+    params = (util.backend_list, util.mask_radius_list, [10, 50])
+    param_names = ["backend", "mask_radius", "total_ellipses"]
+
+    def setup(self, backend, mask_radius, total_ellipses):
+        xp = util.xp_from(backend=backend)
+
+        interp = ag.DatasetInterp(dataset=util.imaging_from(mask_radius=mask_radius))
+
+        def log_likelihood_from(major_axis_list):
+            return fit_ellipse_batch.log_likelihood_from(
+                interp=interp,
+                ellipse_list=ellipse_list_from(major_axis_list=major_axis_list),
+                xp=xp,
+            )
+
+        self.major_axis_list = xp.asarray(
+            np.linspace(0.2, 0.9 * mask_radius, total_ellipses)
+        )
+
+        self.log_likelihood_from = util.jit_from(
+            log_likelihood_from, backend, self.major_axis_list
+        )
+
+    def time_log_likelihood(self, *args):
+        util.block_until_ready(self.log_likelihood_from(self.major_axis_list))
+
+    def peakmem_log_likelihood(self, *args):
+        util.block_until_ready(self.log_likelihood_from(self.major_axis_list))
@@ -0,0 +1,86 @@
+"""
+Benchmarks of the deflection angles of every mass profile and of the Einstein radius computed via `LensCalc`.
+"""
+import inspect
+
+import autogalaxy as ag
+
+from benchmarks import util
+
+mass_profile_name_list = [
+    name
+    for name, cls in inspect.getmembers(ag.mp, inspect.isclass)
+    if issubclass(cls, ag.mp.MassProfile) and cls is not ag.mp.MassProfile
+]
+
+
+class DeflectionsSuite:
+    params = (util.backend_list, mass_profile_name_list, [50, 200])
+    param_names = ["backend", "mass_profile", "total_pixels"]
+
+    timeout = 300
+
+    def setup(self, backend, mass_profile, total_pixels):
+        xp = util.xp_from(backend=backend)
+
+        mass = getattr(ag.mp, mass_profile)()
+
+        grid = ag.Grid2D.uniform(
+            shape_native=(total_pixels, total_pixels), pixel_scales=0.05
+        )
+
+        def deflections_from(grid_array):
+            return mass.deflections_yx_2d_from(
+                grid=ag.Grid2DIrregular(values=grid_array), xp=xp
+            ).array
+
+        self.grid_array = xp.asarray(grid.array)
+
+        self.deflections_from = util.jit_from(
+            deflections_from, backend, self.grid_array
+        )
+
+    def time_deflections_yx_2d_from(self, *args):
+        util.block_until_ready(self.deflections_from(self.grid_array))
+
+    def peakmem_deflections_yx_2d_from(self, *args):
+        util.block_until_ready(self.deflections_from(self.grid_array))
+
+
+class EinsteinRadiusSuite:
+    """
+    `LensCalc.einstein_radius_from` computes critical curves via a marching squares algorithm which only supports
+    NumPy, therefore it is only benchmarked with NumPy.
+    """
+
+    params = (["Isothermal", "PowerLaw", "NFW", "Sersic"], [100, 250])
+    param_names = ["mass_profile", "total_pixels"]
+
+    timeout = 300
+
+    def setup(self, mass_profile, total_pixels):
+        mass = getattr(ag.mp, mass_profile)()
+
+        self.galaxy = ag.Galaxy(redshift=0.5, mass=mass)
+
+        self.total_pixels = total_pixels
+
+    def einstein_radius_from(self):
+        """
+        `LensCalc` caches the evaluation grid and lensing maps of the most recent grid, therefore a new `LensCalc` and
+        grid are created on every call so that every repeat computes the Einstein radius rather than reusing them.
+        """
+        lens_calc = ag.LensCalc.from_mass_obj(self.galaxy)
+
+        grid = ag.Grid2D.uniform(
+            shape_native=(self.total_pixels, self.total_pixels),
+            pixel_scales=5.0 / self.total_pixels,
+        )
+
+        return lens_calc.einstein_radius_from(grid=grid)
+
+    def time_einstein_radius_from(self, *args):
+        self.einstein_radius_from()
+
+    def peakmem_einstein_radius_from(self, *args):
+        self.einstein_radius_from()
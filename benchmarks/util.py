@@ -0,0 +1,174 @@
+"""
+Builders of the reproducible datasets, models and likelihood functions which are timed by the benchmarks.
+
+Datasets are simulated via `SimulatorImaging.via_galaxies_from` and `SimulatorInterferometer.via_galaxies_from` from
+the galaxies of `autogalaxy.fixtures`, with a fixed noise seed, and masked with a circular mask whose radius is a
+parameter of the benchmarks.
+"""
+import numpy as np
+from typing import Tuple
+
+import autofit as af
+from autofit.non_linear.fitness import Fitness
+import autogalaxy as ag
+
+from autogalaxy import fixtures
+
+pixel_scales = 0.1
+
+backend_list = ["numpy", "jax"]
+mask_radius_list = [1.5, 3.0, 4.5]
+over_sample_size_list = [1, 4]
+total_gaussians_list = [10, 30, 60]
+
+
+def xp_from(backend: str):
+    """
+    Returns the array module of a backend, where the benchmark is skipped (by asv, via a `NotImplementedError`) if
+    the backend is JAX and JAX is not installed.
+    """
+    if backend == "numpy":
+        return np
+
+    try:
+        import jax.numpy as jnp
+    except ImportError:
+        raise NotImplementedError("JAX is not installed.")
+
+    return jnp
+
+
+def block_until_ready(value):
+    """
+    Waits for a JAX computation to finish, as JAX dispatches computations asynchronously, so that it is included in
+    the timing of a benchmark.
+    """
+    if hasattr(value, "block_until_ready"):
+        value.block_until_ready()
+
+    return value
+
+
+def jit_from(func, backend: str, *args):
+    """
+    Returns a function which is compiled via `jax.jit` if the backend is JAX, calling it once so that it is compiled
+    before it is timed.
+
+    If the function cannot be compiled by JAX (e.g. a profile which uses SciPy), the benchmark is skipped.
+    """
+    if backend == "jax":
+        import jax
+
+        func = jax.jit(func)
+
+    try:
+        block_until_ready(func(*args))
+    except Exception as e:
+        if backend == "jax":
+            raise NotImplementedError(f"JAX cannot compile the benchmark: {e}")
+        raise
+
+    return func
+
+
+def shape_native_from(mask_radius: float) -> Tuple[int, int]:
+    """
+    Returns the 2D shape of the image which a circular mask of radius `mask_radius` fits within, including a border
+    of pixels for the PSF to blur light into the mask.
+    """
+    total_pixels = 2 * int(np.ceil(mask_radius / pixel_scales)) + 10
+
+    return (total_pixels, total_pixels)
+
+
+def mask_from(mask_radius: float) -> ag.Mask2D:
+    return ag.Mask2D.circular(
+        shape_native=shape_native_from(mask_radius=mask_radius),
+        pixel_scales=pixel_scales,
+        radius=mask_radius,
+    )
+
+
+def imaging_from(mask_radius: float, over_sample_size: int = 1) -> ag.Imaging:
+    """
+    Returns an imaging dataset of the galaxy of `fixtures.make_gal_x1_lp`, simulated with a Gaussian PSF and a
+    fixed noise seed, masked with a circular mask and over sampled with a uniform over sampling size.
+    """
+    mask = mask_from(mask_radius=mask_radius)
+
+    grid = ag.Grid2D.uniform(shape_native=mask.shape_native, pixel_scales=pixel_scales)
+
+    psf = ag.Convolver.from_gaussian(
+        shape_native=(11, 11), pixel_scales=pixel_scales, sigma=0.1, normalize=True
+    )
+
+    simulator = ag.SimulatorImaging(
+        exposure_time=300.0,
+        psf=psf,
+        background_sky_level=0.1,
+        add_poisson_noise_to_data=True,
+        noise_seed=1,
+    )
+
+    dataset = simulator.via_galaxies_from(
+        galaxies=[fixtures.make_gal_x1_lp()], grid=grid
+    )
+
+    dataset = dataset.apply_mask(mask=mask)
+
+    return dataset.apply_over_sampling(over_sample_size_lp=over_sample_size)
+
+
+def interferometer_from(
+    mask_radius: float, total_visibilities: int
+) -> ag.Interferometer:
+    """
+    Returns an interferometer dataset of the galaxy of `fixtures.make_gal_x1_lp`, observed at uniformly random
+    uv-wavelengths and simulated with a fixed noise seed, whose real-space mask is a circular mask.
+    """
+    mask = mask_from(mask_radius=mask_radius)
+
+    uv_wavelengths = np.random.default_rng(seed=1).uniform(
+        low=-3.0e5, high=3.0e5, size=(total_visibilities, 2)
+    )
+
+    simulator = ag.SimulatorInterferometer(
+        uv_wavelengths=uv_wavelengths,
+        exposure_time=300.0,
+        noise_sigma=0.1,
+        transformer_class=ag.TransformerDFT,
+        noise_seed=1,
+    )
+
+    return simulator.via_galaxies_from(
+        galaxies=[fixtures.make_gal_x1_lp()], grid=ag.Grid2D.from_mask(mask=mask)
+    )
+
+
+def mge_model_from(mask_radius: float, total_gaussians: int) -> af.Collection:
+    """
+    Returns the model of a galaxy whose light is a multi-Gaussian expansion (MGE) of `total_gaussians` linear
+    Gaussians, as set up by `model_util.mge_model_from`.
+    """
+    bulge = ag.model_util.mge_model_from(
+        mask_radius=mask_radius, total_gaussians=total_gaussians
+    )
+
+    return af.Collection(
+        galaxies=af.Collection(galaxy=af.Model(ag.Galaxy, redshift=0.5, bulge=bulge))
+    )
+
+
+def log_likelihood_function_from(
+    analysis: af.Analysis, model: af.Collection, backend: str
+):
+    """
+    Returns the log likelihood function of an analysis as called by a non-linear search (via `Fitness`), which is
+    compiled via `jax.jit` if the backend is JAX, and the parameters of the model it is called with, which are the
+    medians of the model's priors.
+    """
+    fitness = Fitness(model=model, analysis=analysis)
+
+    parameters = np.array(model.physical_values_from_prior_medians)
+
+    return jit_from(fitness.call, backend, parameters), parameters
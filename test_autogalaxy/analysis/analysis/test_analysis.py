@@ -45,3 +45,32 @@ def test__save_results__galaxies_output_to_json(analysis_imaging_7x7):
     assert galaxies[0].redshift == 0.5
 
     os.remove(paths._files_path / "galaxies.json")
+
+
+def test__prewarm_cosmology_cache(masked_imaging_7x7):
+    from autogalaxy.cosmology.redshift_cache import redshift_cache
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(ag.Galaxy, redshift=0.5, mass=ag.mp.IsothermalSph),
+            source=af.Model(ag.Galaxy, redshift=1.0),
+            other=af.Model(ag.Galaxy, redshift=af.UniformPrior(0.0, 1.0)),
+        )
+    )
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7, use_jax=False)
+
+    redshift_cache.cache_clear()
+
+    analysis.prewarm_cosmology_cache(model=model)
+
+    misses = redshift_cache.cache_info().misses
+
+    analysis.cosmology.critical_surface_density_between_redshifts_from(
+        redshift_0=0.5, redshift_1=1.0
+    )
+
+    assert misses > 0
+    assert redshift_cache.cache_info().misses == misses
+
+    redshift_cache.cache_clear()
@@ -0,0 +1,115 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.analysis.inversion_cache import InversionCache
+from autogalaxy.analysis.inversion_cache import fingerprint_from
+
+
+def test__fingerprint_from__equal_values_equal_and_different_values_different():
+    grid = ag.Grid2D.uniform(shape_native=(3, 3), pixel_scales=0.1)
+
+    assert fingerprint_from(grid) == fingerprint_from(
+        ag.Grid2D.uniform(shape_native=(3, 3), pixel_scales=0.1)
+    )
+    assert fingerprint_from(grid) != fingerprint_from(
+        grid.subtracted_from(offset=(0.1, 0.0))
+    )
+
+    assert fingerprint_from(ag.mesh.RectangularUniform(shape=(3, 3))) == (
+        fingerprint_from(ag.mesh.RectangularUniform(shape=(3, 3)))
+    )
+    assert fingerprint_from(ag.mesh.RectangularUniform(shape=(3, 3))) != (
+        fingerprint_from(ag.mesh.RectangularUniform(shape=(4, 4)))
+    )
+
+
+def test__value_from__least_recently_used_value_removed():
+    inversion_cache = InversionCache(maxsize=2)
+
+    assert inversion_cache.value_from(key="a", func=lambda: 1) == 1
+    assert inversion_cache.value_from(key="b", func=lambda: 2) == 2
+    assert inversion_cache.value_from(key="a", func=lambda: 3) == 1
+    assert inversion_cache.value_from(key="c", func=lambda: 4) == 4
+    assert inversion_cache.value_from(key="b", func=lambda: 5) == 5
+
+    assert inversion_cache.cache_info() == (1, 4, 2, 2)
+
+    inversion_cache.cache_clear()
+
+    assert inversion_cache.cache_info() == (0, 0, 2, 0)
+
+
+def test__identity_from__least_recently_used_object_removed():
+    inversion_cache = InversionCache(maxsize=2)
+
+    obj_0, obj_1, obj_2 = object(), object(), object()
+
+    identity_0 = inversion_cache.identity_from(obj_0)
+
+    assert inversion_cache.identity_from(obj_0) == identity_0
+
+    inversion_cache.identity_from(obj_1)
+    inversion_cache.identity_from(obj_2)
+
+    assert len(inversion_cache.object_dict) == 2
+    assert inversion_cache.identity_from(obj_0) != identity_0
+
+
+def test__mapper_from__cached_mapper_copied_with_input_regularization(
+    masked_imaging_7x7,
+):
+    inversion_cache = InversionCache()
+
+    mesh = ag.mesh.RectangularUniform(shape=(3, 3))
+
+    key = inversion_cache.mapper_key_from(
+        mesh=mesh,
+        source_plane_data_grid=masked_imaging_7x7.grids.pixelization,
+        source_plane_mesh_grid=None,
+        adapt_data=None,
+        border_relocator=masked_imaging_7x7.grids.border_relocator,
+        settings=ag.Settings(),
+    )
+
+    to_inversion = ag.GalaxiesToInversion(dataset=masked_imaging_7x7, galaxies=[])
+
+    def mapper_func():
+        return to_inversion.mapper_from(
+            mesh=mesh,
+            regularization=ag.reg.Constant(coefficient=1.0),
+            source_plane_data_grid=masked_imaging_7x7.grids.pixelization,
+            source_plane_mesh_grid=None,
+            adapt_galaxy_image=None,
+        )
+
+    mapper = inversion_cache.mapper_from(
+        key=key, func=mapper_func, regularization=ag.reg.Constant(coefficient=1.0)
+    )
+
+    mapping_matrix = mapper.mapping_matrix
+
+    regularization = ag.reg.Constant(coefficient=2.0)
+
+    mapper_cached = inversion_cache.mapper_from(
+        key=key, func=mapper_func, regularization=regularization
+    )
+
+    assert mapper_cached is not mapper
+    assert mapper_cached.regularization is regularization
+    assert mapper_cached.mapping_matrix is mapping_matrix
+    assert mapper.regularization.coefficient == 1.0
+
+
+def test__pickle__cached_values_not_pickled():
+    inversion_cache = InversionCache(maxsize=2)
+
+    inversion_cache.value_from(key="a", func=lambda: np.ones(3))
+
+    inversion_cache = pickle.loads(pickle.dumps(inversion_cache))
+
+    assert inversion_cache.cache_info().currsize == 0
+    assert inversion_cache.maxsize == 2
@@ -141,3 +141,42 @@ def test__velocity_dispersion_from():
     )
 
     assert velocity_dispersion == pytest.approx(np.sqrt(2) * 284.935499691701, 1.0e-4)
+
+
+def test__angular_diameter_distance_z1z2__distance_table_matches_exact_integration():
+
+    cosmology = ag.cosmology.Planck15()
+
+    for z1, z2 in [(0.0, 0.01), (0.1, 1.0), (0.5, 0.5001), (1.0, 3.0), (0.3, 19.9)]:
+
+        distance = cosmology.angular_diameter_distance_kpc_z1z2(z1, z2)
+        distance_exact = cosmology.angular_diameter_distance_kpc_z1z2(
+            z1, z2, n_steps=100001, use_distance_table=False
+        )
+
+        assert distance == pytest.approx(distance_exact, 1.0e-8)
+
+    distance = cosmology.angular_diameter_distance_kpc_z1z2(0.5, 25.0)
+    distance_exact = cosmology.angular_diameter_distance_kpc_z1z2(
+        0.5, 25.0, use_distance_table=False
+    )
+
+    assert distance == distance_exact
+
+
+def test__comoving_distance_table_from__cached_and_recomputed_if_parameters_change():
+
+    cosmology = ag.cosmology.FlatLambdaCDM(H0=70, Om0=0.3, Tcmb0=0.0)
+
+    table = cosmology.comoving_distance_table_from()
+
+    assert cosmology.comoving_distance_table_from() is table
+
+    distance = cosmology.angular_diameter_distance_kpc_z1z2(0.1, 1.0)
+
+    cosmology.H0 = 60.0
+
+    assert cosmology.comoving_distance_table_from() is not table
+    assert cosmology.angular_diameter_distance_kpc_z1z2(0.1, 1.0) == pytest.approx(
+        distance * 70.0 / 60.0, 1.0e-8
+    )
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.cosmology.redshift_cache import RedshiftCache
+from autogalaxy.cosmology.redshift_cache import redshift_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    redshift_cache.cache_clear()
+    yield
+    redshift_cache.cache_clear()
+
+
+def test__cached_by_redshift__values_cached_and_unchanged():
+    cosmology = ag.cosmology.Planck15()
+
+    critical_surface_density = (
+        cosmology.critical_surface_density_between_redshifts_from(
+            redshift_0=0.1, redshift_1=1.0
+        )
+    )
+
+    assert critical_surface_density == pytest.approx(17593241668, 1e-2)
+
+    misses = redshift_cache.cache_info().misses
+
+    assert cosmology.critical_surface_density_between_redshifts_from(
+        0.1, 1.0
+    ) == pytest.approx(critical_surface_density, 1.0e-12)
+    assert ag.cosmology.Planck15().critical_surface_density_between_redshifts_from(
+        redshift_0=0.1, redshift_1=1.0
+    ) == pytest.approx(critical_surface_density, 1.0e-12)
+
+    assert redshift_cache.cache_info().hits == 2
+    assert redshift_cache.cache_info().misses == misses
+
+
+def test__cached_by_redshift__different_parameters_or_array_input_not_cached():
+    kpc_per_arcsec = ag.cosmology.Planck15().kpc_per_arcsec_from(redshift=0.1)
+
+    cosmology = ag.cosmology.FlatLambdaCDM(H0=70, Om0=0.3, Tcmb0=2.725)
+
+    assert cosmology.kpc_per_arcsec_from(redshift=0.1) != pytest.approx(
+        kpc_per_arcsec, 1.0e-4
+    )
+
+    currsize = redshift_cache.cache_info().currsize
+
+    critical_density = cosmology.critical_density(np.array([0.1, 0.2]))
+
+    assert critical_density.shape == (2,)
+    assert redshift_cache.cache_info().currsize == currsize
+
+
+def test__cached_by_redshift__jax_fixed_redshifts_use_cache():
+    jax = pytest.importorskip("jax")
+    import jax.numpy as jnp
+
+    cosmology = ag.cosmology.Planck15()
+
+    kpc_per_arcsec = cosmology.kpc_per_arcsec_from(redshift=0.5)
+
+    kpc_per_arcsec_jit = jax.jit(
+        lambda: cosmology.kpc_per_arcsec_from(redshift=0.5, xp=jnp)
+    )()
+
+    assert float(kpc_per_arcsec_jit) == pytest.approx(kpc_per_arcsec, 1.0e-8)
+    assert redshift_cache.cache_info().hits == 1
+
+    kpc_per_arcsec_traced = jax.jit(
+        lambda redshift: cosmology.kpc_per_arcsec_from(redshift=redshift, xp=jnp)
+    )(0.5)
+
+    assert float(kpc_per_arcsec_traced) == pytest.approx(kpc_per_arcsec, 1.0e-8)
+    assert redshift_cache.cache_info().hits == 1
+
+
+def test__maxsize__least_recently_used_removed():
+    cache = RedshiftCache(maxsize=2)
+
+    cache.value_from(key="a", func=lambda: 1.0)
+    cache.value_from(key="b", func=lambda: 2.0)
+    cache.value_from(key="a", func=lambda: 1.0)
+    cache.value_from(key="c", func=lambda: 3.0)
+
+    assert list(cache.value_dict.keys()) == ["a", "c"]
+    assert cache.cache_info() == (1, 3, 2, 2)
+
+
+def test__prewarm():
+    cosmology = ag.cosmology.Planck15()
+
+    RedshiftCache.prewarm(cosmology=cosmology, redshift_list=[0.5, 1.0, 2.0])
+
+    misses = redshift_cache.cache_info().misses
+
+    cosmology.kpc_per_arcsec_from(redshift=1.0)
+    cosmology.critical_surface_density_between_redshifts_solar_mass_per_kpc2_from(
+        redshift_0=0.5, redshift_1=2.0
+    )
+    cosmology.scaling_factor_between_redshifts_from(
+        redshift_0=0.5, redshift_1=1.0, redshift_final=2.0
+    )
+
+    assert redshift_cache.cache_info().misses == misses
@@ -152,3 +152,18 @@ def test__points_from_major_axis():
     assert ellipse.points_from_major_axis_from(pixel_scale=1.0)[1][0] == pytest.approx(
         -0.2123224755, 1.0e-4
     )
+
+
+def test__points_and_weights_from_major_axis_from():
+    ellipse = ag.Ellipse(centre=(0.1, 0.2), ell_comps=(0.5, 0.5), major_axis=1.0)
+
+    points = ellipse.points_from_major_axis_from(pixel_scale=0.5)
+
+    points_fixed, weights = ellipse.points_and_weights_from_major_axis_from(
+        pixel_scale=0.5, total_points_max=20
+    )
+
+    assert points_fixed.shape == (19, 2)
+    assert weights.sum() == points.shape[0]
+    assert points_fixed[: points.shape[0]] == pytest.approx(points, 1.0e-8)
+    assert weights[points.shape[0] :] == pytest.approx(0.0, 1.0e-8)
@@ -1,8 +1,10 @@
 from os import path
+import pytest
 
 import autofit as af
 import autogalaxy as ag
 
+from autogalaxy.ellipse import fit_ellipse_batch
 from autogalaxy.ellipse.model.result import ResultEllipse
 
 directory = path.dirname(path.realpath(__file__))
@@ -76,3 +78,47 @@ def test__figure_of_merit(
     assert (
         fit_list[0].log_likelihood + fit_list[1].log_likelihood == fit_figure_of_merit
     )
+
+
+def test__fit_list_from__interp_shared_by_fits(masked_imaging_7x7):
+    ellipse_list = af.Collection(af.Model(ag.Ellipse) for _ in range(2))
+
+    ellipse_list[0].major_axis = 0.2
+    ellipse_list[1].major_axis = 0.4
+
+    model = af.Collection(ellipses=ellipse_list)
+
+    analysis = ag.AnalysisEllipse(dataset=masked_imaging_7x7, use_jax=False)
+
+    analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    instance = model.instance_from_prior_medians()
+
+    fit_list = analysis.fit_list_from(instance=instance)
+
+    assert fit_list[0].interp is analysis.interp
+    assert fit_list[1].interp is analysis.interp
+
+
+def test__log_likelihood_function__use_jax(masked_imaging_7x7):
+    pytest.importorskip("jax")
+
+    ellipse_list = af.Collection(af.Model(ag.Ellipse) for _ in range(2))
+
+    ellipse_list[0].major_axis = 0.2
+    ellipse_list[1].major_axis = 0.4
+
+    model = af.Collection(ellipses=ellipse_list)
+
+    instance = model.instance_from_prior_medians()
+
+    analysis = ag.AnalysisEllipse(dataset=masked_imaging_7x7, use_jax=True)
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    log_likelihood_numpy = fit_ellipse_batch.log_likelihood_from(
+        interp=analysis.interp,
+        ellipse_list=[instance.ellipses[0], instance.ellipses[1]],
+    )
+
+    assert float(log_likelihood) == pytest.approx(log_likelihood_numpy, 1.0e-8)
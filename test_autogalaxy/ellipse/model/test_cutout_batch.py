@@ -0,0 +1,190 @@
+import csv
+import numpy as np
+import pytest
+from astropy.io import fits
+
+import autofit as af
+import autogalaxy as ag
+
+from autoconf.fitsable import flip_for_ds9_from
+
+from autogalaxy.ellipse.model import cutout_batch
+
+
+class MockResult:
+    def __init__(self, max_log_likelihood_fit_list):
+        self.max_log_likelihood_fit_list = max_log_likelihood_fit_list
+
+
+class MockSearchMedian:
+    def __init__(self, name, **kwargs):
+        self.name = name
+
+    def fit(self, model, analysis):
+        return MockResult(
+            max_log_likelihood_fit_list=analysis.fit_list_from(
+                instance=model.instance_from_prior_medians()
+            )
+        )
+
+
+@pytest.fixture(name="model")
+def make_model():
+    ellipse_list = af.Collection(af.Model(ag.Ellipse) for _ in range(2))
+
+    ellipse_list[0].major_axis = 0.2
+    ellipse_list[1].major_axis = 0.4
+
+    return af.Collection(ellipses=ellipse_list)
+
+
+@pytest.fixture(name="cutouts_path")
+def make_cutouts_path(tmp_path):
+    cube = np.random.default_rng(1).uniform(1.0, 2.0, size=(3, 7, 7))
+
+    cutouts_path = tmp_path / "cutouts.fits"
+
+    fits.PrimaryHDU(cube).writeto(cutouts_path)
+
+    return cutouts_path
+
+
+def isophote_dict_list_via_output_from(output_path):
+    with open(output_path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test__cutout_list_from(cutouts_path, tmp_path):
+    assert cutout_batch.cutout_list_from(cutouts_path=cutouts_path) == [
+        ("cutouts_0", str(cutouts_path), 0),
+        ("cutouts_1", str(cutouts_path), 1),
+        ("cutouts_2", str(cutouts_path), 2),
+    ]
+
+    cutouts_dir = tmp_path / "cutouts"
+    cutouts_dir.mkdir()
+
+    fits.PrimaryHDU(np.ones((7, 7))).writeto(cutouts_dir / "galaxy_b.fits")
+    fits.PrimaryHDU(np.ones((7, 7))).writeto(cutouts_dir / "galaxy_a.fits")
+
+    assert [
+        cutout[0] for cutout in cutout_batch.cutout_list_from(cutouts_path=cutouts_dir)
+    ] == ["galaxy_a", "galaxy_b"]
+
+
+def test__dataset_via_cutout_from(cutouts_path):
+    dataset = cutout_batch.dataset_via_cutout_from(
+        file_path=cutouts_path,
+        cube_index=1,
+        pixel_scales=0.1,
+        noise_map_value=2.0,
+        mask_radius=0.25,
+    )
+
+    assert dataset.data.native == pytest.approx(
+        flip_for_ds9_from(fits.getdata(cutouts_path)[1]) * np.invert(dataset.mask),
+        1.0e-8,
+    )
+    assert dataset.noise_map.native[3, 3] == pytest.approx(2.0, 1.0e-8)
+    assert (
+        dataset.mask
+        == ag.Mask2D.circular(shape_native=(7, 7), pixel_scales=0.1, radius=0.25)
+    ).all()
+
+
+def test__fit_cutouts__isophotes_output_and_resumed(cutouts_path, tmp_path, model):
+    output_path = tmp_path / "isophotes.csv"
+
+    name_list = cutout_batch.fit_cutouts(
+        cutouts_path=cutouts_path,
+        output_path=output_path,
+        model=model,
+        search_cls=MockSearchMedian,
+        pixel_scales=0.1,
+        noise_map_value=1.0,
+    )
+
+    assert name_list == ["cutouts_0", "cutouts_1", "cutouts_2"]
+
+    isophote_dict_list = isophote_dict_list_via_output_from(output_path)
+
+    assert len(isophote_dict_list) == 6
+    assert isophote_dict_list[1]["name"] == "cutouts_0"
+    assert isophote_dict_list[1]["ellipse_index"] == "1"
+    assert float(isophote_dict_list[1]["major_axis"]) == pytest.approx(0.4, 1.0e-4)
+
+    with open(output_path) as f:
+        content = f.read()
+
+    with open(output_path, "w") as f:
+        f.write(content[: content.find("cutouts_2")] + "cutouts_2,0,0.1")
+
+    assert cutout_batch.name_list_via_output_from(output_path=output_path) == [
+        "cutouts_0",
+        "cutouts_1",
+    ]
+
+    name_list = cutout_batch.fit_cutouts(
+        cutouts_path=cutouts_path,
+        output_path=output_path,
+        model=model,
+        search_cls=MockSearchMedian,
+        pixel_scales=0.1,
+        noise_map_value=1.0,
+    )
+
+    assert name_list == ["cutouts_2"]
+    assert len(isophote_dict_list_via_output_from(output_path)) == 6
+
+
+def test__name_list_via_output_from__cutout_with_missing_isophotes_removed(
+    cutouts_path, tmp_path, model
+):
+    output_path = tmp_path / "isophotes.csv"
+
+    cutout_batch.fit_cutouts(
+        cutouts_path=cutouts_path,
+        output_path=output_path,
+        model=model,
+        search_cls=MockSearchMedian,
+        pixel_scales=0.1,
+        noise_map_value=1.0,
+    )
+
+    with open(output_path) as f:
+        line_list = f.readlines()
+
+    with open(output_path, "w") as f:
+        f.writelines(line_list[:-1])
+
+    assert cutout_batch.name_list_via_output_from(output_path=output_path) == [
+        "cutouts_0",
+        "cutouts_1",
+    ]
+    assert len(isophote_dict_list_via_output_from(output_path)) == 4
+
+
+def test__fieldnames_from():
+    ellipse_list = af.Collection(af.Model(ag.Ellipse) for _ in range(2))
+
+    fieldnames = cutout_batch.fieldnames_from(
+        model=af.Collection(ellipses=ellipse_list)
+    )
+
+    assert fieldnames[-1] == "log_likelihood"
+
+    multipole_list = [
+        [af.Model(ag.EllipseMultipole)],
+        [af.Model(ag.EllipseMultipole), af.Model(ag.EllipseMultipole)],
+    ]
+
+    fieldnames = cutout_batch.fieldnames_from(
+        model=af.Collection(ellipses=ellipse_list, multipoles=multipole_list)
+    )
+
+    assert "total_isophotes" in fieldnames
+    assert fieldnames[-3:] == [
+        "multipole_1_m",
+        "multipole_1_comps_0",
+        "multipole_1_comps_1",
+    ]
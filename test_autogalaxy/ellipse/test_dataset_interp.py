@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import autogalaxy as ag
@@ -53,3 +54,30 @@ def test__noise_map_interp():
     interp = ag.DatasetInterp(dataset=dataset)
 
     assert interp.noise_map_interp((0.5, 0.5)) == pytest.approx(7.0, 1.0e-4)
+
+
+def test__mask_data_and_noise_map_interp_from__matches_interpolators():
+    data = ag.Array2D.no_mask(
+        values=[[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]], pixel_scales=1.0
+    )
+    noise_map = ag.Array2D.no_mask(
+        values=[[2.0, 2.0, 3.0], [1.0, 5.0, 6.0], [7.0, 4.0, 9.0]], pixel_scales=1.0
+    )
+
+    mask = ag.Mask2D(
+        mask=[[False, False, False], [False, True, False], [False, False, False]],
+        pixel_scales=1.0,
+    )
+
+    dataset = ag.Imaging(data=data.apply_mask(mask=mask), noise_map=noise_map)
+
+    interp = ag.DatasetInterp(dataset=dataset)
+
+    points = np.array([[0.5, 0.5], [-0.3, 0.8], [1.0, -1.0], [0.2, 1.5]])
+
+    mask, data, noise_map = interp.mask_data_and_noise_map_interp_from(points=points)
+
+    assert mask == pytest.approx(interp.mask_interp(points), 1.0e-8)
+    assert data == pytest.approx(interp.data_interp(points), 1.0e-8)
+    assert noise_map == pytest.approx(interp.noise_map_interp(points), 1.0e-8)
+    assert noise_map[3] == 0.0
@@ -67,6 +67,27 @@ def test___points_from_major_axis__multipole(imaging_lh):
     assert fit._points_from_major_axis[1, 1] == pytest.approx(0.038856679, 1.0e-4)
 
 
+def test__points_from_major_axis__masked_points_replaced(imaging_lh_masked):
+    ellipse_0 = ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.0, 0.0), major_axis=1.0)
+
+    fit = ag.FitEllipse(dataset=imaging_lh_masked, ellipse=ellipse_0)
+
+    total_points = ellipse_0.points_from_major_axis_from(pixel_scale=1.0).shape[0]
+
+    assert fit._points_from_major_axis.shape[0] == total_points
+    assert np.all(fit.interp.mask_interp(fit._points_from_major_axis) == 0.0)
+
+
+def test__interp__input_interp_used(imaging_lh):
+    ellipse_0 = ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.5, 0.5), major_axis=1.0)
+
+    interp = ag.DatasetInterp(dataset=imaging_lh)
+
+    fit = ag.FitEllipse(dataset=imaging_lh, ellipse=ellipse_0, interp=interp)
+
+    assert fit.interp is interp
+
+
 # def test__mask_interp(imaging_lh, imaging_lh_masked):
 #     ellipse_0 = ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.0, 0.0), major_axis=1.0)
 #
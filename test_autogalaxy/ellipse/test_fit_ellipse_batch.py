@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.ellipse import fit_ellipse_batch
+
+
+@pytest.fixture(name="imaging_batch")
+def make_imaging_batch():
+    data = ag.Array2D.no_mask(
+        values=np.random.default_rng(1).normal(size=(21, 21)) + 5.0,
+        pixel_scales=0.1,
+    )
+    noise_map = ag.Array2D.no_mask(
+        values=np.random.default_rng(2).uniform(0.5, 1.5, size=(21, 21)),
+        pixel_scales=0.1,
+    )
+
+    return ag.Imaging(data=data, noise_map=noise_map)
+
+
+def test__chi_squared_list_via_stacked_points_from__matches_fit_ellipse(
+    imaging_batch,
+):
+    mask = ag.Mask2D.circular(
+        shape_native=(21, 21), pixel_scales=0.1, radius=0.8, centre=(0.2, 0.0)
+    )
+
+    dataset = imaging_batch.apply_mask(mask=mask)
+
+    ellipse_list = [
+        ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.2, 0.1), major_axis=0.3),
+        ag.Ellipse(centre=(0.1, 0.0), ell_comps=(0.1, -0.1), major_axis=0.7),
+        ag.Ellipse(centre=(0.0, 0.0), ell_comps=(0.0, 0.0), major_axis=0.5),
+    ]
+    multipole_lists = [
+        None,
+        [ag.EllipseMultipole(m=4, multipole_comps=(0.05, 0.02))],
+        None,
+    ]
+
+    interp = ag.DatasetInterp(dataset=dataset)
+
+    points_list = fit_ellipse_batch.points_list_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    chi_squared_list = fit_ellipse_batch.chi_squared_list_via_stacked_points_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    fit_list = [
+        ag.FitEllipse(
+            dataset=dataset,
+            ellipse=ellipse_list[i],
+            multipole_list=multipole_lists[i],
+        )
+        for i in range(len(ellipse_list))
+    ]
+
+    for points, chi_squared, fit in zip(points_list, chi_squared_list, fit_list):
+        assert points == pytest.approx(fit._points_from_major_axis, 1.0e-8)
+        assert chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+
+    log_likelihood = fit_ellipse_batch.log_likelihood_via_stacked_points_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    assert log_likelihood == pytest.approx(
+        sum(fit.log_likelihood for fit in fit_list), 1.0e-8
+    )
+
+
+def test__chi_squared_list_from__matches_fit_ellipse(imaging_batch):
+    ellipse_list = [
+        ag.Ellipse(centre=(0.05, -0.1), ell_comps=(0.2, 0.1), major_axis=0.3),
+        ag.Ellipse(centre=(0.05, -0.1), ell_comps=(0.1, -0.1), major_axis=0.7),
+    ]
+    multipole_lists = [
+        [ag.EllipseMultipole(m=4, multipole_comps=(0.05, 0.02))],
+        [
+            ag.EllipseMultipoleScaled(
+                m=3, scaled_multipole_comps=(0.02, 0.01), major_axis=0.7
+            )
+        ],
+    ]
+
+    interp = ag.DatasetInterp(dataset=imaging_batch)
+
+    chi_squared_list = fit_ellipse_batch.chi_squared_list_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    for i in range(len(ellipse_list)):
+        fit = ag.FitEllipse(
+            dataset=imaging_batch,
+            ellipse=ellipse_list[i],
+            multipole_list=multipole_lists[i],
+        )
+
+        assert chi_squared_list[i] == pytest.approx(fit.chi_squared, 1.0e-8)
+
+    log_likelihood = fit_ellipse_batch.log_likelihood_from(
+        interp=interp, ellipse_list=ellipse_list, multipole_lists=multipole_lists
+    )
+
+    assert log_likelihood == pytest.approx(-0.5 * sum(chi_squared_list), 1.0e-8)
+
+
+def test__log_likelihood_from__jax_vmap(imaging_batch):
+    jax = pytest.importorskip("jax")
+    import jax.numpy as jnp
+
+    interp = ag.DatasetInterp(dataset=imaging_batch)
+
+    def log_likelihood_from(vector, xp):
+        ellipse = ag.Ellipse(
+            centre=(vector[0], vector[1]),
+            ell_comps=(vector[2], vector[3]),
+            major_axis=vector[4],
+        )
+
+        return fit_ellipse_batch.log_likelihood_from(
+            interp=interp,
+            ellipse_list=[ellipse],
+            multipole_lists=[
+                [ag.EllipseMultipole(m=4, multipole_comps=(vector[5], vector[6]))]
+            ],
+            xp=xp,
+        )
+
+    parameters = np.array(
+        [
+            [0.0, 0.0, 0.1, 0.1, 0.5, 0.01, 0.02],
+            [0.1, 0.0, 0.0, 0.1, 0.8, 0.0, 0.02],
+        ]
+    )
+
+    log_likelihoods = jax.jit(
+        jax.vmap(lambda vector: log_likelihood_from(vector, jnp))
+    )(parameters)
+
+    assert np.asarray(log_likelihoods) == pytest.approx(
+        [log_likelihood_from(vector, np) for vector in parameters], 1.0e-8
+    )
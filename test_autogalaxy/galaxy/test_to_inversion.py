@@ -2,6 +2,11 @@ import numpy as np
 import pytest
 
 import autogalaxy as ag
+from autoconf.conf import with_config
+from autogalaxy.analysis.inversion_cache import InversionCache
+from autogalaxy.galaxy.to_inversion import InversionImagingMappingCached
+from autogalaxy.galaxy.to_inversion import InversionInterferometerMappingCached
+from autogalaxy.galaxy.to_inversion import InversionInterferometerMappingOverride
 
 
 def test__lp_linear_func_list_galaxy_dict__no_linear_profiles__returns_empty_dict(
@@ -241,6 +246,56 @@ def test__inversion_interferometer_from__linear_light_profile__correct_reconstru
     assert inversion.reconstruction[0] == pytest.approx(0.04124846952, 1.0e-2)
 
 
+@with_config("general", "interferometer", "use_visibilities_via_uv", value=True)
+def test__inversion_interferometer_from__linear_gaussians__visibilities_computed_via_uv(
+    interferometer_7,
+):
+    g_linear = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp_basis.Basis(
+            profile_list=[
+                ag.lp_linear.Gaussian(centre=(0.05, 0.05), sigma=0.5),
+                ag.lp_linear.Gaussian(centre=(0.05, 0.05), sigma=1.0),
+            ]
+        ),
+    )
+
+    to_inversion = ag.GalaxiesToInversion(
+        dataset=interferometer_7,
+        galaxies=[ag.Galaxy(redshift=0.5), g_linear],
+    )
+
+    inversion = to_inversion.inversion
+
+    lp_linear_func = inversion.linear_obj_list[0]
+
+    assert isinstance(inversion, InversionInterferometerMappingOverride)
+    assert lp_linear_func.transformer is interferometer_7.transformer
+    assert inversion.operated_mapping_matrix == pytest.approx(
+        lp_linear_func.transformed_mapping_matrix, 1.0e-4
+    )
+    assert lp_linear_func.transformed_mapping_matrix[:, 1] == pytest.approx(
+        g_linear.bulge.light_profile_list[1].visibilities_via_uv_from(
+            transformer=interferometer_7.transformer
+        ),
+        1.0e-4,
+    )
+
+    g_linear = ag.Galaxy(
+        redshift=0.5, light_linear=ag.lp_linear.Sersic(centre=(0.05, 0.05))
+    )
+
+    to_inversion = ag.GalaxiesToInversion(
+        dataset=interferometer_7,
+        galaxies=[g_linear],
+    )
+
+    inversion = to_inversion.inversion
+
+    assert not isinstance(inversion, InversionInterferometerMappingOverride)
+    assert inversion.linear_obj_list[0].transformer is None
+
+
 def test__inversion_interferometer_from__rectangular_pixelization__reconstructed_visibilities_match_input(
     grid_2d_7x7, interferometer_7
 ):
@@ -265,6 +320,85 @@ def test__inversion_interferometer_from__rectangular_pixelization__reconstructed
     )
 
 
+def test__inversion_imaging_from__inversion_cache__matrices_reused_across_regularization(
+    masked_imaging_7x7,
+):
+    inversion_cache = InversionCache()
+
+    for coefficient in [1.0, 2.0]:
+        pixelization = ag.Pixelization(
+            mesh=ag.mesh.RectangularUniform(shape=(3, 3)),
+            regularization=ag.reg.Constant(coefficient=coefficient),
+        )
+
+        galaxies = [ag.Galaxy(redshift=0.5, pixelization=pixelization)]
+
+        inversion = ag.GalaxiesToInversion(
+            dataset=masked_imaging_7x7, galaxies=galaxies
+        ).inversion
+
+        inversion_cached = ag.GalaxiesToInversion(
+            dataset=masked_imaging_7x7,
+            galaxies=galaxies,
+            inversion_cache=inversion_cache,
+        ).inversion
+
+        assert isinstance(inversion_cached, InversionImagingMappingCached)
+        assert inversion_cached.linear_obj_list[0].regularization is (
+            pixelization.regularization
+        )
+        assert inversion_cached.curvature_matrix == pytest.approx(
+            inversion.curvature_matrix, 1.0e-8
+        )
+        assert inversion_cached.log_det_curvature_reg_matrix_term == pytest.approx(
+            inversion.log_det_curvature_reg_matrix_term, 1.0e-8
+        )
+        assert inversion_cached.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+
+    assert inversion_cache.cache_info().misses == 3
+    assert inversion_cache.cache_info().hits == 3
+
+
+def test__inversion_interferometer_from__inversion_cache__matrices_reused_across_regularization(
+    interferometer_7,
+):
+    inversion_cache = InversionCache()
+
+    for coefficient in [1.0, 2.0]:
+        pixelization = ag.Pixelization(
+            mesh=ag.mesh.RectangularUniform(shape=(3, 3)),
+            regularization=ag.reg.Constant(coefficient=coefficient),
+        )
+
+        galaxies = [
+            ag.Galaxy(redshift=0.5, pixelization=pixelization),
+            ag.Galaxy(redshift=0.5, bulge=ag.lp_linear.Gaussian()),
+        ]
+
+        inversion = ag.GalaxiesToInversion(
+            dataset=interferometer_7, galaxies=galaxies
+        ).inversion
+
+        inversion_cached = ag.GalaxiesToInversion(
+            dataset=interferometer_7,
+            galaxies=galaxies,
+            inversion_cache=inversion_cache,
+        ).inversion
+
+        assert isinstance(inversion_cached, InversionInterferometerMappingCached)
+        assert inversion_cached.curvature_matrix == pytest.approx(
+            inversion.curvature_matrix, 1.0e-8
+        )
+        assert inversion_cached.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+
+    assert inversion_cache.cache_info().misses == 2
+    assert inversion_cache.cache_info().hits == 2
+
+
 def test__raises_exception_if_noise_covariance_input(masked_imaging_covariance_7x7):
     with pytest.raises(ag.exc.InversionException):
         ag.GalaxiesToInversion(
@@ -1,4 +1,5 @@
 from os import path
+import pytest
 
 import autofit as af
 import autogalaxy as ag
@@ -37,3 +38,35 @@ def test__figure_of_merit__matches_correct_fit_given_galaxy_profiles(
     fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=galaxies)
 
     assert fit.log_likelihood == fit_figure_of_merit
+
+
+def test__figure_of_merit__pixelization_matrices_reused_via_inversion_cache(
+    masked_imaging_7x7,
+):
+    pixelization = af.Model(
+        ag.Pixelization,
+        mesh=ag.mesh.RectangularUniform(shape=(3, 3)),
+        regularization=af.Model(ag.reg.Constant),
+    )
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            galaxy=af.Model(ag.Galaxy, redshift=0.5, pixelization=pixelization)
+        )
+    )
+
+    analysis = ag.AnalysisImaging(dataset=masked_imaging_7x7, use_jax=False)
+
+    for unit_value in [0.4, 0.6]:
+        instance = model.instance_from_unit_vector([unit_value])
+
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+        fit = ag.FitImaging(
+            dataset=masked_imaging_7x7,
+            galaxies=analysis.galaxies_via_instance_from(instance=instance),
+        )
+
+        assert fit.figure_of_merit == pytest.approx(fit_figure_of_merit, 1.0e-8)
+
+    assert analysis.inversion_cache.cache_info().misses == 3
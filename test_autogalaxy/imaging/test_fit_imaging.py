@@ -31,6 +31,26 @@ def test__model_image__no_psf_blurring__correct_log_likelihood(
     assert fit.log_likelihood == pytest.approx(-14.63377, 1.0e-4)
 
 
+def test__intermediates__each_evaluated_once(masked_imaging_7x7):
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(intensity=1.0),
+        disk=ag.lp_linear.Exponential(),
+    )
+
+    fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[g0])
+
+    fit.figure_of_merit
+    fit.model_data
+    fit.profile_subtracted_image
+
+    assert fit.evaluation_counter["blurred_image"] == 1
+    assert fit.evaluation_counter["profile_subtracted_image"] == 1
+    assert fit.evaluation_counter["galaxies_to_inversion"] == 1
+    assert fit.evaluation_counter["inversion"] == 1
+    assert fit.evaluation_counter["model_data"] == 1
+
+
 def test__model_image__with_psf_blurring__correct_slim_values(masked_imaging_7x7):
     g0 = ag.Galaxy(
         redshift=0.5,
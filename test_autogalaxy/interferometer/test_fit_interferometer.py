@@ -109,6 +109,25 @@ def test__fit_figure_of_merit__various_galaxy_configs__correct_value_and_inversi
     assert fit.figure_of_merit == pytest.approx(expected_fom, 1.0e-4)
 
 
+def test__intermediates__each_evaluated_once(interferometer_7):
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.Sersic(intensity=1.0),
+        disk=ag.lp_linear.Exponential(),
+    )
+
+    fit = ag.FitInterferometer(dataset=interferometer_7, galaxies=[g0])
+
+    fit.figure_of_merit
+    fit.model_data
+    fit.profile_subtracted_visibilities
+
+    assert fit.evaluation_counter["profile_visibilities"] == 1
+    assert fit.evaluation_counter["profile_subtracted_visibilities"] == 1
+    assert fit.evaluation_counter["galaxies_to_inversion"] == 1
+    assert fit.evaluation_counter["model_data"] == 1
+
+
 def test__fit_figure_of_merit__linear_light_plus_pixelization__log_evidence_correct(
     interferometer_7,
 ):
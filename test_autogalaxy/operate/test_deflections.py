@@ -102,10 +102,10 @@ def test__hessian_from__diagonal_grid__correct_values():
     od = LensCalc.from_mass_obj(mp)
     hessian_yy, hessian_xy, hessian_yx, hessian_xx = od.hessian_from(grid=grid)
 
-    assert hessian_yy == pytest.approx(np.array([1.3883822, 0.694127]), 1.0e-4)
-    assert hessian_xy == pytest.approx(np.array([-1.388124, -0.694094]), 1.0e-4)
-    assert hessian_yx == pytest.approx(np.array([-1.388165, -0.694099]), 1.0e-4)
-    assert hessian_xx == pytest.approx(np.array([1.3883824, 0.694127]), 1.0e-4)
+    assert hessian_yy == pytest.approx(np.array([1.388211, 0.694106]), 1.0e-4)
+    assert hessian_xy == pytest.approx(np.array([-1.388211, -0.694106]), 1.0e-4)
+    assert hessian_yx == pytest.approx(np.array([-1.388211, -0.694106]), 1.0e-4)
+    assert hessian_xx == pytest.approx(np.array([1.388211, 0.694106]), 1.0e-4)
 
 
 def test__hessian_from__axis_aligned_grid__correct_values():
@@ -124,6 +124,117 @@ def test__hessian_from__axis_aligned_grid__correct_values():
     assert hessian_xx == pytest.approx(np.array([2.22209, 0.0]), 1.0e-4)
 
 
+@pytest.mark.parametrize(
+    "mass_obj",
+    [
+        ag.mp.PowerLaw(
+            centre=(0.1, 0.2), ell_comps=(0.1, 0.05), einstein_radius=1.3, slope=2.3
+        ),
+        ag.mp.Isothermal(centre=(0.1, 0.2), ell_comps=(0.1, 0.05), einstein_radius=1.3),
+        ag.mp.NFWSph(centre=(0.1, 0.2), kappa_s=0.3, scale_radius=2.0),
+        ag.mp.PIEMass(centre=(0.1, 0.2), ell_comps=(0.1, 0.05), ra=0.2, b0=1.0),
+        ag.mp.dPIEMass(
+            centre=(0.1, 0.2), ell_comps=(0.1, 0.05), ra=0.2, rs=2.0, b0=1.0
+        ),
+        ag.mp.dPIEMassSph(centre=(0.1, 0.2), ra=0.2, rs=2.0, b0=1.0),
+        ag.mp.MassSheet(centre=(0.1, 0.2), kappa=0.3),
+        ag.mp.ExternalShear(gamma_1=0.05, gamma_2=-0.03),
+        ag.Galaxy(
+            redshift=0.5,
+            mass=ag.mp.Isothermal(ell_comps=(0.1, 0.05), einstein_radius=1.3),
+            shear=ag.mp.ExternalShear(gamma_1=0.05, gamma_2=-0.03),
+        ),
+    ],
+)
+def test__hessian_from__analytical_hessian__matches_finite_difference(mass_obj):
+    grid = ag.Grid2DIrregular(
+        values=[(0.5, 0.3), (1.1, -0.7), (-0.4, 0.9), (-1.3, -1.2)]
+    )
+
+    od = LensCalc.from_mass_obj(mass_obj)
+
+    assert od.hessian_2d_from is not None
+
+    hessian = od.hessian_from(grid=grid)
+    hessian_via_finite_difference = od._hessian_via_finite_difference(
+        grid=grid, buffer=1.0e-5
+    )
+
+    for component, component_via_finite_difference in zip(
+        hessian, hessian_via_finite_difference
+    ):
+        assert component == pytest.approx(
+            np.array(component_via_finite_difference), abs=1.0e-6
+        )
+
+
+@pytest.mark.parametrize(
+    "mass_profile",
+    [
+        ag.mp.PowerLaw(
+            centre=(0.1, 0.2), ell_comps=(0.1, 0.05), einstein_radius=1.3, slope=2.3
+        ),
+        ag.mp.IsothermalSph(centre=(0.1, 0.2), einstein_radius=1.3),
+        ag.mp.NFWSph(centre=(0.1, 0.2), kappa_s=0.3, scale_radius=2.0),
+    ],
+)
+def test__analytical_hessian_2d_from__profile_centre__finite(mass_profile):
+    grid = ag.Grid2DIrregular(values=[(0.1, 0.2), (0.5, 0.3)])
+
+    hessian = mass_profile.analytical_hessian_2d_from(grid=grid)
+
+    for component in hessian:
+        assert np.isfinite(np.array(component)).all()
+
+    hessian_off_centre = mass_profile.analytical_hessian_2d_from(
+        grid=ag.Grid2DIrregular(values=[(0.5, 0.3)])
+    )
+
+    for component, component_off_centre in zip(hessian, hessian_off_centre):
+        assert np.array(component)[1] == pytest.approx(
+            np.array(component_off_centre)[0], 1.0e-8
+        )
+
+
+def test__hessian_from__no_analytical_hessian__uses_finite_difference():
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        mass=ag.mp.Isothermal(einstein_radius=1.3),
+        core=ag.mp.IsothermalCore(einstein_radius=0.5, core_radius=0.1),
+    )
+
+    assert galaxy.has_analytical_hessian is False
+    assert LensCalc.from_mass_obj(galaxy).hessian_2d_from is None
+    assert LensCalc.from_mass_obj(ag.Galaxies([galaxy])).hessian_2d_from is None
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2])
+def test__hessian_from__jax__matches_finite_difference(chunk_size):
+    import jax.numpy as jnp
+
+    grid = ag.Grid2DIrregular(values=[(0.5, 0.3), (1.1, -0.7), (-0.4, 0.9)])
+
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        mass=ag.mp.Isothermal(ell_comps=(0.1, 0.05), einstein_radius=1.3),
+        core=ag.mp.IsothermalCore(einstein_radius=0.5, core_radius=0.1),
+    )
+
+    od = LensCalc.from_mass_obj(galaxy)
+
+    hessian = od.hessian_from(grid=grid, xp=jnp, chunk_size=chunk_size)
+    hessian_via_finite_difference = od._hessian_via_finite_difference(
+        grid=grid, buffer=1.0e-4
+    )
+
+    for component, component_via_finite_difference in zip(
+        hessian, hessian_via_finite_difference
+    ):
+        assert np.array(component) == pytest.approx(
+            np.array(component_via_finite_difference), abs=1.0e-4
+        )
+
+
 def test__convergence_2d_via_hessian_from():
     grid = ag.Grid2DIrregular(
         values=[(1.075, -0.125), (-0.875, -0.075), (-0.925, -0.075), (0.075, 0.925)]
@@ -152,7 +263,7 @@ def test__magnification_2d_via_hessian_from():
     od = LensCalc.from_mass_obj(mp)
     magnification = od.magnification_2d_via_hessian_from(grid=grid)
 
-    assert magnification.in_list[0] == pytest.approx(-0.56303, 1.0e-4)
+    assert magnification.in_list[0] == pytest.approx(-0.56293, 1.0e-4)
     assert magnification.in_list[1] == pytest.approx(-2.57591, 1.0e-4)
 
 
@@ -544,3 +655,135 @@ def test__jacobian_from():
     assert magnification_via_jacobian == pytest.approx(
         np.array(magnification_via_hessian), rel=1e-6
     )
+
+
+def test__lensing_maps_from__maps_match_hessian():
+    grid = ag.Grid2DIrregular(values=[(1.0, 1.0), (2.0, 0.5), (-0.5, 1.5)])
+
+    mp = ag.mp.Isothermal(
+        centre=(0.0, 0.0), ell_comps=(0.0, -0.111111), einstein_radius=2.0
+    )
+
+    od = LensCalc.from_mass_obj(mp)
+
+    hessian_yy, hessian_xy, hessian_yx, hessian_xx = od.hessian_from(grid=grid)
+
+    lensing_maps = od.lensing_maps_from(grid=grid)
+
+    convergence = 0.5 * (hessian_yy + hessian_xx)
+    shear = np.sqrt((0.5 * (hessian_xx - hessian_yy)) ** 2 + hessian_xy**2)
+
+    assert lensing_maps.convergence == pytest.approx(convergence, 1.0e-8)
+    assert lensing_maps.tangential_eigen_value == pytest.approx(
+        1 - convergence - shear, 1.0e-8
+    )
+    assert lensing_maps.radial_eigen_value == pytest.approx(
+        1 - convergence + shear, 1.0e-8
+    )
+    assert lensing_maps.magnification == pytest.approx(
+        1.0 / ((1 - hessian_xx) * (1 - hessian_yy) - hessian_xy * hessian_yx),
+        1.0e-8,
+    )
+
+
+def test__lensing_maps_from__cached_per_grid__hessian_computed_once():
+    grid = ag.Grid2D.uniform(shape_native=(20, 20), pixel_scales=0.25)
+
+    mp = ag.mp.Isothermal(
+        centre=(0.0, 0.0), ell_comps=(0.0, -0.111111), einstein_radius=2.0
+    )
+
+    od = LensCalc.from_mass_obj(mp)
+
+    hessian_from = od.hessian_from
+    hessian_grid_list = []
+
+    def hessian_counted_from(grid, xp=np):
+        hessian_grid_list.append(grid)
+        return hessian_from(grid=grid, xp=xp)
+
+    od.hessian_from = hessian_counted_from
+
+    od.tangential_critical_curve_list_from(grid=grid, pixel_scale=0.1)
+    od.radial_critical_curve_list_from(grid=grid, pixel_scale=0.1)
+    od.tangential_caustic_list_from(grid=grid, pixel_scale=0.1)
+    od.radial_caustic_list_from(grid=grid, pixel_scale=0.1)
+    od.einstein_radius_list_from(grid=grid, pixel_scale=0.1)
+
+    assert len(hessian_grid_list) == 1
+
+    od.magnification_2d_via_hessian_from(grid=grid)
+    od.magnification_2d_via_hessian_from(grid=grid)
+
+    assert len(hessian_grid_list) == 2
+
+
+def test__einstein_radius_from__precision__quadtree_refinement_sub_milliarcsecond():
+    grid = ag.Grid2D.uniform(shape_native=(60, 60), pixel_scales=0.1)
+
+    mp = ag.mp.IsothermalSph(centre=(0.0, 0.0), einstein_radius=2.0)
+
+    od = LensCalc.from_mass_obj(mp)
+
+    einstein_radius = od.einstein_radius_from(
+        grid=grid, pixel_scale=0.05, precision=0.001
+    )
+
+    assert einstein_radius == pytest.approx(2.0, abs=1.0e-5)
+
+    tangential_critical_curve_list = od.tangential_critical_curve_list_from(
+        grid=grid, pixel_scale=0.05, precision=0.001
+    )
+
+    radii = np.sqrt(
+        tangential_critical_curve_list[0][:, 0] ** 2
+        + tangential_critical_curve_list[0][:, 1] ** 2
+    )
+
+    assert radii == pytest.approx(2.0, abs=1.0e-5)
+
+
+def test__einstein_radius_from__precision__coarse_evaluation_grid_refined():
+    grid = ag.Grid2D.uniform(shape_native=(60, 60), pixel_scales=0.1)
+
+    mp = ag.mp.IsothermalSph(centre=(0.0, 0.0), einstein_radius=2.0)
+
+    od = LensCalc.from_mass_obj(mp)
+
+    hessian_from = od.hessian_from
+    hessian_grid_list = []
+
+    def hessian_counted_from(grid, xp=np):
+        hessian_grid_list.append(grid)
+        return hessian_from(grid=grid, xp=xp)
+
+    od.hessian_from = hessian_counted_from
+
+    einstein_radius = od.einstein_radius_from(grid=grid, precision=0.01)
+
+    assert einstein_radius == pytest.approx(2.0, abs=1.0e-4)
+
+    # The quadtree starts from a 30 x 30 grid at the config's `quadtree_pixel_scale` of 0.2", instead of the
+    # 120 x 120 evaluation grid at the default `pixel_scale` of 0.05".
+
+    assert len(hessian_grid_list[0]) == 30 * 30
+    assert sum(len(grid) for grid in hessian_grid_list) < 120 * 120
+
+
+def test__radial_critical_curve_list_from__precision__quadtree_refinement():
+    grid = ag.Grid2D.uniform(shape_native=(50, 50), pixel_scales=0.2)
+
+    mp = ag.mp.PowerLawSph(centre=(0.5, 1.0), einstein_radius=2.0, slope=1.5)
+
+    od = LensCalc.from_mass_obj(mp)
+
+    radial_critical_curve_list = od.radial_critical_curve_list_from(
+        grid=grid, precision=0.001
+    )
+
+    radii = np.sqrt(
+        (radial_critical_curve_list[0][:, 0] - 0.5) ** 2
+        + (radial_critical_curve_list[0][:, 1] - 1.0) ** 2
+    )
+
+    assert radii == pytest.approx(0.5, abs=1.0e-4)
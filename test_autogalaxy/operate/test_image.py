@@ -5,6 +5,8 @@ import pytest
 
 import autogalaxy as ag
 
+from autoconf.conf import with_config
+
 grid = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [2.0, 4.0]])
 
 
@@ -67,6 +69,83 @@ def test__blurred_image_2d_from__galaxy_with_operated_and_non_operated_profiles_
     )
 
 
+def test__image_2d_not_operated_and_operated_from__matches_image_2d_from_with_operated_only(
+    grid_2d_7x7,
+):
+    basis = ag.lp_basis.Basis(
+        profile_list=[
+            ag.lp.Gaussian(intensity=1.0, sigma=0.5),
+            ag.lp_operated.Gaussian(intensity=2.0, sigma=1.0),
+            ag.lp_linear.Gaussian(sigma=2.0),
+        ]
+    )
+
+    g0 = ag.Galaxy(
+        redshift=0.5,
+        light=ag.lp.Sersic(intensity=1.0),
+        light_operated=ag.lp_operated.Gaussian(intensity=1.0),
+        basis=basis,
+    )
+    g1 = ag.Galaxy(redshift=0.5, light=ag.lp.Exponential(intensity=3.0))
+    g2 = ag.Galaxy(redshift=0.5)
+
+    galaxies = ag.Galaxies(galaxies=[g0, g1, g2])
+
+    (
+        image_2d_not_operated,
+        image_2d_operated,
+    ) = galaxies.image_2d_not_operated_and_operated_from(grid=grid_2d_7x7)
+
+    assert image_2d_not_operated.array == pytest.approx(
+        galaxies.image_2d_from(grid=grid_2d_7x7, operated_only=False).array, 1.0e-8
+    )
+    assert image_2d_operated.array == pytest.approx(
+        galaxies.image_2d_from(grid=grid_2d_7x7, operated_only=True).array, 1.0e-8
+    )
+
+    (
+        image_2d_not_operated,
+        image_2d_operated,
+    ) = g1.image_2d_not_operated_and_operated_from(grid=grid_2d_7x7)
+
+    assert image_2d_not_operated.array == pytest.approx(
+        g1.image_2d_from(grid=grid_2d_7x7).array, 1.0e-8
+    )
+    assert image_2d_operated is None
+
+    assert g2.image_2d_not_operated_and_operated_from(grid=grid_2d_7x7) == (
+        None,
+        None,
+    )
+
+
+def test__blurred_image_2d_from__only_operated_profiles__operated_image_unblurred(
+    grid_2d_7x7,
+    blurring_grid_2d_7x7,
+    psf_3x3,
+):
+    light_operated = ag.lp_operated.Gaussian(intensity=1.0)
+
+    galaxy = ag.Galaxy(redshift=0.5, light_operated=light_operated)
+
+    blurred_image_2d = galaxy.blurred_image_2d_from(
+        grid=grid_2d_7x7, psf=psf_3x3, blurring_grid=blurring_grid_2d_7x7
+    )
+
+    assert blurred_image_2d.array == pytest.approx(
+        light_operated.image_2d_from(grid=grid_2d_7x7).array, 1.0e-8
+    )
+
+    galaxy = ag.Galaxy(redshift=0.5)
+
+    blurred_image_2d = galaxy.blurred_image_2d_from(
+        grid=grid_2d_7x7, psf=psf_3x3, blurring_grid=blurring_grid_2d_7x7
+    )
+
+    assert blurred_image_2d.shape_slim == grid_2d_7x7.shape_slim
+    assert blurred_image_2d.array == pytest.approx(0.0, 1.0e-8)
+
+
 def test__x1_galaxies__padded_image__compare_to_galaxy_images_using_padded_grid_stack(
     grid_2d_7x7,
 ):
@@ -182,6 +261,64 @@ def test__visibilities_from_grid_and_transformer(grid_2d_7x7, transformer_7x7_7)
     assert visibilities.array == pytest.approx(lp_visibilities.array, 1.0e-4)
 
 
+@with_config("general", "interferometer", "use_visibilities_via_uv", value=True)
+def test__visibilities_from__gaussians__computed_via_uv():
+    mask = ag.Mask2D.all_false(shape_native=(80, 80), pixel_scales=0.05)
+
+    grid = ag.Grid2D.from_mask(mask=mask, over_sample_size=1)
+
+    transformer = ag.TransformerDFT(
+        uv_wavelengths=np.array(
+            [[1.0e4, 2.0e4], [-5.0e4, 3.0e4], [8.0e4, -6.0e4], [0.0, 0.0]]
+        ),
+        real_space_mask=mask,
+    )
+
+    lp = ag.lp.Gaussian(
+        centre=(0.1, 0.1), ell_comps=(0.1, 0.0), intensity=1.0, sigma=0.3
+    )
+
+    lp_visibilities = lp.visibilities_from(grid=grid, transformer=transformer)
+
+    visibilities = transformer.visibilities_from(image=lp.image_2d_from(grid=grid))
+
+    assert lp_visibilities.array == pytest.approx(visibilities.array, 1.0e-4)
+
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp_basis.Basis(profile_list=[lp, ag.lp_linear.Gaussian()]),
+        mass=ag.mp.Isothermal(),
+    )
+
+    galaxy_visibilities = galaxy.visibilities_from(grid=grid, transformer=transformer)
+
+    assert galaxy.has_visibilities_via_uv
+    assert galaxy_visibilities.array == pytest.approx(visibilities.array, 1.0e-4)
+
+    galaxy = ag.Galaxy(redshift=0.5, bulge=lp, disk=ag.lp.Sersic())
+
+    assert not galaxy.has_visibilities_via_uv
+
+
+def test__visibilities_from__gaussians__default_config__computed_via_image(
+    grid_2d_7x7, transformer_7x7_7
+):
+    lp = ag.lp.Gaussian(centre=(0.1, 0.1), ell_comps=(0.1, 0.0), intensity=1.0)
+
+    lp_visibilities = lp.visibilities_from(
+        grid=grid_2d_7x7, transformer=transformer_7x7_7
+    )
+
+    visibilities = transformer_7x7_7.visibilities_from(
+        image=lp.image_2d_from(grid=grid_2d_7x7)
+    )
+
+    assert lp_visibilities.array == pytest.approx(visibilities.array, 1.0e-4)
+    assert lp_visibilities.array != pytest.approx(
+        lp.visibilities_via_uv_from(transformer=transformer_7x7_7), 1.0e-4
+    )
+
+
 def test__blurred_image_2d_list_from__two_non_operated_profiles__each_profile_correctly_blurred(
     grid_2d_7x7,
     blurring_grid_2d_7x7,
@@ -374,3 +511,29 @@ def test__galaxy_visibilities_dict_from(grid_2d_7x7, transformer_7x7_7):
     assert (visibilities_dict[g0] == visibilities_list[1]).all()
     assert (visibilities_dict[g1] == visibilities_list[0]).all()
     assert (visibilities_dict[g2] == visibilities_list[2]).all()
+
+
+def test__galaxy_visibilities_dict_from__stacked_transform_matches_each_image_transformed(
+    grid_2d_7x7, transformer_7x7_7
+):
+    g0 = ag.Galaxy(redshift=0.5, light_profile=ag.lp.Sersic(intensity=1.0))
+    g1 = ag.Galaxy(redshift=0.5, mass_profile=ag.mp.IsothermalSph())
+    g2 = ag.Galaxy(redshift=0.5, light_profile=ag.lp.Exponential(intensity=3.0))
+
+    galaxies = ag.Galaxies(galaxies=[g0, g1, g2])
+
+    visibilities_dict = galaxies.galaxy_visibilities_dict_from(
+        grid=grid_2d_7x7, transformer=transformer_7x7_7
+    )
+
+    for galaxy in [g0, g2]:
+        visibilities = transformer_7x7_7.visibilities_from(
+            image=galaxy.image_2d_from(grid=grid_2d_7x7)
+        )
+
+        assert visibilities_dict[galaxy].array == pytest.approx(
+            visibilities.array, 1.0e-4
+        )
+
+    assert list(visibilities_dict.keys()) == [g0, g1, g2]
+    assert (visibilities_dict[g1].array == 0.0).all()
@@ -0,0 +1,204 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autogalaxy as ag
+
+from autogalaxy.operate import lens_calc_batch
+
+
+@pytest.fixture(name="grid")
+def make_grid():
+    return ag.Grid2D.uniform(shape_native=(20, 20), pixel_scales=0.2)
+
+
+def mass_obj_from(vector, xp):
+    return ag.Galaxies(
+        galaxies=[
+            ag.Galaxy(
+                redshift=0.5,
+                mass=ag.mp.Isothermal(
+                    centre=(vector[0], vector[1]),
+                    ell_comps=(vector[2], vector[3]),
+                    einstein_radius=vector[4],
+                ),
+            )
+        ]
+    )
+
+
+parameters = np.array(
+    [
+        [0.0, 0.0, 0.0, 0.0, 1.0],
+        [0.1, -0.1, 0.05, 0.0, 1.2],
+        [0.0, 0.1, 0.0, -0.1, 0.8],
+    ]
+)
+
+
+def test__einstein_radius_and_mass_list_from__matches_lens_calc(grid):
+    mass_obj_list = [mass_obj_from(vector, np) for vector in parameters]
+
+    einstein_radii, einstein_masses = (
+        lens_calc_batch.einstein_radius_and_mass_list_from(
+            mass_obj_list=mass_obj_list, grid=grid, pixel_scale=0.1
+        )
+    )
+
+    for i, mass_obj in enumerate(mass_obj_list):
+        lens_calc = ag.LensCalc.from_mass_obj(mass_obj)
+
+        assert einstein_radii[i] == pytest.approx(
+            lens_calc.einstein_radius_from(grid=grid, pixel_scale=0.1), 1.0e-8
+        )
+        assert einstein_masses[i] == pytest.approx(
+            lens_calc.einstein_mass_angular_from(grid=grid, pixel_scale=0.1), 1.0e-8
+        )
+
+    assert einstein_radii == pytest.approx([1.0, 1.2, 0.8], 1.0e-2)
+
+
+def test__einstein_radius_and_mass_list_from__precision__matches_lens_calc(grid):
+    mass_obj_list = [mass_obj_from(vector, np) for vector in parameters]
+
+    einstein_radii, einstein_masses = (
+        lens_calc_batch.einstein_radius_and_mass_list_from(
+            mass_obj_list=mass_obj_list, grid=grid, pixel_scale=0.02, precision=1.0e-2
+        )
+    )
+
+    for i, mass_obj in enumerate(mass_obj_list):
+        lens_calc = ag.LensCalc.from_mass_obj(mass_obj)
+
+        assert einstein_radii[i] == pytest.approx(
+            lens_calc.einstein_radius_from(
+                grid=grid, pixel_scale=0.02, precision=1.0e-2
+            ),
+            1.0e-8,
+        )
+        assert einstein_masses[i] == pytest.approx(
+            lens_calc.einstein_mass_angular_from(
+                grid=grid, pixel_scale=0.02, precision=1.0e-2
+            ),
+            1.0e-8,
+        )
+
+
+def test__einstein_radius_and_mass_list_from__process_pool_matches_serial(grid):
+    mass_obj_list = [mass_obj_from(vector, np) for vector in parameters]
+
+    einstein_radii, einstein_masses = (
+        lens_calc_batch.einstein_radius_and_mass_list_from(
+            mass_obj_list=mass_obj_list, grid=grid, pixel_scale=0.1
+        )
+    )
+
+    (
+        einstein_radii_pool,
+        einstein_masses_pool,
+    ) = lens_calc_batch.einstein_radius_and_mass_list_from(
+        mass_obj_list=mass_obj_list, grid=grid, pixel_scale=0.1, number_of_cores=2
+    )
+
+    assert einstein_radii_pool == pytest.approx(einstein_radii, 1.0e-8)
+    assert einstein_masses_pool == pytest.approx(einstein_masses, 1.0e-8)
+
+
+def test__einstein_radius_and_mass_list_via_parameters_from__matches_mass_obj_list(
+    grid,
+):
+    pytest.importorskip("jax")
+
+    einstein_radii, einstein_masses = (
+        lens_calc_batch.einstein_radius_and_mass_list_from(
+            mass_obj_list=[mass_obj_from(vector, np) for vector in parameters],
+            grid=grid,
+            pixel_scale=0.1,
+        )
+    )
+
+    (
+        einstein_radii_vmap,
+        einstein_masses_vmap,
+    ) = lens_calc_batch.einstein_radius_and_mass_list_via_parameters_from(
+        mass_obj_from=mass_obj_from,
+        parameters=parameters,
+        grid=grid,
+        pixel_scale=0.1,
+        batch_size=2,
+    )
+
+    assert einstein_radii_vmap == pytest.approx(einstein_radii, 1.0e-4)
+    assert einstein_masses_vmap == pytest.approx(einstein_masses, 1.0e-4)
+
+
+def test__einstein_radius_and_mass_list_via_parameters_from__precision__matches_lens_calc(
+    grid,
+):
+    pytest.importorskip("jax")
+
+    einstein_radii, _ = (
+        lens_calc_batch.einstein_radius_and_mass_list_via_parameters_from(
+            mass_obj_from=mass_obj_from,
+            parameters=parameters,
+            grid=grid,
+            pixel_scale=0.02,
+            precision=1.0e-2,
+        )
+    )
+
+    for i, vector in enumerate(parameters):
+        lens_calc = ag.LensCalc.from_mass_obj(mass_obj_from(vector, np))
+
+        assert einstein_radii[i] == pytest.approx(
+            lens_calc.einstein_radius_from(
+                grid=grid, pixel_scale=0.02, precision=1.0e-2
+            ),
+            1.0e-8,
+        )
+
+
+def test__einstein_radius_and_mass_list_via_parameters_from__model_instance(grid):
+    pytest.importorskip("jax")
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(ag.Galaxy, redshift=0.5, mass=ag.mp.IsothermalSph)
+        )
+    )
+
+    def mass_obj_from(vector, xp):
+        instance = model.instance_from_vector(vector=vector, xp=xp)
+        return ag.Galaxies(galaxies=instance.galaxies)
+
+    parameters = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.5]])
+
+    einstein_radii, _ = (
+        lens_calc_batch.einstein_radius_and_mass_list_via_parameters_from(
+            mass_obj_from=mass_obj_from,
+            parameters=parameters,
+            grid=grid,
+            pixel_scale=0.1,
+        )
+    )
+
+    assert einstein_radii == pytest.approx([1.0, 1.5], 1.0e-2)
+
+
+def test__einstein_radius_and_mass_list_via_parameters_from__falls_back_if_not_traceable(
+    grid,
+):
+    def mass_obj_from_floats(vector, xp):
+        return mass_obj_from([float(value) for value in vector], xp)
+
+    (
+        einstein_radii,
+        einstein_masses,
+    ) = lens_calc_batch.einstein_radius_and_mass_list_via_parameters_from(
+        mass_obj_from=mass_obj_from_floats,
+        parameters=parameters,
+        grid=grid,
+        pixel_scale=0.1,
+    )
+
+    assert einstein_radii == pytest.approx([1.0, 1.2, 0.8], 1.0e-2)
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.operate import quadtree
+
+
+def values_native_from(values_from, shape_native, pixel_scale):
+    y = (
+        0.5 * (shape_native[0] - 1) * pixel_scale
+        - np.arange(shape_native[0]) * pixel_scale
+    )
+    x = (
+        -0.5 * (shape_native[1] - 1) * pixel_scale
+        + np.arange(shape_native[1]) * pixel_scale
+    )
+
+    y, x = np.meshgrid(y, x, indexing="ij")
+
+    values = values_from(np.stack((y.ravel(), x.ravel()), axis=-1))
+
+    return values.reshape(shape_native), y[0, 0], x[0, 0]
+
+
+def test__total_levels_from():
+    assert quadtree.total_levels_from(pixel_scale=0.1, precision=0.1) == 0
+    assert quadtree.total_levels_from(pixel_scale=0.1, precision=0.05) == 1
+    assert quadtree.total_levels_from(pixel_scale=0.1, precision=0.001) == 7
+    assert quadtree.total_levels_from(pixel_scale=0.1, precision=1.0) == 0
+
+    with pytest.raises(ag.exc.GridException):
+        quadtree.total_levels_from(pixel_scale=0.1, precision=0.0)
+
+
+def test__zero_contour_list_via_quadtree_from__circle__closed_contour_at_radius():
+    total_evaluations = []
+
+    def values_from(grid):
+        total_evaluations.append(grid.shape[0])
+        return 1.3 - np.sqrt((grid[:, 0] - 0.1) ** 2 + (grid[:, 1] + 0.2) ** 2)
+
+    values_native, y_top, x_left = values_native_from(
+        values_from=values_from, shape_native=(61, 61), pixel_scale=0.1
+    )
+
+    contour_list = quadtree.zero_contour_list_via_quadtree_from(
+        values_from=values_from,
+        values_native=values_native,
+        y_top=y_top,
+        x_left=x_left,
+        pixel_scale=0.1,
+        precision=0.001,
+    )
+
+    assert len(contour_list) == 1
+
+    contour = contour_list[0]
+
+    radii = np.sqrt((contour[:, 0] - 0.1) ** 2 + (contour[:, 1] + 0.2) ** 2)
+
+    assert radii == pytest.approx(1.3, abs=1.0e-6)
+    assert contour[0] == pytest.approx(contour[-1], 1.0e-8)
+
+    # Far fewer evaluations than the 6000 x 6000 uniform grid of the same precision.
+
+    assert sum(total_evaluations[1:]) < 100000
+
+
+def test__zero_contour_list_via_quadtree_from__two_circles_and_open_contour():
+    def values_from(grid):
+        return np.minimum(
+            np.sqrt((grid[:, 0] - 1.0) ** 2 + (grid[:, 1] - 1.0) ** 2) - 0.5,
+            np.sqrt((grid[:, 0] + 1.0) ** 2 + (grid[:, 1] + 1.0) ** 2) - 0.7,
+        )
+
+    values_native, y_top, x_left = values_native_from(
+        values_from=values_from, shape_native=(41, 41), pixel_scale=0.1
+    )
+
+    contour_list = quadtree.zero_contour_list_via_quadtree_from(
+        values_from=values_from,
+        values_native=values_native,
+        y_top=y_top,
+        x_left=x_left,
+        pixel_scale=0.1,
+        precision=0.01,
+    )
+
+    assert len(contour_list) == 2
+
+    def parabola_from(grid):
+        return grid[:, 0] - 0.3 * grid[:, 1] ** 2 + 0.5
+
+    values_native, y_top, x_left = values_native_from(
+        values_from=parabola_from, shape_native=(41, 41), pixel_scale=0.1
+    )
+
+    contour_list = quadtree.zero_contour_list_via_quadtree_from(
+        values_from=parabola_from,
+        values_native=values_native,
+        y_top=y_top,
+        x_left=x_left,
+        pixel_scale=0.1,
+        precision=0.01,
+    )
+
+    assert len(contour_list) == 1
+    assert parabola_from(contour_list[0]) == pytest.approx(0.0, abs=1.0e-4)
+    assert contour_list[0][0] != pytest.approx(contour_list[0][-1], 1.0e-4)
@@ -78,6 +78,76 @@ def test__operated_mapping_matrix__columns_match_individual_blurred_images(
     ] == pytest.approx(lp_1_blurred_image.array, 1.0e-4)
 
 
+def test__blurring_mapping_matrix__columns_match_individual_blurring_images(
+    grid_2d_7x7, blurring_grid_2d_7x7, psf_3x3
+):
+    lp_0 = ag.lp_linear.Sersic(effective_radius=1.0)
+    lp_1 = ag.lp_linear.Sersic(effective_radius=2.0)
+
+    lp_linear_obj_func_list = LightProfileLinearObjFuncList(
+        grid=grid_2d_7x7,
+        blurring_grid=blurring_grid_2d_7x7,
+        psf=psf_3x3,
+        light_profile_list=[lp_0, lp_1],
+    )
+
+    assert lp_linear_obj_func_list.blurring_mapping_matrix.shape == (
+        blurring_grid_2d_7x7.shape[0],
+        2,
+    )
+    assert lp_linear_obj_func_list.blurring_mapping_matrix[:, 1] == pytest.approx(
+        lp_1.image_2d_from(grid=blurring_grid_2d_7x7).array, 1.0e-4
+    )
+
+
+def test__has_shared_gaussian_geometry(grid_2d_7x7, blurring_grid_2d_7x7, psf_3x3):
+    lp_0 = ag.lp_linear.Gaussian(centre=(0.1, 0.2), ell_comps=(0.1, 0.2), sigma=1.0)
+    lp_1 = ag.lp_linear.Gaussian(centre=(0.1, 0.2), ell_comps=(0.1, 0.2), sigma=2.0)
+    lp_2 = ag.lp_linear.Gaussian(centre=(0.1, 0.3), ell_comps=(0.1, 0.2), sigma=2.0)
+    lp_3 = ag.lp_linear.Sersic(centre=(0.1, 0.2), ell_comps=(0.1, 0.2))
+
+    def has_shared_gaussian_geometry_from(light_profile_list):
+        return LightProfileLinearObjFuncList(
+            grid=grid_2d_7x7,
+            blurring_grid=blurring_grid_2d_7x7,
+            psf=psf_3x3,
+            light_profile_list=light_profile_list,
+        ).has_shared_gaussian_geometry
+
+    assert has_shared_gaussian_geometry_from([lp_0, lp_1]) is True
+    assert has_shared_gaussian_geometry_from([lp_0, lp_1, lp_2]) is False
+    assert has_shared_gaussian_geometry_from([lp_0, lp_3]) is False
+
+
+def test__mapping_matrix__shared_gaussian_geometry__columns_match_individual_profile_images(
+    grid_2d_7x7, blurring_grid_2d_7x7, psf_3x3
+):
+    light_profile_list = [
+        ag.lp_linear.Gaussian(centre=(0.1, 0.2), ell_comps=(0.1, 0.2), sigma=sigma)
+        for sigma in [0.5, 1.0, 2.0]
+    ]
+
+    lp_linear_obj_func_list = LightProfileLinearObjFuncList(
+        grid=grid_2d_7x7,
+        blurring_grid=blurring_grid_2d_7x7,
+        psf=psf_3x3,
+        light_profile_list=light_profile_list,
+    )
+
+    for i, light_profile in enumerate(light_profile_list):
+        assert lp_linear_obj_func_list.mapping_matrix[:, i] == pytest.approx(
+            light_profile.image_2d_from(grid=grid_2d_7x7).array, 1.0e-8
+        )
+        assert lp_linear_obj_func_list.operated_mapping_matrix_override[
+            :, i
+        ] == pytest.approx(
+            light_profile.blurred_image_2d_from(
+                grid=grid_2d_7x7, blurring_grid=blurring_grid_2d_7x7, psf=psf_3x3
+            ).array,
+            1.0e-8,
+        )
+
+
 def test__lp_instance_from__returns_non_linear_instance_with_correct_type_and_centre():
     lp_linear = ag.lp_linear.Sersic(centre=(1.0, 2.0))
 
@@ -1,4 +1,5 @@
 from __future__ import division, print_function
+import numpy as np
 import pytest
 
 import autogalaxy as ag
@@ -54,3 +55,26 @@ def test__image_2d_from__spherical_profile__matches_elliptical_with_zero_ellipti
     image_spherical = spherical.image_2d_from(grid=grid)
 
     assert image_elliptical.array == pytest.approx(image_spherical.array, 1.0e-4)
+
+
+def test__visibilities_via_uv_from__matches_fourier_transform_of_image():
+    mask = ag.Mask2D.all_false(shape_native=(80, 80), pixel_scales=0.05)
+
+    grid = ag.Grid2D.from_mask(mask=mask, over_sample_size=1)
+
+    uv_wavelengths = np.array(
+        [[1.0e4, 2.0e4], [-5.0e4, 3.0e4], [8.0e4, -6.0e4], [0.0, 0.0]]
+    )
+
+    transformer = ag.TransformerDFT(uv_wavelengths=uv_wavelengths, real_space_mask=mask)
+
+    lp = ag.lp.Gaussian(
+        centre=(0.1, -0.2), ell_comps=(0.2, 0.1), intensity=2.0, sigma=0.3
+    )
+
+    visibilities = lp.visibilities_via_uv_from(transformer=transformer)
+
+    visibilities_dft = transformer.visibilities_from(image=lp.image_2d_from(grid=grid))
+
+    assert lp.has_visibilities_via_uv
+    assert visibilities == pytest.approx(visibilities_dft.array, 1.0e-4)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.profiles.mass.abstract.decomposition_cache import (
+    DecompositionCache,
+    mge_cache,
+)
+
+
+def decompose(profile):
+    return np.array([profile.kappa_s, 2.0 * profile.inner_slope]), np.array([1.0, 2.0])
+
+
+def test__decomposition_from__counts_hits_and_misses():
+    cache = DecompositionCache(maxsize=2)
+
+    profile = ag.mp.gNFW(centre=(0.0, 0.0), kappa_s=1.0, inner_slope=1.5)
+
+    amplitudes, scales = cache.decomposition_from(
+        profile=profile, decompose=decompose, settings={"three_D": True}
+    )
+    cache.decomposition_from(
+        profile=ag.mp.gNFW(centre=(1.0, 1.0), kappa_s=1.0, inner_slope=1.5),
+        decompose=decompose,
+        settings={"three_D": True},
+    )
+
+    assert amplitudes == pytest.approx(np.array([1.0, 3.0]), 1.0e-8)
+    assert scales == pytest.approx(np.array([1.0, 2.0]), 1.0e-8)
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+    cache.decomposition_from(
+        profile=profile, decompose=decompose, settings={"three_D": False}
+    )
+
+    assert cache.cache_info().misses == 2
+
+    with pytest.raises(ValueError):
+        amplitudes[0] = 2.0
+
+
+def test__decomposition_from__least_recently_used_removed():
+    cache = DecompositionCache(maxsize=2)
+
+    for inner_slope in [0.5, 1.0, 1.5, 0.5]:
+        cache.decomposition_from(
+            profile=ag.mp.gNFW(inner_slope=inner_slope),
+            decompose=decompose,
+            settings={},
+        )
+
+    assert cache.cache_info().misses == 4
+    assert cache.cache_info().currsize == 2
+
+
+def test__add_interpolation_grid():
+    cache = DecompositionCache(maxsize=2)
+
+    cache.add_interpolation_grid(
+        profile=ag.mp.gNFW(kappa_s=2.0, inner_slope=1.0),
+        parameter="inner_slope",
+        values=np.linspace(0.5, 2.0, 4),
+        decompose=decompose,
+        settings={},
+    )
+
+    amplitudes, _ = cache.decomposition_from(
+        profile=ag.mp.gNFW(kappa_s=2.0, inner_slope=1.2),
+        decompose=decompose,
+        settings={},
+    )
+
+    assert amplitudes == pytest.approx(np.array([2.0, 2.4]), 1.0e-8)
+    assert cache.cache_info().interpolated == 1
+
+    cache.decomposition_from(
+        profile=ag.mp.gNFW(kappa_s=3.0, inner_slope=1.2),
+        decompose=decompose,
+        settings={},
+    )
+
+    assert cache.cache_info().misses == 1
+
+    with pytest.raises(ag.exc.ProfileException):
+        cache.add_interpolation_grid(
+            profile=ag.mp.gNFW(),
+            parameter="inner_slope",
+            values=np.linspace(0.5, 2.0, 4),
+            decompose=lambda profile: (np.ones(2), profile.inner_slope * np.ones(2)),
+            settings={},
+        )
+
+
+def test__mge_decomposer__uses_cache():
+    mge_cache.cache_clear()
+
+    mass_profile = ag.mp.gNFW(
+        ell_comps=(0.1, 0.05), kappa_s=1.0, inner_slope=1.3, scale_radius=3.0
+    )
+
+    grid = ag.Grid2DIrregular([[0.1875, 0.1625], [1.0, -0.5]])
+
+    deflections = mass_profile.deflections_yx_2d_from(grid=grid)
+    deflections_cached = mass_profile.deflections_yx_2d_from(grid=grid)
+
+    assert np.array_equal(np.asarray(deflections), np.asarray(deflections_cached))
+    assert mge_cache.cache_info().hits == 1
+    assert mge_cache.cache_info().misses == 1
+
+
+def test__mge_decomposer__add_interpolation_grid():
+    mge_cache.cache_clear()
+
+    sigma_log_list = np.exp(np.linspace(np.log(3.0 / 20000.0), np.log(600.0), 30))
+
+    ag.mp.MGEDecomposer(
+        mass_profile=ag.mp.gNFW(kappa_s=1.0, inner_slope=1.0, scale_radius=3.0)
+    ).add_interpolation_grid(
+        parameter="inner_slope",
+        values=np.linspace(0.5, 2.0, 301),
+        sigma_log_list=sigma_log_list,
+        three_D=True,
+    )
+
+    mge_decomp = ag.mp.MGEDecomposer(
+        mass_profile=ag.mp.gNFW(kappa_s=1.0, inner_slope=1.2345, scale_radius=3.0)
+    )
+
+    amplitudes, _ = mge_decomp.decompose_convergence_via_mge(
+        sigma_log_list=sigma_log_list, three_D=True
+    )
+    amplitudes_exact, _ = mge_decomp._decompose_convergence_via_mge_from(
+        sigma_log_list=sigma_log_list, three_D=True
+    )
+
+    assert mge_cache.cache_info().interpolated == 1
+    assert amplitudes == pytest.approx(amplitudes_exact, 1.0e-3)
+
+    mge_cache.cache_clear()
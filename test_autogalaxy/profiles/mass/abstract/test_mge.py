@@ -672,3 +672,107 @@ def test__sersic_convergence_2d_via_mge_from__elliptical():
     )
 
     assert convergence == pytest.approx(5.38066670129, 1e-3)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test__deflections_2d_via_mge_from__chunked__identical_to_single_pass(chunk_size):
+    nfw = ag.mp.gNFW(
+        centre=(0.1, -0.2),
+        kappa_s=1.0,
+        ell_comps=ag.convert.ell_comps_from(axis_ratio=0.6, angle=30.0),
+        inner_slope=1.2,
+        scale_radius=5.0,
+    )
+
+    sigmas = np.exp(np.linspace(np.log(5.0 / 2000.0), np.log(5.0 * 30.0), 20))
+
+    grid = ag.Grid2DIrregular(
+        np.random.default_rng(seed=1).uniform(-3.0, 3.0, size=(101, 2))
+    )
+
+    mge_decomp = ag.mp.MGEDecomposer(mass_profile=nfw)
+
+    deflections = mge_decomp.deflections_2d_via_mge_from(
+        grid=grid,
+        sigma_log_list=sigmas,
+        ellipticity_convention="major",
+        three_D=True,
+        chunk_size=10**9,
+    )
+
+    deflections_chunked = mge_decomp.deflections_2d_via_mge_from(
+        grid=grid,
+        sigma_log_list=sigmas,
+        ellipticity_convention="major",
+        three_D=True,
+        chunk_size=chunk_size,
+    )
+
+    assert np.array_equal(np.asarray(deflections_chunked), np.asarray(deflections))
+
+
+def test__deflections_2d_via_mge_from__chunked__jax_matches_numpy():
+    pytest.importorskip("jax")
+
+    import jax.numpy as jnp
+
+    nfw = ag.mp.gNFW(
+        centre=(0.1, -0.2),
+        kappa_s=1.0,
+        ell_comps=ag.convert.ell_comps_from(axis_ratio=0.6, angle=30.0),
+        inner_slope=1.2,
+        scale_radius=5.0,
+    )
+
+    sigmas = np.exp(np.linspace(np.log(5.0 / 2000.0), np.log(5.0 * 30.0), 20))
+
+    grid = ag.Grid2DIrregular(
+        np.random.default_rng(seed=1).uniform(-3.0, 3.0, size=(101, 2))
+    )
+
+    mge_decomp = ag.mp.MGEDecomposer(mass_profile=nfw)
+
+    deflections = mge_decomp.deflections_2d_via_mge_from(
+        grid=grid,
+        sigma_log_list=sigmas,
+        ellipticity_convention="major",
+        three_D=True,
+        chunk_size=10**9,
+    )
+
+    deflections_jax = mge_decomp.deflections_2d_via_mge_from(
+        grid=grid,
+        sigma_log_list=jnp.asarray(sigmas),
+        ellipticity_convention="major",
+        three_D=True,
+        chunk_size=10**9,
+        xp=jnp,
+    )
+
+    deflections_jax_chunked = mge_decomp.deflections_2d_via_mge_from(
+        grid=grid,
+        sigma_log_list=jnp.asarray(sigmas),
+        ellipticity_convention="major",
+        three_D=True,
+        chunk_size=7,
+        xp=jnp,
+    )
+
+    assert np.array(deflections_jax_chunked.array) == pytest.approx(
+        np.array(deflections_jax.array), 1.0e-10
+    )
+    assert np.array(deflections_jax_chunked.array) == pytest.approx(
+        deflections.array, 1.0e-4
+    )
+
+
+def test__pixel_chunk_size_from():
+    assert (
+        MGEDecomposer.pixel_chunk_size_from(
+            total_gaussians=30, memory_budget=256 * 30 * 100
+        )
+        == 100
+    )
+    assert (
+        MGEDecomposer.pixel_chunk_size_from(total_gaussians=30, memory_budget=1.0) == 1
+    )
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+from autogalaxy.profiles.mass.abstract import quadrature
+from autogalaxy.profiles.mass.dark import gnfw_util
+
+y = np.array([0.1875, 1.0, -2.0, 0.01])
+x = np.array([0.1625, -0.5, 3.0, 0.02])
+
+
+def test__nodes_and_weights_from__tanh_sinh__integrates_end_point_singularity():
+    nodes, weights = quadrature.nodes_and_weights_from(epsrel=1.0e-8)
+
+    assert np.min(nodes) > 0.0
+    assert np.max(nodes) < 1.0
+    assert np.sum(weights) == pytest.approx(1.0, 1.0e-10)
+    assert np.sum(weights / np.sqrt(nodes)) == pytest.approx(2.0, 1.0e-8)
+
+
+def test__nodes_and_weights_from__gauss_legendre__integrates_polynomial():
+    nodes, weights = quadrature.nodes_and_weights_from(
+        epsrel=1.0e-8, rule="gauss_legendre"
+    )
+
+    assert np.sum(weights) == pytest.approx(1.0, 1.0e-10)
+    assert np.sum(weights * nodes**7) == pytest.approx(1.0 / 8.0, 1.0e-10)
+
+
+def test__nodes_and_weights_from__accuracy_target_sets_total_nodes():
+    nodes_low, _ = quadrature.nodes_and_weights_from(epsrel=1.0e-4)
+    nodes_high, _ = quadrature.nodes_and_weights_from(epsrel=1.0e-14)
+
+    assert len(nodes_low) < len(nodes_high)
+
+
+def test__nodes_and_weights_from__invalid_rule__raises_exception():
+    with pytest.raises(ag.exc.ProfileException):
+        quadrature.nodes_and_weights_from(rule="simpson")
+
+
+def test__integral_from__broadcasts_array_inputs():
+    def func(u, a, b, xp=np):
+        return a * u + b
+
+    integral = quadrature.integral_from(func, np.array([1.0, 2.0, 4.0]), 3.0)
+
+    assert integral == pytest.approx(np.array([3.5, 4.0, 5.0]), 1.0e-10)
+
+
+@pytest.mark.parametrize(
+    "func, args",
+    [
+        (ag.mp.PowerLawCore.deflection_func, (y, x, 1.0, 0.6, 2.3, 0.1)),
+        (ag.mp.PowerLawCore.potential_func, (y, x, 0.6, 2.3, 0.1)),
+        (ag.mp.Sersic.deflection_func, (y, x, 0.0, 0.7, 4.0, 0.8, 7.66)),
+        (
+            ag.mp.SersicGradient.deflection_func,
+            (y, x, 1.0, 0.7, 2.0, 0.8, 0.5, 3.67),
+        ),
+        (ag.mp.Gaussian.deflection_func, (y, x, 1.0, 0.7, 1.2)),
+        (ag.mp.NFW.deflection_func, (y, x, 1.0, 0.7, 1.5)),
+        (ag.mp.NFW.potential_func, (y, x, 0.7, 0.1, 1.5)),
+        (gnfw_util.surface_density_integrand, (np.abs(y), 1.5)),
+        (gnfw_util.deflection_integrand, (np.abs(y), 0.5)),
+    ],
+)
+def test__integral_from__matches_quad(func, args):
+    integral = quadrature.integral_from(func, *args)
+    integral_via_quad = quadrature.integral_via_quad_from(func, *args)
+
+    assert integral == pytest.approx(integral_via_quad, 1.0e-6)
+
+
+@pytest.mark.parametrize(
+    "mass_profile, func_name",
+    [
+        (ag.mp.Sersic(ell_comps=(0.1, 0.05)), "deflections_2d_via_integral_from"),
+        (ag.mp.Gaussian(ell_comps=(0.1, 0.05)), "deflections_2d_via_integral_from"),
+        (ag.mp.NFW(ell_comps=(0.1, 0.05)), "deflections_2d_via_integral_from"),
+        (ag.mp.NFW(ell_comps=(0.1, 0.05)), "potential_2d_from"),
+        (ag.mp.PowerLawCore(ell_comps=(0.1, 0.05)), "potential_2d_from"),
+    ],
+)
+def test__integral_from__jax__matches_numpy(mass_profile, func_name):
+    pytest.importorskip("jax")
+
+    import jax.numpy as jnp
+
+    grid = ag.Grid2DIrregular(values=np.stack((y, x), axis=-1))
+
+    values = getattr(mass_profile, func_name)(grid=grid)
+    values_jax = getattr(mass_profile, func_name)(grid=grid, xp=jnp)
+
+    assert np.array(values_jax.array) == pytest.approx(values.array, 1.0e-10)
+
+
+def test__integral_from__gnfw_tabulated_integrand__matches_quad():
+    minimum_log_eta = -4.0
+    maximum_log_eta = 1.5
+    tabulate_bins = 1000
+
+    eta = ag.mp.gNFW.tabulated_eta_from(
+        minimum_log_eta=minimum_log_eta,
+        maximum_log_eta=maximum_log_eta,
+        tabulate_bins=tabulate_bins,
+    )
+
+    args = (y, x, 1.0, 0.7, minimum_log_eta, maximum_log_eta, tabulate_bins)
+
+    integral = quadrature.integral_from(
+        ag.mp.gNFW.deflection_func, *args, surface_density_integral=1.0 / (1.0 + eta)
+    )
+    integral_via_quad = quadrature.integral_via_quad_from(
+        ag.mp.gNFW.deflection_func, *args, surface_density_integral=1.0 / (1.0 + eta)
+    )
+
+    assert integral == pytest.approx(integral_via_quad, 1.0e-4)
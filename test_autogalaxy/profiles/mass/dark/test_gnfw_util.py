@@ -0,0 +1,146 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from autogalaxy.profiles.mass.dark import gnfw_util
+
+eta = 10.0 ** np.linspace(-7.5, 3.5, 23)
+
+
+@pytest.mark.parametrize("inner_slope", [-0.5, 0.5, 1.0, 1.7, 2.6])
+def test__surface_density_integral_from__matches_quadrature(inner_slope):
+    integral = gnfw_util.surface_density_integral_from(inner_slope=inner_slope, eta=eta)
+    integral_via_quadrature = gnfw_util.surface_density_integral_via_quadrature_from(
+        inner_slope=inner_slope, eta=eta
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-5)
+
+
+@pytest.mark.parametrize("inner_slope", [-0.5, 0.5, 1.0, 1.7, 2.6])
+def test__deflection_integral_from__matches_quadrature(inner_slope):
+    integral = gnfw_util.deflection_integral_from(inner_slope=inner_slope, eta=eta)
+    integral_via_quadrature = gnfw_util.deflection_integral_via_quadrature_from(
+        inner_slope=inner_slope, eta=eta
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-5)
+
+
+def test__in_table_range():
+    assert gnfw_util.in_table_range(inner_slope=1.0, eta=eta) is True
+    assert gnfw_util.in_table_range(inner_slope=2.99, eta=eta) is False
+    assert gnfw_util.in_table_range(inner_slope=1.0, eta=np.array([0.0, 1.0])) is False
+    assert gnfw_util.in_table_range(inner_slope=1.0, eta=eta + 0.0j) is False
+
+
+def test__integral_from__outside_table__uses_quadrature():
+    eta_outside = np.array([1.0e-9, 1.0, 1.0e5])
+
+    integral = gnfw_util.surface_density_integral_from(
+        inner_slope=2.99, eta=eta_outside
+    )
+    integral_via_quadrature = gnfw_util.surface_density_integral_via_quadrature_from(
+        inner_slope=2.99, eta=eta_outside
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-12)
+
+    integral = gnfw_util.deflection_integral_from(inner_slope=1.0, eta=eta_outside)
+    integral_via_quadrature = gnfw_util.deflection_integral_via_quadrature_from(
+        inner_slope=1.0, eta=eta_outside
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-12)
+
+
+def test__log_tables__size_and_memory_of_build():
+    log_surface_density_table, log_deflection_table = gnfw_util.log_tables()
+
+    assert log_surface_density_table.shape == (200, 243)
+    assert log_deflection_table.shape == (200, 243)
+    assert log_surface_density_table.nbytes + log_deflection_table.nbytes < 1.0e6
+
+    gnfw_util.log_tables.cache_clear()
+
+    tracemalloc.start()
+
+    try:
+        gnfw_util.log_tables()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1.0e7
+
+
+@pytest.mark.parametrize("inner_slope", [-1.0, 2.94])
+def test__integral_from__table_edges__matches_quadrature(inner_slope):
+    eta_edges = np.array([1.0e-8, 1.0e4])
+
+    assert gnfw_util.in_table_range(inner_slope=inner_slope, eta=eta_edges) is True
+
+    integral = gnfw_util.surface_density_integral_from(
+        inner_slope=inner_slope, eta=eta_edges
+    )
+    integral_via_quadrature = gnfw_util.surface_density_integral_via_quadrature_from(
+        inner_slope=inner_slope, eta=eta_edges
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-5)
+
+    integral = gnfw_util.deflection_integral_from(
+        inner_slope=inner_slope, eta=eta_edges
+    )
+    integral_via_quadrature = gnfw_util.deflection_integral_via_quadrature_from(
+        inner_slope=inner_slope, eta=eta_edges
+    )
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-5)
+
+
+def test__integral_from__jax__outside_table__nan():
+    pytest.importorskip("jax")
+
+    import jax.numpy as jnp
+
+    eta = np.array([1.0e-9, 0.3, 1.0e5])
+
+    integral = gnfw_util.surface_density_integral_from(
+        inner_slope=1.0, eta=jnp.asarray(eta), xp=jnp
+    )
+
+    assert np.isnan(integral[0])
+    assert integral[1] == pytest.approx(
+        gnfw_util.surface_density_integral_from(inner_slope=1.0, eta=eta[1]), 1.0e-8
+    )
+    assert np.isnan(integral[2])
+
+    integral = gnfw_util.deflection_integral_from(
+        inner_slope=2.99, eta=jnp.asarray(eta), xp=jnp
+    )
+
+    assert np.isnan(integral).all()
+
+
+def test__surface_density_integral_from__complex_eta__uses_quadrature():
+    pytest.importorskip("jax")
+
+    import jax.numpy as jnp
+
+    eta_complex = np.array([0.01, 0.3, 5.0]) * (1.0 + 0.3j)
+
+    integral_via_quadrature = gnfw_util.surface_density_integral_via_quadrature_from(
+        inner_slope=1.0, eta=eta_complex
+    )
+
+    integral = gnfw_util.surface_density_integral_from(inner_slope=1.0, eta=eta_complex)
+
+    assert integral == pytest.approx(integral_via_quadrature, 1.0e-12)
+
+    integral = gnfw_util.surface_density_integral_from(
+        inner_slope=1.0, eta=jnp.asarray(eta_complex), xp=jnp
+    )
+
+    assert np.array(integral) == pytest.approx(integral_via_quadrature, 1.0e-12)
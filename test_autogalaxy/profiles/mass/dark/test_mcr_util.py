@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from autogalaxy.profiles.mass.dark import mcr_util
+
+
+def test__ludlow16_concentration_from__matches_colossus():
+    log10_mass_list = [6.3, 9.0, 11.7, 14.2]
+    redshift_list = [0.05, 0.6, 1.37, 4.2]
+
+    log10_concentration = mcr_util.ludlow16_log10_concentration_table_from_colossus(
+        log10_mass_list=log10_mass_list, redshift_list=redshift_list
+    )
+
+    for i, redshift in enumerate(redshift_list):
+        for j, log10_mass in enumerate(log10_mass_list):
+            concentration = mcr_util.ludlow16_concentration_from(
+                mass_at_200=10.0**log10_mass, redshift_object=redshift
+            )
+
+            assert concentration == pytest.approx(
+                10.0 ** log10_concentration[i, j], 1.0e-3
+            )
+
+
+def test__kappa_s_and_scale_radius_for_ludlow__jax_vmap_matches_numpy():
+    jax = pytest.importorskip("jax")
+    import jax.numpy as jnp
+
+    mass_at_200_list = [1.0e9, 1.0e11, 1.0e13]
+
+    kappa_s_list = [
+        mcr_util.kappa_s_and_scale_radius_for_ludlow(
+            mass_at_200=mass_at_200,
+            scatter_sigma=0.0,
+            redshift_object=0.6,
+            redshift_source=2.5,
+        )[0]
+        for mass_at_200 in mass_at_200_list
+    ]
+
+    kappa_s_vmap = jax.jit(
+        jax.vmap(
+            lambda mass_at_200: mcr_util.kappa_s_and_scale_radius_for_ludlow(
+                mass_at_200=mass_at_200,
+                scatter_sigma=0.0,
+                redshift_object=0.6,
+                redshift_source=2.5,
+            )[0]
+        )
+    )(jnp.array(mass_at_200_list))
+
+    assert np.asarray(kappa_s_vmap) == pytest.approx(np.array(kappa_s_list), 1.0e-4)
@@ -0,0 +1,87 @@
+import pytest
+
+import autogalaxy as ag
+
+
+def test__call__profiling_not_enabled__function_called():
+    assert ag.profiling.current() is None
+    assert ag.profiling.call(sum, [1, 2]) == 3
+
+    with ag.profiling.stage(name="stage"):
+        pass
+
+    assert ag.profiling.current() is None
+
+
+def test__enabled__profiler_yielded_and_previous_profiler_restored():
+    profiler = ag.profiling.Profiler()
+
+    with ag.profiling.enabled(profiler=profiler) as profiler_0:
+        assert profiler_0 is profiler
+
+        with ag.profiling.enabled() as profiler_1:
+            assert ag.profiling.current() is profiler_1
+
+        assert ag.profiling.current() is profiler
+
+    assert ag.profiling.current() is None
+
+
+def test__fit_imaging__stages_recorded(masked_imaging_7x7, gal_x1_lp):
+    with ag.profiling.enabled() as profiler:
+        fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[gal_x1_lp])
+        fit.figure_of_merit
+
+    assert profiler.call_dict["FitImaging.blurred_image"] == 1
+    assert profiler.call_dict["FitImaging.model_data"] == 1
+    assert profiler.call_dict["Convolver.convolved_image_from"] == 1
+    assert profiler.call_dict["SersicSph.image_2d_from"] == 2
+    assert "FitImaging.linear_algebra" not in profiler.call_dict
+
+    assert profiler.time_dict["FitImaging.model_data"] >= (
+        profiler.time_dict["FitImaging.blurred_image"]
+    )
+
+
+def test__fit_imaging__inversion__set_up_and_linear_algebra_recorded_separately(
+    masked_imaging_7x7,
+):
+    galaxy = ag.Galaxy(
+        redshift=0.5,
+        pixelization=ag.Pixelization(
+            mesh=ag.mesh.RectangularUniform(shape=(3, 3)),
+            regularization=ag.reg.Constant(coefficient=1.0),
+        ),
+    )
+
+    with ag.profiling.enabled() as profiler:
+        fit = ag.FitImaging(dataset=masked_imaging_7x7, galaxies=[galaxy])
+        fit.figure_of_merit
+        fit.galaxies_to_inversion.inversion
+
+    assert profiler.call_dict["FitImaging.inversion"] == 1
+    assert profiler.call_dict["GalaxiesToInversion.inversion"] == 1
+    assert profiler.call_dict["GalaxiesToInversion.mapper_galaxy_dict"] == 1
+    assert profiler.call_dict["FitImaging.linear_algebra"] == 1
+
+
+def test__report_dict_and_output_to(tmp_path):
+    profiler = ag.profiling.Profiler()
+
+    profiler.add(name="stage_0", time=1.0)
+    profiler.add(name="stage_1", time=3.0)
+    profiler.add(name="stage_0", time=1.0)
+
+    assert list(profiler.report_dict) == ["stage_1", "stage_0"]
+    assert profiler.report_dict["stage_0"]["calls"] == 2
+    assert profiler.report_dict["stage_0"]["time"] == pytest.approx(2.0, 1.0e-4)
+    assert profiler.report_dict["stage_0"]["time_per_call"] == pytest.approx(
+        1.0, 1.0e-4
+    )
+
+    profiler.output_to(file_path=tmp_path / "profiling.results")
+
+    report = (tmp_path / "profiling.results").read_text()
+
+    assert "stage_0" in report
+    assert "stage_1" in report